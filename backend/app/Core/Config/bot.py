@@ -1,11 +1,16 @@
 """Bot configuration management module."""
 
+import json
 import os
-from typing import Any, Dict, List, Literal, NotRequired, Optional, TypedDict
+import uuid
+from typing import TYPE_CHECKING, Any, Dict, List, Literal, NotRequired, Optional, Tuple, TypedDict
 
 from dotenv import load_dotenv
-from pipecat.services.google.llm import GoogleLLMService
-from pipecat.services.openai.llm import BaseOpenAILLMService
+
+# Provider SDKs are imported by the params that need them, not by every bot
+if TYPE_CHECKING:
+    from pipecat.services.google.llm import GoogleLLMService
+    from pipecat.services.openai.llm import BaseOpenAILLMService
 
 
 class DailyConfig(TypedDict):
@@ -16,10 +21,182 @@ class DailyConfig(TypedDict):
 
 BotType = Literal["simple", "flow", "multimodal"]
 
+# Variable holding the model (LLM, STT) or voice (TTS) of each provider, and its default;
+# providers not listed use the generic one under None
+LLM_MODEL_SETTINGS = {
+    "google": ("GOOGLE_MODEL", "gemini-2.5-flash"),
+    "openai": ("OPENAI_MODEL", "gpt-5o"),
+    "anthropic": ("ANTHROPIC_MODEL", "claude-3-5-sonnet-20241022"),
+    "groq": ("GROQ_MODEL", "llama-3.3-70b-versatile"),
+    "together": ("TOGETHER_MODEL", "meta-llama/Llama-3.3-70B-Instruct-Turbo"),
+    "mistral": ("MISTRAL_MODEL", "mistral-large-latest"),
+    "ultravox": ("ULTRAVOX_MODEL", "fixie-ai/ultravox"),
+    None: ("LLM_MODEL", ""),
+}
+
+STT_MODEL_SETTINGS = {
+    "deepgram": ("DEEPGRAM_STT_MODEL", "nova-3-general"),
+    None: ("STT_MODEL", ""),
+}
+
+TTS_VOICE_SETTINGS = {
+    "deepgram": ("DEEPGRAM_VOICE", "aura-athena-en"),
+    "cartesia": ("CARTESIA_VOICE", "79a125e8-cd45-4c13-8a67-188112f4dd22"),
+    "elevenlabs": ("ELEVENLABS_VOICE_ID", "JBFqnCBsd6RMkjVDRZzb"),
+    "playht": (
+        "PLAYHT_VOICE_ID",
+        "s3://voice-training-authenticated/original_voices/marissa_extracted/manifest.json",
+    ),
+    "rime": ("RIME_VOICE_ID", "marissa"),
+    "openai": ("OPENAI_VOICE", "alloy"),
+    "azure": ("AZURE_VOICE", "en-US-AvaMultilingualNeural"),
+    "ultravox": ("ULTRAVOX_VOICE", "a6afd1fc-960f-45d3-9e46-e8182af650b9"),  # 'Clive'
+    None: ("TTS_VOICE", ""),
+}
+
+# Set by bot_runner from the assistant and per call after the config is built
+CALL_ATTRIBUTES = (
+    "tools",
+    "flow_config",
+    "inactivity_messages",
+    "initial_message",
+    "initial_delay",
+    "initial_message_interruptible",
+    "interruptibility",
+    "prerendered_audio",
+    "filler_speech",
+    "handle_sigint",
+    "call_id",
+)
+
+# Resolved from the environment when the config is built, read-only afterwards
+SETTINGS = (
+    # API keys
+    "google_api_key",
+    "openai_api_key",
+    "deepgram_api_key",
+    "cartesia_api_key",
+    "elevenlabs_api_key",
+    "anthropic_api_key",
+    "groq_api_key",
+    "together_api_key",
+    "mistral_api_key",
+    "playht_api_key",
+    "playht_user_id",
+    "gladia_api_key",
+    "assemblyai_api_key",
+    "rime_api_key",
+    "aws_access_key_id",
+    "aws_secret_access_key",
+    "aws_region",
+    "ultravox_api_key",
+    # Bot configuration
+    "daily",
+    "architecture_type",
+    "assistant_id",
+    "bot_name",
+    # LLM configuration
+    "llm_provider",
+    "llm_model",
+    "llm_temperature",
+    "llm_params",
+    "llm_hedge_provider",
+    "llm_hedge_model",
+    "llm_hedge_after_ms",
+    "prompt_cache_enabled",
+    "prompt_cache_backend",
+    "context_strategy",
+    "context_max_turns",
+    "tool_timeout_secs",
+    "tool_max_concurrency",
+    "tool_policies",
+    "google_model",
+    "openai_model",
+    # STT configuration
+    "stt_provider",
+    "stt_language",
+    "stt_model",
+    # TTS configuration
+    "tts_provider",
+    "tts_language",
+    "tts_speed",
+    "tts_cache_enabled",
+    "tts_cache_memory_bytes",
+    "tts_cache_disk_bytes",
+    "tts_text_aggregation",
+    "tts_early_flush_min_words",
+    "tts_voice",
+    "deepgram_voice",
+    "cartesia_voice",
+    "elevenlabs_voice_id",
+    "rime_voice_id",
+    "rime_reduce_latency",
+    "rime_speed_alpha",
+    "audio_out_sample_rate",
+    "provider_warmup_enabled",
+    "pipeline_ready_timeout",
+    "audio_cache_dir",
+    "analysis_queue_dir",
+    "latency_metrics_dir",
+    "call_events_url",
+    "call_events_token",
+    "provider_routing",
+    # Filters and Extras
+    "enable_stt_mute_filter",
+    "amd_enabled",
+    "stt_keywords",
+    "agent_type",
+    "classifier_model",
+    "_speak_first",
+)
+
+
+def provider_setting(settings: Dict[Optional[str], Tuple[str, str]], provider: str) -> str:
+    """Name of the variable holding the provider's model or voice in `settings`."""
+    return settings.get(provider, settings[None])[0]
+
+
+def _is_truthy(value: Optional[str]) -> bool:
+    if not value:
+        return False
+    return value.lower() in (
+        "true",
+        "1",
+        "t",
+        "yes",
+        "y",
+        "on",
+        "enable",
+        "enabled",
+        "si",
+        "ok",
+        "okay",
+    )
+
+
+def _parse_json(value: Optional[str]) -> Optional[Any]:
+    if not value:
+        return None
+    try:
+        return json.loads(value)
+    except json.JSONDecodeError:
+        return None
+
 
 class BotConfig:
-    def __init__(self):
+    """Settings of one bot, resolved from the environment when the config is built.
+
+    `env` is the process environment or the per-call mapping bot_runner resolves from the
+    call spec. Every setting is parsed once into a slot, so reading one in the pipeline is
+    a plain attribute lookup; settings cannot be assigned afterwards, a config with other
+    settings (provider routing, a standby bot's call) comes from `with_env`.
+    """
+
+    __slots__ = ("env", "_google_params", "_openai_params", *CALL_ATTRIBUTES, *SETTINGS)
+
+    def __init__(self, env: Optional[Dict[str, str]] = None):
         load_dotenv()
+        self.env = os.environ if env is None else env
 
         self.tools: List[Dict[str, Any]] = []
         self.flow_config: Optional[Any] = None
@@ -28,10 +205,74 @@ class BotConfig:
         self.initial_delay: float = 0.0
         self.initial_message_interruptible: bool = True
         self.interruptibility: bool = True
+        self.prerendered_audio: bool = True
+        # {"threshold_ms": ..., "phrases": [...]} when filler speech is enabled
+        self.filler_speech: Optional[Dict[str, Any]] = None
+        # Bot workers run many calls per process and handle signals themselves
+        self.handle_sigint: bool = True
+        # Identifies the call in post-call jobs; the server passes its own id via CALL_ID
+        self.call_id: str = self.env.get("CALL_ID") or uuid.uuid4().hex
+
+        # Built on first use, they import the provider SDK
+        self._google_params = None
+        self._openai_params = None
+
+        self._resolve(self.env)
+
+    def __setattr__(self, name: str, value: Any):
+        if name in SETTINGS and hasattr(self, name):
+            raise AttributeError(f"BotConfig.{name} is resolved from the environment, see with_env")
+        object.__setattr__(self, name, value)
+
+    def __repr__(self) -> str:
+        return (
+            f"BotConfig(architecture_type={self.architecture_type}, bot_name={self.bot_name}, "
+            f"llm_provider={self.llm_provider}, tts_provider={self.tts_provider})"
+        )
+
+    def with_env(self, settings: Dict[str, str]) -> "BotConfig":
+        """A config resolved from this one's environment updated with `settings`.
+
+        The attributes set after construction (CALL_ATTRIBUTES) are carried over, except
+        call_id when the settings name the call (CALL_ID).
+        """
+        config = BotConfig(env={**self.env, **settings})
+        for name in CALL_ATTRIBUTES:
+            if name != "call_id" or "CALL_ID" not in settings:
+                setattr(config, name, getattr(self, name))
+        return config
+
+    def _resolve(self, env: Dict[str, str]):
+        ###########################################################################
+        # API keys
+        ###########################################################################
+
+        self.google_api_key: Optional[str] = env.get("GOOGLE_API_KEY")
+        self.openai_api_key: Optional[str] = env.get("OPENAI_API_KEY")
+        self.deepgram_api_key: Optional[str] = env.get("DEEPGRAM_API_KEY")
+        self.cartesia_api_key: Optional[str] = env.get("CARTESIA_API_KEY")
+        self.elevenlabs_api_key: Optional[str] = env.get("ELEVENLABS_API_KEY")
+        self.anthropic_api_key: Optional[str] = env.get("ANTHROPIC_API_KEY")
+        self.groq_api_key: Optional[str] = env.get("GROQ_API_KEY")
+        self.together_api_key: Optional[str] = env.get("TOGETHER_API_KEY")
+        self.mistral_api_key: Optional[str] = env.get("MISTRAL_API_KEY")
+        self.playht_api_key: Optional[str] = env.get("PLAYHT_API_KEY")
+        self.playht_user_id: Optional[str] = env.get("PLAYHT_USER_ID")
+        self.gladia_api_key: Optional[str] = env.get("GLADIA_API_KEY")
+        self.assemblyai_api_key: Optional[str] = env.get("ASSEMBLYAI_API_KEY")
+        self.rime_api_key: Optional[str] = env.get("RIME_API_KEY")
+        self.aws_access_key_id: Optional[str] = env.get("AWS_ACCESS_KEY_ID")
+        self.aws_secret_access_key: Optional[str] = env.get("AWS_SECRET_ACCESS_KEY")
+        self.aws_region: str = env.get("AWS_REGION", "us-east-1")
+        self.ultravox_api_key: Optional[str] = env.get("ULTRAVOX_API_KEY")
+
+        ###########################################################################
+        # Bot configuration
+        ###########################################################################
 
         # Validate core required vars
         required = {
-            "DAILY_API_KEY": os.getenv("DAILY_API_KEY"),
+            "DAILY_API_KEY": env.get("DAILY_API_KEY"),
         }
 
         missing = [k for k, v in required.items() if not v]
@@ -40,359 +281,171 @@ class BotConfig:
 
         self.daily: DailyConfig = {
             "api_key": required["DAILY_API_KEY"],
-            "api_url": os.getenv("DAILY_API_URL", "https://api.daily.co/v1"),
+            "api_url": env.get("DAILY_API_URL", "https://api.daily.co/v1"),
         }
 
-        # Bot configuration
-        self._bot_type: BotType = os.getenv("ARCHITECTURE_TYPE", "flow")
-        if self._bot_type not in ("simple", "flow", "multimodal"):
-            self._bot_type = "flow"
-
-    def __repr__(self) -> str:
-        return f"BotConfig(architecture_type={self.architecture_type}, bot_name={self.bot_name}, llm_provider={self.llm_provider}, tts_provider={self.tts_provider})"
-
-    def _is_truthy(self, value: str) -> bool:
-        if not value:
-            return False
-        return value.lower() in (
-            "true",
-            "1",
-            "t",
-            "yes",
-            "y",
-            "on",
-            "enable",
-            "enabled",
-            "si",
-            "ok",
-            "okay",
-        )
-
-    ###########################################################################
-    # API keys
-    ###########################################################################
-
-    @property
-    def google_api_key(self) -> str:
-        return os.getenv("GOOGLE_API_KEY")
-
-    @property
-    def openai_api_key(self) -> str:
-        return os.getenv("OPENAI_API_KEY")
-
-    @property
-    def deepgram_api_key(self) -> str:
-        return os.getenv("DEEPGRAM_API_KEY")
-
-    @property
-    def cartesia_api_key(self) -> str:
-        return os.getenv("CARTESIA_API_KEY")
-
-    @property
-    def elevenlabs_api_key(self) -> str:
-        return os.getenv("ELEVENLABS_API_KEY")
-
-    @property
-    def anthropic_api_key(self) -> str:
-        return os.getenv("ANTHROPIC_API_KEY")
-
-    @property
-    def groq_api_key(self) -> str:
-        return os.getenv("GROQ_API_KEY")
-
-    @property
-    def together_api_key(self) -> str:
-        return os.getenv("TOGETHER_API_KEY")
-
-    @property
-    def mistral_api_key(self) -> str:
-        return os.getenv("MISTRAL_API_KEY")
-
-    @property
-    def playht_api_key(self) -> str:
-        return os.getenv("PLAYHT_API_KEY")
-
-    @property
-    def playht_user_id(self) -> str:
-        return os.getenv("PLAYHT_USER_ID")
-
-    @property
-    def gladia_api_key(self) -> str:
-        return os.getenv("GLADIA_API_KEY")
-
-    @property
-    def assemblyai_api_key(self) -> str:
-        return os.getenv("ASSEMBLYAI_API_KEY")
-
-    @property
-    def rime_api_key(self) -> str:
-        return os.getenv("RIME_API_KEY")
-
-    @property
-    def aws_access_key_id(self) -> str:
-        return os.getenv("AWS_ACCESS_KEY_ID")
-
-    @property
-    def aws_secret_access_key(self) -> str:
-        return os.getenv("AWS_SECRET_ACCESS_KEY")
-
-    @property
-    def aws_region(self) -> str:
-        return os.getenv("AWS_REGION", "us-east-1")
-
-    @property
-    def ultravox_api_key(self) -> str:
-        return os.getenv("ULTRAVOX_API_KEY")
-
-    ###########################################################################
-    # Bot configuration
-    ###########################################################################
-
-    @property
-    def architecture_type(self) -> BotType:
-        return self._bot_type
-
-    @architecture_type.setter
-    def architecture_type(self, value: BotType):
-        self._bot_type = value
-        os.environ["ARCHITECTURE_TYPE"] = value
-
-    @property
-    def bot_name(self) -> str:
-        return os.getenv("BOT_NAME", "Marissa")
-
-    @bot_name.setter
-    def bot_name(self, value: str):
-        os.environ["BOT_NAME"] = value
-
-    ###########################################################################
-    # LLM configuration
-    ###########################################################################
-
-    @property
-    def llm_provider(self) -> str:
-        return os.getenv("LLM_PROVIDER", "google").lower()
-
-    @llm_provider.setter
-    def llm_provider(self, value: str):
-        os.environ["LLM_PROVIDER"] = value.lower()
-
-    @property
-    def llm_model(self) -> str:
-        match self.llm_provider:
-            case "google":
-                return os.getenv("GOOGLE_MODEL", "gemini-2.5-flash")
-            case "openai":
-                return os.getenv("OPENAI_MODEL", "gpt-5o")
-            case "anthropic":
-                return os.getenv("ANTHROPIC_MODEL", "claude-3-5-sonnet-20241022")
-            case "groq":
-                return os.getenv("GROQ_MODEL", "llama-3.3-70b-versatile")
-            case "together":
-                return os.getenv("TOGETHER_MODEL", "meta-llama/Llama-3.3-70B-Instruct-Turbo")
-            case "mistral":
-                return os.getenv("MISTRAL_MODEL", "mistral-large-latest")
-            case "ultravox":
-                return os.getenv("ULTRAVOX_MODEL", "fixie-ai/ultravox")
-            case _:
-                return os.getenv("LLM_MODEL", "")
-
-    @llm_model.setter
-    def llm_model(self, value: str):
-        match self.llm_provider:
-            case "google":
-                os.environ["GOOGLE_MODEL"] = value
-            case "openai":
-                os.environ["OPENAI_MODEL"] = value
-            case "anthropic":
-                os.environ["ANTHROPIC_MODEL"] = value
-            case "groq":
-                os.environ["GROQ_MODEL"] = value
-            case "together":
-                os.environ["TOGETHER_MODEL"] = value
-            case "mistral":
-                os.environ["MISTRAL_MODEL"] = value
-            case "ultravox":
-                os.environ["ULTRAVOX_MODEL"] = value
-
-    @property
-    def llm_temperature(self) -> float:
-        return float(os.getenv("LLM_TEMPERATURE", 0.7))
-
-    @property
-    def llm_params(self) -> dict:
-        return {"temperature": self.llm_temperature}
-
-    # Backward compatibility properties (kept for original bots if needed)
-    @property
-    def google_model(self) -> str:
-        return self.llm_model
-
-    @property
-    def google_params(self) -> GoogleLLMService.InputParams:
-        return GoogleLLMService.InputParams(temperature=self.llm_params["temperature"])
-
-    @property
-    def openai_model(self) -> str:
-        return self.llm_model
-
-    @property
-    def openai_params(self) -> BaseOpenAILLMService.InputParams:
-        return BaseOpenAILLMService.InputParams(temperature=self.llm_params["temperature"])
-
-    ###########################################################################
-    # STT configuration
-    ###########################################################################
-
-    @property
-    def stt_provider(self) -> str:
-        provider = os.getenv("STT_PROVIDER")
+        bot_type = env.get("ARCHITECTURE_TYPE", "flow")
+        if bot_type not in ("simple", "flow", "multimodal"):
+            bot_type = "flow"
+        self.architecture_type: BotType = bot_type
+        self.assistant_id: Optional[str] = env.get("ASSISTANT_ID")
+        self.bot_name: str = env.get("BOT_NAME", "Marissa")
+
+        ###########################################################################
+        # LLM configuration
+        ###########################################################################
+
+        self.llm_provider: str = env.get("LLM_PROVIDER", "google").lower()
+        self.llm_model: str = self.default_llm_model(self.llm_provider)
+        self.llm_temperature: float = float(env.get("LLM_TEMPERATURE", 0.7))
+        self.llm_params: dict = {"temperature": self.llm_temperature}
+
+        # Secondary provider that slow LLM requests are hedged to (disabled when unset)
+        hedge_provider = env.get("LLM_HEDGE_PROVIDER")
+        self.llm_hedge_provider: Optional[str] = hedge_provider.lower() if hedge_provider else None
+        self.llm_hedge_model: Optional[str] = None
+        if self.llm_hedge_provider:
+            self.llm_hedge_model = env.get("LLM_HEDGE_MODEL") or self.default_llm_model(
+                self.llm_hedge_provider
+            )
+        # Fixed hedge budget; when unset the primary's observed p95 first-token time is used
+        hedge_after_ms = env.get("LLM_HEDGE_AFTER_MS")
+        self.llm_hedge_after_ms: Optional[float] = float(hedge_after_ms) if hedge_after_ms else None
+
+        self.prompt_cache_enabled: bool = _is_truthy(env.get("PROMPT_CACHE_ENABLED", "true"))
+        # Where prompt cache handles live: file (shared by all bots) or local (in memory)
+        self.prompt_cache_backend: str = env.get("PROMPT_CACHE_BACKEND", "file").lower()
+        # How the LLM context is bounded: none, sliding_window or summarize
+        self.context_strategy: str = env.get("CONTEXT_STRATEGY", "none").lower()
+        self.context_max_turns: int = int(env.get("CONTEXT_MAX_TURNS", 12))
+        self.tool_timeout_secs: float = float(env.get("TOOL_TIMEOUT_SECS", 8))
+        self.tool_max_concurrency: int = int(env.get("TOOL_MAX_CONCURRENCY", 4))
+        # Per-tool overrides of timeout, cache TTL, parallelism and invalidations
+        self.tool_policies: Dict[str, Dict[str, Any]] = _parse_json(env.get("TOOL_POLICIES")) or {}
+
+        # Backward compatibility settings (kept for original bots if needed)
+        self.google_model: str = self.llm_model
+        self.openai_model: str = self.llm_model
+
+        ###########################################################################
+        # STT configuration
+        ###########################################################################
+
+        stt_provider = env.get("STT_PROVIDER")
         # If multimodal, default to the native provider unless an explicit non-default is provided
-        if self.architecture_type == "multimodal":
-            if not provider or provider.lower() in ["deepgram"]:
-                return self.llm_provider
-        return (provider or "deepgram").lower()
-
-    @stt_provider.setter
-    def stt_provider(self, value: str):
-        os.environ["STT_PROVIDER"] = value.lower()
-
-    @property
-    def stt_language(self) -> str:
-        return os.getenv("STT_LANGUAGE", "en")
-
-    @stt_language.setter
-    def stt_language(self, value: str):
-        os.environ["STT_LANGUAGE"] = value
-
-    @property
-    def stt_model(self) -> str:
-        match self.stt_provider:
-            case "deepgram":
-                return os.getenv("DEEPGRAM_STT_MODEL", "nova-3-general")
-            case _:
-                return os.getenv("STT_MODEL", "")
-
-    ###########################################################################
-    # TTS configuration
-    ###########################################################################
-
-    @property
-    def tts_provider(self) -> str:
-        provider = os.getenv("TTS_PROVIDER")
+        if self.architecture_type == "multimodal" and (
+            not stt_provider or stt_provider.lower() in ["deepgram"]
+        ):
+            stt_provider = self.llm_provider
+        self.stt_provider: str = (stt_provider or "deepgram").lower()
+        self.stt_language: str = env.get("STT_LANGUAGE", "en")
+        self.stt_model: str = self.default_stt_model(self.stt_provider)
+
+        ###########################################################################
+        # TTS configuration
+        ###########################################################################
+
+        tts_provider = env.get("TTS_PROVIDER")
         # If multimodal, default to the native provider unless an explicit non-default is provided
-        if self.architecture_type == "multimodal":
-            if not provider or provider.lower() in ["cartesia", "deepgram"]:
-                return self.llm_provider
-        return (provider or "deepgram").lower()
-
-    @tts_provider.setter
-    def tts_provider(self, value: str):
-        os.environ["TTS_PROVIDER"] = value.lower()
-
-    @property
-    def tts_language(self) -> str:
-        return os.getenv("TTS_LANGUAGE", "en")
-
-    @tts_language.setter
-    def tts_language(self, value: str):
-        os.environ["TTS_LANGUAGE"] = value
-
-    @property
-    def tts_speed(self) -> float:
-        return float(os.getenv("TTS_SPEED", 1.0))
-
-    @property
-    def tts_voice(self) -> str:
-        match self.tts_provider:
-            case "deepgram":
-                return os.getenv("DEEPGRAM_VOICE", "aura-athena-en")
-            case "cartesia":
-                return os.getenv("CARTESIA_VOICE", "79a125e8-cd45-4c13-8a67-188112f4dd22")
-            case "elevenlabs":
-                return os.getenv("ELEVENLABS_VOICE_ID", "JBFqnCBsd6RMkjVDRZzb")
-            case "playht":
-                return os.getenv(
-                    "PLAYHT_VOICE_ID",
-                    "s3://voice-training-authenticated/original_voices/marissa_extracted/manifest.json",
-                )
-            case "rime":
-                return os.getenv("RIME_VOICE_ID", "marissa")
-            case "openai":
-                return os.getenv("OPENAI_VOICE", "alloy")
-            case "azure":
-                return os.getenv("AZURE_VOICE", "en-US-AvaMultilingualNeural")
-            case "ultravox":
-                return os.getenv(
-                    "ULTRAVOX_VOICE", "a6afd1fc-960f-45d3-9e46-e8182af650b9"
-                )  # Default to 'Clive'
-            case _:
-                return os.getenv("TTS_VOICE", "")
-
-    # Backward compatibility properties
-    @property
-    def deepgram_voice(self) -> str:
-        return (
-            self.tts_voice
-            if self.tts_provider == "deepgram"
-            else os.getenv("DEEPGRAM_VOICE", "aura-athena-en")
+        if self.architecture_type == "multimodal" and (
+            not tts_provider or tts_provider.lower() in ["cartesia", "deepgram"]
+        ):
+            tts_provider = self.llm_provider
+        self.tts_provider: str = (tts_provider or "deepgram").lower()
+        self.tts_language: str = env.get("TTS_LANGUAGE", "en")
+        self.tts_speed: float = float(env.get("TTS_SPEED", 1.0))
+        self.tts_cache_enabled: bool = _is_truthy(env.get("TTS_CACHE_ENABLED", "false"))
+        self.tts_cache_memory_bytes: int = int(
+            float(env.get("TTS_CACHE_MEMORY_MB", 32)) * 1024 * 1024
         )
-
-    @property
-    def cartesia_voice(self) -> str:
-        return (
-            self.tts_voice
-            if self.tts_provider == "cartesia"
-            else os.getenv("CARTESIA_VOICE", "79a125e8-cd45-4c13-8a67-188112f4dd22")
+        self.tts_cache_disk_bytes: int = int(float(env.get("TTS_CACHE_DISK_MB", 512)) * 1024 * 1024)
+        # How LLM text is split for TTS: sentence (TTS default) or early_flush
+        self.tts_text_aggregation: str = env.get("TTS_TEXT_AGGREGATION", "sentence").lower()
+        self.tts_early_flush_min_words: int = int(env.get("TTS_EARLY_FLUSH_MIN_WORDS", 4))
+        self.tts_voice: str = self.default_tts_voice(self.tts_provider)
+
+        # Backward compatibility settings
+        self.deepgram_voice: str = self.default_tts_voice("deepgram")
+        self.cartesia_voice: str = self.default_tts_voice("cartesia")
+        self.elevenlabs_voice_id: str = self.default_tts_voice("elevenlabs")
+        self.rime_voice_id: str = self.default_tts_voice("rime")
+        self.rime_reduce_latency: bool = _is_truthy(env.get("RIME_REDUCE_LATENCY", "false"))
+        self.rime_speed_alpha: float = float(env.get("RIME_SPEED_ALPHA", 1.0))
+
+        self.audio_out_sample_rate: int = int(env.get("AUDIO_OUT_SAMPLE_RATE", 24000))
+        # Time DNS and TLS to the call's providers (diagnostics, reported in call_ended)
+        self.provider_warmup_enabled: bool = _is_truthy(env.get("PROVIDER_WARMUP_ENABLED", "false"))
+        # How long the greeting waits for every service to finish connecting
+        self.pipeline_ready_timeout: float = float(env.get("PIPELINE_READY_TIMEOUT_SECS", 5))
+        self.audio_cache_dir: Optional[str] = env.get("AUDIO_CACHE_DIR")
+        self.analysis_queue_dir: Optional[str] = env.get("ANALYSIS_QUEUE_DIR")
+        self.latency_metrics_dir: Optional[str] = env.get("LATENCY_METRICS_DIR")
+        # Where the bot reports its call state; set per call by the server
+        self.call_events_url: Optional[str] = env.get("CALL_EVENTS_URL")
+        self.call_events_token: Optional[str] = env.get("CALL_EVENTS_TOKEN")
+        # Allowed providers per service kind, chosen by observed latency at call start
+        self.provider_routing: Optional[Dict[str, Any]] = _parse_json(env.get("PROVIDER_ROUTING"))
+
+        ###########################################################################
+        # Filters and Extras
+        ###########################################################################
+
+        self.enable_stt_mute_filter: bool = _is_truthy(env.get("ENABLE_STT_MUTE_FILTER", "false"))
+        self.amd_enabled: bool = _is_truthy(env.get("AMD_ENABLED", "false"))
+        keywords = env.get("STT_KEYWORDS")
+        self.stt_keywords: List[str] = keywords.split(",") if keywords else []
+        self.agent_type: str = env.get("AGENT_TYPE", "inbound")
+        self.classifier_model: str = env.get("CLASSIFIER_MODEL", "gemini-3.0-flash")
+        speak_first = env.get("SPEAK_FIRST")
+        self._speak_first: Optional[bool] = (
+            _is_truthy(speak_first) if speak_first is not None else None
         )
 
-    @property
-    def elevenlabs_voice_id(self) -> str:
-        return (
-            self.tts_voice
-            if self.tts_provider == "elevenlabs"
-            else os.getenv("ELEVENLABS_VOICE_ID", "JBFqnCBsd6RMkjVDRZzb")
-        )
+    ###########################################################################
+    # Per-provider settings, read when routing picks another provider
+    ###########################################################################
 
-    @property
-    def rime_voice_id(self) -> str:
-        return (
-            self.tts_voice if self.tts_provider == "rime" else os.getenv("RIME_VOICE_ID", "marissa")
-        )
+    def default_llm_model(self, provider: str) -> str:
+        name, default = LLM_MODEL_SETTINGS.get(provider, LLM_MODEL_SETTINGS[None])
+        return self.env.get(name, default)
 
-    @property
-    def rime_reduce_latency(self) -> bool:
-        return self._is_truthy(os.getenv("RIME_REDUCE_LATENCY", "false"))
+    def default_stt_model(self, provider: str) -> str:
+        name, default = STT_MODEL_SETTINGS.get(provider, STT_MODEL_SETTINGS[None])
+        return self.env.get(name, default)
 
-    @property
-    def rime_speed_alpha(self) -> float:
-        return float(os.getenv("RIME_SPEED_ALPHA", 1.0))
+    def default_tts_voice(self, provider: str) -> str:
+        name, default = TTS_VOICE_SETTINGS.get(provider, TTS_VOICE_SETTINGS[None])
+        return self.env.get(name, default)
+
+    def secret(self, name: str) -> Optional[str]:
+        """Per-call secret (CallConfig.secrets) passed to the bot as an environment variable."""
+        return self.env.get(name)
 
     ###########################################################################
-    # Filters and Extras
+    # Derived settings
     ###########################################################################
 
     @property
-    def enable_stt_mute_filter(self) -> bool:
-        return self._is_truthy(os.getenv("ENABLE_STT_MUTE_FILTER", "false"))
+    def google_params(self) -> "GoogleLLMService.InputParams":
+        if self._google_params is None:
+            from pipecat.services.google.llm import GoogleLLMService
 
-    @property
-    def amd_enabled(self) -> bool:
-        return self._is_truthy(os.getenv("AMD_ENABLED", "false"))
+            self._google_params = GoogleLLMService.InputParams(temperature=self.llm_temperature)
+        return self._google_params
 
     @property
-    def agent_type(self) -> str:
-        return os.getenv("AGENT_TYPE", "inbound")
+    def openai_params(self) -> "BaseOpenAILLMService.InputParams":
+        if self._openai_params is None:
+            from pipecat.services.openai.llm import BaseOpenAILLMService
 
-    @agent_type.setter
-    def agent_type(self, value: str):
-        os.environ["AGENT_TYPE"] = value
+            self._openai_params = BaseOpenAILLMService.InputParams(temperature=self.llm_temperature)
+        return self._openai_params
 
     @property
     def speak_first(self) -> bool:
         # Check explicit env var first
-        if os.getenv("SPEAK_FIRST") is not None:
-            return self._is_truthy(os.getenv("SPEAK_FIRST"))
+        if self._speak_first is not None:
+            return self._speak_first
 
         # If initial_message is set, we should speak first
         if self.initial_message:
@@ -400,11 +453,3 @@ class BotConfig:
 
         # Fallback to type-based logic: Outbound speaks first, Inbound waits
         return self.agent_type == "outbound"
-
-    @speak_first.setter
-    def speak_first(self, value: bool):
-        os.environ["SPEAK_FIRST"] = "true" if value else "false"
-
-    @property
-    def classifier_model(self) -> str:
-        return os.getenv("CLASSIFIER_MODEL", "gemini-3.0-flash")
@@ -0,0 +1,162 @@
+"""What a bot needs to run one call, built once by the server and handed to the bot."""
+
+import json
+import os
+import struct
+import tempfile
+from typing import Any, Dict, List, Literal, Optional
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from app.Domains.Assistant.Models.assistant import Assistant
+
+# Encoded spec: magic, format version and payload length, then the JSON payload
+SPEC_MAGIC = b"TCSP"
+SPEC_VERSION = 1
+SPEC_HEADER = struct.Struct("!4sBI")
+
+
+def assistant_settings(assistant: Assistant) -> Dict[str, Optional[str]]:
+    """BotConfig settings (environment variable names) of an assistant; None unsets one."""
+    agent = assistant.agent
+    io_layer = assistant.io_layer
+    multimodal = assistant.architecture_type == "multimodal"
+
+    settings: Dict[str, Optional[str]] = {
+        # Core
+        "ASSISTANT_ID": assistant.id,
+        "BOT_NAME": assistant.name,
+        "ARCHITECTURE_TYPE": assistant.architecture_type,
+        # Agent / LLM
+        "LLM_PROVIDER": agent.provider,
+        "LLM_TEMPERATURE": str(agent.temperature),
+        "TOOL_TIMEOUT_SECS": str(agent.tool_runtime.default_timeout_secs),
+        "TOOL_MAX_CONCURRENCY": str(agent.tool_runtime.max_concurrency),
+        "CONTEXT_STRATEGY": agent.context_management.strategy,
+        "CONTEXT_MAX_TURNS": str(agent.context_management.max_turns),
+        "SPEAK_FIRST": "true" if assistant.pipeline_settings.speak_first else "false",
+    }
+    if agent.model:
+        settings["LLM_MODEL"] = agent.model
+    if agent.tool_runtime.tools:
+        settings["TOOL_POLICIES"] = json.dumps(
+            {name: policy.model_dump() for name, policy in agent.tool_runtime.tools.items()}
+        )
+    if agent.hedge:
+        settings["LLM_HEDGE_PROVIDER"] = agent.hedge.provider
+        if agent.hedge.model:
+            settings["LLM_HEDGE_MODEL"] = agent.hedge.model
+        if agent.hedge.after_ms:
+            settings["LLM_HEDGE_AFTER_MS"] = str(agent.hedge.after_ms)
+
+    # IO Layer; realtime models do their own STT/TTS unless the assistant sets one
+    stt, tts = io_layer.stt, io_layer.tts
+    if stt:
+        settings["STT_PROVIDER"] = stt.provider
+        if stt.model:
+            settings["STT_MODEL"] = stt.model
+        if stt.language:
+            settings["STT_LANGUAGE"] = stt.language
+        if stt.enable_mute_filter:
+            settings["ENABLE_STT_MUTE_FILTER"] = "true"
+    elif multimodal:
+        settings["STT_PROVIDER"] = None
+
+    if tts:
+        settings["TTS_PROVIDER"] = tts.provider
+        if tts.voice_id:
+            settings["TTS_VOICE"] = tts.voice_id
+        if tts.language:
+            settings["TTS_LANGUAGE"] = tts.language
+        if tts.cache_enabled:
+            settings["TTS_CACHE_ENABLED"] = "true"
+        settings["TTS_TEXT_AGGREGATION"] = tts.text_aggregation
+        settings["TTS_EARLY_FLUSH_MIN_WORDS"] = str(tts.early_flush_min_words)
+    elif multimodal:
+        settings["TTS_PROVIDER"] = None
+
+    if io_layer.sip.amd_enabled:
+        settings["AMD_ENABLED"] = "true"
+
+    # Latency-aware provider routing
+    if assistant.routing and assistant.routing.enabled:
+        settings["PROVIDER_ROUTING"] = assistant.routing.model_dump_json()
+
+    return settings
+
+
+class CallSpec(BaseModel):
+    """Validated, immutable description of a call for bot_runner and the bot workers.
+
+    Replaces the CLI flags and environment variables the server used to pass per call: the
+    bot gets the assistant itself instead of re-reading it from disk, and its BotConfig is
+    resolved from `settings()` without touching the process environment.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    room_url: Optional[str] = None
+    token: Optional[str] = None
+    assistant: Optional[Assistant] = None
+    agent_type: Optional[Literal["inbound", "outbound"]] = None
+    prompt_variables: Optional[Dict[str, Any]] = None
+    stt_keywords: List[str] = Field(default_factory=list)
+    # Per-call environment: CallConfig.secrets and the call id and events endpoint
+    env: Dict[str, str] = Field(default_factory=dict)
+
+    def settings(self) -> Dict[str, Optional[str]]:
+        settings = assistant_settings(self.assistant) if self.assistant else {}
+        if self.agent_type:
+            settings["AGENT_TYPE"] = self.agent_type
+        if self.stt_keywords:
+            settings["STT_KEYWORDS"] = ",".join(self.stt_keywords)
+        settings.update(self.env)
+        return settings
+
+    def for_standby(self) -> "CallSpec":
+        """The spec without what is only known once the call exists (standby bots)."""
+        return self.model_copy(
+            update={"room_url": None, "token": None, "prompt_variables": None, "env": {}}
+        )
+
+    def encode(self) -> bytes:
+        payload = self.model_dump_json(exclude_defaults=True).encode()
+        return SPEC_HEADER.pack(SPEC_MAGIC, SPEC_VERSION, len(payload)) + payload
+
+    @classmethod
+    def decode(cls, data: bytes) -> "CallSpec":
+        if len(data) < SPEC_HEADER.size:
+            raise ValueError("Call spec truncated")
+        magic, version, length = SPEC_HEADER.unpack_from(data)
+        if magic != SPEC_MAGIC or version != SPEC_VERSION:
+            raise ValueError(f"Not a call spec (version {SPEC_VERSION})")
+        payload = data[SPEC_HEADER.size : SPEC_HEADER.size + length]
+        if len(payload) != length:
+            raise ValueError("Call spec truncated")
+        return cls.model_validate_json(payload)
+
+
+def write_spec_fd(spec: CallSpec) -> int:
+    """Anonymous in-memory file holding the encoded spec, for the bot to inherit.
+
+    Unlike a pipe, writing never blocks on a bot that has not started reading yet. The
+    caller closes its descriptor once the bot is spawned.
+    """
+    data = spec.encode()
+    if hasattr(os, "memfd_create"):
+        fd = os.memfd_create("call-spec")
+    else:
+        with tempfile.TemporaryFile() as f:
+            fd = os.dup(f.fileno())
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view) :]
+    return fd
+
+
+def read_spec_fd(fd: int) -> CallSpec:
+    """Read (from the start, whatever the shared offset) and close a spec descriptor."""
+    try:
+        return CallSpec.decode(os.pread(fd, os.fstat(fd).st_size, 0))
+    finally:
+        os.close(fd)
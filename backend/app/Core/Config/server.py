@@ -21,6 +21,64 @@ class ServerConfig:
         # Bot settings
         self.max_bots_per_room: int = int(os.getenv("MAX_BOTS_PER_ROOM", "1"))
 
+        # Bot worker processes running many calls each (0: one process per call)
+        workers = os.getenv("BOT_WORKERS", "0").lower()
+        self.bot_workers: int = (os.cpu_count() or 1) if workers == "auto" else int(workers)
+
+        # Fork bots from a pre-initialized zygote instead of starting a fresh interpreter
+        self.bot_zygote_enabled: bool = os.getenv("BOT_ZYGOTE_ENABLED", "false").lower() == "true"
+        self.bot_zygote_socket: str = os.getenv("BOT_ZYGOTE_SOCKET", "")
+
+        # Standby bot pool (0 disables it)
+        self.bot_pool_size: int = int(os.getenv("BOT_POOL_SIZE", "0"))
+        self.bot_pool_assistants: list = [
+            a.strip() for a in os.getenv("BOT_POOL_ASSISTANTS", "").split(",") if a.strip()
+        ]
+        self.bot_pool_top_assistants: int = int(os.getenv("BOT_POOL_TOP_ASSISTANTS", "3"))
+        self.bot_pool_max_idle_secs: float = float(os.getenv("BOT_POOL_MAX_IDLE_SECS", "300"))
+
+        # Per-bot CPU, memory and I/O sampling from /proc (0 disables it)
+        self.bot_sample_interval_secs: float = float(os.getenv("BOT_SAMPLE_INTERVAL_SECS", "2"))
+        self.bot_sample_history: int = int(os.getenv("BOT_SAMPLE_HISTORY", "60"))
+        self.bot_runaway_cpu_percent: float = float(os.getenv("BOT_RUNAWAY_CPU_PERCENT", "90"))
+        self.bot_runaway_secs: float = float(os.getenv("BOT_RUNAWAY_SECS", "30"))
+
+        # Pool of Daily rooms with tokens created ahead of calls (0 disables it)
+        self.room_pool_size: int = int(os.getenv("ROOM_POOL_SIZE", "0"))
+        self.room_pool_room_ttl_secs: float = float(
+            os.getenv("ROOM_POOL_ROOM_TTL_SECS", str(24 * 60 * 60))
+        )
+        self.room_pool_token_ttl_secs: float = float(os.getenv("ROOM_POOL_TOKEN_TTL_SECS", "600"))
+
+        # Admission control (0 disables a limit)
+        self.max_concurrent_calls: int = int(os.getenv("MAX_CONCURRENT_CALLS", "0"))
+        self.admission_max_cpu_percent: float = float(
+            os.getenv("ADMISSION_MAX_CPU_PERCENT", "90")
+        )
+        self.admission_min_free_memory_mb: float = float(
+            os.getenv("ADMISSION_MIN_FREE_MEMORY_MB", "512")
+        )
+        self.admission_queue_size: int = int(os.getenv("ADMISSION_QUEUE_SIZE", "50"))
+        self.admission_queue_timeout_secs: float = float(
+            os.getenv("ADMISSION_QUEUE_TIMEOUT_SECS", "15")
+        )
+        self.admission_retry_after_secs: float = float(
+            os.getenv("ADMISSION_RETRY_AFTER_SECS", "5")
+        )
+
+        # Call registry: "memory", or "file" to keep calls across restarts
+        self.call_registry_backend: str = os.getenv("CALL_REGISTRY_BACKEND", "memory").lower()
+        self.call_registry_dir: str = os.getenv("CALL_REGISTRY_DIR", "")
+        # Where bots report their call state; the server itself by default
+        self.call_events_base_url: str = os.getenv(
+            "CALL_EVENTS_BASE_URL", f"http://127.0.0.1:{self.port}"
+        ).rstrip("/")
+
+        # Shutdown: how long SIGTERM waits for active calls before the server exits
+        self.drain_timeout_secs: float = float(os.getenv("DRAIN_TIMEOUT_SECS", "300"))
+        # Unix socket where the next server takes over the running calls ("" disables it)
+        self.handover_socket: str = os.getenv("HANDOVER_SOCKET", "")
+
         # Validate required settings
         if not self.daily_api_key:
             raise ValueError("DAILY_API_KEY environment variable must be set")
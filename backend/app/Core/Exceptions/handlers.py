@@ -29,6 +29,7 @@ def register_exception_handlers(app: Any):
         return JSONResponse(
             status_code=exc.status_code,
             content=response.model_dump(by_alias=True, exclude_none=True),
+            headers=exc.headers,
         )
 
     @app.exception_handler(RequestValidationError)
@@ -3,14 +3,13 @@
 import asyncio
 import time
 from abc import ABC, abstractmethod
-from typing import Dict, List, Optional
+from typing import TYPE_CHECKING, Dict, List, Optional
 
 from loguru import logger
-from pipecat.audio.vad.silero import SileroVADAnalyzer
 from pipecat.frames.frames import (
-    LLMMessagesUpdateFrame,
-    LLMRunFrame,
+    LLMMessagesAppendFrame,
     TranscriptionFrame,
+    TTSSpeakFrame,
     UserStartedSpeakingFrame,
     UserStoppedSpeakingFrame,
 )
@@ -19,26 +18,52 @@ from pipecat.pipeline.runner import PipelineRunner
 from pipecat.pipeline.task import PipelineParams, PipelineTask
 from pipecat.processors.aggregators.llm_context import LLMContext
 from pipecat.processors.aggregators.llm_response_universal import LLMContextAggregatorPair
-from pipecat.processors.filters.function_filter import FunctionFilter
 from pipecat.processors.filters.stt_mute_filter import (
     STTMuteConfig,
     STTMuteFilter,
     STTMuteStrategy,
 )
-from pipecat.services.llm_service import FunctionCallParams
 from pipecat.processors.frameworks.rtvi import RTVIConfig, RTVIProcessor
 from pipecat.processors.user_idle_processor import UserIdleProcessor
-from pipecat.transports.daily.transport import DailyParams, DailyTransport, VADParams
+from pipecat.services.llm_service import FunctionCallParams
 
+from app.Domains.Agent.Cache.audio_cache import PrerenderedAudioCache, audio_cache_key
+from app.Domains.Agent.Cache.prerender import prerender_phrases
+from app.Domains.Agent.Cache.prompt_cache import get_prompt_cache_registry
+from app.Domains.Agent.Cache.tts_cache import TTSOutputCache, get_tts_output_cache
 from app.Domains.Agent.Factory.service_factory import ServiceFactory
-from app.Domains.Agent.Transports.asterisk.serializer import AsteriskWsFrameSerializer
-from app.Domains.Agent.Transports.asterisk.transport import (
-    AsteriskWSServerParams,
-    AsteriskWSServerTransport,
+from app.Domains.Agent.Metrics.latency import LatencyStore
+from app.Domains.Agent.Metrics.provider_ledger import get_provider_ledger
+from app.Domains.Agent.Observers.frame_tap_observer import FrameTapObserver
+from app.Domains.Agent.Observers.latency_observer import LatencyObserver
+from app.Domains.Agent.Observers.prompt_cache_observer import PromptCacheObserver
+from app.Domains.Agent.Observers.provider_ledger_observer import ProviderLedgerObserver
+from app.Domains.Agent.Observers.startup_observer import StartupObserver
+from app.Domains.Agent.Processors.context_window import ContextWindowManager, llm_summarizer
+from app.Domains.Agent.Processors.early_flush import EarlyFlushTextAggregator
+from app.Domains.Agent.Processors.filler_speech import (
+    DEFAULT_FILLER_PHRASES,
+    FillerSpeechProcessor,
+)
+from app.Domains.Agent.Processors.hedged_llm import HedgedLLMService
+from app.Domains.Agent.Processors.prerendered_audio import (
+    PrerenderedAudioRecorder,
+    play_prerendered_audio,
 )
+from app.Domains.Agent.Tools.runtime import ToolRuntime, tool_policies_from_config
+from app.Domains.Agent.Tools.schema import tools_schema_from_config
+from app.Domains.Agent.Warmup.provider_warmup import provider_hosts, warm_up_in_background
 from app.Http.DTOs.schemas import WebhookConfig
-from app.Services.webhook_sender import WebhookSender
-from app.Utils.analysis import analyze_conversation_with_gemini
+from app.Services.webhook_sender import WebhookSender, report_call_state
+
+# The transport (Daily or Asterisk), the VAD model and the post-call analysis hand-off are
+# imported where they are used, so a bot only loads what its call needs
+if TYPE_CHECKING:
+    from pipecat.transports.daily.transport import DailyTransport
+
+
+def _is_system_message(message) -> bool:
+    return isinstance(message, dict) and message.get("role") == "system"
 
 
 class BaseBot(ABC):
@@ -51,23 +76,119 @@ class BaseBot(ABC):
         webhook_config: Optional[WebhookConfig] = None,
     ):
         """Initialize the bot with services and common components."""
-        self.config = config
 
         # Initialize context aggregator
         self.context = LLMContext(messages=system_messages)
         self.context_aggregator = LLMContextAggregatorPair(self.context)
 
+        # Opted-in assistants use the allowed providers with the best recent latency
+        config, self.provider_routing = ServiceFactory.route_providers(config)
+        self.config = config
+
+        # Time DNS and TLS to the providers while the transport and services are set up
+        self.provider_warmup: Optional[asyncio.Task] = None
+        if config.provider_warmup_enabled:
+            self.provider_warmup = warm_up_in_background(
+                provider_hosts(config.stt_provider, config.llm_provider, config.tts_provider)
+            )
+        self.startup_observer: Optional[StartupObserver] = None
+
         # Initialize services using Factory
         self.stt = ServiceFactory.create_stt_service(config)
         self.tts = ServiceFactory.create_tts_service(config)
         self.llm = ServiceFactory.create_llm_service(config, system_messages)
 
+        # Hedged requests may be answered by either provider, so the tools go on the shared
+        # context in a provider-neutral schema instead of one service's native format
+        self.hedged_llm: Optional[HedgedLLMService] = None
+        if isinstance(self.llm, HedgedLLMService):
+            self.hedged_llm = self.llm
+            if config.tools:
+                self.context.set_tools(tools_schema_from_config(config.tools))
+
+        # Observed TTFB, errors and usage per provider, shared with later calls
+        llm_services = {self.llm: ("llm", config.llm_provider, config.llm_model)}
+        if self.hedged_llm:
+            llm_services = {
+                self.hedged_llm.primary: ("llm", config.llm_provider, config.llm_model),
+                self.hedged_llm.secondary: (
+                    "llm",
+                    config.llm_hedge_provider,
+                    config.llm_hedge_model,
+                ),
+            }
+        self.provider_ledger_observer = ProviderLedgerObserver(
+            get_provider_ledger(),
+            {
+                self.stt: ("stt", config.stt_provider, config.stt_model),
+                self.tts: ("tts", config.tts_provider, config.tts_voice),
+                **llm_services,
+            },
+        )
+
+        # Provider prompt caching the factory set up for this assistant (if enabled)
+        self.prompt_cache_observer: Optional[PromptCacheObserver] = None
+        if getattr(self.llm, "prompt_cache", None):
+            self.prompt_cache_observer = PromptCacheObserver(
+                self.llm.prompt_cache, get_prompt_cache_registry(config.prompt_cache_backend)
+            )
+
+        # Process-wide sentence cache the factory wrapped the TTS service with (if enabled);
+        # the hit/miss counters it reports are this call's
+        self.tts_cache: Optional[TTSOutputCache] = None
+        if config.tts_cache_enabled:
+            self.tts_cache = get_tts_output_cache(
+                config.audio_cache_dir, config.tts_cache_memory_bytes, config.tts_cache_disk_bytes
+            )
+
         self.stt_mute_filter = STTMuteFilter(
             config=STTMuteConfig(
                 strategies={STTMuteStrategy.ALWAYS},
             )
         )
 
+        # Static phrases (greeting, inactivity prompts) are replayed from disk when cached
+        # and recorded from the live TTS output the first time they are spoken.
+        self.audio_cache: Optional[PrerenderedAudioCache] = None
+        self.audio_recorder: Optional[PrerenderedAudioRecorder] = None
+        if config.prerendered_audio:
+            self.audio_cache = PrerenderedAudioCache(config.audio_cache_dir)
+            self.audio_recorder = PrerenderedAudioRecorder(
+                self.audio_cache,
+                provider=config.tts_provider,
+                voice=config.tts_voice,
+                language=config.tts_language,
+            )
+
+        # Lets the TTS start on the first clause instead of waiting for the whole sentence
+        self.text_aggregator: Optional[EarlyFlushTextAggregator] = None
+        if config.tts_text_aggregation == "early_flush":
+            self.text_aggregator = EarlyFlushTextAggregator(
+                min_words=config.tts_early_flush_min_words
+            )
+
+        # Masks slow tool calls with a short phrase, only ever played from the audio cache
+        self.filler_speech: Optional[FillerSpeechProcessor] = None
+        self._filler_prerender_task: Optional[asyncio.Task] = None
+        if config.filler_speech:
+            self.filler_cache = self.audio_cache or PrerenderedAudioCache(config.audio_cache_dir)
+            self.filler_speech = FillerSpeechProcessor(
+                config.filler_speech.get("phrases") or DEFAULT_FILLER_PHRASES,
+                self._load_filler_clip,
+                sample_rate=config.audio_out_sample_rate,
+                threshold_ms=config.filler_speech.get("threshold_ms", 1000.0),
+            )
+
+        # Keeps long calls from growing every LLM request (prompt + last N turns)
+        self.context_window: Optional[ContextWindowManager] = None
+        if config.context_strategy in ("sliding_window", "summarize"):
+            self.context_window = ContextWindowManager(
+                self.context,
+                max_turns=config.context_max_turns,
+                strategy=config.context_strategy,
+                summarizer=llm_summarizer(self.llm),
+            )
+
         # Initialize RTVI with default config
         self.rtvi = RTVIProcessor(config=RTVIConfig(config=[]))
 
@@ -89,18 +210,25 @@ class BaseBot(ABC):
                 f"User idle stage {self.idle_stage}. Action: {behavior}. Message: {message}"
             )
 
-            if message:
+            if message and self.audio_cache:
+                await self._speak_static_message(message)
+            elif message:
                 # Prompt LLM to speak the message
-                messages = list(self.context.messages)
-                messages.append(
-                    {
-                        "role": "system",
-                        "content": f"The user is silent. Say exactly this to re-engage: '{message}'",
-                    }
-                )
                 if self.task:
-                    # Queue message update AND trigger LLM run
-                    await self.task.queue_frames([LLMMessagesUpdateFrame(messages=messages), LLMRunFrame()])
+                    # Append the instruction and trigger an LLM run, without copying the context
+                    await self.task.queue_frames(
+                        [
+                            LLMMessagesAppendFrame(
+                                messages=[
+                                    {
+                                        "role": "system",
+                                        "content": f"The user is silent. Say exactly this to re-engage: '{message}'",
+                                    }
+                                ],
+                                run_llm=True,
+                            )
+                        ]
+                    )
 
             if behavior == "hangup":
                 logger.info("Ending call due to inactivity.")
@@ -128,31 +256,81 @@ class BaseBot(ABC):
         else:
             self.user_idle = None
 
+        # Loading the VAD model is part of construction, so standby bots have it ready
+        from pipecat.audio.vad.silero import SileroVADAnalyzer
+        from pipecat.audio.vad.vad_analyzer import VADParams
+
+        self.vad_analyzer = SileroVADAnalyzer(
+            params=VADParams(
+                confidence=0.7,
+                start_secs=0.2,
+                stop_secs=0.8,
+                min_volume=0.6,
+            )
+        )
+
         # These will be set up when needed
-        self.transport: Optional[DailyTransport] = None
+        self.transport: Optional["DailyTransport"] = None
         self.task: Optional[PipelineTask] = None
         self.runner: Optional[PipelineRunner] = None
 
         self.webhook_sender = WebhookSender(webhook_config)
+        self.latency_observer = LatencyObserver(
+            config.call_id, store=LatencyStore(config.latency_metrics_dir)
+        )
+        self.latency_observer.tags = {
+            "stt_provider": config.stt_provider,
+            "llm_provider": config.llm_provider,
+            "tts_provider": config.tts_provider,
+            "text_aggregation": config.tts_text_aggregation,
+        }
+
+        self.tool_runtime = ToolRuntime(
+            default_timeout_secs=config.tool_timeout_secs,
+            max_concurrency=config.tool_max_concurrency,
+            policies=tool_policies_from_config(config.tool_policies),
+            stats=self.latency_observer.stats,
+        )
 
         self.appointments = []
 
         logger.debug(f"Initialised bot with config: {config}")
 
+    def bind_call(
+        self,
+        system_messages: Optional[List[Dict[str, str]]],
+        env: Optional[Dict[str, str]] = None,
+    ):
+        """Apply per-call state to a bot constructed before its call was known.
+
+        Used by standby bots: the config is resolved again with the call's environment
+        (call id, events endpoint, secrets). The services were created with the assistant's
+        prompt template, so the rendered system prompt replaces it in the context, which
+        every pooled LLM service reads on each request (Gemini takes its system instruction
+        from it too). LLM setups that fix the prompt at construction are never pooled for
+        calls with prompt variables (StandbyBotPool.acquire).
+        """
+        if env:
+            self.config = self.config.with_env(env)
+            self.latency_observer.call_id = self.config.call_id
+
+        if not system_messages:
+            return
+        messages = self.context.get_messages()
+        head = 0
+        while head < len(messages) and _is_system_message(messages[head]):
+            head += 1
+        self.context.set_messages([*system_messages, *messages[head:]])
+
     async def setup_transport(self, url: str, token: str):
         """Set up the transport and its internal event handlers."""
+        from pipecat.transports.daily.transport import DailyParams, DailyTransport
+
         # Standard configuration for Daily transport
         transport_params = DailyParams(
             audio_out_enabled=True,
             audio_in_enabled=True,
-            vad_analyzer=SileroVADAnalyzer(
-                params=VADParams(
-                    confidence=0.7,
-                    start_secs=0.2,
-                    stop_secs=0.8,
-                    min_volume=0.6,
-                )
-            ),
+            vad_analyzer=self.vad_analyzer,
         )
 
         self.transport = DailyTransport(
@@ -165,10 +343,12 @@ class BaseBot(ABC):
         @self.transport.event_handler("on_participant_joined")
         async def on_participant_joined(transport, participant):
             logger.info(f"Participant joined: {participant['id']}")
+            self._report_connected()
             await self.webhook_sender.send("participant_joined", {"participant": participant})
             if hasattr(transport, "capture_participant_transcription"):
                 await transport.capture_participant_transcription(participant["id"])
             # The first participant (user) triggers the bot's greeting/start
+            await self._wait_until_ready()
             await self._handle_first_participant()
 
         @self.transport.event_handler("on_app_message")
@@ -190,6 +370,14 @@ class BaseBot(ABC):
 
     def setup_asterisk_transport(self, host: str, port: int):
         """Set up the Asterisk WebSocket transport."""
+        from pipecat.audio.vad.silero import SileroVADAnalyzer
+
+        from app.Domains.Agent.Transports.asterisk.serializer import AsteriskWsFrameSerializer
+        from app.Domains.Agent.Transports.asterisk.transport import (
+            AsteriskWSServerParams,
+            AsteriskWSServerTransport,
+        )
+
         params = AsteriskWSServerParams(
             host=host,
             port=port,
@@ -205,25 +393,97 @@ class BaseBot(ABC):
         @self.transport.event_handler("on_client_connected")
         async def on_client_connected(transport, client):
             logger.info(f"📞 Client connected: {client.remote_address}")
+            self._report_connected()
             # Map Asterisk connection to first participant logic (starts conversation)
+            await self._wait_until_ready()
             await self._handle_first_participant()
 
         @self.transport.event_handler("on_client_disconnected")
         async def on_client_disconnected(transport, client):
             logger.info(f"📴 Client disconnected: {client.remote_address}")
 
+    def _report_connected(self):
+        report_call_state(self.config.call_events_url, self.config.call_events_token, "connected")
+
+    async def _wait_until_ready(self):
+        """Hold the greeting until every service has connected.
+
+        Pre-rendered audio goes straight to the output transport, and a greeting queued
+        while a service is still connecting would start the call with silence.
+        """
+        if self.startup_observer:
+            await self.startup_observer.wait_ready(self.config.pipeline_ready_timeout)
+
     async def handle_dtmf(self, digit: str, call_id: str):
         """Handle DTMF digit received during call (optional override)."""
         logger.info(f"DTMF received: {digit} (call: {call_id})")
 
-    async def _reset_idle_monitor_if_needed(self, frame):
+    async def _speak_static_message(self, text: str):
+        """Speak a fixed phrase, from pre-rendered audio when available."""
+        if not self.task:
+            return
+
+        key = audio_cache_key(
+            self.config.tts_provider,
+            self.config.tts_voice,
+            self.config.tts_language,
+            self.config.audio_out_sample_rate,
+            text,
+        )
+        audio = self.audio_cache.get(key) if self.audio_cache else None
+        if audio is None:
+            logger.debug(f"No pre-rendered audio yet, synthesizing: {text}")
+            if self.audio_recorder:
+                self.audio_recorder.expect(text)
+            # The TTS text frames reach the assistant aggregator, which records the turn.
+            await self.task.queue_frames([TTSSpeakFrame(text)])
+            return
+
+        logger.debug(f"Playing pre-rendered audio for: {text}")
+        self.context.add_message({"role": "assistant", "content": text})
+        await play_prerendered_audio(
+            self.transport.output(), audio, self.config.audio_out_sample_rate
+        )
+
+    def _load_filler_clip(self, text: str):
+        key = audio_cache_key(
+            self.config.tts_provider,
+            self.config.tts_voice,
+            self.config.tts_language,
+            self.config.audio_out_sample_rate,
+            text,
+        )
+        return self.filler_cache.get(key)
+
+    async def _prerender_filler_phrases(self):
+        """Render filler phrases the assistant's save-time job could not (e.g. default voice)."""
+        try:
+            await prerender_phrases(
+                self.config,
+                self.config.filler_speech.get("phrases") or DEFAULT_FILLER_PHRASES,
+                cache=self.filler_cache,
+                sample_rate=self.config.audio_out_sample_rate,
+            )
+        except Exception as e:
+            logger.warning(f"Could not pre-render filler phrases: {e}")
+
+    async def _reset_idle_monitor(self, frame: UserStartedSpeakingFrame):
         """Reset idle stage when user speaks."""
-        if isinstance(frame, UserStartedSpeakingFrame):
-            self.idle_stage = 0
-            if self.user_idle and self.config.inactivity_messages:
-                first_timeout = self.config.inactivity_messages[0].get("timeout", 10.0)
-                self.user_idle.timeout = first_timeout
-        return True
+        self.idle_stage = 0
+        if self.user_idle and self.config.inactivity_messages:
+            first_timeout = self.config.inactivity_messages[0].get("timeout", 10.0)
+            self.user_idle.timeout = first_timeout
+
+    async def _send_transcription_webhook(self, frame: TranscriptionFrame):
+        await self.webhook_sender.send(
+            "transcription",
+            {
+                "user_id": frame.user_id,
+                "text": frame.text,
+                "timestamp": frame.timestamp,
+                "is_final": True,  # Pipecat transcription frames are usually final segments
+            },
+        )
 
     def create_pipeline(self):
         """Create the processing pipeline."""
@@ -234,19 +494,6 @@ class BaseBot(ABC):
         if self.config.tools:
             self._register_tools(self.config.tools)
 
-        async def transcription_webhook(frame):
-            if isinstance(frame, TranscriptionFrame):
-                await self.webhook_sender.send(
-                    "transcription",
-                    {
-                        "user_id": frame.user_id,
-                        "text": frame.text,
-                        "timestamp": frame.timestamp,
-                        "is_final": True,  # Pipecat transcription frames are usually final segments
-                    },
-                )
-            return True
-
         # Build pipeline with Deepgram STT at the beginning
         pipeline = Pipeline(
             [
@@ -256,11 +503,13 @@ class BaseBot(ABC):
                     self.transport.input(),
                     self.stt_mute_filter,
                     self.stt,  # Deepgram transcribes incoming audio
-                    FunctionFilter(filter=transcription_webhook),  # Hook for transcription webhooks
-                    FunctionFilter(filter=self._reset_idle_monitor_if_needed),
                     self.context_aggregator.user(),
+                    self.context_window,
                     self.llm,
+                    self.text_aggregator,
                     self.tts,
+                    self.filler_speech,
+                    self.audio_recorder,
                     self.user_idle,
                     self.transport.output(),
                     self.context_aggregator.assistant(),
@@ -269,49 +518,115 @@ class BaseBot(ABC):
             ]
         )
 
+        # Transcription webhooks and idle resets see frames as they leave the STT,
+        # from an observer rather than inline filters every audio frame would go through
+        self.frame_taps = FrameTapObserver()
+        self.frame_taps.tap(TranscriptionFrame, self._send_transcription_webhook, source=self.stt)
+        self.frame_taps.tap(UserStartedSpeakingFrame, self._reset_idle_monitor, source=self.stt)
+
+        self.startup_observer = StartupObserver(
+            {
+                self.transport.input(): "transport_in",
+                self.stt: "stt",
+                self.llm: "llm",
+                self.tts: "tts",
+                self.transport.output(): "transport_out",
+            },
+            ready_at=self.transport.output(),
+            stats=self.latency_observer.stats,
+        )
+
         self.task = PipelineTask(
             pipeline,
             params=PipelineParams(
                 allow_interruptions=self.config.interruptibility,
+                audio_out_sample_rate=self.config.audio_out_sample_rate,
                 enable_metrics=True,
                 enable_usage_metrics=True,
             ),
+            observers=[
+                observer
+                for observer in [
+                    self.latency_observer,
+                    self.prompt_cache_observer,
+                    self.provider_ledger_observer,
+                    self.startup_observer,
+                    self.frame_taps,
+                ]
+                if observer is not None
+            ],
         )
-        self.runner = PipelineRunner()
+        self.runner = PipelineRunner(handle_sigint=self.config.handle_sigint)
 
     async def start(self):
         """Start the bot's main task."""
         if not self.runner or not self.task:
             raise RuntimeError("Bot not properly initialized. Call create_pipeline first.")
 
+        if self.filler_speech:
+            self._filler_prerender_task = asyncio.create_task(self._prerender_filler_phrases())
+
         room_url = getattr(self.transport, "room_url", None)
         await self.webhook_sender.send("call_started", {"room_url": room_url})
         await self.runner.run(self.task)
 
     async def cleanup(self):
-        """Clean up resources and analyze call."""
+        """Clean up resources and hand the call off for analysis."""
         if self.runner:
             await self.runner.stop_when_done()
+        if self._filler_prerender_task and not self._filler_prerender_task.done():
+            # Rendering phrases for later calls; not worth keeping the process alive for
+            self._filler_prerender_task.cancel()
+            try:
+                await self._filler_prerender_task
+            except asyncio.CancelledError:
+                pass
         if self.transport:
             # DailyTransport handles cleanup via the runner/client interaction
             pass
 
-        # Perform Post-Call Analysis
-        analysis_result = {}
+        call_ended = {"timestamp": time.time(), "latency": self.latency_observer.summary()}
+        self.latency_observer.save()
+        self.provider_ledger_observer.save()
+        if self.provider_routing:
+            call_ended["provider_routing"] = self.provider_routing
+        if self.startup_observer:
+            call_ended["startup"] = self.startup_observer.summary()
+            if self.provider_warmup and self.provider_warmup.done():
+                call_ended["startup"]["connections"] = self.provider_warmup.result()
+        tools = self.tool_runtime.summary()
+        if tools:
+            call_ended["tools"] = tools
+        if self.filler_speech:
+            call_ended["filler_speech"] = {"played": self.filler_speech.played}
+        if self.hedged_llm:
+            call_ended["llm_hedge"] = self.hedged_llm.stats()
+            logger.info(f"LLM hedge stats: {call_ended['llm_hedge']}")
+        if self.prompt_cache_observer:
+            call_ended["prompt_cache"] = self.prompt_cache_observer.summary()
+            self.prompt_cache_observer.save()
+        if self.tts_cache:
+            call_ended["tts_cache"] = self.tts_cache.stats(
+                getattr(self.tts, "tts_cache_stats", None)
+            )
+            logger.info(f"TTS cache stats: {call_ended['tts_cache']}")
+
+        # Post-call analysis and the call_ended webhook are sent by the analysis worker
+        from app.Utils.analysis import hand_off_call_analysis
+
+        # The context itself may have been trimmed; the analysis needs the whole call
+        if self.context_window:
+            messages = self.context_window.transcript()
+        else:
+            messages = self.context.get_messages()
         try:
-            # Gather messages from context
-            messages = self.context.messages
-            # Prefer Google key, fallback to others if needed, using Gemini for cost/speed
-            api_key = self.config.google_api_key
-            if api_key and messages:
-                logger.info("Running post-call analysis...")
-                analysis_result = await analyze_conversation_with_gemini(api_key, messages)
+            hand_off_call_analysis(self.config, messages, self.webhook_sender.config, call_ended)
         except Exception as e:
-            logger.error(f"Analysis error: {e}")
+            logger.error(f"Failed to queue post-call analysis: {e}")
+            await self.webhook_sender.send("call_ended", {**call_ended, "analysis": {}})
 
-        await self.webhook_sender.send(
-            "call_ended", {"timestamp": time.time(), "analysis": analysis_result}
-        )
+        if self.audio_cache:
+            self.audio_cache.close()
 
     # --- Tool Call Handlers ---
 
@@ -331,7 +646,7 @@ class BaseBot(ABC):
             handler = getattr(self, handler_name, self.generic_tool_handler)
             logger.debug(f"Registering tool handler: {func_name} -> {handler.__name__}")
             # Note: For OpenAI/Google standard services, we use register_function
-            self.llm.register_function(func_name, handler)
+            self.llm.register_function(func_name, self.tool_runtime.wrap(func_name, handler))
 
     async def handle_transfer_call(self, params: FunctionCallParams):
         """Standard handler for call transfers."""
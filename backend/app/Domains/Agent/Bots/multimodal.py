@@ -1,10 +1,8 @@
 import datetime
-import os
 import time
-from typing import Dict, List, Optional
+from typing import TYPE_CHECKING, Dict, List, Optional
 
 from loguru import logger
-from pipecat.audio.vad.silero import SileroVADAnalyzer
 from pipecat.frames.frames import TranscriptionFrame
 from pipecat.pipeline.pipeline import Pipeline
 from pipecat.pipeline.runner import PipelineRunner
@@ -12,19 +10,21 @@ from pipecat.pipeline.task import PipelineParams, PipelineTask
 from pipecat.processors.aggregators.llm_context import LLMContext
 from pipecat.processors.aggregators.llm_response_universal import LLMContextAggregatorPair
 from pipecat.services.llm_service import FunctionCallParams
-from pipecat.transports.daily.transport import DailyParams, DailyTransport
 
 from app.Core.Config.bot import BotConfig
+from app.Domains.Agent.Metrics.latency import LatencyStore
+from app.Domains.Agent.Observers.frame_tap_observer import FrameTapObserver
+from app.Domains.Agent.Observers.latency_observer import LatencyObserver
+from app.Domains.Agent.Observers.startup_observer import StartupObserver
 from app.Domains.Agent.Tools.context import GET_SECURE_DATA_TOOL
 from app.Domains.Agent.Tools.telephony import TRANSFER_CALL_TOOL
-from app.Domains.Agent.Transports.asterisk.serializer import AsteriskWsFrameSerializer
-from app.Domains.Agent.Transports.asterisk.transport import (
-    AsteriskWSServerParams,
-    AsteriskWSServerTransport,
-)
+from app.Domains.Agent.Warmup.provider_warmup import provider_hosts, warm_up_in_background
 from app.Http.DTOs.schemas import WebhookConfig
-from app.Services.webhook_sender import WebhookSender
-from app.Utils.analysis import analyze_conversation_with_gemini
+from app.Services.webhook_sender import WebhookSender, report_call_state
+
+# Transports, the VAD model and the analysis hand-off are imported where they are used
+if TYPE_CHECKING:
+    from pipecat.transports.daily.transport import DailyTransport
 
 
 class MultimodalBot:
@@ -54,19 +54,30 @@ class MultimodalBot:
         self.context = LLMContext(self.system_messages)
         self.user_aggregator, self.assistant_aggregator = LLMContextAggregatorPair(self.context)
 
+        # The realtime session is opened at pipeline start; time DNS and TLS meanwhile
+        self.provider_warmup = None
+        if config.provider_warmup_enabled:
+            self.provider_warmup = warm_up_in_background(
+                provider_hosts(llm_provider=config.llm_provider)
+            )
+
         # Initialize the multimodal service based on the provider
         self.service = self._init_multimodal_service(config)
 
-        self.transport_params = DailyParams(
-            audio_out_enabled=True,
-            audio_in_enabled=True,
-            vad_analyzer=SileroVADAnalyzer(),
-        )
+        # Loading the VAD model is part of construction, so standby bots have it ready
+        from pipecat.audio.vad.silero import SileroVADAnalyzer
 
-        self.transport: Optional[DailyTransport] = None
+        self.vad_analyzer = SileroVADAnalyzer()
+
+        self.transport: Optional["DailyTransport"] = None
         self.task: Optional[PipelineTask] = None
         self.runner: Optional[PipelineRunner] = None
 
+        self.latency_observer = LatencyObserver(
+            config.call_id, store=LatencyStore(config.latency_metrics_dir)
+        )
+        self.latency_observer.tags = {"llm_provider": config.llm_provider}
+
     def _init_multimodal_service(self, config: BotConfig):
         system_instruction = self.system_messages[0]["content"]
 
@@ -148,14 +159,24 @@ class MultimodalBot:
 
     async def get_secure_data_simple(self):
         """Retrieves secure data using the injected secret token."""
-        token = os.environ.get("CRM_SECRET_TOKEN")
+        token = self.config.secret("CRM_SECRET_TOKEN")
         logger.info(f"Checking secret token: {token}")
         if token == "super-secret-123":
             return "Access Granted: VIP Customer List [Alice, Bob]"
         return f"Access Denied. Token was: {token}"
 
+    def _report_connected(self):
+        report_call_state(self.config.call_events_url, self.config.call_events_token, "connected")
+
     async def setup_transport(self, url: str, token: str):
-        self.transport = DailyTransport(url, token, self.config.bot_name, self.transport_params)
+        from pipecat.transports.daily.transport import DailyParams, DailyTransport
+
+        params = DailyParams(
+            audio_out_enabled=True,
+            audio_in_enabled=True,
+            vad_analyzer=self.vad_analyzer,
+        )
+        self.transport = DailyTransport(url, token, self.config.bot_name, params)
 
         @self.transport.event_handler("on_participant_left")
         async def on_participant_left(transport, participant, reason):
@@ -167,11 +188,20 @@ class MultimodalBot:
 
         @self.transport.event_handler("on_first_participant_joined")
         async def on_first_participant_joined(transport, participant):
+            self._report_connected()
             await transport.capture_participant_transcription(participant["id"])
             await self.webhook_sender.send("participant_joined", {"participant": participant})
 
     def setup_asterisk_transport(self, host: str, port: int):
         """Set up the Asterisk WebSocket transport."""
+        from pipecat.audio.vad.silero import SileroVADAnalyzer
+
+        from app.Domains.Agent.Transports.asterisk.serializer import AsteriskWsFrameSerializer
+        from app.Domains.Agent.Transports.asterisk.transport import (
+            AsteriskWSServerParams,
+            AsteriskWSServerTransport,
+        )
+
         params = AsteriskWSServerParams(
             host=host,
             port=port,
@@ -188,6 +218,7 @@ class MultimodalBot:
         @self.transport.event_handler("on_client_connected")
         async def on_client_connected(transport, client):
             logger.info(f"📞 Client connected: {client.remote_address}")
+            self._report_connected()
             await self.webhook_sender.send(
                 "participant_joined", {"participant": {"id": "asterisk_user"}}
             )
@@ -200,8 +231,6 @@ class MultimodalBot:
         if not self.transport:
             raise RuntimeError("Transport must be set up before creating pipeline")
 
-        from pipecat.processors.filters.function_filter import FunctionFilter
-
         # Build pipeline based on provider
         processors = [self.transport.input()]
 
@@ -212,27 +241,25 @@ class MultimodalBot:
             # Others like Gemini/OpenAI mostly handle it internal/direct
             processors.append(self.service)
 
-        async def transcription_webhook(frame):
-            if isinstance(frame, TranscriptionFrame):
-                await self.webhook_sender.send(
-                    "transcription",
-                    {
-                        "user_id": frame.user_id,
-                        "text": frame.text,
-                        "timestamp": frame.timestamp,
-                        "is_final": True,
-                    },
-                )
-            return True
+        # Caption frames (if any) are sent as webhooks when they reach the output.
+        # Note: Implementation details of multimodal services vary on where they emit frames.
+        self.frame_taps = FrameTapObserver()
+        self.frame_taps.tap(
+            TranscriptionFrame, self._send_transcription_webhook, source=processors[-1]
+        )
 
         processors.append(self.transport.output())
 
-        # Add webhook filter before output to caption frames (if any flow through)
-        # Note: Implementation details of multimodal services vary on where they emit frames.
-        # Ideally we place it after service.
-        processors.insert(-1, FunctionFilter(filter=transcription_webhook))
-
         pipeline = Pipeline(processors)
+        self.startup_observer = StartupObserver(
+            {
+                self.transport.input(): "transport_in",
+                self.service: "llm",
+                self.transport.output(): "transport_out",
+            },
+            ready_at=self.transport.output(),
+            stats=self.latency_observer.stats,
+        )
 
         self.task = PipelineTask(
             pipeline,
@@ -241,8 +268,20 @@ class MultimodalBot:
                 enable_metrics=True,
                 enable_usage_metrics=True,
             ),
+            observers=[self.latency_observer, self.startup_observer, self.frame_taps],
+        )
+        self.runner = PipelineRunner(handle_sigint=self.config.handle_sigint)
+
+    async def _send_transcription_webhook(self, frame: TranscriptionFrame):
+        await self.webhook_sender.send(
+            "transcription",
+            {
+                "user_id": frame.user_id,
+                "text": frame.text,
+                "timestamp": frame.timestamp,
+                "is_final": True,
+            },
         )
-        self.runner = PipelineRunner()
 
     async def start(self):
         if not self.runner or not self.task:
@@ -253,19 +292,21 @@ class MultimodalBot:
         try:
             await self.runner.run(self.task)
         finally:
-            # Post-call analysis
-            analysis_result = {}
+            # Post-call analysis and the call_ended webhook are sent by the analysis worker
+            call_ended = {
+                "timestamp": datetime.datetime.now().isoformat(),
+                "latency": self.latency_observer.summary(),
+            }
+            call_ended["startup"] = self.startup_observer.summary()
+            if self.provider_warmup and self.provider_warmup.done():
+                call_ended["startup"]["connections"] = self.provider_warmup.result()
+            self.latency_observer.save()
+            from app.Utils.analysis import hand_off_call_analysis
+
             try:
-                messages = self.context.messages
-                # Use gathered messages if available, otherwise check if we can reconstruct from somewhere
-                # For now rely on context
-                api_key = self.config.google_api_key
-                if api_key and messages:
-                    analysis_result = await analyze_conversation_with_gemini(api_key, messages)
+                hand_off_call_analysis(
+                    self.config, self.context.messages, self.webhook_sender.config, call_ended
+                )
             except Exception as e:
-                logger.error(f"Analysis error: {e}")
-
-            await self.webhook_sender.send(
-                "call_ended",
-                {"timestamp": datetime.datetime.now().isoformat(), "analysis": analysis_result},
-            )
+                logger.error(f"Failed to queue post-call analysis: {e}")
+                await self.webhook_sender.send("call_ended", {**call_ended, "analysis": {}})
@@ -22,7 +22,7 @@ class SimpleBot(BaseBot):
     ):
         # Define the initial system message if not provided
         if not system_messages:
-            system_messages = get_simple_prompt()["task_messages"]
+            system_messages = get_simple_prompt(config)["task_messages"]
 
         logger.info(f"Initialising SimpleBot with system messages: {system_messages}")
         super().__init__(config, system_messages, webhook_config)
@@ -38,6 +38,12 @@ class SimpleBot(BaseBot):
             logger.info(f"Waiting {self.config.initial_delay}s before greeting...")
             await asyncio.sleep(self.config.initial_delay)
 
+        # A verbatim greeting does not need an LLM round trip
+        if self.config.speak_first and self.config.initial_message and self.audio_cache:
+            logger.info(f"Speaking initial message: {self.config.initial_message}")
+            await self._speak_static_message(self.config.initial_message)
+            return
+
         # Queue the context frame
         frames = [self.context_aggregator.user()._get_context_frame()]
 
@@ -0,0 +1,103 @@
+"""Content-addressed cache of pre-rendered TTS audio.
+
+Static phrases (greetings, inactivity prompts) are synthesized once and stored on local
+disk as raw 16-bit mono PCM at the pipeline output rate. Reads are memory-mapped so every
+bot process on the node shares the same pages through the OS page cache.
+"""
+
+import hashlib
+import mmap
+import os
+import unicodedata
+from typing import Dict, Optional
+
+from loguru import logger
+
+# backend/resources/cache/audio
+DEFAULT_AUDIO_CACHE_DIR = os.path.join(
+    os.path.dirname(
+        os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+    ),
+    "resources",
+    "cache",
+    "audio",
+)
+
+
+def normalize_text(text: str) -> str:
+    """Normalize text so trivially different spellings of a phrase share one entry."""
+    return " ".join(unicodedata.normalize("NFC", text).split())
+
+
+def audio_cache_key(
+    provider: str, voice: Optional[str], language: Optional[str], sample_rate: int, text: str
+) -> str:
+    """Return the content address for a phrase rendered with the given voice parameters."""
+    material = "\x1f".join(
+        [
+            (provider or "").lower(),
+            voice or "",
+            (language or "").lower(),
+            str(sample_rate),
+            normalize_text(text),
+        ]
+    )
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+class PrerenderedAudioCache:
+    """Disk store of raw PCM entries addressed by `audio_cache_key`."""
+
+    def __init__(self, cache_dir: Optional[str] = None):
+        self.cache_dir = cache_dir or DEFAULT_AUDIO_CACHE_DIR
+        os.makedirs(self.cache_dir, exist_ok=True)
+        self._maps: Dict[str, mmap.mmap] = {}
+
+    def _get_file_path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key[:2], f"{key}.pcm")
+
+    def contains(self, key: str) -> bool:
+        return key in self._maps or os.path.exists(self._get_file_path(key))
+
+    def get(self, key: str) -> Optional[mmap.mmap]:
+        """Return a read-only memory map of the entry, or None on a miss."""
+        if key in self._maps:
+            return self._maps[key]
+
+        file_path = self._get_file_path(key)
+        try:
+            with open(file_path, "rb") as f:
+                if os.fstat(f.fileno()).st_size == 0:
+                    return None
+                audio = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.error(f"Failed to map cached audio {key}: {e}")
+            return None
+
+        self._maps[key] = audio
+        return audio
+
+    def put(self, key: str, audio: bytes) -> None:
+        """Store an entry atomically so concurrent readers never see partial audio."""
+        if not audio:
+            return
+
+        file_path = self._get_file_path(key)
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        tmp_path = f"{file_path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, "wb") as f:
+                f.write(audio)
+            os.replace(tmp_path, file_path)
+            logger.debug(f"Stored pre-rendered audio {key} ({len(audio)} bytes)")
+        except Exception as e:
+            logger.error(f"Failed to store pre-rendered audio {key}: {e}")
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def close(self) -> None:
+        for audio in self._maps.values():
+            audio.close()
+        self._maps.clear()
@@ -0,0 +1,153 @@
+"""Offline rendering of an assistant's static phrases into the audio cache."""
+
+import asyncio
+import os
+from typing import List, Optional
+
+from loguru import logger
+
+from app.Domains.Agent.Cache.audio_cache import PrerenderedAudioCache, audio_cache_key
+from app.Domains.Assistant.Models.assistant import Assistant
+
+DEFAULT_SAMPLE_RATE = 24000
+
+
+# Provider settings create_tts_service reads, from the same variables BotConfig uses
+TTS_ENV_SETTINGS = {
+    "cartesia_api_key": "CARTESIA_API_KEY",
+    "elevenlabs_api_key": "ELEVENLABS_API_KEY",
+    "deepgram_api_key": "DEEPGRAM_API_KEY",
+    "rime_api_key": "RIME_API_KEY",
+    "playht_api_key": "PLAYHT_API_KEY",
+    "playht_user_id": "PLAYHT_USER_ID",
+    "openai_api_key": "OPENAI_API_KEY",
+    "azure_api_key": "AZURE_API_KEY",
+    "azure_region": "AZURE_REGION",
+    "audio_cache_dir": "AUDIO_CACHE_DIR",
+}
+
+
+class AssistantTTSConfig:
+    """Minimal config view exposing what ServiceFactory.create_tts_service reads.
+
+    API keys and other provider settings (TTS_ENV_SETTINGS) come from the environment;
+    any other attribute is missing, as it would be on a misspelt BotConfig property.
+    """
+
+    def __init__(self, assistant: Assistant):
+        tts = assistant.io_layer.tts
+        self.tts_provider = tts.provider
+        self.tts_voice = tts.voice_id
+        self.tts_language = tts.language
+        # The recorder below stores the audio, the sentence cache would only double it
+        self.tts_cache_enabled = False
+
+    def __getattr__(self, name: str):
+        if name in TTS_ENV_SETTINGS:
+            return os.getenv(TTS_ENV_SETTINGS[name])
+        raise AttributeError(f"{type(self).__name__} has no attribute {name!r}")
+
+
+def static_phrases(assistant: Assistant) -> List[str]:
+    """Phrases an assistant speaks verbatim and that are therefore safe to pre-render."""
+    settings = assistant.pipeline_settings
+    phrases = [m.message for m in settings.inactivity_messages if m.message]
+    if settings.filler_speech.enabled and assistant.architecture_type != "multimodal":
+        phrases.extend(settings.filler_speech.phrases)
+    # Flow bots hand initial_message to the LLM as an instruction, only SimpleBot says it verbatim
+    if settings.initial_message and assistant.architecture_type == "simple":
+        phrases.insert(0, settings.initial_message)
+    return list(dict.fromkeys(phrases))
+
+
+async def prerender_phrases(
+    config,
+    phrases: List[str],
+    cache: Optional[PrerenderedAudioCache] = None,
+    sample_rate: int = DEFAULT_SAMPLE_RATE,
+    timeout: float = 30.0,
+) -> int:
+    """Synthesize missing phrases with the configured TTS and store them. Returns the count."""
+    from pipecat.frames.frames import EndFrame, TTSSpeakFrame
+    from pipecat.pipeline.pipeline import Pipeline
+    from pipecat.pipeline.runner import PipelineRunner
+    from pipecat.pipeline.task import PipelineParams, PipelineTask
+
+    from app.Domains.Agent.Factory.service_factory import ServiceFactory
+    from app.Domains.Agent.Processors.prerendered_audio import PrerenderedAudioRecorder
+
+    cache = cache or PrerenderedAudioCache()
+    missing = [
+        text
+        for text in phrases
+        if not cache.contains(
+            audio_cache_key(
+                config.tts_provider, config.tts_voice, config.tts_language, sample_rate, text
+            )
+        )
+    ]
+    if not missing:
+        return 0
+
+    tts = ServiceFactory.create_tts_service(config)
+    recorder = PrerenderedAudioRecorder(
+        cache,
+        provider=config.tts_provider,
+        voice=config.tts_voice,
+        language=config.tts_language,
+    )
+    task = PipelineTask(
+        Pipeline([tts, recorder]),
+        params=PipelineParams(audio_out_sample_rate=sample_rate),
+    )
+    runner_task = asyncio.create_task(PipelineRunner(handle_sigint=False).run(task))
+
+    rendered = 0
+    try:
+        # One phrase at a time: streaming TTS providers may merge back-to-back phrases into a
+        # single started/stopped span, which would store the wrong audio under a key.
+        for text in missing:
+            recorder.expect(text)
+            await task.queue_frame(TTSSpeakFrame(text))
+            if await recorder.wait_idle(timeout):
+                rendered += 1
+            else:
+                logger.warning(f"Timed out pre-rendering phrase: {text}")
+        await task.queue_frame(EndFrame())
+        await runner_task
+    except Exception as e:
+        logger.error(f"Pre-rendering failed: {e}")
+        await task.cancel()
+
+    return rendered
+
+
+async def prerender_assistant_audio(assistant: Assistant) -> int:
+    """Background job run when an assistant is saved."""
+    if assistant.architecture_type == "multimodal" or not assistant.io_layer.tts:
+        return 0
+    settings = assistant.pipeline_settings
+    if not settings.prerendered_audio and not settings.filler_speech.enabled:
+        return 0
+    # Without an explicit voice the bot resolves a provider default from its own env,
+    # so leave those entries to be recorded on first use.
+    if not assistant.io_layer.tts.voice_id:
+        return 0
+
+    # Filler speech is only ever played from cache, even with prerendered_audio off
+    if settings.prerendered_audio:
+        phrases = static_phrases(assistant)
+    else:
+        phrases = settings.filler_speech.phrases
+    if not phrases:
+        return 0
+
+    sample_rate = int(os.getenv("AUDIO_OUT_SAMPLE_RATE", DEFAULT_SAMPLE_RATE))
+    rendered = await prerender_phrases(
+        AssistantTTSConfig(assistant),
+        phrases,
+        cache=PrerenderedAudioCache(os.getenv("AUDIO_CACHE_DIR")),
+        sample_rate=sample_rate,
+    )
+    logger.info(f"Pre-rendered {rendered} phrase(s) for assistant {assistant.id}")
+    return rendered
@@ -0,0 +1,205 @@
+"""Provider-side prompt prefix caching.
+
+LLM providers can reuse the work done on a prompt prefix they have already seen: Anthropic
+with explicit `cache_control` breakpoints, OpenAI and Gemini automatically when requests
+share a byte-identical prefix (OpenAI routes by `prompt_cache_key`). A handle per
+assistant and prefix is kept in a registry shared by all bot processes, so every call of
+an assistant presents the same prefix and cache key, and hit statistics add up across calls.
+"""
+
+import fcntl
+import hashlib
+import json
+import os
+import time
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from typing import Any, Dict, List, Optional
+
+from loguru import logger
+from pydantic import BaseModel, Field
+
+# backend/resources/cache/prompt_cache.json
+DEFAULT_PROMPT_CACHE_REGISTRY = os.path.join(
+    os.path.dirname(
+        os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+    ),
+    "resources",
+    "cache",
+    "prompt_cache.json",
+)
+
+# Providers whose services support prefix caching through the factory
+CACHING_PROVIDERS = ("anthropic", "openai", "google")
+
+
+def prompt_prefix_hash(
+    provider: str, model: Optional[str], system_instruction: str, tools: Optional[List] = None
+) -> str:
+    """Identify a stable prompt prefix: anything that changes it invalidates provider caches."""
+    material = json.dumps(
+        [provider, model or "", system_instruction or "", tools or []],
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+class PromptCacheUsage(BaseModel):
+    requests: int = 0
+    hits: int = 0
+    prompt_tokens: int = 0
+    cached_tokens: int = 0
+    cache_write_tokens: int = 0
+
+    def record(self, prompt_tokens: int, cached_tokens: int, cache_write_tokens: int) -> None:
+        self.requests += 1
+        self.hits += 1 if cached_tokens else 0
+        self.prompt_tokens += prompt_tokens
+        self.cached_tokens += cached_tokens
+        self.cache_write_tokens += cache_write_tokens
+
+    def add(self, other: "PromptCacheUsage") -> None:
+        for field in ("requests", "hits", "prompt_tokens", "cached_tokens", "cache_write_tokens"):
+            setattr(self, field, getattr(self, field) + getattr(other, field))
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            **self.model_dump(),
+            "hit_ratio": round(self.hits / self.requests, 3) if self.requests else 0.0,
+            "cached_token_ratio": (
+                round(self.cached_tokens / self.prompt_tokens, 3) if self.prompt_tokens else 0.0
+            ),
+        }
+
+
+class PromptCacheHandle(BaseModel):
+    """Cache identity of one assistant's prompt prefix, plus its cumulative usage."""
+
+    scope: str
+    provider: str
+    model: Optional[str] = None
+    prefix_hash: str
+    created_at: float
+    calls: int = 0
+    usage: PromptCacheUsage = Field(default_factory=PromptCacheUsage)
+
+    @property
+    def cache_key(self) -> str:
+        # Stable across calls of the same assistant and prefix
+        return f"tito-{self.scope}-{self.prefix_hash[:16]}"
+
+
+class PromptCacheRegistry(ABC):
+    @abstractmethod
+    def get_or_create(
+        self, scope: str, provider: str, model: Optional[str], prefix_hash: str
+    ) -> PromptCacheHandle:
+        pass
+
+    @abstractmethod
+    def record_call(self, handle: PromptCacheHandle, usage: PromptCacheUsage) -> None:
+        """Add one finished call's usage to the handle."""
+        pass
+
+
+class InMemoryPromptCacheRegistry(PromptCacheRegistry):
+    """Process-local registry, used for tests and when persistence is disabled."""
+
+    def __init__(self):
+        self._handles: Dict[str, PromptCacheHandle] = {}
+
+    def get_or_create(self, scope, provider, model, prefix_hash) -> PromptCacheHandle:
+        handle = self._handles.get(scope)
+        if handle is None or handle.prefix_hash != prefix_hash:
+            handle = PromptCacheHandle(
+                scope=scope,
+                provider=provider,
+                model=model,
+                prefix_hash=prefix_hash,
+                created_at=time.time(),
+            )
+            self._handles[scope] = handle
+        return handle
+
+    def record_call(self, handle: PromptCacheHandle, usage: PromptCacheUsage) -> None:
+        stored = self._handles.get(handle.scope)
+        if stored is None or stored.prefix_hash != handle.prefix_hash:
+            return
+        stored.calls += 1
+        stored.usage.add(usage)
+
+
+class FilePromptCacheRegistry(PromptCacheRegistry):
+    """Registry kept in one JSON file, shared by all bot processes on the node."""
+
+    def __init__(self, file_path: Optional[str] = None):
+        self.file_path = file_path or DEFAULT_PROMPT_CACHE_REGISTRY
+        os.makedirs(os.path.dirname(self.file_path), exist_ok=True)
+
+    @contextmanager
+    def _locked(self):
+        with open(f"{self.file_path}.lock", "w") as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            try:
+                yield self._load()
+            finally:
+                fcntl.flock(lock, fcntl.LOCK_UN)
+
+    def _load(self) -> Dict[str, Dict]:
+        try:
+            with open(self.file_path, "r") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            logger.error(f"Unreadable prompt cache registry, starting over: {e}")
+            return {}
+
+    def _store(self, data: Dict[str, Dict]) -> None:
+        tmp_path = f"{self.file_path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(data, f, indent=2)
+        os.replace(tmp_path, self.file_path)
+
+    def get_or_create(self, scope, provider, model, prefix_hash) -> PromptCacheHandle:
+        with self._locked() as data:
+            entry = data.get(scope)
+            if entry and entry.get("prefix_hash") == prefix_hash:
+                return PromptCacheHandle(**entry)
+
+            # New assistant or its prompt/tools changed: the old prefix is dead
+            handle = PromptCacheHandle(
+                scope=scope,
+                provider=provider,
+                model=model,
+                prefix_hash=prefix_hash,
+                created_at=time.time(),
+            )
+            data[scope] = handle.model_dump()
+            self._store(data)
+            return handle
+
+    def record_call(self, handle: PromptCacheHandle, usage: PromptCacheUsage) -> None:
+        with self._locked() as data:
+            entry = data.get(handle.scope)
+            if not entry or entry.get("prefix_hash") != handle.prefix_hash:
+                return
+            stored = PromptCacheHandle(**entry)
+            stored.calls += 1
+            stored.usage.add(usage)
+            data[handle.scope] = stored.model_dump()
+            self._store(data)
+
+
+_registries: Dict[str, PromptCacheRegistry] = {}
+
+
+def get_prompt_cache_registry(backend: str = "file") -> PromptCacheRegistry:
+    """Process-wide registry: "file" (shared across processes) or "local" (in memory)."""
+    if backend not in _registries:
+        if backend == "local":
+            _registries[backend] = InMemoryPromptCacheRegistry()
+        else:
+            _registries[backend] = FilePromptCacheRegistry(os.getenv("PROMPT_CACHE_REGISTRY"))
+    return _registries[backend]
@@ -0,0 +1,270 @@
+"""Sentence-level TTS output cache.
+
+Wraps a TTS service's `run_tts` so repeated sentences are replayed from a bounded
+in-memory LRU, backed by a bounded on-disk tier shared by the node's bot processes (and
+the pre-rendered phrases), instead of being synthesized again. Only services that yield
+their audio inline from `run_tts` (HTTP-style services) can be wrapped: websocket
+services deliver audio out of band, so a replayed sentence could overtake audio that is
+still streaming for the previous one.
+"""
+
+import os
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+from loguru import logger
+from pipecat.frames.frames import ErrorFrame, TTSAudioRawFrame, TTSStartedFrame, TTSStoppedFrame
+
+from app.Domains.Agent.Cache.audio_cache import PrerenderedAudioCache, audio_cache_key
+
+# Size of each replayed audio frame (100ms of 16-bit mono audio).
+REPLAY_CHUNK_MS = 100
+
+
+class LRUAudioCache:
+    """In-memory LRU of PCM entries bounded by total size in bytes."""
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.size_bytes = 0
+        self._entries: "OrderedDict[str, bytes]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Optional[bytes]:
+        audio = self._entries.get(key)
+        if audio is not None:
+            self._entries.move_to_end(key)
+        return audio
+
+    def put(self, key: str, audio: bytes) -> None:
+        if len(audio) > self.max_bytes:
+            return
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self.size_bytes -= len(previous)
+        self._entries[key] = audio
+        self.size_bytes += len(audio)
+        while self.size_bytes > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self.size_bytes -= len(evicted)
+
+
+class DiskAudioLRU(PrerenderedAudioCache):
+    """Disk tier of the sentence cache, bounded by total size in bytes.
+
+    Entries are read into memory rather than mapped (the memory tier keeps a copy anyway)
+    and their mtime is refreshed on every hit, so once the directory outgrows `max_bytes`
+    the least recently used entries are removed, whichever process wrote them.
+    """
+
+    def __init__(self, cache_dir: str, max_bytes: int):
+        super().__init__(cache_dir)
+        self.max_bytes = max_bytes
+        # This process' running estimate; the directory is rescanned when it overflows
+        self.size_bytes = self._scan()[1]
+
+    def _scan(self):
+        entries = []
+        total = 0
+        for root, _, names in os.walk(self.cache_dir):
+            for name in names:
+                if not name.endswith(".pcm"):
+                    continue
+                file_path = os.path.join(root, name)
+                try:
+                    stat = os.stat(file_path)
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, file_path))
+                total += stat.st_size
+        return entries, total
+
+    def get(self, key: str) -> Optional[bytes]:
+        file_path = self._get_file_path(key)
+        try:
+            with open(file_path, "rb") as f:
+                audio = f.read()
+            os.utime(file_path)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.error(f"Failed to read cached sentence {key}: {e}")
+            return None
+        return audio or None
+
+    def put(self, key: str, audio: bytes) -> None:
+        if not audio or len(audio) > self.max_bytes:
+            return
+        super().put(key, audio)
+        self.size_bytes += len(audio)
+        if self.size_bytes > self.max_bytes:
+            self.evict()
+
+    def evict(self) -> int:
+        """Remove least recently used entries down to 90% of `max_bytes`. Returns the count."""
+        entries, total = self._scan()
+        removed = 0
+        for _, size, file_path in sorted(entries):
+            if total <= self.max_bytes * 0.9:
+                break
+            try:
+                os.remove(file_path)
+            except FileNotFoundError:
+                pass
+            total -= size
+            removed += 1
+        self.size_bytes = total
+        if removed:
+            logger.debug(f"Evicted {removed} sentence(s) from the TTS disk cache")
+        return removed
+
+
+class TTSCacheStats:
+    """Hit/miss counters of one call (the caches themselves are shared by the process)."""
+
+    def __init__(self):
+        self.counters: Dict[str, int] = {
+            "memory_hits": 0,
+            "disk_hits": 0,
+            "misses": 0,
+            "bytes_served": 0,
+            "bytes_stored": 0,
+        }
+
+    def summary(self) -> Dict[str, Any]:
+        lookups = self.counters["memory_hits"] + self.counters["disk_hits"]
+        lookups += self.counters["misses"]
+        hits = lookups - self.counters["misses"]
+        return {**self.counters, "hit_ratio": round(hits / lookups, 3) if lookups else 0.0}
+
+
+class TTSOutputCache:
+    """Two-tier (memory, disk) cache of synthesized sentences.
+
+    Pre-rendered phrases in `static` are served as disk hits but never written or evicted.
+    Statistics are kept per installed service (one per call), see `install`.
+    """
+
+    def __init__(
+        self,
+        disk: DiskAudioLRU,
+        memory_bytes: int = 32 * 1024 * 1024,
+        static: Optional[PrerenderedAudioCache] = None,
+    ):
+        self.disk = disk
+        self.static = static
+        self.memory = LRUAudioCache(memory_bytes)
+
+    def get(self, key: str, stats: Optional[TTSCacheStats] = None) -> Optional[bytes]:
+        counters = (stats or TTSCacheStats()).counters
+        audio = self.memory.get(key)
+        if audio is not None:
+            counters["memory_hits"] += 1
+            counters["bytes_served"] += len(audio)
+            return audio
+
+        audio = self.disk.get(key)
+        if audio is None and self.static:
+            mapped = self.static.get(key)
+            audio = mapped[:] if mapped is not None else None
+        if audio is not None:
+            self.memory.put(key, audio)
+            counters["disk_hits"] += 1
+            counters["bytes_served"] += len(audio)
+            return audio
+
+        counters["misses"] += 1
+        return None
+
+    def put(self, key: str, audio: bytes, stats: Optional[TTSCacheStats] = None) -> None:
+        self.memory.put(key, audio)
+        if not self.disk.contains(key):
+            self.disk.put(key, audio)
+        if stats:
+            stats.counters["bytes_stored"] += len(audio)
+
+    def stats(self, call_stats: Optional[TTSCacheStats] = None) -> Dict[str, Any]:
+        """The call's hit/miss counters plus the current size of the shared tiers."""
+        return {
+            **(call_stats or TTSCacheStats()).summary(),
+            "memory_entries": len(self.memory),
+            "memory_bytes": self.memory.size_bytes,
+            "disk_bytes": self.disk.size_bytes,
+        }
+
+    def install(self, service, *, provider: str, voice: Optional[str], language: Optional[str]):
+        """Route the service's `run_tts` through this cache. Returns the service.
+
+        The service's own hit/miss counters are exposed as `service.tts_cache_stats`.
+        """
+        from pipecat.services.websocket_service import WebsocketService
+
+        if isinstance(service, WebsocketService):
+            logger.warning(
+                f"TTS cache disabled for {service}: websocket services stream audio out of band"
+            )
+            return service
+
+        original_run_tts = service.run_tts
+        cache = self
+        stats = TTSCacheStats()
+        service.tts_cache_stats = stats
+
+        async def run_tts(text: str):
+            sample_rate = service.sample_rate
+            key = audio_cache_key(provider, voice, language, sample_rate, text)
+
+            audio = cache.get(key, stats)
+            if audio is not None:
+                logger.debug(f"TTS cache hit: [{text}]")
+                chunk_size = int(sample_rate * REPLAY_CHUNK_MS / 1000) * 2
+                yield TTSStartedFrame()
+                for offset in range(0, len(audio), chunk_size):
+                    yield TTSAudioRawFrame(
+                        audio=audio[offset : offset + chunk_size],
+                        sample_rate=sample_rate,
+                        num_channels=1,
+                    )
+                yield TTSStoppedFrame()
+                return
+
+            # Interruptions close this generator early, so partial audio is never stored.
+            recorded = bytearray()
+            failed = False
+            async for frame in original_run_tts(text):
+                if isinstance(frame, TTSAudioRawFrame):
+                    if frame.num_channels == 1 and frame.sample_rate == sample_rate:
+                        recorded.extend(frame.audio)
+                    else:
+                        failed = True
+                elif isinstance(frame, ErrorFrame):
+                    failed = True
+                yield frame
+
+            if recorded and not failed:
+                cache.put(key, bytes(recorded), stats)
+
+        service.run_tts = run_tts
+        return service
+
+
+_shared_caches: Dict[str, TTSOutputCache] = {}
+
+
+def get_tts_output_cache(
+    cache_dir: Optional[str], memory_bytes: int, disk_bytes: int = 512 * 1024 * 1024
+) -> TTSOutputCache:
+    """Process-wide cache per directory, so bots in one process share the memory tier.
+
+    Sentences go to the `sentences` subdirectory of the audio cache, apart from the
+    pre-rendered phrases, which filler speech needs and eviction must not touch.
+    """
+    static = PrerenderedAudioCache(cache_dir)
+    cache = _shared_caches.get(static.cache_dir)
+    if cache is None:
+        disk = DiskAudioLRU(os.path.join(static.cache_dir, "sentences"), disk_bytes)
+        cache = TTSOutputCache(disk, memory_bytes=memory_bytes, static=static)
+        _shared_caches[static.cache_dir] = cache
+    return cache
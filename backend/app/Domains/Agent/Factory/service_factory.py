@@ -1,13 +1,105 @@
-import os
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from loguru import logger
 from pipecat.transcriptions.language import Language
 
+from app.Core.Config.bot import (
+    LLM_MODEL_SETTINGS,
+    STT_MODEL_SETTINGS,
+    TTS_VOICE_SETTINGS,
+    provider_setting,
+)
+
+# Streaming text LLMs that can stand in for each other on the same context
+HEDGE_PROVIDERS = ("google", "openai", "anthropic", "groq", "together", "mistral")
+
+# Providers route_providers may switch to: those the create_* methods below can build
+# (and, for the LLM, that take the same pipeline as the configured one)
+ROUTABLE_PROVIDERS = {
+    "llm": HEDGE_PROVIDERS,
+    "stt": ("deepgram",),
+    "tts": ("cartesia", "elevenlabs", "deepgram", "rime", "playht", "openai", "azure"),
+}
+
+
+class LLMConfigOverride:
+    """Config view that swaps the LLM provider and model, used for the hedge service."""
+
+    def __init__(self, config, llm_provider: str, llm_model: Optional[str]):
+        self._config = config
+        self.llm_provider = llm_provider
+        self.llm_model = llm_model
+
+    def __getattr__(self, name: str):
+        return getattr(self._config, name)
+
 
 class ServiceFactory:
     """Factory for creating Pipecat services (STT, TTS, LLM) based on configuration."""
 
+    @staticmethod
+    def route_providers(config) -> Tuple[Any, Dict[str, Dict[str, Any]]]:
+        """Resolve a config with the fastest allowed providers before services are created.
+
+        Only for assistants that opted in (`config.provider_routing`): for each of llm, stt
+        and tts with allowed candidates, the one with the lowest recent p95 TTFB in the
+        provider ledger is chosen. Returns the routed config (`config` itself when nothing
+        was routed) and the decisions, keyed by service kind.
+        """
+        routing = config.provider_routing
+        if not routing or config.architecture_type == "multimodal":
+            return config, {}
+
+        from app.Domains.Agent.Metrics.provider_ledger import get_provider_ledger
+
+        ledger = get_provider_ledger()
+        decisions: Dict[str, Dict[str, Any]] = {}
+        settings: Dict[str, str] = {}
+        for kind in ("llm", "stt", "tts"):
+            allowed = routing.get(kind) or []
+            if not allowed:
+                continue
+
+            candidates = []
+            for candidate in allowed:
+                provider = candidate["provider"].lower()
+                if provider not in ROUTABLE_PROVIDERS[kind]:
+                    logger.warning(f"Provider {provider} cannot be routed to for {kind}, skipped")
+                    continue
+                if kind == "llm":
+                    model = candidate.get("model") or config.default_llm_model(provider)
+                elif kind == "tts":
+                    model = candidate.get("voice_id") or config.default_tts_voice(provider)
+                elif provider == config.stt_provider:
+                    model = candidate.get("model") or config.stt_model
+                else:
+                    model = candidate.get("model")
+                candidates.append((provider, model))
+            if not candidates:
+                continue
+
+            index, reason = ledger.choose(
+                kind,
+                candidates,
+                min_samples=routing.get("min_samples", 20),
+                max_error_rate=routing.get("max_error_rate", 0.2),
+            )
+            provider, model = candidates[index]
+            if kind == "llm":
+                settings["LLM_PROVIDER"] = provider
+                settings[provider_setting(LLM_MODEL_SETTINGS, provider)] = model
+            elif kind == "tts":
+                settings["TTS_PROVIDER"] = provider
+                settings[provider_setting(TTS_VOICE_SETTINGS, provider)] = model
+            else:
+                settings["STT_PROVIDER"] = provider
+                if model:
+                    settings[provider_setting(STT_MODEL_SETTINGS, provider)] = model
+
+            decisions[kind] = {"provider": provider, "model": model, "reason": reason}
+            logger.info(f"Routed {kind} to {provider} ({model}): {reason}")
+        return (config.with_env(settings) if settings else config), decisions
+
     @staticmethod
     def create_stt_service(config):
         """Initialize the STT service based on configuration."""
@@ -57,10 +149,7 @@ class ServiceFactory:
                             except Exception:
                                 pass
 
-                keywords = []
-                stt_keywords_env = os.getenv("STT_KEYWORDS")
-                if stt_keywords_env:
-                    keywords = stt_keywords_env.split(",")
+                keywords = config.stt_keywords
 
                 # Configure language detection if 'multi' or 'auto'
                 detect_language = config.stt_language in ("multi", "auto")
@@ -92,8 +181,42 @@ class ServiceFactory:
 
     @staticmethod
     def create_tts_service(config):
+        """Initialize the TTS service, wrapped in the sentence cache when enabled."""
+        if not config.tts_cache_enabled:
+            return ServiceFactory._create_tts_service(config)
+
+        from app.Domains.Agent.Cache.tts_cache import get_tts_output_cache
+
+        cache = get_tts_output_cache(
+            config.audio_cache_dir, config.tts_cache_memory_bytes, config.tts_cache_disk_bytes
+        )
+        return cache.install(
+            ServiceFactory._create_tts_service(config),
+            provider=config.tts_provider,
+            voice=config.tts_voice,
+            language=config.tts_language,
+        )
+
+    @staticmethod
+    def _create_tts_service(config):
         """Initialize the TTS service based on configuration."""
+        extra = {}
+        if getattr(config, "tts_text_aggregation", None) == "early_flush":
+            # Text arrives already split into clauses/sentences by EarlyFlushTextAggregator
+            extra["aggregate_sentences"] = False
         match config.tts_provider:
+            case "cartesia" if config.tts_cache_enabled:
+                # The HTTP variant yields audio per sentence, which the cache can record
+                from pipecat.services.cartesia.tts import CartesiaHttpTTSService
+
+                return CartesiaHttpTTSService(
+                    api_key=config.cartesia_api_key,
+                    voice_id=config.tts_voice,
+                    params=CartesiaHttpTTSService.InputParams(
+                        language=Language(config.tts_language) if config.tts_language else Language.EN,
+                    ),
+                    **extra,
+                )
             case "cartesia":
                 from pipecat.services.cartesia.tts import CartesiaTTSService
 
@@ -103,6 +226,7 @@ class ServiceFactory:
                     params=CartesiaTTSService.InputParams(
                         language=Language(config.tts_language) if config.tts_language else Language.EN,
                     ),
+                    **extra,
                 )
             case "elevenlabs":
                 from pipecat.services.elevenlabs.tts import ElevenLabsTTSService
@@ -110,6 +234,7 @@ class ServiceFactory:
                 return ElevenLabsTTSService(
                     api_key=config.elevenlabs_api_key,
                     voice_id=config.tts_voice,
+                    **extra,
                 )
             case "deepgram":
                 from pipecat.services.deepgram.tts import DeepgramTTSService
@@ -117,6 +242,7 @@ class ServiceFactory:
                 return DeepgramTTSService(
                     api_key=config.deepgram_api_key,
                     voice=config.tts_voice,
+                    **extra,
                 )
             case "rime":
                 from pipecat.services.rime.tts import RimeHttpTTSService
@@ -124,6 +250,7 @@ class ServiceFactory:
                 return RimeHttpTTSService(
                     api_key=config.rime_api_key,
                     voice_id=config.tts_voice,
+                    **extra,
                 )
             case "playht":
                 from pipecat.services.playht.tts import PlayHTTTSService
@@ -132,6 +259,7 @@ class ServiceFactory:
                     api_key=config.playht_api_key,
                     user_id=config.playht_user_id,
                     voice_url=config.tts_voice,
+                    **extra,
                 )
             case "openai":
                 from pipecat.services.openai.tts import OpenAITTSService
@@ -139,6 +267,7 @@ class ServiceFactory:
                 return OpenAITTSService(
                     api_key=config.openai_api_key,
                     voice=config.tts_voice,
+                    **extra,
                 )
             case "azure":
                 from pipecat.services.azure.tts import AzureTTSService
@@ -147,13 +276,17 @@ class ServiceFactory:
                     api_key=config.azure_api_key,
                     region=config.azure_region,
                     voice=config.tts_voice,
+                    **extra,
                 )
             case _:
                 raise ValueError(f"Invalid TTS provider: {config.tts_provider}")
 
     @staticmethod
     def create_llm_service(config, system_messages: List[Dict[str, str]]):
-        """Initialize the LLM service based on configuration."""
+        """Initialize the LLM service, with provider prompt caching when enabled.
+
+        The prompt cache handle (if any) is exposed as `service.prompt_cache`.
+        """
         if system_messages:
             system_instruction = system_messages[0]["content"]
         else:
@@ -163,10 +296,55 @@ class ServiceFactory:
             if not system_instruction:
                 system_instruction = "You are a voice assistant"
 
+        prompt_cache = None
+        if config.prompt_cache_enabled:
+            from app.Domains.Agent.Cache.prompt_cache import (
+                CACHING_PROVIDERS,
+                get_prompt_cache_registry,
+                prompt_prefix_hash,
+            )
+
+            if config.llm_provider in CACHING_PROVIDERS:
+                prompt_cache = get_prompt_cache_registry(config.prompt_cache_backend).get_or_create(
+                    scope=config.assistant_id or "default",
+                    provider=config.llm_provider,
+                    model=config.llm_model,
+                    prefix_hash=prompt_prefix_hash(
+                        config.llm_provider, config.llm_model, system_instruction, config.tools
+                    ),
+                )
+
+        service = ServiceFactory._create_llm_service(config, system_instruction, prompt_cache)
+        service.prompt_cache = prompt_cache
+
+        hedge_provider = config.llm_hedge_provider
+        if not hedge_provider:
+            return service
+        if config.architecture_type != "simple":
+            # Flows drive the LLM service directly and multimodal services are realtime
+            logger.warning(f"LLM hedging is not supported for {config.architecture_type} bots")
+            return service
+        if hedge_provider not in HEDGE_PROVIDERS or config.llm_provider not in HEDGE_PROVIDERS:
+            logger.warning(f"LLM hedging not supported between {config.llm_provider} and {hedge_provider}")
+            return service
+
+        from app.Domains.Agent.Processors.hedged_llm import HedgedLLMService
+
+        secondary = ServiceFactory._create_llm_service(
+            LLMConfigOverride(config, hedge_provider, config.llm_hedge_model), system_instruction
+        )
+        logger.info(f"Hedging LLM requests: {config.llm_provider} -> {hedge_provider}")
+        return HedgedLLMService(service, secondary, hedge_after_ms=config.llm_hedge_after_ms)
+
+    @staticmethod
+    def _create_llm_service(config, system_instruction: str, prompt_cache=None):
+        """Initialize the LLM service based on configuration."""
         match config.llm_provider:
             case "google":
                 from pipecat.services.google.llm import GoogleLLMService
 
+                # Gemini caches repeated prefixes implicitly; the system instruction and tools
+                # are fixed for the whole call, so every request starts with the same prefix.
                 return GoogleLLMService(
                     api_key=config.google_api_key,
                     model=config.llm_model,
@@ -177,14 +355,28 @@ class ServiceFactory:
             case "openai":
                 from pipecat.services.openai.llm import OpenAILLMService
 
+                params = config.openai_params
+                if prompt_cache:
+                    # Routes requests with the same prefix to the same cache. On a copy:
+                    # config.openai_params is cached on the config.
+                    extra = {**(params.extra or {}), "prompt_cache_key": prompt_cache.cache_key}
+                    params = params.model_copy(update={"extra": extra})
+
                 return OpenAILLMService(
                     api_key=config.openai_api_key,
                     model=config.llm_model,
-                    params=config.openai_params,
+                    params=params,
                 )
             case "anthropic":
                 from pipecat.services.anthropic.llm import AnthropicLLMService
 
+                if prompt_cache:
+                    # Adds cache_control breakpoints on the system prompt and latest turns
+                    return AnthropicLLMService(
+                        api_key=config.anthropic_api_key,
+                        model=config.llm_model,
+                        params=AnthropicLLMService.InputParams(enable_prompt_caching=True),
+                    )
                 return AnthropicLLMService(api_key=config.anthropic_api_key, model=config.llm_model)
             case "groq":
                 from pipecat.services.groq.llm import GroqLLMService
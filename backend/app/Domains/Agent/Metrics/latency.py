@@ -0,0 +1,216 @@
+"""Latency histograms for voice turns.
+
+Values are recorded into logarithmic buckets with ~2% relative precision, in the spirit
+of HDR histograms: memory stays constant no matter how many samples are recorded, and
+histograms from different calls or processes merge by adding bucket counts.
+"""
+
+import json
+import math
+import os
+import threading
+from typing import Dict, Iterable, Optional, Tuple
+
+from loguru import logger
+
+# backend/resources/data/metrics/latency
+DEFAULT_LATENCY_METRICS_DIR = os.path.join(
+    os.path.dirname(
+        os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+    ),
+    "resources",
+    "data",
+    "metrics",
+    "latency",
+)
+
+# Per-turn stages, all in milliseconds from the moment the user stopped speaking
+# (LLM and TTS TTFB are measured by each service from its own request start, text_to_audio
+# from the first LLM token).
+STAGES = ("stt", "llm_ttfb", "tts_ttfb", "text_to_audio", "voice_to_voice")
+
+BUCKET_BASE = 1.02
+_LOG_BASE = math.log(BUCKET_BASE)
+
+
+class LatencyHistogram:
+    """Log-bucketed histogram of millisecond values."""
+
+    def __init__(self):
+        self.counts: Dict[int, int] = {}
+        self.count = 0
+        self.total = 0.0
+        self.min: Optional[float] = None
+        self.max: Optional[float] = None
+
+    @staticmethod
+    def _bucket(value_ms: float) -> int:
+        return 0 if value_ms < 1.0 else int(math.log(value_ms) / _LOG_BASE) + 1
+
+    @staticmethod
+    def _bucket_value(bucket: int) -> float:
+        # Upper bound of the bucket, so percentiles never under-report
+        return 1.0 if bucket == 0 else BUCKET_BASE**bucket
+
+    def record(self, value_ms: float) -> None:
+        value_ms = max(0.0, value_ms)
+        bucket = self._bucket(value_ms)
+        self.counts[bucket] = self.counts.get(bucket, 0) + 1
+        self.count += 1
+        self.total += value_ms
+        self.min = value_ms if self.min is None else min(self.min, value_ms)
+        self.max = value_ms if self.max is None else max(self.max, value_ms)
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        for bucket, count in other.counts.items():
+            self.counts[bucket] = self.counts.get(bucket, 0) + count
+        self.count += other.count
+        self.total += other.total
+        if other.min is not None:
+            self.min = other.min if self.min is None else min(self.min, other.min)
+        if other.max is not None:
+            self.max = other.max if self.max is None else max(self.max, other.max)
+
+    def percentile(self, fraction: float) -> float:
+        if not self.count:
+            return 0.0
+        rank = max(1, math.ceil(fraction * self.count))
+        seen = 0
+        for bucket in sorted(self.counts):
+            seen += self.counts[bucket]
+            if seen >= rank:
+                return min(self._bucket_value(bucket), self.max)
+        return self.max
+
+    def summary(self) -> Dict[str, float]:
+        return {
+            "count": self.count,
+            "min": round(self.min or 0.0, 1),
+            "mean": round(self.total / self.count, 1) if self.count else 0.0,
+            "p50": round(self.percentile(0.50), 1),
+            "p95": round(self.percentile(0.95), 1),
+            "p99": round(self.percentile(0.99), 1),
+            "max": round(self.max or 0.0, 1),
+        }
+
+    def to_dict(self) -> Dict:
+        return {
+            "counts": {str(k): v for k, v in self.counts.items()},
+            "count": self.count,
+            "total": self.total,
+            "min": self.min,
+            "max": self.max,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "LatencyHistogram":
+        histogram = cls()
+        histogram.counts = {int(k): v for k, v in data.get("counts", {}).items()}
+        histogram.count = data.get("count", 0)
+        histogram.total = data.get("total", 0.0)
+        histogram.min = data.get("min")
+        histogram.max = data.get("max")
+        return histogram
+
+
+class LatencyStats:
+    """One histogram per stage."""
+
+    def __init__(self):
+        self.histograms: Dict[str, LatencyHistogram] = {}
+
+    def record(self, stage: str, value_ms: float) -> None:
+        self.histograms.setdefault(stage, LatencyHistogram()).record(value_ms)
+
+    def merge(self, other: "LatencyStats") -> None:
+        for stage, histogram in other.histograms.items():
+            self.histograms.setdefault(stage, LatencyHistogram()).merge(histogram)
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        return {stage: h.summary() for stage, h in sorted(self.histograms.items())}
+
+    def to_dict(self) -> Dict:
+        return {stage: h.to_dict() for stage, h in self.histograms.items()}
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "LatencyStats":
+        stats = cls()
+        stats.histograms = {stage: LatencyHistogram.from_dict(h) for stage, h in data.items()}
+        return stats
+
+
+class LatencyStore:
+    """Per-call latency snapshots on disk, readable by the API server.
+
+    Snapshots are parsed once and kept while their file is unchanged, and aggregations
+    are reused until a snapshot is added or replaced (which changes the directory), so
+    the API server does not re-read every call on each request.
+    """
+
+    def __init__(self, data_dir: Optional[str] = None):
+        self.data_dir = data_dir or DEFAULT_LATENCY_METRICS_DIR
+        os.makedirs(self.data_dir, exist_ok=True)
+        # File name -> ((mtime, size) it was read at, parsed snapshot)
+        self._parsed: Dict[str, Tuple[Tuple[int, int], Dict]] = {}
+        # Directory mtime the aggregations below were computed at
+        self._aggregated_at: Optional[int] = None
+        self._aggregated: Dict[Tuple, Tuple[int, LatencyStats]] = {}
+        # The API serves sync routes from a thread pool
+        self._lock = threading.Lock()
+
+    def _get_file_path(self, call_id: str) -> str:
+        return os.path.join(self.data_dir, f"{call_id}.json")
+
+    def save(self, call_id: str, stats: LatencyStats, extra: Optional[Dict] = None) -> None:
+        file_path = self._get_file_path(call_id)
+        tmp_path = f"{file_path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, "w") as f:
+                json.dump({"call_id": call_id, **(extra or {}), "stats": stats.to_dict()}, f)
+            os.replace(tmp_path, file_path)
+        except Exception as e:
+            logger.error(f"Failed to save latency snapshot for {call_id}: {e}")
+
+    def get(self, call_id: str) -> Optional[Dict]:
+        file_path = self._get_file_path(call_id)
+        if not os.path.exists(file_path):
+            return None
+        with open(file_path, "r") as f:
+            return json.load(f)
+
+    def snapshots(self) -> Iterable[Dict]:
+        names = [name for name in os.listdir(self.data_dir) if name.endswith(".json")]
+        for name in set(self._parsed) - set(names):
+            del self._parsed[name]
+        for name in names:
+            file_path = os.path.join(self.data_dir, name)
+            try:
+                stat = os.stat(file_path)
+                version = (stat.st_mtime_ns, stat.st_size)
+                cached = self._parsed.get(name)
+                if cached is None or cached[0] != version:
+                    with open(file_path, "r") as f:
+                        cached = self._parsed[name] = (version, json.load(f))
+            except Exception:
+                continue  # Skip malformed, half-written or just removed files
+            yield cached[1]
+
+    def aggregate(self, tags: Optional[Dict[str, str]] = None) -> Tuple[int, LatencyStats]:
+        """Merged stats of the calls whose tags match all of `tags`, and their count."""
+        key = tuple(sorted((tags or {}).items()))
+        with self._lock:
+            directory_mtime = os.stat(self.data_dir).st_mtime_ns
+            if directory_mtime != self._aggregated_at:
+                self._aggregated_at = directory_mtime
+                self._aggregated.clear()
+            if key not in self._aggregated:
+                total = LatencyStats()
+                calls = 0
+                for snapshot in self.snapshots():
+                    snapshot_tags = snapshot.get("tags", {})
+                    if any(snapshot_tags.get(name) != value for name, value in key):
+                        continue
+                    total.merge(LatencyStats.from_dict(snapshot.get("stats", {})))
+                    calls += 1
+                self._aggregated[key] = (calls, total)
+            return self._aggregated[key]
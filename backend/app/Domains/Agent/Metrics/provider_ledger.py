@@ -0,0 +1,264 @@
+"""Rolling per-provider performance ledger.
+
+Bots record TTFB, errors and usage for the STT, LLM and TTS services they run, keyed by
+kind, provider, model (the voice for TTS) and region. Each bot merges its numbers into a
+JSON snapshot shared by every process on the node when its call ends, so the ledger
+survives restarts and the next call can route around a degraded provider.
+"""
+
+import fcntl
+import json
+import os
+import random
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+from loguru import logger
+
+from app.Domains.Agent.Metrics.latency import DEFAULT_LATENCY_METRICS_DIR
+
+# backend/resources/data/metrics/provider_ledger.json
+DEFAULT_PROVIDER_LEDGER_PATH = os.path.join(
+    os.path.dirname(DEFAULT_LATENCY_METRICS_DIR), "provider_ledger.json"
+)
+
+MAX_SAMPLES = 200
+
+
+def ledger_key(kind: str, provider: str, model: Optional[str], region: str) -> str:
+    return ":".join([kind, provider or "", model or "", region or ""])
+
+
+class LedgerEntry:
+    def __init__(self, kind: str, provider: str, model: Optional[str], region: str):
+        self.kind = kind
+        self.provider = provider
+        self.model = model
+        self.region = region
+        # (unix time, ttfb ms), newest last
+        self.samples: Deque[Tuple[float, float]] = deque(maxlen=MAX_SAMPLES)
+        # Unix time of each error, newest last
+        self.error_times: Deque[float] = deque(maxlen=MAX_SAMPLES)
+        self.requests = 0
+        self.errors = 0
+        self.usage: Dict[str, int] = {}
+        self.updated_at = 0.0
+
+    def merge(self, other: "LedgerEntry") -> None:
+        self.samples = deque(
+            sorted([*self.samples, *other.samples])[-MAX_SAMPLES:], maxlen=MAX_SAMPLES
+        )
+        self.error_times = deque(
+            sorted([*self.error_times, *other.error_times])[-MAX_SAMPLES:], maxlen=MAX_SAMPLES
+        )
+        self.requests += other.requests
+        self.errors += other.errors
+        for name, value in other.usage.items():
+            self.usage[name] = self.usage.get(name, 0) + value
+        self.updated_at = max(self.updated_at, other.updated_at)
+
+    def recent(self, window_secs: float) -> List[float]:
+        cutoff = time.time() - window_secs
+        return [ms for ts, ms in self.samples if ts >= cutoff]
+
+    def p95(self, window_secs: float) -> Optional[float]:
+        values = sorted(self.recent(window_secs))
+        if not values:
+            return None
+        return values[min(len(values) - 1, int(0.95 * len(values)))]
+
+    def error_rate(self, window_secs: float) -> float:
+        """Share of the requests in the last `window_secs` that failed."""
+        cutoff = time.time() - window_secs
+        errors = sum(1 for ts in self.error_times if ts >= cutoff)
+        attempts = len(self.recent(window_secs)) + errors
+        return errors / attempts if attempts else 0.0
+
+    def summary(self, window_secs: float) -> Dict[str, Any]:
+        recent = sorted(self.recent(window_secs))
+        return {
+            "kind": self.kind,
+            "provider": self.provider,
+            "model": self.model,
+            "region": self.region,
+            "samples": len(recent),
+            "ttfb_p50": round(recent[len(recent) // 2], 1) if recent else None,
+            "ttfb_p95": round(self.p95(window_secs), 1) if recent else None,
+            "requests": self.requests,
+            "errors": self.errors,
+            "error_rate": round(self.error_rate(window_secs), 3),
+            "usage": self.usage,
+            "updated_at": self.updated_at,
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "kind": self.kind,
+            "provider": self.provider,
+            "model": self.model,
+            "region": self.region,
+            "samples": [list(s) for s in self.samples],
+            "error_times": list(self.error_times),
+            "requests": self.requests,
+            "errors": self.errors,
+            "usage": self.usage,
+            "updated_at": self.updated_at,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "LedgerEntry":
+        entry = cls(data["kind"], data["provider"], data.get("model"), data.get("region", ""))
+        entry.samples.extend(tuple(s) for s in data.get("samples", []))
+        entry.error_times.extend(data.get("error_times", []))
+        entry.requests = data.get("requests", 0)
+        entry.errors = data.get("errors", 0)
+        entry.usage = dict(data.get("usage", {}))
+        entry.updated_at = data.get("updated_at", 0.0)
+        return entry
+
+
+class ProviderLedger:
+    """In-process ledger; `flush` merges what this process recorded into the shared snapshot."""
+
+    def __init__(
+        self,
+        file_path: Optional[str] = None,
+        region: Optional[str] = None,
+        window_secs: float = 3600.0,
+    ):
+        self.file_path = file_path or DEFAULT_PROVIDER_LEDGER_PATH
+        self.region = region or "default"
+        self.window_secs = window_secs
+        self._pending: Dict[str, LedgerEntry] = {}
+
+    def _entry(self, kind: str, provider: str, model: Optional[str]) -> LedgerEntry:
+        key = ledger_key(kind, provider, model, self.region)
+        entry = self._pending.get(key)
+        if entry is None:
+            entry = self._pending[key] = LedgerEntry(kind, provider, model, self.region)
+        entry.updated_at = time.time()
+        return entry
+
+    # --- Recording ---
+
+    def record_ttfb(self, kind: str, provider: str, model: Optional[str], ttfb_ms: float):
+        entry = self._entry(kind, provider, model)
+        entry.samples.append((time.time(), ttfb_ms))
+        entry.requests += 1
+
+    def record_error(self, kind: str, provider: str, model: Optional[str]):
+        entry = self._entry(kind, provider, model)
+        entry.error_times.append(time.time())
+        entry.errors += 1
+
+    def record_usage(self, kind: str, provider: str, model: Optional[str], **usage: int):
+        entry = self._entry(kind, provider, model)
+        for name, value in usage.items():
+            if value:
+                entry.usage[name] = entry.usage.get(name, 0) + value
+
+    # --- Persistence ---
+
+    @contextmanager
+    def _locked(self):
+        os.makedirs(os.path.dirname(self.file_path), exist_ok=True)
+        with open(f"{self.file_path}.lock", "w") as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock, fcntl.LOCK_UN)
+
+    def _load(self) -> Dict[str, LedgerEntry]:
+        try:
+            with open(self.file_path, "r") as f:
+                return {key: LedgerEntry.from_dict(e) for key, e in json.load(f).items()}
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            logger.error(f"Unreadable provider ledger, starting over: {e}")
+            return {}
+
+    def flush(self) -> None:
+        """Merge pending records into the shared snapshot."""
+        if not self._pending:
+            return
+        try:
+            with self._locked():
+                entries = self._load()
+                for key, pending in self._pending.items():
+                    if key in entries:
+                        entries[key].merge(pending)
+                    else:
+                        entries[key] = pending
+                tmp_path = f"{self.file_path}.{os.getpid()}.tmp"
+                with open(tmp_path, "w") as f:
+                    json.dump({key: e.to_dict() for key, e in entries.items()}, f)
+                os.replace(tmp_path, self.file_path)
+            self._pending = {}
+        except Exception as e:
+            logger.error(f"Failed to persist provider ledger: {e}")
+
+    def entries(self) -> Dict[str, LedgerEntry]:
+        """The shared snapshot plus anything recorded here and not flushed yet."""
+        entries = self._load()
+        for key, pending in self._pending.items():
+            if key in entries:
+                entries[key].merge(pending)
+            else:
+                entries[key] = pending
+        return entries
+
+    def get(self, kind: str, provider: str, model: Optional[str]) -> Optional[LedgerEntry]:
+        return self.entries().get(ledger_key(kind, provider, model, self.region))
+
+    def summary(self) -> List[Dict[str, Any]]:
+        return [e.summary(self.window_secs) for _, e in sorted(self.entries().items())]
+
+    def choose(
+        self,
+        kind: str,
+        candidates: List[Tuple[str, Optional[str]]],
+        min_samples: int = 20,
+        max_error_rate: float = 0.2,
+        explore: float = 0.1,
+    ) -> Tuple[int, str]:
+        """Pick the (provider, model) candidate with the lowest recent p95 TTFB.
+
+        Candidates without `min_samples` recent samples are tried with probability
+        `explore` so they get measured; unhealthy ones are skipped. Falls back to the
+        first candidate. Returns its index and the reason for the choice.
+        """
+        entries = self.entries()
+        scored: List[Tuple[float, int]] = []
+        unmeasured: List[int] = []
+        for index, (provider, model) in enumerate(candidates):
+            entry = entries.get(ledger_key(kind, provider, model, self.region))
+            if entry is None or len(entry.recent(self.window_secs)) < min_samples:
+                unmeasured.append(index)
+            elif entry.error_rate(self.window_secs) <= max_error_rate:
+                scored.append((entry.p95(self.window_secs), index))
+
+        if unmeasured and (not scored or random.random() < explore):
+            return random.choice(unmeasured), "exploring"
+        if scored:
+            p95, index = min(scored)
+            return index, f"lowest p95 ({p95:.0f} ms)"
+        return 0, "no healthy candidate, using the first"
+
+
+_ledger: Optional[ProviderLedger] = None
+
+
+def get_provider_ledger() -> ProviderLedger:
+    """Process-wide ledger configured from PROVIDER_LEDGER_PATH, REGION and LEDGER_WINDOW_SECS."""
+    global _ledger
+    if _ledger is None:
+        _ledger = ProviderLedger(
+            file_path=os.getenv("PROVIDER_LEDGER_PATH"),
+            region=os.getenv("REGION"),
+            window_secs=float(os.getenv("LEDGER_WINDOW_SECS", "3600")),
+        )
+    return _ledger
@@ -0,0 +1,85 @@
+"""Frame taps: callbacks on selected frame types without an inline processor."""
+
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Awaitable, Callable, List, Optional, Tuple, Type, Union
+
+from loguru import logger
+from pipecat.frames.frames import Frame
+from pipecat.observers.base_observer import BaseObserver, FramePushed
+from pipecat.processors.frame_processor import FrameDirection
+
+FrameTypes = Union[Type[Frame], Tuple[Type[Frame], ...]]
+
+
+@dataclass
+class FrameTap:
+    frame_types: FrameTypes
+    handler: Callable[[Frame], Awaitable[None]]
+    source: Optional[object] = None
+    direction: Optional[FrameDirection] = FrameDirection.DOWNSTREAM
+
+
+class FrameTapObserver(BaseObserver):
+    """Runs handlers for the frame types they subscribe to.
+
+    Replaces pass-through `FunctionFilter`s, which add a queue hop for every frame in the
+    pipeline just to run an `isinstance` check. Observers are fed by the pipeline task
+    outside the frame path, so a slow handler never delays audio.
+
+    A tap with `source` only fires for frames pushed by that processor, i.e. at the
+    position an inline filter placed after it would have seen them. Without `source` it
+    fires once per frame, wherever the frame is first pushed.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._taps: List[FrameTap] = []
+        self._frame_types: Tuple[Type[Frame], ...] = ()
+        self._seen: "OrderedDict[int, None]" = OrderedDict()
+
+    def tap(
+        self,
+        frame_types: FrameTypes,
+        handler: Callable[[Frame], Awaitable[None]],
+        *,
+        source: Optional[object] = None,
+        direction: Optional[FrameDirection] = FrameDirection.DOWNSTREAM,
+    ):
+        self._taps.append(FrameTap(frame_types, handler, source, direction))
+        types = frame_types if isinstance(frame_types, tuple) else (frame_types,)
+        self._frame_types = tuple(dict.fromkeys(self._frame_types + types))
+
+    def _first_push(self, frame: Frame) -> bool:
+        if frame.id in self._seen:
+            return False
+        self._seen[frame.id] = None
+        if len(self._seen) > 256:
+            self._seen.popitem(last=False)
+        return True
+
+    async def on_push_frame(self, data: FramePushed):
+        frame = data.frame
+        if not isinstance(frame, self._frame_types):
+            return
+
+        first_push = None
+        for tap in self._taps:
+            if not isinstance(frame, tap.frame_types):
+                continue
+            if tap.direction is not None and data.direction != tap.direction:
+                continue
+            if tap.source is not None:
+                if data.source is not tap.source:
+                    continue
+            else:
+                if first_push is None:
+                    first_push = self._first_push(frame)
+                if not first_push:
+                    continue
+
+            try:
+                await tap.handler(frame)
+            except Exception as e:
+                name = getattr(tap.handler, "__name__", tap.handler)
+                logger.error(f"Frame tap {name} failed: {e}")
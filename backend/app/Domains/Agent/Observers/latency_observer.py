@@ -0,0 +1,145 @@
+"""Per-turn voice-to-voice latency measurement."""
+
+from collections import OrderedDict, deque
+from typing import Any, Deque, Dict, Optional
+
+from loguru import logger
+from pipecat.frames.frames import (
+    BotStartedSpeakingFrame,
+    LLMTextFrame,
+    MetricsFrame,
+    TranscriptionFrame,
+    UserStartedSpeakingFrame,
+    UserStoppedSpeakingFrame,
+)
+from pipecat.metrics.metrics import LLMUsageMetricsData, TTFBMetricsData
+from pipecat.observers.base_observer import BaseObserver, FramePushed
+from pipecat.services.llm_service import LLMService
+from pipecat.services.stt_service import STTService
+from pipecat.services.tts_service import TTSService
+
+from app.Domains.Agent.Metrics.latency import LatencyStats, LatencyStore
+
+NS_PER_MS = 1_000_000
+
+
+class LatencyObserver(BaseObserver):
+    """Measures each turn from the moment the user stops speaking.
+
+    Stages: STT final transcript, LLM TTFB, TTS TTFB (as reported by the services'
+    metrics frames), text-to-audio (first LLM token until bot audio, which includes the
+    time text waits for aggregation before reaching the TTS) and voice-to-voice, i.e.
+    until the output transport starts writing bot audio. The LLM prompt size of each
+    turn is tracked as `prompt_tokens`. Requires
+    `PipelineParams(enable_metrics=True, enable_usage_metrics=True)`.
+    """
+
+    def __init__(self, call_id: str, store: Optional[LatencyStore] = None, max_turns: int = 500):
+        super().__init__()
+        self.call_id = call_id
+        self.store = store
+        self.stats = LatencyStats()
+        self.turns: Deque[Dict[str, Any]] = deque(maxlen=max_turns)
+        self.turn_count = 0
+        # Included in the saved snapshot, e.g. provider names, to slice stats later
+        self.tags: Dict[str, Any] = {}
+
+        self._seen: "OrderedDict[int, None]" = OrderedDict()
+        self._transcribed_at: Optional[int] = None
+        self._turn: Optional[Dict[str, Any]] = None
+
+    def _first_sighting(self, frame) -> bool:
+        # Every processor hop is reported; only the first push of a frame matters
+        if frame.id in self._seen:
+            return False
+        self._seen[frame.id] = None
+        if len(self._seen) > 2048:
+            self._seen.popitem(last=False)
+        return True
+
+    async def on_push_frame(self, data: FramePushed):
+        frame = data.frame
+        if not isinstance(
+            frame,
+            (
+                UserStartedSpeakingFrame,
+                UserStoppedSpeakingFrame,
+                TranscriptionFrame,
+                LLMTextFrame,
+                MetricsFrame,
+                BotStartedSpeakingFrame,
+            ),
+        ):
+            return
+        if not self._first_sighting(frame):
+            return
+
+        if isinstance(frame, UserStartedSpeakingFrame):
+            # A turn the bot never answered (user kept talking) is discarded
+            self._turn = None
+            self._transcribed_at = None
+        elif isinstance(frame, UserStoppedSpeakingFrame):
+            self._turn = {"stopped_at": data.timestamp}
+        elif isinstance(frame, TranscriptionFrame):
+            self._transcribed_at = data.timestamp
+        elif isinstance(frame, LLMTextFrame):
+            if self._turn is not None:
+                self._turn.setdefault("first_text_at", data.timestamp)
+        elif isinstance(frame, MetricsFrame):
+            self._handle_metrics(data)
+        elif isinstance(frame, BotStartedSpeakingFrame):
+            self._finish_turn(data.timestamp)
+
+    def _handle_metrics(self, data: FramePushed):
+        if isinstance(data.source, LLMService):
+            stage = "llm_ttfb"
+        elif isinstance(data.source, TTSService):
+            stage = "tts_ttfb"
+        else:
+            return
+        for metric in data.frame.data:
+            if isinstance(metric, LLMUsageMetricsData):
+                self._record_prompt_tokens(metric.value.prompt_tokens)
+            elif (
+                isinstance(metric, TTFBMetricsData)
+                and metric.value
+                and self._turn is not None
+                and stage not in self._turn
+            ):
+                self._turn[stage] = metric.value * 1000
+
+    def _record_prompt_tokens(self, tokens: int):
+        # Usage is reported when the response completes, usually after the bot started speaking
+        if self._turn is not None:
+            self._turn.setdefault("prompt_tokens", tokens)
+        elif self.turns and "prompt_tokens" not in self.turns[-1]:
+            self.turns[-1]["prompt_tokens"] = tokens
+            self.stats.record("prompt_tokens", tokens)
+
+    def _finish_turn(self, timestamp: int):
+        turn, self._turn = self._turn, None
+        if not turn:
+            return
+
+        stopped_at = turn.pop("stopped_at")
+        first_text_at = turn.pop("first_text_at", None)
+        if first_text_at is not None:
+            turn["text_to_audio"] = max(0, timestamp - first_text_at) / NS_PER_MS
+        if self._transcribed_at is not None:
+            # Streaming STT often finalizes before VAD reports the end of speech
+            turn["stt"] = max(0, self._transcribed_at - stopped_at) / NS_PER_MS
+        turn["voice_to_voice"] = (timestamp - stopped_at) / NS_PER_MS
+        self._transcribed_at = None
+
+        for stage, value in turn.items():
+            self.stats.record(stage, value)
+        self.turn_count += 1
+        self.turns.append({stage: round(value, 1) for stage, value in turn.items()})
+        logger.debug(f"Turn latency (ms): {self.turns[-1]}")
+
+    def summary(self) -> Dict[str, Any]:
+        return {"turns": self.turn_count, "stages": self.stats.summary()}
+
+    def save(self) -> None:
+        if self.store and self.turn_count:
+            self.store.save(self.call_id, self.stats, {"tags": self.tags})
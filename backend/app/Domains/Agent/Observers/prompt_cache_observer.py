@@ -0,0 +1,50 @@
+"""Prompt cache hit tracking."""
+
+from collections import OrderedDict
+from typing import Any, Dict
+
+from pipecat.frames.frames import MetricsFrame
+from pipecat.metrics.metrics import LLMUsageMetricsData
+from pipecat.observers.base_observer import BaseObserver, FramePushed
+
+from app.Domains.Agent.Cache.prompt_cache import (
+    PromptCacheHandle,
+    PromptCacheRegistry,
+    PromptCacheUsage,
+)
+
+
+class PromptCacheObserver(BaseObserver):
+    """Counts cached prompt tokens reported by the LLM's usage metrics for one call."""
+
+    def __init__(self, handle: PromptCacheHandle, registry: PromptCacheRegistry):
+        super().__init__()
+        self.handle = handle
+        self.registry = registry
+        self.usage = PromptCacheUsage()
+        self._seen: "OrderedDict[int, None]" = OrderedDict()
+
+    async def on_push_frame(self, data: FramePushed):
+        frame = data.frame
+        if not isinstance(frame, MetricsFrame) or frame.id in self._seen:
+            return
+        self._seen[frame.id] = None
+        if len(self._seen) > 256:
+            self._seen.popitem(last=False)
+
+        for metric in frame.data:
+            if isinstance(metric, LLMUsageMetricsData):
+                tokens = metric.value
+                self.usage.record(
+                    prompt_tokens=tokens.prompt_tokens or 0,
+                    cached_tokens=getattr(tokens, "cache_read_input_tokens", None) or 0,
+                    cache_write_tokens=getattr(tokens, "cache_creation_input_tokens", None) or 0,
+                )
+
+    def summary(self) -> Dict[str, Any]:
+        return {"cache_key": self.handle.cache_key, **self.usage.stats()}
+
+    def save(self) -> None:
+        """Add this call's usage to the assistant's handle in the shared registry."""
+        if self.usage.requests:
+            self.registry.record_call(self.handle, self.usage)
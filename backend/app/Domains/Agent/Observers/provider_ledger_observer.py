@@ -0,0 +1,61 @@
+"""Feeds the provider ledger from pipeline metrics."""
+
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+from pipecat.frames.frames import ErrorFrame, MetricsFrame
+from pipecat.metrics.metrics import LLMUsageMetricsData, TTFBMetricsData, TTSUsageMetricsData
+from pipecat.observers.base_observer import BaseObserver, FramePushed
+
+from app.Domains.Agent.Metrics.provider_ledger import ProviderLedger
+
+# (kind, provider, model)
+ServiceIdentity = Tuple[str, str, Optional[str]]
+
+
+class ProviderLedgerObserver(BaseObserver):
+    """Records TTFB, errors and usage of known services into a ProviderLedger.
+
+    `services` maps each service instance to its identity, e.g.
+    `{llm: ("llm", "openai", "gpt-4o")}`. Requires
+    `PipelineParams(enable_metrics=True, enable_usage_metrics=True)`.
+    """
+
+    def __init__(self, ledger: ProviderLedger, services: Dict[object, ServiceIdentity]):
+        super().__init__()
+        self.ledger = ledger
+        self._services = {id(service): identity for service, identity in services.items()}
+        self._seen: "OrderedDict[int, None]" = OrderedDict()
+
+    async def on_push_frame(self, data: FramePushed):
+        frame = data.frame
+        if not isinstance(frame, (MetricsFrame, ErrorFrame)) or frame.id in self._seen:
+            return
+        self._seen[frame.id] = None
+        if len(self._seen) > 256:
+            self._seen.popitem(last=False)
+
+        if isinstance(frame, ErrorFrame):
+            source = getattr(frame, "processor", None) or data.source
+            identity = self._services.get(id(source))
+            if identity:
+                self.ledger.record_error(*identity)
+            return
+
+        identity = self._services.get(id(data.source))
+        if not identity:
+            return
+        for metric in frame.data:
+            if isinstance(metric, TTFBMetricsData) and metric.value:
+                self.ledger.record_ttfb(*identity, metric.value * 1000)
+            elif isinstance(metric, LLMUsageMetricsData):
+                self.ledger.record_usage(
+                    *identity,
+                    prompt_tokens=metric.value.prompt_tokens or 0,
+                    completion_tokens=metric.value.completion_tokens or 0,
+                )
+            elif isinstance(metric, TTSUsageMetricsData):
+                self.ledger.record_usage(*identity, characters=metric.value or 0)
+
+    def save(self) -> None:
+        self.ledger.flush()
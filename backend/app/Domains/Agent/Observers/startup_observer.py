@@ -0,0 +1,68 @@
+"""Pipeline start-up timing and readiness."""
+
+import asyncio
+from typing import Any, Dict, Optional
+
+from loguru import logger
+from pipecat.frames.frames import StartFrame
+from pipecat.observers.base_observer import BaseObserver, FramePushed
+
+from app.Domains.Agent.Metrics.latency import LatencyStats
+
+NS_PER_MS = 1_000_000
+
+
+class StartupObserver(BaseObserver):
+    """Times how long each processor holds the StartFrame.
+
+    Services open their provider connections (websockets, realtime sessions) when they
+    receive the StartFrame and only pass it on once connected, so the time a service
+    holds it is its connection setup time. `processors` maps the processors to time to a
+    label; the pipeline is ready once `ready_at` has passed the StartFrame on. Setup times
+    also go into `stats` (the call's latency stats) as `setup_<label>` stages.
+    """
+
+    def __init__(
+        self,
+        processors: Dict[object, str],
+        ready_at: object,
+        stats: Optional[LatencyStats] = None,
+    ):
+        super().__init__()
+        self._stats = stats
+        self._labels = {id(processor): label for processor, label in processors.items()}
+        self._ready_at = id(ready_at)
+        self._received: Dict[int, int] = {}
+        self._first_at: Optional[int] = None
+        self.setup_ms: Dict[str, float] = {}
+        self.ready = asyncio.Event()
+
+    async def on_push_frame(self, data: FramePushed):
+        if not isinstance(data.frame, StartFrame) or self.ready.is_set():
+            return
+        if self._first_at is None:
+            self._first_at = data.timestamp
+
+        self._received[id(data.destination)] = data.timestamp
+        source = id(data.source)
+        label = self._labels.get(source)
+        if label and source in self._received:
+            self.setup_ms[label] = round((data.timestamp - self._received[source]) / NS_PER_MS, 1)
+            if self._stats is not None:
+                self._stats.record(f"setup_{label}", self.setup_ms[label])
+
+        if source == self._ready_at:
+            self.setup_ms["total"] = round((data.timestamp - self._first_at) / NS_PER_MS, 1)
+            self.ready.set()
+            logger.info(f"Pipeline ready, setup times (ms): {self.setup_ms}")
+
+    async def wait_ready(self, timeout: float) -> bool:
+        try:
+            await asyncio.wait_for(self.ready.wait(), timeout=timeout)
+            return True
+        except asyncio.TimeoutError:
+            logger.warning(f"Pipeline not ready after {timeout}s, continuing anyway")
+            return False
+
+    def summary(self) -> Dict[str, Any]:
+        return {"ready": self.ready.is_set(), "setup_ms": self.setup_ms}
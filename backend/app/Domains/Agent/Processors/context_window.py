@@ -0,0 +1,181 @@
+"""Bounded LLM context for long calls."""
+
+import asyncio
+from typing import Awaitable, Callable, Dict, List, Optional
+
+from loguru import logger
+from pipecat.frames.frames import Frame, LLMContextFrame
+from pipecat.processors.aggregators.llm_context import LLMContext
+from pipecat.processors.frame_processor import FrameDirection, FrameProcessor
+
+SUMMARY_PREFIX = "Summary of the earlier conversation:"
+
+SUMMARY_INSTRUCTION = (
+    "You maintain a running summary of a phone conversation between a user and an "
+    "assistant. Merge the previous summary with the new turns into one concise summary. "
+    "Keep names, numbers, dates, decisions and open requests. Reply with the summary only."
+)
+
+# (previous summary, messages to fold) -> new summary
+Summarizer = Callable[[Optional[str], List[Dict]], Awaitable[Optional[str]]]
+
+
+def format_transcript(messages: List[Dict]) -> str:
+    lines = []
+    for message in messages:
+        content = message.get("content")
+        if isinstance(content, list):
+            content = " ".join(part.get("text", "") for part in content if isinstance(part, dict))
+        if content:
+            lines.append(f"{message.get('role', 'unknown')}: {content}")
+    return "\n".join(lines)
+
+
+class ContextWindowManager(FrameProcessor):
+    """Keeps the system prompt plus the last `max_turns` user turns in the LLM context.
+
+    Place it between the user context aggregator and the LLM. Before each request the
+    context is trimmed in place. With the "summarize" strategy the dropped turns are
+    folded into a running summary by a background task, so the summary lags by a turn or
+    so but summarization never delays a response. With "sliding_window" they are dropped.
+    Dropped turns are kept aside, so `transcript()` still returns the whole call.
+    """
+
+    def __init__(
+        self,
+        context: LLMContext,
+        *,
+        max_turns: int = 12,
+        strategy: str = "summarize",
+        summarizer: Optional[Summarizer] = None,
+        **kwargs,
+    ):
+        super().__init__(**kwargs)
+        self._context = context
+        self._max_turns = max(1, max_turns)
+        self._strategy = strategy
+        self._summarizer = summarizer if strategy == "summarize" else None
+
+        self._summary: Optional[str] = None
+        self._to_fold: List[Dict] = []
+        # Every message trimmed from the context, in order (append-only)
+        self._dropped: List[Dict] = []
+        self._summary_task: Optional[asyncio.Task] = None
+
+    @property
+    def summary(self) -> Optional[str]:
+        return self._summary
+
+    def transcript(self) -> List[Dict]:
+        """The whole conversation: the prompt, every trimmed turn, then the current ones."""
+        messages = self._context.get_messages()
+        head = 0
+        while head < len(messages) and _is_system(messages[head]):
+            head += 1
+        prefix = [m for m in messages[:head] if not _is_summary(m)]
+        return prefix + self._dropped + messages[head:]
+
+    def trim(self) -> int:
+        """Trim the context in place. Returns the number of messages removed."""
+        messages = self._context.get_messages()
+
+        # Leading system messages (the prompt) are always kept verbatim
+        head = 0
+        while head < len(messages) and _is_system(messages[head]):
+            head += 1
+        prefix = [m for m in messages[:head] if not _is_summary(m)]
+        body = messages[head:]
+
+        # Cut only at user messages, so tool calls stay with their results
+        user_indexes = [i for i, m in enumerate(body) if _role(m) == "user"]
+        if len(user_indexes) <= self._max_turns:
+            return 0
+        cut = user_indexes[-self._max_turns]
+        dropped, kept = body[:cut], body[cut:]
+        self._dropped.extend(dropped)
+
+        if self._summarizer:
+            self._to_fold.extend(m for m in dropped if isinstance(m, dict))
+            self._maybe_start_summary()
+
+        self._context.set_messages(prefix + self._summary_messages() + kept)
+        logger.debug(f"Context trimmed: dropped {len(dropped)} message(s), kept {len(kept)}")
+        return len(dropped)
+
+    def _summary_messages(self) -> List[Dict]:
+        if not self._summary:
+            return []
+        return [{"role": "system", "content": f"{SUMMARY_PREFIX} {self._summary}"}]
+
+    def _maybe_start_summary(self):
+        if not self._to_fold or (self._summary_task and not self._summary_task.done()):
+            return
+        batch, self._to_fold = self._to_fold, []
+        self._summary_task = self.create_task(self._summarize(batch))
+
+    async def _summarize(self, batch: List[Dict]):
+        try:
+            summary = await self._summarizer(self._summary, batch)
+        except Exception as e:
+            logger.warning(f"Context summarization failed, dropping {len(batch)} message(s): {e}")
+            summary = None
+
+        if summary:
+            self._summary = summary.strip()
+            self._replace_summary()
+
+        # Turns dropped while this summary was running
+        self._maybe_start_summary()
+
+    def _replace_summary(self):
+        messages = self._context.get_messages()
+        head = 0
+        while head < len(messages) and _is_system(messages[head]):
+            head += 1
+        prefix = [m for m in messages[:head] if not _is_summary(m)]
+        self._context.set_messages(prefix + self._summary_messages() + messages[head:])
+
+    async def process_frame(self, frame: Frame, direction: FrameDirection):
+        await super().process_frame(frame, direction)
+
+        if isinstance(frame, LLMContextFrame) and frame.context is self._context:
+            self.trim()
+
+        await self.push_frame(frame, direction)
+
+    async def cleanup(self):
+        await super().cleanup()
+        if self._summary_task:
+            await self.cancel_task(self._summary_task)
+            self._summary_task = None
+
+
+def _role(message) -> Optional[str]:
+    return message.get("role") if isinstance(message, dict) else None
+
+
+def _is_system(message) -> bool:
+    return _role(message) == "system"
+
+
+def _is_summary(message) -> bool:
+    content = message.get("content") if isinstance(message, dict) else None
+    return isinstance(content, str) and content.startswith(SUMMARY_PREFIX)
+
+
+def llm_summarizer(llm) -> Summarizer:
+    """Summarizer that runs an out-of-band request on the bot's own LLM service."""
+
+    async def summarize(previous: Optional[str], messages: List[Dict]) -> Optional[str]:
+        prompt = format_transcript(messages)
+        if previous:
+            prompt = f"Previous summary:\n{previous}\n\nNew turns:\n{prompt}"
+        context = LLMContext(
+            messages=[
+                {"role": "system", "content": SUMMARY_INSTRUCTION},
+                {"role": "user", "content": prompt},
+            ]
+        )
+        return await llm.run_inference(context)
+
+    return summarize
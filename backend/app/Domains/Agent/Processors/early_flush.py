@@ -0,0 +1,83 @@
+"""Clause-level text aggregation between the LLM and the TTS service."""
+
+import re
+from typing import Optional
+
+from pipecat.frames.frames import (
+    EndFrame,
+    Frame,
+    InterruptionFrame,
+    LLMFullResponseEndFrame,
+    LLMFullResponseStartFrame,
+    LLMTextFrame,
+)
+from pipecat.processors.frame_processor import FrameDirection, FrameProcessor
+
+SENTENCE_END = re.compile(r"[.!?…][\"')\]»]*\s")
+
+# A clause ends at punctuation followed by a space, or right before a conjunction
+CLAUSE_END = re.compile(r"[,;:—]\s")
+CONJUNCTION = re.compile(
+    r"\s(?=(?:y|e|o|u|pero|que|porque|aunque|pues|entonces|mientras|"
+    r"and|but|or|so|because|while)\s)",
+    re.IGNORECASE,
+)
+
+
+class EarlyFlushTextAggregator(FrameProcessor):
+    """Sends the first clause of each response to TTS as soon as it is complete.
+
+    Place it between the LLM and a TTS service created with `aggregate_sentences=False`.
+    The first clause of a response is flushed at a comma or before a conjunction once it
+    has `min_words` words, so synthesis starts before a long sentence is finished; the rest
+    of the response is flushed sentence by sentence, as the TTS would do itself.
+    """
+
+    def __init__(self, *, min_words: int = 4, **kwargs):
+        super().__init__(**kwargs)
+        self._min_words = max(1, min_words)
+        self._buffer = ""
+        self._first_clause = True
+
+    def _split(self) -> Optional[int]:
+        """Index where the buffered text can be flushed, if any."""
+        if self._first_clause:
+            ends = sorted(
+                match.end()
+                for pattern in (CLAUSE_END, SENTENCE_END, CONJUNCTION)
+                for match in pattern.finditer(self._buffer)
+            )
+            for end in ends:
+                if len(self._buffer[:end].split()) >= self._min_words:
+                    return end
+        match = SENTENCE_END.search(self._buffer)
+        return match.end() if match else None
+
+    async def _flush(self, text: str):
+        if text.strip():
+            await self.push_frame(LLMTextFrame(text))
+
+    async def process_frame(self, frame: Frame, direction: FrameDirection):
+        await super().process_frame(frame, direction)
+
+        if isinstance(frame, LLMTextFrame) and direction == FrameDirection.DOWNSTREAM:
+            self._buffer += frame.text
+            index = self._split()
+            while index is not None:
+                chunk, self._buffer = self._buffer[:index], self._buffer[index:]
+                self._first_clause = False
+                await self._flush(chunk)
+                index = self._split()
+            return
+
+        if isinstance(frame, LLMFullResponseStartFrame):
+            self._buffer = ""
+            self._first_clause = True
+        elif isinstance(frame, (LLMFullResponseEndFrame, EndFrame)):
+            text, self._buffer = self._buffer, ""
+            await self._flush(text)
+        elif isinstance(frame, InterruptionFrame):
+            self._buffer = ""
+            self._first_clause = True
+
+        await self.push_frame(frame, direction)
@@ -0,0 +1,111 @@
+"""Filler speech played while slow tools run."""
+
+import asyncio
+from typing import Callable, List, Optional, Set
+
+from loguru import logger
+from pipecat.frames.frames import (
+    CancelFrame,
+    EndFrame,
+    Frame,
+    FunctionCallCancelFrame,
+    FunctionCallInProgressFrame,
+    FunctionCallResultFrame,
+    InterruptionFrame,
+    OutputAudioRawFrame,
+    TTSStartedFrame,
+)
+from pipecat.processors.frame_processor import FrameDirection, FrameProcessor
+
+from app.Domains.Agent.Processors.prerendered_audio import PLAYBACK_CHUNK_MS
+
+DEFAULT_FILLER_PHRASES = ["Un momento, por favor.", "Déjame revisar."]
+
+# Audio queued ahead of real time; bounds how much filler is heard after a cancel
+LEAD_CHUNKS = 2
+
+
+class FillerSpeechProcessor(FrameProcessor):
+    """Masks tool latency with a short pre-rendered phrase.
+
+    Place it after the TTS service. When a function call is still running `threshold_ms`
+    after it started, one filler phrase is played from the audio cache, paced in real time
+    so it can be stopped as soon as the result (or the bot's answer, or the user) arrives.
+    Phrases without cached audio are skipped: live synthesis would only add latency.
+    """
+
+    def __init__(
+        self,
+        phrases: List[str],
+        load_clip: Callable[[str], Optional[bytes]],
+        *,
+        sample_rate: int,
+        threshold_ms: float = 1000.0,
+        **kwargs,
+    ):
+        super().__init__(**kwargs)
+        self._phrases = phrases or DEFAULT_FILLER_PHRASES
+        self._load_clip = load_clip
+        self._sample_rate = sample_rate
+        self._threshold = threshold_ms / 1000
+
+        self._pending: Set[str] = set()
+        self._task: Optional[asyncio.Task] = None
+        self._next_phrase = 0
+        self.played = 0
+
+    async def process_frame(self, frame: Frame, direction: FrameDirection):
+        await super().process_frame(frame, direction)
+
+        if direction == FrameDirection.DOWNSTREAM:
+            if isinstance(frame, FunctionCallInProgressFrame):
+                self._pending.add(frame.tool_call_id)
+                if not self._task or self._task.done():
+                    self._task = self.create_task(self._fill())
+            elif isinstance(frame, (FunctionCallResultFrame, FunctionCallCancelFrame)):
+                self._pending.discard(frame.tool_call_id)
+                if not self._pending:
+                    await self._stop()
+            elif isinstance(frame, TTSStartedFrame):
+                await self._stop()
+
+        if isinstance(frame, (InterruptionFrame, EndFrame, CancelFrame)):
+            self._pending.clear()
+            await self._stop()
+
+        await self.push_frame(frame, direction)
+
+    async def _fill(self):
+        await asyncio.sleep(self._threshold)
+        if not self._pending:
+            return
+
+        text = self._phrases[self._next_phrase % len(self._phrases)]
+        self._next_phrase += 1
+        clip = self._load_clip(text)
+        if clip is None:
+            logger.debug(f"No pre-rendered audio for filler phrase: {text}")
+            return
+
+        logger.debug(f"Tool still running after {self._threshold}s, playing filler: {text}")
+        self.played += 1
+        chunk_size = int(self._sample_rate * PLAYBACK_CHUNK_MS / 1000) * 2
+        for index, offset in enumerate(range(0, len(clip), chunk_size)):
+            await self.push_frame(
+                OutputAudioRawFrame(
+                    audio=bytes(clip[offset : offset + chunk_size]),
+                    sample_rate=self._sample_rate,
+                    num_channels=1,
+                )
+            )
+            if index >= LEAD_CHUNKS - 1:
+                await asyncio.sleep(PLAYBACK_CHUNK_MS / 1000)
+
+    async def _stop(self):
+        task, self._task = self._task, None
+        if task and not task.done():
+            await self.cancel_task(task)
+
+    async def cleanup(self):
+        await super().cleanup()
+        await self._stop()
@@ -0,0 +1,283 @@
+"""Hedged LLM requests across two providers."""
+
+import asyncio
+import time
+from typing import Any, Dict, List, Optional, Set
+
+from loguru import logger
+from pipecat.frames.frames import (
+    CancelFrame,
+    EndFrame,
+    Frame,
+    FunctionCallInProgressFrame,
+    FunctionCallsStartedFrame,
+    InterruptionFrame,
+    LLMContextFrame,
+    LLMFullResponseEndFrame,
+    LLMFullResponseStartFrame,
+    LLMTextFrame,
+    MetricsFrame,
+    SystemFrame,
+)
+from pipecat.pipeline.parallel_pipeline import ParallelPipeline
+from pipecat.processors.frame_processor import FrameDirection, FrameProcessor
+from pipecat.services.llm_service import FunctionCallParams, LLMService
+
+from app.Domains.Agent.Metrics.latency import LatencyHistogram
+
+PRIMARY = "primary"
+SECONDARY = "secondary"
+
+# Until enough first-token samples exist, hedge after this long
+DEFAULT_HEDGE_AFTER_MS = 1500.0
+MIN_HEDGE_AFTER_MS = 200.0
+MIN_SAMPLES = 20
+
+# Frames that mean a branch has started answering
+FIRST_OUTPUT_FRAMES = (LLMTextFrame, FunctionCallsStartedFrame, FunctionCallInProgressFrame)
+
+
+class HedgeCoordinator:
+    """Shared state of the two branches for the request in flight."""
+
+    def __init__(self, hedge_after_ms: Optional[float] = None):
+        self.hedge_after_ms = hedge_after_ms
+        self.primary_ttft = LatencyHistogram()
+
+        self.input_gates: Dict[str, "HedgeInputGate"] = {}
+        self.winner: Optional[str] = None
+        self.hedged = False
+        self._started_at = 0.0
+        self._timer: Optional[asyncio.Task] = None
+        # Cancellations of losing branches still being pushed
+        self._cancelling: Set[asyncio.Task] = set()
+        # Interruptions injected to cancel the losing branch, never forwarded
+        self.injected_ids: set = set()
+
+        self._stats: Dict[str, int] = {"requests": 0, "hedged": 0, PRIMARY: 0, SECONDARY: 0}
+
+    def hedge_delay(self) -> float:
+        """Seconds to wait for the primary: fixed budget, or its observed p95 first token."""
+        if self.hedge_after_ms is not None:
+            return self.hedge_after_ms / 1000
+        if self.primary_ttft.count < MIN_SAMPLES:
+            return DEFAULT_HEDGE_AFTER_MS / 1000
+        return max(MIN_HEDGE_AFTER_MS, self.primary_ttft.percentile(0.95)) / 1000
+
+    def begin(self, frame: LLMContextFrame):
+        self.reset()
+        self._stats["requests"] += 1
+        self._started_at = time.monotonic()
+        secondary = self.input_gates.get(SECONDARY)
+        if secondary:
+            self._timer = asyncio.create_task(self._hedge_after(secondary, frame))
+
+    async def _hedge_after(self, secondary: "HedgeInputGate", frame: LLMContextFrame):
+        await asyncio.sleep(self.hedge_delay())
+        if self.winner is None:
+            self.hedged = True
+            self._stats["hedged"] += 1
+            logger.debug("Primary LLM is slow, hedging to the secondary provider")
+            await secondary.release(frame)
+
+    def declare(self, role: str) -> bool:
+        """First output of a branch. Returns True if that branch won the request."""
+        if self.winner is not None:
+            return self.winner == role
+
+        self.winner = role
+        self._stats[role] += 1
+        # When the secondary wins, the primary's first token would have come later still:
+        # record the wait so far (past the hedge delay) rather than leave the slow requests
+        # out, which would pull the p95 down request after request
+        self.primary_ttft.record((time.monotonic() - self._started_at) * 1000)
+        if self._timer:
+            self._timer.cancel()
+            self._timer = None
+
+        loser = SECONDARY if role == PRIMARY else PRIMARY
+        if self.hedged and loser in self.input_gates:
+            task = asyncio.create_task(self.input_gates[loser].cancel_request())
+            self._cancelling.add(task)
+            task.add_done_callback(self._cancelling.discard)
+        return True
+
+    def allows(self, role: str) -> bool:
+        return self.winner is None or self.winner == role
+
+    def reset(self):
+        if self._timer:
+            self._timer.cancel()
+            self._timer = None
+        self.winner = None
+        self.hedged = False
+
+    def close(self):
+        """Cancel the hedge timer and pending cancellations (pipeline cleanup)."""
+        self.reset()
+        for task in list(self._cancelling):
+            task.cancel()
+        self._cancelling.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        hedged = self._stats["hedged"]
+        return {
+            "requests": self._stats["requests"],
+            "hedged": hedged,
+            "primary_wins": self._stats[PRIMARY],
+            "secondary_wins": self._stats[SECONDARY],
+            "secondary_win_rate": round(self._stats[SECONDARY] / hedged, 3) if hedged else 0.0,
+            "hedge_after_ms": round(self.hedge_delay() * 1000, 1),
+        }
+
+
+class HedgeInputGate(FrameProcessor):
+    """Sits before a branch's LLM. The secondary holds each request until it is hedged."""
+
+    def __init__(self, coordinator: HedgeCoordinator, role: str, **kwargs):
+        super().__init__(**kwargs)
+        self._coordinator = coordinator
+        self._role = role
+        coordinator.input_gates[role] = self
+
+    async def release(self, frame: LLMContextFrame):
+        await self.push_frame(frame, FrameDirection.DOWNSTREAM)
+
+    async def cancel_request(self):
+        interruption = InterruptionFrame()
+        self._coordinator.injected_ids.add(interruption.id)
+        await self.push_frame(interruption, FrameDirection.DOWNSTREAM)
+
+    async def process_frame(self, frame: Frame, direction: FrameDirection):
+        await super().process_frame(frame, direction)
+
+        if direction == FrameDirection.UPSTREAM:
+            # Function call progress/results from the losing branch must not reach the context
+            if isinstance(frame, SystemFrame) or self._coordinator.allows(self._role):
+                await self.push_frame(frame, direction)
+            return
+
+        if isinstance(frame, LLMContextFrame):
+            if self._role == PRIMARY:
+                self._coordinator.begin(frame)
+                await self.push_frame(frame, direction)
+            return
+
+        if isinstance(frame, InterruptionFrame) and self._role == PRIMARY:
+            self._coordinator.reset()
+        elif isinstance(frame, (EndFrame, CancelFrame)) and self._role == PRIMARY:
+            self._coordinator.reset()
+
+        await self.push_frame(frame, direction)
+
+    async def cleanup(self):
+        await super().cleanup()
+        if self._role == PRIMARY:
+            self._coordinator.close()
+
+
+class HedgeOutputGate(FrameProcessor):
+    """Sits after a branch's LLM and only lets the winning branch's output through."""
+
+    def __init__(self, coordinator: HedgeCoordinator, role: str, **kwargs):
+        super().__init__(**kwargs)
+        self._coordinator = coordinator
+        self._role = role
+        self._buffer: List[Frame] = []
+
+    async def process_frame(self, frame: Frame, direction: FrameDirection):
+        await super().process_frame(frame, direction)
+        coordinator = self._coordinator
+
+        if direction == FrameDirection.UPSTREAM:
+            await self.push_frame(frame, direction)
+            return
+
+        if isinstance(frame, InterruptionFrame):
+            self._buffer.clear()
+            if frame.id in coordinator.injected_ids:
+                coordinator.injected_ids.discard(frame.id)
+                return
+            await self.push_frame(frame, direction)
+            return
+
+        if isinstance(frame, MetricsFrame):
+            if coordinator.allows(self._role):
+                await self.push_frame(frame, direction)
+            return
+
+        if isinstance(frame, LLMFullResponseStartFrame) and coordinator.winner is None:
+            self._buffer.append(frame)
+            return
+
+        if isinstance(frame, FIRST_OUTPUT_FRAMES) or (
+            isinstance(frame, LLMFullResponseEndFrame) and coordinator.winner is None
+        ):
+            if not coordinator.declare(self._role):
+                self._buffer.clear()
+                return
+            for buffered in self._buffer:
+                await self.push_frame(buffered, direction)
+            self._buffer.clear()
+
+        if coordinator.allows(self._role):
+            await self.push_frame(frame, direction)
+
+
+class HedgedLLMService(ParallelPipeline):
+    """Runs a primary LLM and hedges slow requests to a secondary provider.
+
+    Every request goes to the primary. If it has not produced a first token within the
+    hedge budget (fixed, or the primary's observed p95), the same context is sent to the
+    secondary; whichever answers first is streamed and the other is cancelled. Both
+    services share the context, so tools must be set on it as a provider-neutral
+    ToolsSchema for function calling to work on either side.
+    """
+
+    def __init__(
+        self,
+        primary: LLMService,
+        secondary: LLMService,
+        *,
+        hedge_after_ms: Optional[float] = None,
+    ):
+        self.primary = primary
+        self.secondary = secondary
+        self.coordinator = HedgeCoordinator(hedge_after_ms)
+        super().__init__(
+            [
+                HedgeInputGate(self.coordinator, PRIMARY),
+                primary,
+                HedgeOutputGate(self.coordinator, PRIMARY),
+            ],
+            [
+                HedgeInputGate(self.coordinator, SECONDARY),
+                secondary,
+                HedgeOutputGate(self.coordinator, SECONDARY),
+            ],
+        )
+
+    @property
+    def prompt_cache(self):
+        return getattr(self.primary, "prompt_cache", None)
+
+    def register_function(self, function_name: Optional[str], handler, *args, **kwargs):
+        """Register on both services; only the winning branch's calls run."""
+        for role, service in ((PRIMARY, self.primary), (SECONDARY, self.secondary)):
+            service.register_function(function_name, self._guard(role, handler), *args, **kwargs)
+
+    def _guard(self, role: str, handler):
+        async def guarded(params: FunctionCallParams):
+            if not self.coordinator.allows(role):
+                logger.debug(f"Skipping {params.function_name} from the losing {role} LLM")
+                return
+            await handler(params)
+
+        guarded.__name__ = getattr(handler, "__name__", "handler")
+        return guarded
+
+    async def run_inference(self, context) -> Optional[str]:
+        return await self.primary.run_inference(context)
+
+    def stats(self) -> Dict[str, Any]:
+        return self.coordinator.stats()
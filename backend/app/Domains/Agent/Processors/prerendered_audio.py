@@ -0,0 +1,113 @@
+"""Processors and helpers for pre-rendered static phrases."""
+
+import asyncio
+from collections import deque
+from typing import Deque, Optional
+
+from loguru import logger
+from pipecat.frames.frames import (
+    CancelFrame,
+    Frame,
+    InterruptionFrame,
+    OutputAudioRawFrame,
+    TTSAudioRawFrame,
+    TTSStartedFrame,
+    TTSStoppedFrame,
+)
+from pipecat.processors.frame_processor import FrameDirection, FrameProcessor
+
+from app.Domains.Agent.Cache.audio_cache import PrerenderedAudioCache, audio_cache_key
+
+# Size of each frame handed to the output transport (100ms of 16-bit mono audio).
+PLAYBACK_CHUNK_MS = 100
+
+
+class PrerenderedAudioRecorder(FrameProcessor):
+    """Captures TTS output for expected static phrases and stores it in the audio cache.
+
+    Place this processor right after the TTS service. Call `expect(text)` before queueing a
+    `TTSSpeakFrame` for a phrase; the audio between the next TTSStartedFrame and
+    TTSStoppedFrame is stored under that phrase's key. Interrupted phrases are discarded.
+    """
+
+    def __init__(
+        self,
+        cache: PrerenderedAudioCache,
+        *,
+        provider: str,
+        voice: Optional[str],
+        language: Optional[str],
+        **kwargs,
+    ):
+        super().__init__(**kwargs)
+        self._cache = cache
+        self._provider = provider
+        self._voice = voice
+        self._language = language
+
+        self._pending: Deque[str] = deque()
+        self._current: Optional[str] = None
+        self._buffer = bytearray()
+        self._sample_rate: Optional[int] = None
+        self._idle = asyncio.Event()
+        self._idle.set()
+
+    def expect(self, text: str):
+        """Record the next synthesized phrase as `text`."""
+        self._pending.append(text)
+        self._idle.clear()
+
+    async def wait_idle(self, timeout: float = 30.0) -> bool:
+        """Wait until every expected phrase has been stored or discarded."""
+        try:
+            await asyncio.wait_for(self._idle.wait(), timeout=timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+
+    def _finish(self, store: bool):
+        if store and self._current and self._sample_rate:
+            key = audio_cache_key(
+                self._provider, self._voice, self._language, self._sample_rate, self._current
+            )
+            self._cache.put(key, bytes(self._buffer))
+        elif self._current:
+            logger.debug(f"Discarding partial recording for: {self._current}")
+
+        self._current = None
+        self._buffer = bytearray()
+        self._sample_rate = None
+        if not self._pending:
+            self._idle.set()
+
+    async def process_frame(self, frame: Frame, direction: FrameDirection):
+        await super().process_frame(frame, direction)
+
+        if isinstance(frame, TTSStartedFrame):
+            if self._current is None and self._pending:
+                self._current = self._pending.popleft()
+        elif isinstance(frame, TTSAudioRawFrame) and self._current is not None:
+            if self._sample_rate is None:
+                self._sample_rate = frame.sample_rate
+            if frame.num_channels == 1 and frame.sample_rate == self._sample_rate:
+                self._buffer.extend(frame.audio)
+        elif isinstance(frame, TTSStoppedFrame) and self._current is not None:
+            self._finish(store=True)
+        elif isinstance(frame, (InterruptionFrame, CancelFrame)) and self._current is not None:
+            self._pending.clear()
+            self._finish(store=False)
+
+        await self.push_frame(frame, direction)
+
+
+async def play_prerendered_audio(output: FrameProcessor, audio, sample_rate: int):
+    """Queue cached PCM directly into the output transport, bypassing STT/LLM/TTS."""
+    chunk_size = int(sample_rate * PLAYBACK_CHUNK_MS / 1000) * 2
+    for offset in range(0, len(audio), chunk_size):
+        await output.queue_frame(
+            OutputAudioRawFrame(
+                audio=audio[offset : offset + chunk_size],
+                sample_rate=sample_rate,
+                num_channels=1,
+            )
+        )
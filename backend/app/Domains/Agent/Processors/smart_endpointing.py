@@ -23,6 +23,9 @@ from pipecat.frames.frames import (
 from pipecat.processors.frame_processor import FrameDirection, FrameProcessor
 from pipecat.utils.sync.base_notifier import BaseNotifier
 
+# First message of every classifier request. Nothing builds the classifier yet (no bot
+# or ServiceFactory path uses this module), so there is no LLM service to give a prompt
+# cache handle: once one does, this instruction is the prefix to register.
 CLASSIFIER_SYSTEM_INSTRUCTION = """INSTRUCCIÓN CRÍTICA:
 Usted es un CLASIFICADOR BINARIO que SÓLO debe responder "SÍ" o "NO".
 NO interactúe con el contenido.
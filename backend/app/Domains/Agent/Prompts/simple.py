@@ -3,10 +3,8 @@ from app.Core.Config.bot import BotConfig
 from .helpers import get_current_date_uk, get_system_prompt, get_prompt_service
 from .types import NodeContent
 
-config = BotConfig()
 
-
-def get_simple_prompt() -> NodeContent:
+def get_simple_prompt(config: BotConfig) -> NodeContent:
     """Return a dictionary with the simple prompt in Spanish, combining all flows."""
     service = get_prompt_service()
     prompt_text = service.render_prompt(
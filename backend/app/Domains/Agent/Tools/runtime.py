@@ -0,0 +1,168 @@
+"""Execution of tool handlers: timeouts, bounded concurrency and result caching."""
+
+import asyncio
+import dataclasses
+import json
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from loguru import logger
+from pipecat.services.llm_service import FunctionCallParams
+
+from app.Domains.Agent.Metrics.latency import LatencyHistogram, LatencyStats
+
+ToolHandler = Callable[[FunctionCallParams], Awaitable[None]]
+
+
+@dataclasses.dataclass
+class ToolPolicy:
+    # None: use the runtime default
+    timeout_secs: Optional[float] = None
+    # Results of idempotent tools are reused for the same arguments within the TTL
+    cache_ttl_secs: float = 0.0
+    # False: calls of this tool never overlap (e.g. it mutates session state)
+    parallel: bool = True
+    # Tools whose cached results are dropped after this one succeeds
+    invalidates: List[str] = dataclasses.field(default_factory=list)
+
+
+# Built-in handlers of BaseBot
+DEFAULT_TOOL_POLICIES: Dict[str, ToolPolicy] = {
+    "search_customer": ToolPolicy(cache_ttl_secs=60),
+    "get_scheduled_appointments": ToolPolicy(cache_ttl_secs=30),
+    "schedule_appointment": ToolPolicy(parallel=False, invalidates=["get_scheduled_appointments"]),
+    "create_crm_lead": ToolPolicy(parallel=False, invalidates=["search_customer"]),
+}
+
+
+class ToolRuntime:
+    """Wraps tool handlers before they are registered with the LLM service.
+
+    The LLM service already runs the calls of one response in parallel; the runtime bounds
+    how many run at once, serializes tools that must not overlap, gives every call a
+    deadline (the LLM gets an error result instead of waiting forever) and serves repeated
+    calls of idempotent tools from a per-call TTL cache. Latency of every executed call is
+    recorded as the `tool_<name>` stage.
+    """
+
+    def __init__(
+        self,
+        *,
+        default_timeout_secs: float = 8.0,
+        max_concurrency: int = 4,
+        policies: Optional[Dict[str, ToolPolicy]] = None,
+        stats: Optional[LatencyStats] = None,
+    ):
+        self.default_timeout_secs = default_timeout_secs
+        self.policies: Dict[str, ToolPolicy] = {**DEFAULT_TOOL_POLICIES, **(policies or {})}
+        self.stats = stats
+
+        self._semaphore = asyncio.Semaphore(max(1, max_concurrency))
+        self._serial_locks: Dict[str, asyncio.Lock] = {}
+        # (tool, arguments) -> (expires at, result)
+        self._cache: Dict[Tuple[str, str], Tuple[float, Any]] = {}
+        self._latency: Dict[str, LatencyHistogram] = {}
+        self._counters: Dict[str, Dict[str, int]] = {}
+
+    def policy(self, name: str) -> ToolPolicy:
+        return self.policies.get(name) or ToolPolicy()
+
+    def wrap(self, name: str, handler: ToolHandler) -> ToolHandler:
+        async def run(params: FunctionCallParams):
+            await self.execute(name, handler, params)
+
+        run.__name__ = getattr(handler, "__name__", "handler")
+        return run
+
+    def invalidate(self, name: str) -> None:
+        for key in [key for key in self._cache if key[0] == name]:
+            del self._cache[key]
+
+    async def execute(self, name: str, handler: ToolHandler, params: FunctionCallParams):
+        policy = self.policy(name)
+        counters = self._counters.setdefault(
+            name, {"calls": 0, "cache_hits": 0, "timeouts": 0, "errors": 0}
+        )
+        counters["calls"] += 1
+
+        cache_key = (name, json.dumps(params.arguments or {}, sort_keys=True, default=str))
+        if policy.cache_ttl_secs:
+            cached = self._cache.get(cache_key)
+            if cached and cached[0] > time.monotonic():
+                counters["cache_hits"] += 1
+                logger.debug(f"Tool {name}: served from cache")
+                await _deliver(params, cached[1])
+                return
+
+        delivered: List[Any] = []
+
+        async def capture(result: Any, *args, **kwargs):
+            delivered.append(result)
+            if params.result_callback:
+                await params.result_callback(result, *args, **kwargs)
+
+        call = dataclasses.replace(params, result_callback=capture)
+        timeout = policy.timeout_secs or self.default_timeout_secs
+        started = time.monotonic()
+        try:
+            async with self._semaphore:
+                if policy.parallel:
+                    await asyncio.wait_for(handler(call), timeout=timeout)
+                else:
+                    lock = self._serial_locks.setdefault(name, asyncio.Lock())
+                    async with lock:
+                        await asyncio.wait_for(handler(call), timeout=timeout)
+        except asyncio.TimeoutError:
+            counters["timeouts"] += 1
+            logger.warning(f"Tool {name} timed out after {timeout}s")
+            if not delivered:
+                await _deliver(
+                    params,
+                    {"status": "error", "message": f"{name} did not respond in time, try again"},
+                )
+            return
+        except Exception as e:
+            counters["errors"] += 1
+            logger.error(f"Tool {name} failed: {e}")
+            if not delivered:
+                await _deliver(params, {"status": "error", "message": f"{name} failed"})
+            return
+        finally:
+            self._record_latency(name, (time.monotonic() - started) * 1000)
+
+        if delivered:
+            if policy.cache_ttl_secs:
+                self._cache[cache_key] = (time.monotonic() + policy.cache_ttl_secs, delivered[0])
+            for other in policy.invalidates:
+                self.invalidate(other)
+
+    def _record_latency(self, name: str, elapsed_ms: float):
+        self._latency.setdefault(name, LatencyHistogram()).record(elapsed_ms)
+        stage = f"tool_{name}"
+        if self.stats is not None:
+            self.stats.record(stage, elapsed_ms)
+
+    def summary(self) -> Dict[str, Dict[str, Any]]:
+        return {
+            name: {
+                **counters,
+                "latency": self._latency[name].summary() if name in self._latency else {},
+            }
+            for name, counters in self._counters.items()
+        }
+
+
+async def _deliver(params: FunctionCallParams, result: Any):
+    if params.result_callback:
+        await params.result_callback(result)
+
+
+def tool_policies_from_config(data: Optional[Dict[str, Dict[str, Any]]]) -> Dict[str, ToolPolicy]:
+    """Per-tool overrides as found in the assistant config, on top of the defaults."""
+    policies = {}
+    for name, values in (data or {}).items():
+        base = dataclasses.asdict(DEFAULT_TOOL_POLICIES.get(name) or ToolPolicy())
+        policies[name] = ToolPolicy(
+            **{**base, **{k: v for k, v in values.items() if v is not None}}
+        )
+    return policies
@@ -0,0 +1,31 @@
+from typing import Any, Dict, List
+
+from pipecat.adapters.schemas.function_schema import FunctionSchema
+from pipecat.adapters.schemas.tools_schema import ToolsSchema
+
+
+def _function_schema(declaration: Dict[str, Any]) -> FunctionSchema:
+    parameters = declaration.get("parameters") or {}
+    return FunctionSchema(
+        name=declaration["name"],
+        description=declaration.get("description", ""),
+        properties=parameters.get("properties", {}),
+        required=parameters.get("required", []),
+    )
+
+
+def tools_schema_from_config(tools: List[Dict[str, Any]]) -> ToolsSchema:
+    """Convert assistant tools (OpenAI or Google format) into a provider-neutral ToolsSchema.
+
+    Set on the LLMContext, each LLM service's adapter turns it back into its own format,
+    so the same tools work with any provider.
+    """
+    functions = []
+    for tool in tools or []:
+        if "function" in tool:
+            functions.append(_function_schema(tool["function"]))
+        elif "function_declarations" in tool:
+            functions.extend(_function_schema(d) for d in tool["function_declarations"])
+        elif "name" in tool:
+            functions.append(_function_schema(tool))
+    return ToolsSchema(standard_tools=functions)
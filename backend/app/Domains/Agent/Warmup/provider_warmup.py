@@ -0,0 +1,104 @@
+"""DNS and TLS timings to the providers a call will use, for startup diagnostics.
+
+Runs in the bot process while the transport and services are set up, when
+PROVIDER_WARMUP_ENABLED is set. The probe sockets are closed right away and nothing is
+cached (the services open their own connections, and getaddrinfo keeps no cache without
+a local caching resolver): the timings, reported in the call_ended `startup`, only show
+how much of the call setup is spent connecting.
+"""
+
+import asyncio
+import ssl
+import time
+from typing import Dict, Iterable, List, Optional
+
+from loguru import logger
+
+STT_HOSTS = {
+    "deepgram": "api.deepgram.com",
+    "gladia": "api.gladia.io",
+    "assemblyai": "streaming.assemblyai.com",
+    "groq": "api.groq.com",
+}
+
+LLM_HOSTS = {
+    "google": "generativelanguage.googleapis.com",
+    "openai": "api.openai.com",
+    "anthropic": "api.anthropic.com",
+    "groq": "api.groq.com",
+    "together": "api.together.xyz",
+    "mistral": "api.mistral.ai",
+    "ultravox": "api.ultravox.ai",
+}
+
+TTS_HOSTS = {
+    "deepgram": "api.deepgram.com",
+    "cartesia": "api.cartesia.ai",
+    "elevenlabs": "api.elevenlabs.io",
+    "rime": "users.rime.ai",
+    "playht": "api.play.ht",
+    "openai": "api.openai.com",
+}
+
+
+def provider_hosts(
+    stt_provider: Optional[str] = None,
+    llm_provider: Optional[str] = None,
+    tts_provider: Optional[str] = None,
+) -> List[str]:
+    hosts = [
+        STT_HOSTS.get(stt_provider or ""),
+        LLM_HOSTS.get(llm_provider or ""),
+        TTS_HOSTS.get(tts_provider or ""),
+    ]
+    return list(dict.fromkeys(host for host in hosts if host))
+
+
+async def _probe(host: str, port: int, timeout: float) -> Dict[str, Optional[float]]:
+    loop = asyncio.get_running_loop()
+    started = time.perf_counter()
+    result: Dict[str, Optional[float]] = {"dns_ms": None, "tls_ms": None}
+    try:
+        infos = await asyncio.wait_for(loop.getaddrinfo(host, port), timeout=timeout)
+        resolved = time.perf_counter()
+        result["dns_ms"] = round((resolved - started) * 1000, 1)
+
+        address = infos[0][4][0]
+        _, writer = await asyncio.wait_for(
+            asyncio.open_connection(
+                address, port, ssl=ssl.create_default_context(), server_hostname=host
+            ),
+            timeout=timeout,
+        )
+        result["tls_ms"] = round((time.perf_counter() - resolved) * 1000, 1)
+        writer.close()
+    except Exception as e:
+        result["error"] = str(e) or type(e).__name__
+    return result
+
+
+async def warm_up_hosts(
+    hosts: Iterable[str], port: int = 443, timeout: float = 3.0
+) -> Dict[str, Dict[str, Optional[float]]]:
+    """Resolve and handshake with every host concurrently. Never raises."""
+    hosts = list(hosts)
+    if not hosts:
+        return {}
+    results = await asyncio.gather(*(_probe(host, port, timeout) for host in hosts))
+    timings = dict(zip(hosts, results))
+    logger.debug(f"Provider warm-up: {timings}")
+    return timings
+
+
+_background: set = set()
+
+
+def warm_up_in_background(hosts: Iterable[str]) -> Optional[asyncio.Task]:
+    """Fire-and-forget warm-up from a running event loop."""
+    try:
+        task = asyncio.get_running_loop().create_task(warm_up_hosts(hosts))
+    except RuntimeError:
+        return None
+    _background.add(task)
+    task.add_done_callback(_background.discard)
+    return task
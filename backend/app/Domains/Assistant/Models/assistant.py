@@ -17,6 +17,30 @@ class KnowledgeBaseConfig(BaseModel):
     retrieval_settings: Dict[str, Any] = Field(default_factory=dict)
 
 
+class ContextManagementConfig(BaseModel):
+    strategy: Literal["none", "sliding_window", "summarize"] = "none"
+    max_turns: int = Field(12, ge=1)
+
+
+class LLMHedgeConfig(BaseModel):
+    provider: Literal["google", "openai", "anthropic", "groq", "together", "mistral"]
+    model: Optional[str] = None
+    after_ms: Optional[float] = Field(None, gt=0)
+
+
+class ToolPolicyConfig(BaseModel):
+    timeout_secs: Optional[float] = Field(None, gt=0)
+    cache_ttl_secs: Optional[float] = Field(None, ge=0)
+    parallel: Optional[bool] = None
+    invalidates: Optional[List[str]] = None
+
+
+class ToolRuntimeConfig(BaseModel):
+    default_timeout_secs: float = Field(8.0, gt=0)
+    max_concurrency: int = Field(4, ge=1)
+    tools: Dict[str, ToolPolicyConfig] = Field(default_factory=dict)
+
+
 class AgentConfig(BaseModel):
     provider: Literal[
         "google", "openai", "anthropic", "groq", "together", "mistral", "aws", "ultravox"
@@ -27,6 +51,9 @@ class AgentConfig(BaseModel):
     initial_messages: List[Dict[str, str]] = Field(default_factory=list)
     knowledge_base: Optional[KnowledgeBaseConfig] = None
     tools: List[Dict[str, Any]] = Field(default_factory=list)
+    tool_runtime: ToolRuntimeConfig = Field(default_factory=ToolRuntimeConfig)
+    context_management: ContextManagementConfig = Field(default_factory=ContextManagementConfig)
+    hedge: Optional[LLMHedgeConfig] = None
 
 
 class VADParams(BaseModel):
@@ -48,6 +75,14 @@ class InactivityMessage(BaseModel):
     end_behavior: Literal["continue", "hangup"] = "continue"
 
 
+class FillerSpeechConfig(BaseModel):
+    enabled: bool = False
+    threshold_ms: float = Field(1000.0, ge=0)
+    phrases: List[str] = Field(
+        default_factory=lambda: ["Un momento, por favor.", "Déjame revisar."]
+    )
+
+
 class PipelineSettings(BaseModel):
     vad: VADConfig = Field(default_factory=VADConfig)
     interruptibility: bool = True
@@ -56,6 +91,8 @@ class PipelineSettings(BaseModel):
     initial_delay: float = 0.0
     initial_message_interruptible: bool = True
     inactivity_messages: List[InactivityMessage] = Field(default_factory=list)
+    prerendered_audio: bool = True
+    filler_speech: FillerSpeechConfig = Field(default_factory=FillerSpeechConfig)
 
 
 class TransportConfig(BaseModel):
@@ -79,6 +116,10 @@ class TTSConfig(BaseModel):
     params: Dict[str, Any] = Field(default_factory=dict)
     speed: float = 1.0
     language: str = "en"
+    cache_enabled: bool = False
+    # early_flush: speak the first clause of each response before the sentence is complete
+    text_aggregation: Literal["sentence", "early_flush"] = "sentence"
+    early_flush_min_words: int = Field(4, ge=1)
 
 
 class SipConfig(BaseModel):
@@ -99,6 +140,23 @@ class IOLayerConfig(BaseModel):
     sip: SipConfig = Field(default_factory=SipConfig)
 
 
+class ProviderCandidate(BaseModel):
+    provider: str
+    model: Optional[str] = None
+    voice_id: Optional[str] = None
+
+
+class ProviderRoutingConfig(BaseModel):
+    """Providers each call may use; the one with the lowest recent p95 TTFB is chosen."""
+
+    enabled: bool = False
+    llm: List[ProviderCandidate] = Field(default_factory=list)
+    stt: List[ProviderCandidate] = Field(default_factory=list)
+    tts: List[ProviderCandidate] = Field(default_factory=list)
+    min_samples: int = Field(20, ge=1)
+    max_error_rate: float = Field(0.2, ge=0.0, le=1.0)
+
+
 class WebhookConfig(BaseModel):
     url: Optional[str] = None
     headers: Dict[str, str] = Field(default_factory=dict)
@@ -119,6 +177,7 @@ class Assistant(BaseModel):
     agent: AgentConfig = Field(default_factory=AgentConfig)
     io_layer: IOLayerConfig = Field(default_factory=IOLayerConfig)
     webhooks: Optional[WebhookConfig] = None
+    routing: Optional[ProviderRoutingConfig] = None
     flow: Optional[Dict[str, Any]] = None
 
     # Backward compatibility properties for simple access
@@ -0,0 +1,29 @@
+from abc import ABC, abstractmethod
+from typing import List, Optional
+
+from app.Domains.Call.Models.analysis_job import AnalysisJob
+
+
+class AnalysisQueue(ABC):
+    @abstractmethod
+    def enqueue(self, job: AnalysisJob) -> bool:
+        """Adds a job. Returns False if a job for the same call id already exists"""
+        pass
+
+    @abstractmethod
+    def claim(self, limit: int) -> List[AnalysisJob]:
+        """Takes up to `limit` pending jobs for processing"""
+        pass
+
+    @abstractmethod
+    def complete(self, job: AnalysisJob) -> None:
+        pass
+
+    @abstractmethod
+    def fail(self, job: AnalysisJob, error: str, retry: bool) -> None:
+        """Returns the job to pending when `retry`, otherwise marks it failed"""
+        pass
+
+    @abstractmethod
+    def get(self, call_id: str) -> Optional[AnalysisJob]:
+        pass
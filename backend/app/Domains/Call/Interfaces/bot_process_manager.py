@@ -1,13 +1,16 @@
 from abc import ABC, abstractmethod
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, Optional
+
+from loguru import logger
+
+from app.Core.Config.call_spec import CallSpec
+from app.Domains.Call.Models.call import CallRecord
 
 
 class BotProcessManager(ABC):
     @abstractmethod
-    async def start_bot(
-        self, room_url: str, token: str, args: List[str], env_vars: Optional[Dict[str, str]] = None
-    ) -> int:
-        """Starts a bot process and returns its PID"""
+    async def start_bot(self, spec: CallSpec) -> int:
+        """Starts a bot for the call (spec with room_url and token) and returns its PID"""
         pass
 
     @abstractmethod
@@ -19,3 +22,38 @@ class BotProcessManager(ABC):
     async def cleanup(self):
         """Clean up finished processes"""
         pass
+
+    def get_record(self, pid: int) -> Optional[CallRecord]:
+        """Exit code, duration and peak memory of a bot, if tracked"""
+        return None
+
+    def get_resources(self, pid: int) -> Optional[Dict[str, Any]]:
+        """CPU, memory and I/O samples of a bot, if sampled"""
+        return None
+
+    def adopt(self, pid: int, room_url: Optional[str], started_at: float) -> bool:
+        """Tracks a bot a previous server started for a call created at `started_at`.
+
+        Returns False when the bot is gone or cannot be adopted by this manager.
+        """
+        return False
+
+    def release(self, pid: int) -> bool:
+        """Stops tracking a running bot, without stopping it, for the next server to adopt.
+
+        Returns False when the bot cannot outlive this server.
+        """
+        return False
+
+    def add_exit_listener(self, listener: Callable[[int, Optional[int]], None]):
+        """Calls `listener(pid, exit_code)` when a bot ends (exit_code None if unknown)"""
+        if not hasattr(self, "_exit_listeners"):
+            self._exit_listeners = []
+        self._exit_listeners.append(listener)
+
+    def _notify_exit(self, pid: int, exit_code: Optional[int]):
+        for listener in getattr(self, "_exit_listeners", []):
+            try:
+                listener(pid, exit_code)
+            except Exception as e:
+                logger.error(f"Exit listener failed for bot {pid}: {e}")
@@ -0,0 +1,27 @@
+from abc import ABC, abstractmethod
+from typing import List, Optional
+
+from app.Domains.Call.Models.call import TrackedCall
+
+
+class CallStore(ABC):
+    @abstractmethod
+    def save(self, call: TrackedCall) -> None:
+        """Persists the call as it is now (called on every state change)"""
+        pass
+
+    @abstractmethod
+    def load_recent(self, limit: int) -> List[TrackedCall]:
+        """Up to `limit` calls, oldest first"""
+        pass
+
+    @abstractmethod
+    def delete(self, call_id: str) -> None:
+        pass
+
+    def save_token(self, call_id: str, token: Optional[str]) -> None:
+        """Keeps the report token of a running call across restarts; None drops it"""
+        pass
+
+    def load_token(self, call_id: str) -> Optional[str]:
+        return None
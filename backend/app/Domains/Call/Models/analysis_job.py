@@ -0,0 +1,23 @@
+import time
+from typing import Any, Dict, List, Optional
+
+from pydantic import BaseModel, Field
+
+from app.Domains.Assistant.Models.assistant import WebhookConfig
+
+
+class AnalysisJob(BaseModel):
+    """Post-call work handed off by a bot process when the call ends."""
+
+    call_id: str
+    messages: List[Dict[str, Any]] = Field(default_factory=list)
+    webhooks: Optional[WebhookConfig] = None
+    # The call's key for the analysis model, dropped once the job is finished
+    api_key: Optional[str] = None
+    # Extra fields merged into the call_ended payload (e.g. cache stats)
+    call_ended: Dict[str, Any] = Field(default_factory=dict)
+    created_at: float = Field(default_factory=time.time)
+    attempts: int = 0
+    next_attempt_at: float = 0.0
+    last_error: Optional[str] = None
+    analysis: Optional[Dict[str, Any]] = None
@@ -1,6 +1,14 @@
-from typing import Any, Dict, List, Optional
+import time
+import uuid
+from typing import Any, Dict, List, Literal, Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
+
+CallState = Literal["spawning", "ringing", "connected", "ended", "failed"]
+
+# Order of the states; a call never moves back
+CALL_STATES = ("spawning", "ringing", "connected", "ended", "failed")
+TERMINAL_STATES = ("ended", "failed")
 
 
 class CallConfig(BaseModel):
@@ -9,10 +17,63 @@ class CallConfig(BaseModel):
     variables: Optional[Dict[str, Any]] = None
     dynamic_vocabulary: Optional[List[str]] = None
     secrets: Optional[Dict[str, str]] = None
+    priority: int = 0  # Higher is admitted first when the server is at capacity
 
 
 class CallSession(BaseModel):
-    id: str  # PID or UUID
+    id: str  # Call id (UUID) from the call registry
     room_url: str
     token: str
     status: str
+    bot_pid: Optional[int] = None  # PID, or the worker call id with BOT_WORKERS
+
+
+class CallRecord(BaseModel):
+    """Lifecycle of a bot process, kept after it exits."""
+
+    id: str
+    room_url: str
+    started_at: float
+    ended_at: Optional[float] = None
+    exit_code: Optional[int] = None
+    peak_rss_kb: Optional[int] = None
+    cpu_secs: Optional[float] = None
+
+    @property
+    def duration_secs(self) -> Optional[float]:
+        if self.ended_at is None:
+            return None
+        return round(self.ended_at - self.started_at, 3)
+
+
+class CallTransition(BaseModel):
+    state: CallState
+    at: float = Field(default_factory=time.time)
+    detail: Optional[str] = None
+
+
+class TrackedCall(BaseModel):
+    """A call as seen by the server, from spawning its bot until it ends."""
+
+    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    assistant_id: Optional[str] = None
+    campaign_id: Optional[str] = None
+    room_url: Optional[str] = None
+    bot_pid: Optional[int] = None
+    state: CallState = "spawning"
+    history: List[CallTransition] = Field(
+        default_factory=lambda: [CallTransition(state="spawning")]
+    )
+    exit_code: Optional[int] = None
+
+    @property
+    def created_at(self) -> float:
+        return self.history[0].at
+
+    @property
+    def updated_at(self) -> float:
+        return self.history[-1].at
+
+    @property
+    def is_finished(self) -> bool:
+        return self.state in TERMINAL_STATES
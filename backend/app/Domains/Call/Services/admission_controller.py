@@ -0,0 +1,259 @@
+import asyncio
+import heapq
+import itertools
+import math
+import os
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from fastapi import HTTPException
+from loguru import logger
+
+from app.Domains.Call.Services.call_registry import CallRegistry
+
+
+class AdmissionRejected(HTTPException):
+    """The node cannot take the call now; answered with 429 and Retry-After."""
+
+    def __init__(self, reason: str, retry_after: float):
+        super().__init__(
+            status_code=429,
+            detail=f"Server at capacity: {reason}",
+            headers={"Retry-After": str(max(1, math.ceil(retry_after)))},
+        )
+        self.code = "AT_CAPACITY"
+        self.reason = reason
+
+
+class ServerDraining(AdmissionRejected):
+    """The server is shutting down and takes no new calls; answered with 503."""
+
+    def __init__(self, retry_after: float):
+        HTTPException.__init__(
+            self,
+            status_code=503,
+            detail="Server draining: not taking new calls",
+            headers={"Retry-After": str(max(1, math.ceil(retry_after)))},
+        )
+        self.code = "DRAINING"
+        self.reason = "server draining"
+
+
+def _read_cpu_times() -> Optional[Tuple[int, int]]:
+    """(idle, total) jiffies of all CPUs since boot, from /proc/stat."""
+    try:
+        with open("/proc/stat") as f:
+            fields = [int(v) for v in f.readline().split()[1:]]
+    except (OSError, ValueError):
+        return None
+    # idle + iowait count as idle time
+    return fields[3] + fields[4], sum(fields)
+
+
+def _read_available_memory_mb() -> Optional[float]:
+    try:
+        with open("/proc/meminfo") as f:
+            for line in f:
+                if line.startswith("MemAvailable:"):
+                    return int(line.split()[1]) / 1024
+    except (OSError, ValueError):
+        pass
+    return None
+
+
+class AdmissionController:
+    """Decides whether this node takes a new call, or how long the call waits for room.
+
+    A call is admitted while the active calls in the registry are under
+    `max_concurrent_calls` and the node has CPU and memory headroom. Otherwise it waits
+    in a bounded priority queue (higher priority first, then arrival order) until a call
+    ends or its deadline passes; a full queue or an expired deadline is rejected with
+    AdmissionRejected. Admission and the registry entry are made without yielding to
+    the event loop in between, so an admitted call holds its slot from that moment.
+
+    Once draining (`start_draining`, on shutdown) every new and queued call is rejected
+    with ServerDraining, so the load balancer sends it to another node.
+    """
+
+    def __init__(
+        self,
+        registry: CallRegistry,
+        max_concurrent_calls: int = 0,
+        max_cpu_percent: float = 0.0,
+        min_free_memory_mb: float = 0.0,
+        queue_size: int = 50,
+        queue_timeout_secs: float = 15.0,
+        retry_after_secs: float = 5.0,
+        interval_secs: float = 0.5,
+    ):
+        self.registry = registry
+        self.max_concurrent_calls = max_concurrent_calls
+        self.max_cpu_percent = max_cpu_percent
+        self.min_free_memory_mb = min_free_memory_mb
+        self.queue_size = queue_size
+        self.queue_timeout_secs = queue_timeout_secs
+        self.retry_after_secs = retry_after_secs
+        self.interval_secs = interval_secs
+
+        # (-priority, arrival, deadline, future)
+        self._waiters: List[Tuple[int, int, float, asyncio.Future]] = []
+        self._arrivals = itertools.count()
+        # Granted to queued calls that have not created their registry entry yet
+        self._granted = 0
+        self._cpu_times = _read_cpu_times()
+        self.cpu_percent: Optional[float] = None
+        self.available_memory_mb: Optional[float] = _read_available_memory_mb()
+        self.draining = False
+        self.admitted = 0
+        self.queued = 0
+        self.rejected = 0
+
+    def _sample(self):
+        times = _read_cpu_times()
+        if times and self._cpu_times:
+            idle = times[0] - self._cpu_times[0]
+            total = times[1] - self._cpu_times[1]
+            if total > 0:
+                self.cpu_percent = round(100.0 * (1 - idle / total), 1)
+        self._cpu_times = times
+        self.available_memory_mb = _read_available_memory_mb()
+
+    def _blocked_by(self) -> Optional[str]:
+        """Why a new call cannot start right now, or None if it can."""
+        active = self.registry.active_count() + self._granted
+        if self.max_concurrent_calls and active >= self.max_concurrent_calls:
+            return f"{active} of {self.max_concurrent_calls} calls active"
+        if (
+            self.max_cpu_percent
+            and self.cpu_percent is not None
+            and self.cpu_percent >= self.max_cpu_percent
+        ):
+            return f"CPU at {self.cpu_percent}%"
+        if (
+            self.min_free_memory_mb
+            and self.available_memory_mb is not None
+            and self.available_memory_mb < self.min_free_memory_mb
+        ):
+            return f"{round(self.available_memory_mb)} MB of memory available"
+        return None
+
+    async def admit(self, priority: int = 0, timeout: Optional[float] = None):
+        """Returns once the call may start; raises AdmissionRejected otherwise.
+
+        The caller must create the call in the registry before its next await.
+        """
+        if self.draining:
+            self.rejected += 1
+            raise ServerDraining(self.retry_after_secs)
+        reason = self._blocked_by()
+        if reason is None and not self._waiters:
+            self.admitted += 1
+            return
+        if len(self._waiters) >= self.queue_size:
+            self.rejected += 1
+            raise AdmissionRejected(reason or "admission queue full", self.retry_after_secs)
+
+        timeout = self.queue_timeout_secs if timeout is None else timeout
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(
+            self._waiters, (-priority, next(self._arrivals), time.monotonic() + timeout, future)
+        )
+        self.queued += 1
+        logger.info(f"Call queued for admission ({reason}), {len(self._waiters)} waiting")
+
+        try:
+            await future
+        except asyncio.CancelledError:
+            # The request went away after its slot was granted: give the slot back
+            if future.done() and not future.cancelled():
+                self._granted -= 1
+            raise
+        self._granted -= 1
+        self.admitted += 1
+
+    def start_draining(self):
+        """Stops admitting calls; queued ones are rejected right away."""
+        if self.draining:
+            return
+        self.draining = True
+        for _, _, _, future in self._waiters:
+            if not future.done():
+                self.rejected += 1
+                future.set_exception(ServerDraining(self.retry_after_secs))
+        self._waiters = []
+        logger.info(f"Draining: no new calls, {self.registry.active_count()} still active")
+
+    def _release_waiters(self):
+        now = time.monotonic()
+        # Expired and abandoned waiters leave the queue
+        pending = []
+        for waiter in self._waiters:
+            future = waiter[3]
+            if future.done():
+                continue
+            if waiter[2] <= now:
+                self.rejected += 1
+                future.set_exception(
+                    AdmissionRejected("timed out in the admission queue", self.retry_after_secs)
+                )
+                continue
+            pending.append(waiter)
+        if len(pending) != len(self._waiters):
+            heapq.heapify(pending)
+            self._waiters = pending
+
+        while self._waiters and self._blocked_by() is None:
+            _, _, _, future = heapq.heappop(self._waiters)
+            self._granted += 1
+            future.set_result(None)
+
+    async def run(self):
+        """Samples CPU and memory and hands freed capacity to queued calls."""
+        changes = self.registry.subscribe()
+        sampled_at = time.monotonic()
+        try:
+            while True:
+                try:
+                    # Any call state change (an ending call above all) may free a slot.
+                    # Not wait_for: it can swallow a cancel that races a change (3.11)
+                    async with asyncio.timeout(self.interval_secs):
+                        await changes.get()
+                    while not changes.empty():
+                        changes.get_nowait()
+                except asyncio.TimeoutError:
+                    pass
+                if time.monotonic() - sampled_at >= self.interval_secs:
+                    self._sample()
+                    sampled_at = time.monotonic()
+                try:
+                    self._release_waiters()
+                except Exception as e:
+                    logger.error(f"Admission error: {e}")
+        finally:
+            self.registry.unsubscribe(changes)
+            for _, _, _, future in self._waiters:
+                if not future.done():
+                    future.set_exception(
+                        AdmissionRejected("server shutting down", self.retry_after_secs)
+                    )
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "ready": not self.draining and self._blocked_by() is None and not self._waiters,
+            "draining": self.draining,
+            "active_calls": self.registry.active_count(),
+            "max_concurrent_calls": self.max_concurrent_calls or None,
+            "queued_calls": len(self._waiters),
+            "queue_size": self.queue_size,
+            "cpu_percent": self.cpu_percent,
+            "max_cpu_percent": self.max_cpu_percent or None,
+            "available_memory_mb": (
+                round(self.available_memory_mb) if self.available_memory_mb is not None else None
+            ),
+            "min_free_memory_mb": self.min_free_memory_mb or None,
+            "blocked_by": self._blocked_by(),
+            "admitted": self.admitted,
+            "queued": self.queued,
+            "rejected": self.rejected,
+            "load_per_cpu": round(os.getloadavg()[0] / (os.cpu_count() or 1), 2),
+        }
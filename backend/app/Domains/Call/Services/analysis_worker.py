@@ -0,0 +1,109 @@
+import asyncio
+import os
+import time
+from typing import Optional, Set
+
+from dotenv import load_dotenv
+from loguru import logger
+
+from app.Domains.Call.Interfaces.analysis_queue import AnalysisQueue
+from app.Domains.Call.Models.analysis_job import AnalysisJob
+from app.Services.webhook_sender import WebhookSender
+from app.Utils.analysis import get_analyzer
+
+
+class AnalysisWorker:
+    """Drains the analysis queue: runs post-call analysis and sends `call_ended`.
+
+    Bot processes hand their transcript to the queue and exit, so a call slot is freed
+    as soon as the call ends instead of when the remote analysis model answers.
+    """
+
+    def __init__(
+        self,
+        queue: AnalysisQueue,
+        analyzer=None,
+        concurrency: Optional[int] = None,
+        max_retries: Optional[int] = None,
+        poll_interval: float = 1.0,
+    ):
+        load_dotenv()
+
+        self.queue = queue
+        self.analyzer = analyzer or get_analyzer()
+        self.concurrency = concurrency or int(os.getenv("ANALYSIS_CONCURRENCY", "4"))
+        self.max_retries = (
+            max_retries if max_retries is not None else int(os.getenv("ANALYSIS_MAX_RETRIES", "3"))
+        )
+        self.timeout = float(os.getenv("ANALYSIS_TIMEOUT_SECS", "60"))
+        self.poll_interval = poll_interval
+        self._active: Set[asyncio.Task] = set()
+
+    async def run(self):
+        """Process jobs until cancelled."""
+        logger.info(f"Analysis worker started (concurrency={self.concurrency})")
+        try:
+            while True:
+                self.run_once()
+                await asyncio.sleep(self.poll_interval)
+        finally:
+            # Interrupted jobs stay in processing and are re-queued once stale
+            for task in list(self._active):
+                task.cancel()
+
+    def run_once(self) -> int:
+        """Start as many pending jobs as there are free slots. Returns the number started."""
+        free_slots = self.concurrency - len(self._active)
+        if free_slots <= 0:
+            return 0
+        try:
+            jobs = self.queue.claim(free_slots)
+        except Exception as e:
+            logger.error(f"Failed to claim analysis jobs: {e}")
+            return 0
+        for job in jobs:
+            task = asyncio.create_task(self.process(job))
+            self._active.add(task)
+            task.add_done_callback(self._active.discard)
+        return len(jobs)
+
+    async def drain(self):
+        """Process everything currently pending, then return."""
+        while self.run_once() or self._active:
+            if self._active:
+                await asyncio.wait(self._active, return_when=asyncio.FIRST_COMPLETED)
+
+    async def process(self, job: AnalysisJob):
+        job.attempts += 1
+        try:
+            analysis = {}
+            if job.messages:
+                # Jobs queued before keys travelled with them use the worker's own
+                api_key = job.api_key or os.getenv("GOOGLE_API_KEY")
+                analysis = await asyncio.wait_for(
+                    self.analyzer(api_key, job.messages), timeout=self.timeout
+                )
+        except Exception as e:
+            error = str(e) or type(e).__name__
+            if job.attempts <= self.max_retries:
+                delay = min(300.0, 5.0 * 2 ** (job.attempts - 1))
+                job.next_attempt_at = time.time() + delay
+                logger.warning(
+                    f"Analysis for call {job.call_id} failed (attempt {job.attempts}), "
+                    f"retrying in {delay:.0f}s: {error}"
+                )
+                self.queue.fail(job, error, retry=True)
+                return
+            analysis = {"error": f"Analysis failed: {error}"}
+
+        job.analysis = analysis
+        await WebhookSender(job.webhooks).send(
+            "call_ended", {**job.call_ended, "analysis": analysis}
+        )
+
+        if "error" in analysis:
+            logger.error(f"Analysis for call {job.call_id} failed: {analysis['error']}")
+            self.queue.fail(job, analysis["error"], retry=False)
+        else:
+            logger.info(f"Analysis for call {job.call_id} completed")
+            self.queue.complete(job)
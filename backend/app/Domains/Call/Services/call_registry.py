@@ -0,0 +1,348 @@
+import asyncio
+import hmac
+import secrets
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Set
+
+from loguru import logger
+
+from app.Domains.Call.Interfaces.call_store import CallStore
+from app.Domains.Call.Models.call import (
+    CALL_STATES,
+    TERMINAL_STATES,
+    CallState,
+    CallTransition,
+    TrackedCall,
+)
+
+# Finished calls kept in memory (and in the store) for status queries
+MAX_FINISHED_CALLS = 1000
+
+# Status changes buffered per subscriber before the oldest are dropped
+SUBSCRIBER_QUEUE_SIZE = 256
+
+
+class CallRegistry:
+    """Every call the server started, keyed by a call id that is not an OS pid.
+
+    Calls move forward through spawning -> ringing -> connected -> ended | failed, each
+    step timestamped in the call's history. Lookups by assistant, campaign, room and bot
+    pid go through set indexes, so none of them scans the registry. Every change is
+    written to the optional store and pushed to the subscribers (the /calls/events feed).
+
+    Calls a previous server left running (restored from the store, or handed over through
+    `receive`) stay unclaimed until `adopt_unclaimed` gives their bots to the process
+    manager; the ones it cannot take are failed.
+    """
+
+    def __init__(
+        self,
+        store: Optional[CallStore] = None,
+        events_base_url: Optional[str] = None,
+        max_finished: int = MAX_FINISHED_CALLS,
+    ):
+        self.store = store
+        # Where bots report their own state changes (POST /calls/{call_id}/state)
+        self.events_base_url = events_base_url
+        self.max_finished = max_finished
+
+        self.calls: "OrderedDict[str, TrackedCall]" = OrderedDict()
+        self._by_assistant: Dict[str, Set[str]] = {}
+        self._by_campaign: Dict[str, Set[str]] = {}
+        self._by_room: Dict[str, Set[str]] = {}
+        self._by_pid: Dict[int, str] = {}
+        self._finished = 0
+        # Per-call secrets the bots present when reporting, kept in the store while the
+        # call runs so that a bot outliving the server can still report to the next one
+        self._tokens: Dict[str, str] = {}
+        self._subscribers: Set[asyncio.Queue] = set()
+        # Running calls of a previous server, waiting for adopt_unclaimed
+        self._unclaimed: Set[str] = set()
+        # Calls this server handed over to the next one
+        self._handed_over: Set[str] = set()
+
+        if self.store:
+            self._restore()
+
+    def _restore(self):
+        for call in self.store.load_recent(self.max_finished):
+            self.calls[call.id] = call
+            self._index(call)
+            if call.is_finished:
+                self._finished += 1
+            else:
+                # Its bot may have outlived the previous server process
+                self._unclaimed.add(call.id)
+                token = self.store.load_token(call.id)
+                if token:
+                    self._tokens[call.id] = token
+        if self.calls:
+            logger.info(
+                f"Restored {len(self.calls)} calls from the call store, "
+                f"{len(self._unclaimed)} of them unfinished"
+            )
+
+    def receive(self, calls: List[Dict[str, Any]]):
+        """Takes over the running calls handed over by the previous server (`hand_over`).
+
+        Unfinished calls restored from the store that are not among them still belong to
+        the previous server, which sees them to the end; they are dropped here.
+        """
+        for call_id in self._unclaimed:
+            restored = self.calls.pop(call_id, None)
+            if restored:
+                self._unindex(restored)
+        self._unclaimed.clear()
+
+        for entry in calls:
+            call = TrackedCall(**entry["call"])
+            previous = self.calls.pop(call.id, None)
+            if previous:
+                self._unindex(previous)
+                if previous.is_finished:
+                    self._finished -= 1
+            self.calls[call.id] = call
+            self._index(call)
+            if call.is_finished:
+                self._finished += 1
+                continue
+            if entry.get("token"):
+                self._tokens[call.id] = entry["token"]
+                if self.store:
+                    self.store.save_token(call.id, entry["token"])
+            self._unclaimed.add(call.id)
+            self._changed(call)
+
+    def adopt_unclaimed(self, adopt: Callable[[TrackedCall], bool]) -> List[TrackedCall]:
+        """Offers the bot of each unclaimed call to `adopt`; calls it rejects are failed.
+
+        Returns the failed calls, whose rooms no process manager will release.
+        """
+        failed = []
+        for call_id in list(self._unclaimed):
+            call = self.calls.get(call_id)
+            if not call or call.is_finished:
+                continue
+            if call.bot_pid is not None and adopt(call):
+                logger.info(f"Adopted call {call.id} (bot {call.bot_pid}, {call.state})")
+                continue
+            # Its bot belonged to a previous server process and is gone
+            self.transition(call.id, "failed", detail="server restarted")
+            failed.append(call)
+        self._unclaimed.clear()
+        return failed
+
+    def hand_over(self, call_id: str) -> Optional[Dict[str, Any]]:
+        """Stops tracking a running call the next server takes over.
+
+        Returns the call and its report token, for the next server's `receive`. The store
+        is left as is: the next server writes the call from now on.
+        """
+        call = self.calls.get(call_id)
+        if not call or call.is_finished:
+            return None
+        del self.calls[call_id]
+        self._unindex(call)
+        self._unclaimed.discard(call_id)
+        self._handed_over.add(call_id)
+        return {"call": call.model_dump(), "token": self._tokens.pop(call_id, None)}
+
+    def handed_over(self, call_id: str) -> bool:
+        return call_id in self._handed_over
+
+    def _index(self, call: TrackedCall):
+        if call.assistant_id:
+            self._by_assistant.setdefault(call.assistant_id, set()).add(call.id)
+        if call.campaign_id:
+            self._by_campaign.setdefault(call.campaign_id, set()).add(call.id)
+        if call.room_url:
+            self._by_room.setdefault(call.room_url, set()).add(call.id)
+        if call.bot_pid is not None and not call.is_finished:
+            self._by_pid[call.bot_pid] = call.id
+
+    def _unindex(self, call: TrackedCall):
+        for index, key in (
+            (self._by_assistant, call.assistant_id),
+            (self._by_campaign, call.campaign_id),
+            (self._by_room, call.room_url),
+        ):
+            ids = index.get(key)
+            if ids is not None:
+                ids.discard(call.id)
+                if not ids:
+                    del index[key]
+        if self._by_pid.get(call.bot_pid) == call.id:
+            del self._by_pid[call.bot_pid]
+
+    def create(
+        self, assistant_id: Optional[str] = None, campaign_id: Optional[str] = None
+    ) -> TrackedCall:
+        call = TrackedCall(assistant_id=assistant_id, campaign_id=campaign_id)
+        self.calls[call.id] = call
+        self._tokens[call.id] = secrets.token_urlsafe(24)
+        if self.store:
+            self.store.save_token(call.id, self._tokens[call.id])
+        self._index(call)
+        self._changed(call)
+        return call
+
+    def get(self, call_id: str) -> Optional[TrackedCall]:
+        return self.calls.get(call_id)
+
+    def active_count(self) -> int:
+        """Calls that have not ended yet."""
+        return len(self.calls) - self._finished
+
+    async def wait_idle(self, timeout: float) -> int:
+        """Waits up to `timeout` seconds for every active call to end. Returns those left."""
+        changes = self.subscribe()
+        deadline = time.monotonic() + timeout
+        try:
+            while self.active_count() and deadline > time.monotonic():
+                try:
+                    await asyncio.wait_for(changes.get(), deadline - time.monotonic())
+                except asyncio.TimeoutError:
+                    break
+        finally:
+            self.unsubscribe(changes)
+        return self.active_count()
+
+    def find_by_pid(self, pid: int) -> Optional[TrackedCall]:
+        call_id = self._by_pid.get(pid)
+        return self.calls.get(call_id) if call_id else None
+
+    def list(
+        self,
+        assistant_id: Optional[str] = None,
+        campaign_id: Optional[str] = None,
+        room_url: Optional[str] = None,
+        state: Optional[CallState] = None,
+    ) -> List[TrackedCall]:
+        """Calls matching every given filter, oldest first."""
+        candidates: Optional[Set[str]] = None
+        for index, key in (
+            (self._by_assistant, assistant_id),
+            (self._by_campaign, campaign_id),
+            (self._by_room, room_url),
+        ):
+            if key is None:
+                continue
+            ids = index.get(key, set())
+            candidates = ids if candidates is None else candidates & ids
+
+        if candidates is None:
+            calls = list(self.calls.values())
+        else:
+            calls = sorted((self.calls[c] for c in candidates), key=lambda c: c.created_at)
+        if state:
+            calls = [c for c in calls if c.state == state]
+        return calls
+
+    def bot_env(self, call_id: str) -> Dict[str, str]:
+        """Environment a bot needs to report its state for this call."""
+        env = {"CALL_ID": call_id}
+        if self.events_base_url and call_id in self._tokens:
+            env["CALL_EVENTS_URL"] = f"{self.events_base_url}/calls/{call_id}/state"
+            env["CALL_EVENTS_TOKEN"] = self._tokens[call_id]
+        return env
+
+    def verify_token(self, call_id: str, token: Optional[str]) -> bool:
+        expected = self._tokens.get(call_id)
+        return bool(expected and token) and hmac.compare_digest(expected, token)
+
+    def attach(
+        self, call_id: str, room_url: Optional[str] = None, bot_pid: Optional[int] = None
+    ) -> Optional[TrackedCall]:
+        """Records the room and bot of a call as they are created."""
+        call = self.calls.get(call_id)
+        if not call:
+            return None
+        self._unindex(call)
+        if room_url:
+            call.room_url = room_url
+        if bot_pid is not None:
+            call.bot_pid = bot_pid
+        self._index(call)
+        return call
+
+    def transition(
+        self,
+        call_id: str,
+        state: CallState,
+        detail: Optional[str] = None,
+        exit_code: Optional[int] = None,
+    ) -> Optional[TrackedCall]:
+        """Moves a call to `state`. Repeated and backward moves are ignored."""
+        call = self.calls.get(call_id)
+        if not call or call.is_finished:
+            return None
+        if CALL_STATES.index(state) <= CALL_STATES.index(call.state):
+            return None
+
+        call.state = state
+        call.history.append(CallTransition(state=state, at=time.time(), detail=detail))
+        if exit_code is not None:
+            call.exit_code = exit_code
+        if call.is_finished:
+            self._tokens.pop(call_id, None)
+            if self.store:
+                self.store.save_token(call_id, None)
+            if self._by_pid.get(call.bot_pid) == call.id:
+                del self._by_pid[call.bot_pid]
+            self._finished += 1
+        self._changed(call)
+        self._evict()
+        return call
+
+    def on_process_exit(self, pid: int, exit_code: Optional[int]):
+        """Process manager exit listener: ends the call the bot was serving."""
+        call = self.find_by_pid(pid)
+        if not call:
+            return
+        if exit_code is None:
+            # Adopted bot that died without recording how
+            self.transition(call.id, "failed", detail="bot exited without an exit status")
+            return
+        state = "ended" if exit_code == 0 else "failed"
+        self.transition(call.id, state, detail=f"bot exited with {exit_code}", exit_code=exit_code)
+
+    def _evict(self):
+        while self._finished > self.max_finished:
+            oldest = next((c for c in self.calls.values() if c.is_finished), None)
+            if not oldest:
+                return
+            del self.calls[oldest.id]
+            self._unindex(oldest)
+            self._finished -= 1
+            if self.store:
+                self.store.delete(oldest.id)
+
+    def _changed(self, call: TrackedCall):
+        if self.store:
+            try:
+                self.store.save(call)
+            except Exception as e:
+                logger.error(f"Failed to persist call {call.id}: {e}")
+
+        event = call.model_dump()
+        for queue in self._subscribers:
+            if queue.full():
+                # A slow reader loses the oldest changes, not the newest
+                queue.get_nowait()
+            queue.put_nowait(event)
+
+    def subscribe(self) -> asyncio.Queue:
+        """Queue receiving every call change (as a dict) from now on."""
+        queue: asyncio.Queue = asyncio.Queue(maxsize=SUBSCRIBER_QUEUE_SIZE)
+        self._subscribers.add(queue)
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue):
+        self._subscribers.discard(queue)
+
+    def summary(self) -> Dict[str, int]:
+        counts = {state: 0 for state in CALL_STATES}
+        for call in self.calls.values():
+            counts[call.state] += 1
+        return counts
@@ -1,12 +1,14 @@
-import json
+from typing import Dict, Optional
 
 from loguru import logger
 
-from app.Core.Parsers.bot_config_parser import dict_to_cli_args
+from app.Core.Config.call_spec import CallSpec
 from app.Domains.Assistant.Services.assistant_service import AssistantService
 from app.Domains.Call.Interfaces.bot_process_manager import BotProcessManager
 from app.Domains.Call.Interfaces.room_provider import RoomProvider
-from app.Domains.Call.Models.call import CallConfig, CallSession
+from app.Domains.Call.Models.call import CallConfig, CallRecord, CallSession, TrackedCall
+from app.Domains.Call.Services.admission_controller import AdmissionController
+from app.Domains.Call.Services.call_registry import CallRegistry
 
 
 class CallService:
@@ -15,10 +17,50 @@ class CallService:
         assistant_service: AssistantService,
         room_provider: RoomProvider,
         process_manager: BotProcessManager,
+        call_registry: CallRegistry,
+        admission: AdmissionController,
     ):
         self.assistant_service = assistant_service
         self.room_provider = room_provider
         self.process_manager = process_manager
+        self.call_registry = call_registry
+        self.admission = admission
+
+    async def _admit(self, priority: int = 0, assistant_id: Optional[str] = None) -> TrackedCall:
+        """Waits for capacity (or raises AdmissionRejected), then registers the call."""
+        await self.admission.admit(priority)
+        # No await in between, so the slot is taken before anyone else is admitted
+        return self.call_registry.create(assistant_id=assistant_id)
+
+    async def _start(self, call: TrackedCall, spec: CallSpec) -> CallSession:
+        """Creates the room and starts the bot, recording each step in the registry."""
+        room_url = None
+        try:
+            room_url, token = await self.room_provider.create_room_and_token()
+            self.call_registry.attach(call.id, room_url=room_url)
+
+            pid = await self.process_manager.start_bot(
+                spec.model_copy(
+                    update={
+                        "room_url": room_url,
+                        "token": token,
+                        "env": {**spec.env, **self.call_registry.bot_env(call.id)},
+                    }
+                )
+            )
+        except Exception as e:
+            self.call_registry.transition(call.id, "failed", detail=str(e))
+            if room_url:
+                # No bot will release it; a pooled room goes back to the pool
+                await self.room_provider.delete_room(room_url)
+            raise
+
+        self.call_registry.attach(call.id, bot_pid=pid)
+        # The bot is up and waiting for the user to join
+        self.call_registry.transition(call.id, "ringing")
+        return CallSession(
+            id=call.id, room_url=room_url, token=token, status="initiated", bot_pid=pid
+        )
 
     async def initiate_call(self, config: CallConfig) -> CallSession:
         logger.info(f"Initiating call for assistant {config.assistant_id}")
@@ -28,57 +70,76 @@ class CallService:
         if not assistant:
             raise ValueError("Assistant not found")
 
-        # 2. Create Infrastructure (Room)
-        room_url, token = await self.room_provider.create_room_and_token()
-
-        # 3. Prepare Arguments
-        cli_args = dict_to_cli_args(assistant)
-        cli_args.extend(["--assistant-id", config.assistant_id])
-
-        if config.variables:
-            cli_args.extend(["--prompt-variables", json.dumps(config.variables)])
+        call = await self._admit(config.priority, assistant_id=config.assistant_id)
 
-        if config.dynamic_vocabulary:
-            keywords = ",".join(config.dynamic_vocabulary)
-            cli_args.extend(["--stt-keywords", keywords])
-
-        # 4. Start Process
-        pid = await self.process_manager.start_bot(
-            room_url=room_url, token=token, args=cli_args, env_vars=config.secrets
+        # 2. Describe the call for the bot
+        spec = CallSpec(
+            assistant=assistant,
+            prompt_variables=config.variables,
+            stt_keywords=config.dynamic_vocabulary or [],
+            env=config.secrets or {},
         )
 
-        return CallSession(id=str(pid), room_url=room_url, token=token, status="initiated")
+        # 3. Create the Room and start the Process
+        return await self._start(call, spec)
+
+    def get_call(self, call_id: str) -> Optional[TrackedCall]:
+        return self.call_registry.get(call_id)
 
     def get_call_status(self, call_id: str) -> str:
-        # Assuming call_id is PID for now
+        call = self.call_registry.get(call_id)
+        if call:
+            return "finished" if call.is_finished else "running"
+        # Bot PIDs from before call ids were introduced
         try:
             return self.process_manager.get_status(int(call_id))
         except ValueError:
             return "unknown"
 
+    def get_call_record(self, call_id: str) -> Optional[CallRecord]:
+        call = self.call_registry.get(call_id)
+        if call:
+            return self.process_manager.get_record(call.bot_pid) if call.bot_pid else None
+        try:
+            return self.process_manager.get_record(int(call_id))
+        except ValueError:
+            return None
+
+    def get_call_resources(self, call_id: str) -> Optional[Dict]:
+        call = self.call_registry.get(call_id)
+        if call:
+            return self.process_manager.get_resources(call.bot_pid) if call.bot_pid else None
+        try:
+            return self.process_manager.get_resources(int(call_id))
+        except ValueError:
+            return None
+
     async def start_rtvi_session(self, raw_config: dict) -> CallSession:
         """Starts a session with inline configuration (no saved assistant needed)"""
-        room_url, token = await self.room_provider.create_room_and_token()
-
-        cli_args = []
-        arg_map = {
-            "bot_type": "-a",
-            "bot_name": "-n",
-            "llm_provider": "-l",
-            "llm_model": "-m",
-            "llm_temperature": "-T",
-            "stt_provider": "-s",
-            "tts_provider": "-p",
-            "tts_voice": "-v",
+        # BotConfig settings, the same the runner's CLI overrides set
+        setting_map = {
+            "bot_type": "ARCHITECTURE_TYPE",
+            "bot_name": "BOT_NAME",
+            "llm_provider": "LLM_PROVIDER",
+            "llm_model": "LLM_MODEL",
+            "llm_temperature": "LLM_TEMPERATURE",
+            "stt_provider": "STT_PROVIDER",
+            "tts_provider": "TTS_PROVIDER",
+            "tts_voice": "TTS_VOICE",
+        }
+        env = {
+            setting: str(raw_config[key])
+            for key, setting in setting_map.items()
+            if raw_config.get(key) is not None
         }
-        for key, flag in arg_map.items():
-            if key in raw_config:
-                cli_args.extend([flag, str(raw_config[key])])
+        for setting in ("ARCHITECTURE_TYPE", "LLM_PROVIDER", "STT_PROVIDER", "TTS_PROVIDER"):
+            if setting in env:
+                env[setting] = env[setting].lower()
 
         if "enable_stt_mute_filter" in raw_config:
-            val = "true" if raw_config["enable_stt_mute_filter"] else "false"
-            cli_args.extend(["--enable-stt-mute-filter", val])
-
-        pid = await self.process_manager.start_bot(room_url, token, cli_args)
+            env["ENABLE_STT_MUTE_FILTER"] = (
+                "true" if raw_config["enable_stt_mute_filter"] else "false"
+            )
 
-        return CallSession(id=str(pid), room_url=room_url, token=token, status="initiated")
+        call = await self._admit()
+        return await self._start(call, CallSpec(env=env))
@@ -1,17 +1,21 @@
 import asyncio
-import json
 import os
 
 from loguru import logger
 
-from app.Core.Parsers.bot_config_parser import dict_to_cli_args
+from app.Core.Config.call_spec import CallSpec
 from app.Domains.Assistant.Services.assistant_service import AssistantService
 from app.Domains.Call.Interfaces.bot_process_manager import BotProcessManager
 from app.Domains.Call.Interfaces.room_provider import RoomProvider
+from app.Domains.Call.Services.admission_controller import AdmissionController, AdmissionRejected
+from app.Domains.Call.Services.call_registry import CallRegistry
 from app.Domains.Campaign.Models.campaign import Campaign
 from app.Domains.Campaign.Repositories.campaign_repository import CampaignRepository
 from app.Infrastructure.Repositories.file_assistant_repository import FileAssistantRepository
 
+# Below the default (0) of calls started through the API
+CAMPAIGN_CALL_PRIORITY = -1
+
 
 class CampaignService:
     def __init__(
@@ -19,10 +23,14 @@ class CampaignService:
         repository: CampaignRepository,
         room_provider: RoomProvider,
         process_manager: BotProcessManager,
+        call_registry: CallRegistry,
+        admission: AdmissionController,
     ):
         self.repository = repository
         self.room_provider = room_provider
         self.process_manager = process_manager
+        self.call_registry = call_registry
+        self.admission = admission
         self.active_tasks = {}  # In-memory task tracking (simple version)
 
         # Setup assistant service for dialing
@@ -102,23 +110,49 @@ class CampaignService:
             self.repository.save(campaign)
             return
 
-        config_args = dict_to_cli_args(assistant)
-        config_args.extend(["--assistant-id", campaign.assistant_id])
-        config_args.extend(["--agent-type", "outbound"])  # Use new agent type logic
+        spec = CallSpec(
+            assistant=assistant,
+            agent_type="outbound",  # Use new agent type logic
+            prompt_variables={**contact.variables, "campaign_name": campaign.name},
+        )
 
-        vars = {**contact.variables, "campaign_name": campaign.name}
-        config_args.extend(["--prompt-variables", json.dumps(vars)])
+        try:
+            # Dialing yields to interactive calls when the server is at capacity
+            await self.admission.admit(priority=CAMPAIGN_CALL_PRIORITY)
+        except AdmissionRejected as e:
+            # The contact stays pending and is dialed again on a later pass
+            logger.warning(f"Not dialing {contact.name} yet: {e.reason}")
+            return
+        call = self.call_registry.create(
+            assistant_id=campaign.assistant_id, campaign_id=campaign.id
+        )
+        contact.last_call_id = call.id
 
+        room_url = pid = None
         try:
             room_url, token = await self.room_provider.create_room_and_token()
-            pid = await self.process_manager.start_bot(room_url, token, args=config_args)
+            self.call_registry.attach(call.id, room_url=room_url)
+            pid = await self.process_manager.start_bot(
+                spec.model_copy(
+                    update={
+                        "room_url": room_url,
+                        "token": token,
+                        "env": self.call_registry.bot_env(call.id),
+                    }
+                )
+            )
+            self.call_registry.attach(call.id, bot_pid=pid)
+            self.call_registry.transition(call.id, "ringing")
 
             # Update contact in memory then save
             contact.status = "called"
-            contact.last_call_id = str(pid)
             self.repository.save(campaign)
 
         except Exception as e:
             logger.error(f"Failed to dial: {e}")
+            self.call_registry.transition(call.id, "failed", detail=str(e))
+            if room_url and pid is None:
+                # No bot will release it; a pooled room goes back to the pool
+                await self.room_provider.delete_room(room_url)
             contact.status = "failed"
             self.repository.save(campaign)
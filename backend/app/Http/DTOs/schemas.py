@@ -21,6 +21,7 @@ class CallRequest(BaseModel):
     variables: Optional[Dict[str, Any]] = None
     secrets: Optional[Dict[str, str]] = None
     dynamic_vocabulary: Optional[List[str]] = None
+    priority: int = 0  # Higher is admitted first when the server is at capacity
 
 
 class CallResponse(BaseModel):
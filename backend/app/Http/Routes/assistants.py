@@ -1,10 +1,11 @@
 from typing import List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Request
 from fastapi.responses import JSONResponse
 from pydantic import BaseModel, Field
 
 from app.dependencies import get_assistant_service
+from app.Domains.Agent.Cache.prerender import prerender_assistant_audio
 from app.Domains.Assistant.Models.assistant import Assistant
 from app.Domains.Assistant.Services.assistant_service import AssistantService
 from app.Http.Responses.hateoas import HateoasModel, Link
@@ -68,9 +69,12 @@ async def list_assistants(
 async def create_assistant(
     assistant: Assistant,
     request: Request,
+    background_tasks: BackgroundTasks,
     service: AssistantService = Depends(get_assistant_service),
 ):
     created = service.create_assistant(assistant)
+    # Render greeting/inactivity audio off the request path so the first call plays from cache
+    background_tasks.add_task(prerender_assistant_audio, created)
     return _map_to_response(created, request)
 
 
@@ -89,11 +93,13 @@ async def update_assistant(
     assistant_id: str,
     update_data: dict,
     request: Request,
+    background_tasks: BackgroundTasks,
     service: AssistantService = Depends(get_assistant_service),
 ):
     updated = service.update_assistant(assistant_id, update_data)
     if not updated:
         raise HTTPException(status_code=404, detail="Assistant not found")
+    background_tasks.add_task(prerender_assistant_audio, updated)
     return _map_to_response(updated, request)
 
 
@@ -1,12 +1,16 @@
+import asyncio
+import json
 from typing import Any, Dict, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Request
-from fastapi.responses import JSONResponse
+from fastapi import APIRouter, Depends, Header, HTTPException, Request
+from fastapi.responses import JSONResponse, StreamingResponse
 from loguru import logger
 from pydantic import BaseModel
 
-from app.dependencies import get_call_service
-from app.Domains.Call.Models.call import CallConfig
+from app.dependencies import get_admission_controller, get_call_registry, get_call_service
+from app.Domains.Call.Models.call import CALL_STATES, CallConfig, CallState
+from app.Domains.Call.Services.admission_controller import AdmissionController
+from app.Domains.Call.Services.call_registry import CallRegistry
 from app.Domains.Call.Services.call_service import CallService
 from app.Http.DTOs.error_schemas import APIErrorResponse
 from app.Http.DTOs.schemas import CallRequest, CallResponse, Link
@@ -24,7 +28,12 @@ class ConnectRequest(BaseModel):
     status_code=201,
     summary="Create a new call",
     description="Spawns a new agent process for a specific assistant.",
-    responses={404: {"model": APIErrorResponse}, 422: {"model": APIErrorResponse}},
+    responses={
+        404: {"model": APIErrorResponse},
+        422: {"model": APIErrorResponse},
+        429: {"model": APIErrorResponse},
+        503: {"model": APIErrorResponse},
+    },
 )
 async def create_call(
     request: Request, body: CallRequest, service: CallService = Depends(get_call_service)
@@ -39,12 +48,15 @@ async def create_call(
         variables=body.variables,
         dynamic_vocabulary=body.dynamic_vocabulary,
         secrets=body.secrets,
+        priority=body.priority,
     )
 
     try:
         session = await service.initiate_call(config)
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Call failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -57,6 +69,7 @@ async def create_call(
         token=session.token,
         _links=[
             Link(href=f"{base_url}/status/{session.id}", method="GET", rel="status"),
+            Link(href=f"{base_url}/calls/events?call_id={session.id}", method="GET", rel="events"),
             Link(href=f"{base_url}/assistants/{body.assistant_id}", method="GET", rel="assistant"),
         ],
     )
@@ -84,8 +97,10 @@ async def rtvi_connect(
     return {
         "room_url": session.room_url,
         "token": session.token,
-        "bot_pid": int(session.id),
+        "call_id": session.id,
+        "bot_pid": session.bot_pid,
         "status_endpoint": f"/status/{session.id}",
+        "events_endpoint": f"/calls/events?call_id={session.id}",
     }
 
 
@@ -115,23 +130,174 @@ async def connect_assistant(
     return {
         "room_url": session.room_url,
         "token": session.token,
-        "bot_pid": int(session.id),
+        "call_id": session.id,
+        "bot_pid": session.bot_pid,
         "status_endpoint": f"/status/{session.id}",
+        "events_endpoint": f"/calls/events?call_id={session.id}",
     }
 
 
 @router.get(
-    "/status/{pid}", summary="Get process status", responses={404: {"model": APIErrorResponse}}
+    "/calls",
+    summary="List calls",
+    description=(
+        "Calls known to the server, optionally filtered by assistant, campaign, room and state."
+    ),
+)
+def list_calls(
+    assistant_id: Optional[str] = None,
+    campaign_id: Optional[str] = None,
+    room_url: Optional[str] = None,
+    state: Optional[CallState] = None,
+    registry: CallRegistry = Depends(get_call_registry),
+):
+    calls = registry.list(
+        assistant_id=assistant_id, campaign_id=campaign_id, room_url=room_url, state=state
+    )
+    return JSONResponse(
+        {"calls": [call.model_dump() for call in calls], "summary": registry.summary()}
+    )
+
+
+@router.get(
+    "/calls/events",
+    summary="Call state feed",
+    description=(
+        "Server-Sent Events stream with every call state change, instead of polling /status."
+    ),
 )
-def get_status(pid: str, service: CallService = Depends(get_call_service)):
+async def call_events(
+    request: Request,
+    call_id: Optional[str] = None,
+    assistant_id: Optional[str] = None,
+    campaign_id: Optional[str] = None,
+    registry: CallRegistry = Depends(get_call_registry),
+    admission: AdmissionController = Depends(get_admission_controller),
+):
     """
-    Check if a bot process is still running or has finished.
+    Sends the current state of the matching calls, then each change as it happens.
+    The stream ends when the server starts draining, so that it can shut down.
+    """
+    filters = {
+        key: value
+        for key, value in {
+            "id": call_id,
+            "assistant_id": assistant_id,
+            "campaign_id": campaign_id,
+        }.items()
+        if value
+    }
+
+    def matches(call: Dict[str, Any]) -> bool:
+        return all(call.get(key) == value for key, value in filters.items())
+
+    def event(call: Dict[str, Any]) -> str:
+        return f"event: call.state\nid: {call['id']}\ndata: {json.dumps(call, default=str)}\n\n"
+
+    queue = registry.subscribe()
+
+    async def stream():
+        try:
+            if call_id:
+                call = registry.get(call_id)
+                current = [call] if call else []
+            else:
+                current = registry.list(assistant_id=assistant_id, campaign_id=campaign_id)
+                current = [call for call in current if not call.is_finished]
+            for call in current:
+                yield event(call.model_dump())
+
+            while not admission.draining and not await request.is_disconnected():
+                try:
+                    call = await asyncio.wait_for(queue.get(), timeout=15)
+                except asyncio.TimeoutError:
+                    # Keeps proxies from closing an idle stream
+                    yield ": keep-alive\n\n"
+                    continue
+                if matches(call):
+                    yield event(call)
+        finally:
+            registry.unsubscribe(queue)
+
+    return StreamingResponse(
+        stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.get("/calls/{call_id}", summary="Get a call", responses={404: {"model": APIErrorResponse}})
+def get_call(call_id: str, registry: CallRegistry = Depends(get_call_registry)):
+    """
+    State, timestamped state history, room and bot of a call.
+    """
+    call = registry.get(call_id)
+    if not call:
+        raise HTTPException(status_code=404, detail=f"Call {call_id} not found")
+    return JSONResponse(call.model_dump())
+
+
+@router.post(
+    "/calls/{call_id}/state",
+    summary="Report call state (bots)",
+    description="Used by bot processes to report state changes of their call.",
+    include_in_schema=False,
+)
+async def report_call_state(
+    call_id: str,
+    request: Request,
+    x_call_token: Optional[str] = Header(default=None),
+    registry: CallRegistry = Depends(get_call_registry),
+):
+    if registry.handed_over(call_id):
+        # Reached this server before it stopped listening; retried, it reaches the next one
+        raise HTTPException(
+            status_code=503,
+            detail="Call handed over to another server",
+            headers={"Retry-After": "1"},
+        )
+    if not registry.verify_token(call_id, x_call_token):
+        raise HTTPException(status_code=403, detail="Invalid call token")
+
+    body = await request.json()
+    # Batched deliveries from the webhook dispatcher arrive as {"events": [...]}
+    for event in body.get("events", [body]):
+        state = event.get("event")
+        if state in CALL_STATES and state != "spawning":
+            registry.transition(call_id, state)
+    return JSONResponse({"ok": True})
+
+
+@router.get(
+    "/status/{call_id}", summary="Get call status", responses={404: {"model": APIErrorResponse}}
+)
+def get_status(call_id: str, service: CallService = Depends(get_call_service)):
+    """
+    Check if a call (or, by PID, a bot process) is still running or has finished.
     """
     try:
-        status = service.get_call_status(pid)
-        return JSONResponse({"bot_id": pid, "status": status})
+        status = service.get_call_status(call_id)
     except Exception:
-        raise HTTPException(status_code=404, detail=f"Bot with PID {pid} not found")
+        raise HTTPException(status_code=404, detail=f"Call {call_id} not found")
+
+    response = {"bot_id": call_id, "status": status}
+    call = service.get_call(call_id)
+    if call:
+        response.update(call_id=call.id, state=call.state, bot_pid=call.bot_pid)
+    record = service.get_call_record(call_id)
+    if record:
+        response.update(
+            started_at=record.started_at,
+            ended_at=record.ended_at,
+            duration_secs=record.duration_secs,
+            exit_code=record.exit_code,
+            peak_rss_kb=record.peak_rss_kb,
+            cpu_secs=record.cpu_secs,
+        )
+    resources = service.get_call_resources(call_id)
+    if resources:
+        response["resources"] = resources
+    return JSONResponse(response)
 
     """
     Check if a bot process is still running or has finished.
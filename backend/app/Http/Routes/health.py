@@ -0,0 +1,23 @@
+from fastapi import APIRouter, Depends
+from fastapi.responses import JSONResponse
+
+from app.dependencies import get_admission_controller
+from app.Domains.Call.Services.admission_controller import AdmissionController
+
+router = APIRouter(tags=["Health"])
+
+
+@router.get(
+    "/ready",
+    summary="Readiness and capacity",
+    description=(
+        "200 while the node can start a call right away, 503 while calls would queue or the "
+        "server is draining."
+    ),
+)
+def ready(admission: AdmissionController = Depends(get_admission_controller)):
+    """
+    Live capacity: active and queued calls, CPU usage and available memory against their limits.
+    """
+    summary = admission.summary()
+    return JSONResponse(summary, status_code=200 if summary["ready"] else 503)
@@ -0,0 +1,128 @@
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import JSONResponse
+
+from app.dependencies import get_latency_store, get_process_manager, get_room_provider
+from app.Domains.Agent.Metrics.latency import LatencyStats, LatencyStore
+from app.Domains.Agent.Metrics.provider_ledger import ProviderLedger, get_provider_ledger
+from app.Http.DTOs.error_schemas import APIErrorResponse
+from app.Infrastructure.Call.room_pool import RoomPool
+from app.Infrastructure.Call.worker_pool_bot_manager import WorkerPoolBotManager
+
+router = APIRouter(tags=["Metrics"])
+
+
+@router.get(
+    "/metrics/latency",
+    summary="Aggregated turn latency",
+    description="p50/p95/p99 per stage (STT, LLM TTFB, TTS TTFB, voice-to-voice) across saved calls.",
+)
+def get_latency(
+    stt_provider: Optional[str] = None,
+    llm_provider: Optional[str] = None,
+    tts_provider: Optional[str] = None,
+    text_aggregation: Optional[str] = None,
+    store: LatencyStore = Depends(get_latency_store),
+):
+    """
+    Merges the latency histograms of every finished call, optionally filtered by provider.
+    """
+    filters = {
+        key: value
+        for key, value in {
+            "stt_provider": stt_provider,
+            "llm_provider": llm_provider,
+            "tts_provider": tts_provider,
+            "text_aggregation": text_aggregation,
+        }.items()
+        if value
+    }
+
+    calls, total = store.aggregate(filters)
+    return JSONResponse({"calls": calls, "filters": filters, "stages": total.summary()})
+
+
+@router.get(
+    "/metrics/latency/{call_id}",
+    summary="Turn latency of a call",
+    responses={404: {"model": APIErrorResponse}},
+)
+def get_call_latency(call_id: str, store: LatencyStore = Depends(get_latency_store)):
+    """
+    Latency histograms of a single finished call.
+    """
+    snapshot = store.get(call_id)
+    if not snapshot:
+        raise HTTPException(status_code=404, detail=f"No latency metrics for call {call_id}")
+
+    stats = LatencyStats.from_dict(snapshot.get("stats", {}))
+    return JSONResponse(
+        {"call_id": call_id, "tags": snapshot.get("tags", {}), "stages": stats.summary()}
+    )
+
+
+@router.get(
+    "/metrics/providers",
+    summary="Provider performance ledger",
+    description="Recent TTFB, error rate and usage per provider, model and region.",
+)
+def get_provider_metrics(
+    kind: Optional[str] = None, ledger: ProviderLedger = Depends(get_provider_ledger)
+):
+    """
+    The snapshot used to route calls of assistants with latency-aware routing enabled.
+    """
+    entries = [e for e in ledger.summary() if not kind or e["kind"] == kind]
+    return JSONResponse(
+        {"region": ledger.region, "window_secs": ledger.window_secs, "providers": entries}
+    )
+
+
+@router.get(
+    "/metrics/bots",
+    summary="Bot resource usage",
+    description="CPU, memory and I/O of the running bot processes, in total and per bot.",
+)
+def get_bot_metrics(process_manager=Depends(get_process_manager)):
+    """
+    Totals and per-bot means for sizing nodes, the top CPU users and bots flagged as runaway.
+    """
+    sampler = getattr(process_manager, "sampler", None)
+    if not sampler:
+        return JSONResponse({"enabled": False})
+    return JSONResponse({"enabled": True, **sampler.summary()})
+
+
+@router.get(
+    "/metrics/standby-pool",
+    summary="Standby bot pool",
+    description="Idle pre-constructed bots per assistant and how many calls they served.",
+)
+def get_standby_pool_metrics(process_manager=Depends(get_process_manager)):
+    pool = getattr(process_manager, "standby_pool", None)
+    if not pool:
+        return JSONResponse({"enabled": False})
+    return JSONResponse({"enabled": True, **pool.summary()})
+
+
+@router.get(
+    "/metrics/bot-workers",
+    summary="Bot workers",
+    description="Active calls per bot worker process when BOT_WORKERS is enabled.",
+)
+def get_bot_worker_metrics(process_manager=Depends(get_process_manager)):
+    if not isinstance(process_manager, WorkerPoolBotManager):
+        return JSONResponse({"enabled": False})
+    return JSONResponse({"enabled": True, "workers": process_manager.summary()})
+
+
+@router.get(
+    "/metrics/room-pool",
+    summary="Room pool",
+    description="Daily rooms with tokens kept ready for new calls, and how many calls they served.",
+)
+def get_room_pool_metrics(room_provider=Depends(get_room_provider)):
+    if not isinstance(room_provider, RoomPool):
+        return JSONResponse({"enabled": False})
+    return JSONResponse({"enabled": True, **room_provider.summary()})
@@ -10,11 +10,13 @@ app = FastAPI()
 async def receive_webhook(request: Request):
     try:
         data = await request.json()
-        print("\n" + "=" * 40)
-        print(f"🔔 WEBHOOK RECEIVED [{data.get('event', 'unknown')}]")
-        print("-" * 40)
-        print(json.dumps(data, indent=2))
-        print("=" * 40 + "\n")
+        # Batched deliveries wrap several events as {"events": [...]}
+        for event in data.get("events", [data]):
+            print("\n" + "=" * 40)
+            print(f"🔔 WEBHOOK RECEIVED [{event.get('event', 'unknown')}]")
+            print("-" * 40)
+            print(json.dumps(event, indent=2))
+            print("=" * 40 + "\n")
     except Exception as e:
         print(f"Error processing webhook: {e}")
     return {"status": "received"}
@@ -0,0 +1,52 @@
+"""Exit statuses bots record for a server that adopted them and so cannot reap them."""
+
+import os
+import tempfile
+from typing import Optional
+
+DEFAULT_BOT_EXIT_STATUS_DIR = os.path.join(tempfile.gettempdir(), "tito-bot-exits")
+
+
+def exit_status_dir() -> str:
+    return os.getenv("BOT_EXIT_STATUS_DIR") or DEFAULT_BOT_EXIT_STATUS_DIR
+
+
+def _status_path(pid: int) -> str:
+    return os.path.join(exit_status_dir(), str(pid))
+
+
+def write_exit_status(code: int) -> None:
+    """Records this bot's exit status, if it serves a call (the only bots ever adopted)."""
+    if not os.getenv("CALL_ID"):
+        return
+    try:
+        os.makedirs(exit_status_dir(), exist_ok=True)
+        path = _status_path(os.getpid())
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w") as f:
+            f.write(str(code))
+        os.replace(tmp_path, path)
+    except OSError:
+        pass  # The server then reports the exit status as unknown
+
+
+def read_exit_status(pid: int) -> Optional[int]:
+    """Exit status the bot `pid` recorded, removing it. None if it recorded none."""
+    path = _status_path(pid)
+    try:
+        with open(path, "r") as f:
+            data = f.read().strip()
+    except OSError:
+        return None
+    clear_exit_status(pid)
+    try:
+        return int(data)
+    except ValueError:
+        return None
+
+
+def clear_exit_status(pid: int) -> None:
+    try:
+        os.remove(_status_path(pid))
+    except FileNotFoundError:
+        pass
@@ -1,6 +1,9 @@
+import time
+from typing import Optional
+
 import aiohttp
 from fastapi import HTTPException
-from pipecat.transports.daily.utils import DailyRESTHelper, DailyRoomParams
+from pipecat.transports.daily.utils import DailyRESTHelper, DailyRoomParams, DailyRoomProperties
 
 from app.Core.Config.server import ServerConfig
 from app.Domains.Call.Interfaces.room_provider import RoomProvider
@@ -21,21 +24,48 @@ class DailyRoomProvider(RoomProvider):
                 aiohttp_session=self.session,
             )
 
-    async def create_room_and_token(self) -> tuple[str, str]:
+    async def create_room(self, exp: Optional[float] = None, private: bool = False) -> str:
+        """Creates a room, expiring (no new joins) at the `exp` timestamp. Returns its URL."""
         await self._ensure_helper()
-        try:
-            room = await self.helper.create_room(DailyRoomParams())
-            if not room.url:
-                raise Exception("Daily API returned no URL")
+        params = DailyRoomParams(
+            privacy="private" if private else "public",
+            properties=DailyRoomProperties(exp=exp),
+        )
+        room = await self.helper.create_room(params)
+        if not room.url:
+            raise Exception("Daily API returned no URL")
+        return room.url
 
-            token = await self.helper.get_token(room.url)
-            if not token:
-                raise Exception("Daily API returned no token")
+    async def create_token(self, room_url: str, expires_in: float = 60 * 60) -> str:
+        """Meeting token to join `room_url` within `expires_in` seconds."""
+        await self._ensure_helper()
+        token = await self.helper.get_token(room_url, expiry_time=expires_in)
+        if not token:
+            raise Exception("Daily API returned no token")
+        return token
 
-            return room.url, token
+    async def create_room_and_token(self) -> tuple[str, str]:
+        try:
+            room_url = await self.create_room()
+            return room_url, await self.create_token(room_url)
         except Exception as e:
             raise HTTPException(status_code=500, detail=f"Failed to create Daily room: {str(e)}")
 
+    async def room_occupancy(self, room_url: str) -> Optional[int]:
+        """Participants in the room right now, or None if Daily could not tell."""
+        await self._ensure_helper()
+        name = room_url.rstrip("/").rsplit("/", 1)[-1]
+        try:
+            async with self.session.get(
+                f"{self.config.daily_api_url}/rooms/{name}/presence",
+                headers={"Authorization": f"Bearer {self.config.daily_api_key}"},
+            ) as resp:
+                if resp.status != 200:
+                    return None
+                return (await resp.json()).get("total_count", 0)
+        except Exception:
+            return None
+
     async def delete_room(self, room_url: str) -> None:
         await self._ensure_helper()
         try:
@@ -46,3 +76,13 @@ class DailyRoomProvider(RoomProvider):
     async def close(self):
         if self.session:
             await self.session.close()
+
+
+async def create_daily_room(expires_in: float = 60 * 60) -> tuple[str, str]:
+    """One-off room and token for a bot started by hand (bot_runner without --room-url)."""
+    provider = DailyRoomProvider()
+    try:
+        room_url = await provider.create_room(exp=time.time() + expires_in)
+        return room_url, await provider.create_token(room_url, expires_in)
+    finally:
+        await provider.close()
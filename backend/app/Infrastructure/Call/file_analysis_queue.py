@@ -0,0 +1,163 @@
+import json
+import os
+import re
+import time
+from typing import List, Optional
+
+from loguru import logger
+
+from app.Domains.Call.Interfaces.analysis_queue import AnalysisQueue
+from app.Domains.Call.Models.analysis_job import AnalysisJob
+
+STATES = ("pending", "processing", "done", "failed")
+
+# backend/resources/data/analysis
+DEFAULT_ANALYSIS_QUEUE_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))),
+    "resources",
+    "data",
+    "analysis",
+)
+
+
+class FileAnalysisQueue(AnalysisQueue):
+    """Analysis jobs stored as one JSON file per call, moved between state directories.
+
+    Moving a file with `os.rename` is atomic, so any number of bot processes can enqueue
+    and any number of workers can claim without further locking. A job file per call id
+    in any state doubles as the deduplication record. Finished jobs are removed from
+    done/ after `keep_done_secs` (ANALYSIS_KEEP_DONE_SECS, a day by default).
+    """
+
+    def __init__(
+        self,
+        data_dir: Optional[str] = None,
+        stale_after_secs: float = 600.0,
+        keep_done_secs: Optional[float] = None,
+    ):
+        self.data_dir = data_dir or DEFAULT_ANALYSIS_QUEUE_DIR
+        self.stale_after_secs = stale_after_secs
+        self.keep_done_secs = (
+            keep_done_secs
+            if keep_done_secs is not None
+            else float(os.getenv("ANALYSIS_KEEP_DONE_SECS", "86400"))
+        )
+        self._pruned_at = 0.0
+        for state in STATES:
+            os.makedirs(os.path.join(self.data_dir, state), exist_ok=True)
+
+    def _get_file_path(self, state: str, call_id: str) -> str:
+        safe_id = re.sub(r"[^A-Za-z0-9_.-]", "_", call_id)
+        return os.path.join(self.data_dir, state, f"{safe_id}.json")
+
+    def _write(self, state: str, job: AnalysisJob) -> None:
+        file_path = self._get_file_path(state, job.call_id)
+        tmp_path = f"{file_path}.{os.getpid()}.tmp"
+        # Pending jobs carry the call's API key: readable by the owner only
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w") as f:
+            json.dump(job.model_dump(), f, default=str)
+        os.replace(tmp_path, file_path)
+
+    def _read(self, file_path: str) -> Optional[AnalysisJob]:
+        try:
+            with open(file_path, "r") as f:
+                return AnalysisJob(**json.load(f))
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.error(f"Malformed analysis job {file_path}: {e}")
+            return None
+
+    def enqueue(self, job: AnalysisJob) -> bool:
+        if any(os.path.exists(self._get_file_path(state, job.call_id)) for state in STATES):
+            logger.info(f"Analysis job for call {job.call_id} already queued, skipping")
+            return False
+        self._write("pending", job)
+        return True
+
+    def claim(self, limit: int) -> List[AnalysisJob]:
+        self._requeue_stale()
+        self._prune_done()
+
+        pending_dir = os.path.join(self.data_dir, "pending")
+        claimed = []
+        names = sorted(
+            (n for n in os.listdir(pending_dir) if n.endswith(".json")),
+            key=lambda n: (
+                os.path.getmtime(os.path.join(pending_dir, n))
+                if os.path.exists(os.path.join(pending_dir, n))
+                else 0
+            ),
+        )
+        now = time.time()
+        for name in names:
+            if len(claimed) >= limit:
+                break
+            source = os.path.join(pending_dir, name)
+            job = self._read(source)
+            if job is None or job.next_attempt_at > now:
+                continue
+            target = os.path.join(self.data_dir, "processing", name)
+            try:
+                os.rename(source, target)
+            except OSError:
+                continue  # Claimed by another worker
+            # Refresh mtime so the stale check measures time spent processing
+            os.utime(target)
+            claimed.append(job)
+        return claimed
+
+    def complete(self, job: AnalysisJob) -> None:
+        job.api_key = None
+        self._write("done", job)
+        self._remove("processing", job.call_id)
+
+    def fail(self, job: AnalysisJob, error: str, retry: bool) -> None:
+        job.last_error = error
+        if not retry:
+            job.api_key = None
+        self._write("pending" if retry else "failed", job)
+        self._remove("processing", job.call_id)
+
+    def get(self, call_id: str) -> Optional[AnalysisJob]:
+        for state in STATES:
+            job = self._read(self._get_file_path(state, call_id))
+            if job is not None:
+                return job
+        return None
+
+    def _remove(self, state: str, call_id: str) -> None:
+        file_path = self._get_file_path(state, call_id)
+        if os.path.exists(file_path):
+            os.remove(file_path)
+
+    def _prune_done(self) -> None:
+        """Remove jobs finished more than `keep_done_secs` ago (checked once a minute)."""
+        now = time.time()
+        if now - self._pruned_at < 60:
+            return
+        self._pruned_at = now
+        done_dir = os.path.join(self.data_dir, "done")
+        cutoff = now - self.keep_done_secs
+        for name in os.listdir(done_dir):
+            file_path = os.path.join(done_dir, name)
+            try:
+                if os.path.getmtime(file_path) < cutoff:
+                    os.remove(file_path)
+            except OSError:
+                continue
+
+    def _requeue_stale(self) -> None:
+        """Return jobs left in processing by a worker that died mid-job."""
+        processing_dir = os.path.join(self.data_dir, "processing")
+        cutoff = time.time() - self.stale_after_secs
+        for name in os.listdir(processing_dir):
+            source = os.path.join(processing_dir, name)
+            try:
+                if not name.endswith(".json") or os.path.getmtime(source) > cutoff:
+                    continue
+                os.rename(source, os.path.join(self.data_dir, "pending", name))
+                logger.warning(f"Re-queued stale analysis job {name}")
+            except OSError:
+                continue
@@ -0,0 +1,85 @@
+import json
+import os
+import re
+from typing import List, Optional
+
+from loguru import logger
+
+from app.Domains.Call.Interfaces.call_store import CallStore
+from app.Domains.Call.Models.call import TrackedCall
+
+# backend/resources/data/calls
+DEFAULT_CALL_STORE_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))),
+    "resources",
+    "data",
+    "calls",
+)
+
+
+class FileCallStore(CallStore):
+    """Calls stored as one JSON file per call id, replaced atomically on every change."""
+
+    def __init__(self, data_dir: Optional[str] = None):
+        self.data_dir = data_dir or DEFAULT_CALL_STORE_DIR
+        os.makedirs(self.data_dir, exist_ok=True)
+
+    def _get_file_path(self, call_id: str) -> str:
+        safe_id = re.sub(r"[^A-Za-z0-9_.-]", "_", call_id)
+        return os.path.join(self.data_dir, f"{safe_id}.json")
+
+    def save(self, call: TrackedCall) -> None:
+        file_path = self._get_file_path(call.id)
+        tmp_path = f"{file_path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(call.model_dump(), f, default=str)
+        os.replace(tmp_path, file_path)
+
+    def save_token(self, call_id: str, token: Optional[str]) -> None:
+        token_path = self._get_file_path(call_id)[: -len(".json")] + ".token"
+        if token is None:
+            try:
+                os.remove(token_path)
+            except FileNotFoundError:
+                pass
+            return
+        tmp_path = f"{token_path}.{os.getpid()}.tmp"
+        # A secret: readable by the server's user only
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w") as f:
+            f.write(token)
+        os.replace(tmp_path, token_path)
+
+    def load_token(self, call_id: str) -> Optional[str]:
+        token_path = self._get_file_path(call_id)[: -len(".json")] + ".token"
+        try:
+            with open(token_path, "r") as f:
+                return f.read().strip() or None
+        except FileNotFoundError:
+            return None
+
+    def load_recent(self, limit: int) -> List[TrackedCall]:
+        paths = [
+            os.path.join(self.data_dir, name)
+            for name in os.listdir(self.data_dir)
+            if name.endswith(".json")
+        ]
+        paths.sort(key=lambda p: os.path.getmtime(p) if os.path.exists(p) else 0)
+
+        calls = []
+        for file_path in paths[-limit:]:
+            try:
+                with open(file_path, "r") as f:
+                    calls.append(TrackedCall(**json.load(f)))
+            except FileNotFoundError:
+                continue
+            except Exception as e:
+                logger.error(f"Malformed call record {file_path}: {e}")
+        return calls
+
+    def delete(self, call_id: str) -> None:
+        try:
+            os.remove(self._get_file_path(call_id))
+        except FileNotFoundError:
+            pass
+        self.save_token(call_id, None)
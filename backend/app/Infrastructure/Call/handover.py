@@ -0,0 +1,110 @@
+"""Hands the running calls of a server that is being replaced to the next one."""
+
+import asyncio
+import json
+import os
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from loguru import logger
+
+# A handover carries up to every running call with its history
+MAX_MESSAGE_BYTES = 16 * 1024 * 1024
+
+
+class HandoverServer:
+    """Unix socket on which the next server asks this one for its running calls.
+
+    A single handover is served: `hand_over()` returns the calls the next server takes
+    (and stops tracking them here), then `on_handed_over()` stops this server from
+    accepting connections, so they all reach the next one, and drains what is left. The
+    socket is removed before answering, so the next server can listen on the same path for
+    its own successor.
+    """
+
+    def __init__(
+        self,
+        socket_path: str,
+        hand_over: Callable[[], Awaitable[Dict[str, Any]]],
+        on_handed_over: Callable[[], None],
+    ):
+        self.socket_path = socket_path
+        self.hand_over = hand_over
+        self.on_handed_over = on_handed_over
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._inode: Optional[int] = None
+        self._done = asyncio.Event()
+
+    def _remove_socket(self):
+        if self._server:
+            self._server.close()
+        try:
+            # Only our own socket, not one the next server already bound
+            if os.stat(self.socket_path).st_ino == self._inode:
+                os.unlink(self.socket_path)
+        except FileNotFoundError:
+            pass
+
+    async def _serve(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        handed_over = False
+        try:
+            request = json.loads(await reader.readline() or b"{}")
+            if request.get("op") != "handover" or self._done.is_set():
+                writer.write(b'{"error": "unsupported request"}\n')
+                return
+            self._done.set()
+            handed_over = True
+            self._remove_socket()
+            try:
+                reply = await self.hand_over()
+            except Exception as e:
+                logger.error(f"Handover failed: {e}")
+                reply = {"error": str(e), "calls": []}
+            writer.write(json.dumps(reply, default=str).encode() + b"\n")
+            await writer.drain()
+            logger.info(f"Handed {len(reply['calls'])} running calls over to the next server")
+        except Exception as e:
+            logger.error(f"Handover request failed: {e}")
+        finally:
+            writer.close()
+        if handed_over:
+            self.on_handed_over()
+
+    async def run(self):
+        """Serves one handover, until the server shuts down."""
+        if os.path.exists(self.socket_path):
+            # Left behind by a server that did not exit cleanly; request_handover found
+            # no one listening on it
+            os.unlink(self.socket_path)
+        self._server = await asyncio.start_unix_server(
+            self._serve, path=self.socket_path, limit=MAX_MESSAGE_BYTES
+        )
+        os.chmod(self.socket_path, 0o600)
+        self._inode = os.stat(self.socket_path).st_ino
+        logger.info(f"Handover socket listening on {self.socket_path}")
+        try:
+            await self._done.wait()
+        finally:
+            self._remove_socket()
+
+
+async def request_handover(socket_path: str, timeout: float = 10.0) -> Optional[Dict[str, Any]]:
+    """Running calls of the server listening on `socket_path`, None if there is none.
+
+    The reply is `{"pid": ..., "calls": [{"call": {...}, "token": ...}, ...]}`; the old
+    server stops listening once it has sent it.
+    """
+    try:
+        reader, writer = await asyncio.wait_for(
+            asyncio.open_unix_connection(socket_path, limit=MAX_MESSAGE_BYTES), timeout
+        )
+    except (FileNotFoundError, ConnectionRefusedError):
+        return None
+    try:
+        writer.write(b'{"op": "handover"}\n')
+        await writer.drain()
+        reply = json.loads(await asyncio.wait_for(reader.readline(), timeout) or b"{}")
+    finally:
+        writer.close()
+    if reply.get("error"):
+        logger.error(f"Previous server could not hand its calls over: {reply['error']}")
+    return reply
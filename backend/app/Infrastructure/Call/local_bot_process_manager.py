@@ -2,18 +2,58 @@ import asyncio
 import os
 import subprocess
 import sys
-from typing import Dict, List, Optional, Tuple
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
 
 from fastapi import HTTPException
 from loguru import logger
 
+from app.Core.Config.call_spec import CallSpec, write_spec_fd
 from app.Core.Config.server import ServerConfig
 from app.Domains.Call.Interfaces.bot_process_manager import BotProcessManager
 from app.Domains.Call.Interfaces.room_provider import RoomProvider
+from app.Domains.Call.Models.call import CallRecord
+from app.Infrastructure.Call.bot_exit_status import clear_exit_status, read_exit_status
+from app.Infrastructure.Call.process_sampler import ProcessSampler, read_started_at
+from app.Infrastructure.Call.standby_bot_pool import StandbyBotPool
+from app.Infrastructure.Call.zygote_spawner import (
+    ZygoteProcess,
+    ZygoteSpawner,
+    has_exited,
+    server_zygote_socket,
+)
+
+# Assuming current file is in app/Infrastructure/Call/
+# and bot runner is in backend/runners/bot_runner.py
+BACKEND_ROOT = os.path.dirname(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+)
+RUNNER_PATH = os.path.join(BACKEND_ROOT, "runners", "bot_runner.py")
+
+# Finished calls kept for status queries
+MAX_CALL_RECORDS = 1000
+
+# A bot starts within this long of its call being created (standby bots even before)
+BOT_START_WINDOW_SECS = 60
+
+
+class AdoptedProcess(ZygoteProcess):
+    """A running bot of a previous server, which is not its parent and cannot reap it:
+    the exit status is the one the bot recorded as it exited, None if it recorded none
+    (killed, or crashed without unwinding)."""
+
+    def _read_status(self):
+        if self.returncode is None:
+            self.returncode = read_exit_status(self.pid)
 
 
 class LocalBotProcessManager(BotProcessManager):
-    def __init__(self, room_provider: RoomProvider):
+    def __init__(
+        self,
+        room_provider: RoomProvider,
+        assistant_spec: Optional[Callable[[str], Optional[CallSpec]]] = None,
+    ):
         self.active_processes: Dict[int, Tuple[subprocess.Popen, str]] = (
             {}
         )  # PID -> (Proc, RoomURL)
@@ -22,65 +62,266 @@ class LocalBotProcessManager(BotProcessManager):
         # Store initial args passed to server to propagate them if needed
         self.base_bot_args = []
 
+        # Running and recently finished calls; exits are handled as they happen (pidfd)
+        self.records: "OrderedDict[int, CallRecord]" = OrderedDict()
+        self._finishing: Set[asyncio.Task] = set()
+        # PID -> pidfd of the bots whose exit is watched
+        self._watched: Dict[int, int] = {}
+
+        # CPU, memory and I/O of each running bot
+        self.sampler: Optional[ProcessSampler] = None
+        if self.config.bot_sample_interval_secs > 0:
+            self.sampler = ProcessSampler(
+                interval_secs=self.config.bot_sample_interval_secs,
+                history=self.config.bot_sample_history,
+                runaway_cpu_percent=self.config.bot_runaway_cpu_percent,
+                runaway_secs=self.config.bot_runaway_secs,
+                max_finished=MAX_CALL_RECORDS,
+            )
+
+        self.zygote: Optional[ZygoteSpawner] = None
+        if self.config.bot_zygote_enabled:
+            self.zygote = ZygoteSpawner(
+                self.config.bot_zygote_socket or server_zygote_socket(), BACKEND_ROOT, self._env()
+            )
+
+        # Bots constructed ahead of time for the busiest assistants
+        self.standby_pool: Optional[StandbyBotPool] = None
+        if self.config.bot_pool_size > 0:
+            self.standby_pool = StandbyBotPool(
+                self._spawn_standby,
+                size=self.config.bot_pool_size,
+                assistants=self.config.bot_pool_assistants,
+                top_assistants=self.config.bot_pool_top_assistants,
+                assistant_spec=assistant_spec,
+                max_idle_secs=self.config.bot_pool_max_idle_secs,
+            )
+
     def set_base_args(self, args: List[str]):
         self.base_bot_args = args
 
-    async def start_bot(
-        self, room_url: str, token: str, args: List[str], env_vars: Optional[Dict[str, str]] = None
-    ) -> int:
+    async def start_bot(self, spec: CallSpec) -> int:
+        room_url = spec.room_url
         # Capacity check
         active_in_room = sum(
             1
             for proc, url in self.active_processes.values()
-            if url == room_url and proc.poll() is None
+            if url == room_url and not has_exited(proc)
         )
         if active_in_room >= self.config.max_bots_per_room:
             raise HTTPException(status_code=429, detail="Room capacity reached")
 
-        try:
-            # Locate bot runner script
-            # Assuming current file is in app/Infrastructure/Call/
-            # and bot runner is in backend/runners/bot_runner.py
-            backend_root = os.path.dirname(
-                os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-            )
-            runner_path = os.path.join(backend_root, "runners", "bot_runner.py")
-
-            cmd = [sys.executable, runner_path, "-u", room_url, "-t", token, *self.base_bot_args]
-            if args:
-                cmd.extend(args)
+        if self.standby_pool:
+            proc = self.standby_pool.acquire(spec)
+            if proc:
+                self._track(proc, room_url)
+                return proc.pid
 
-            env = os.environ.copy()
-            env["PYTHONPATH"] = backend_root
-            if env_vars:
-                env.update(env_vars)
-
-            proc = subprocess.Popen(cmd, bufsize=1, cwd=backend_root, env=env)
+        try:
+            proc = self._launch(self.base_bot_args, spec)
 
-            self.active_processes[proc.pid] = (proc, room_url)
+            self._track(proc, room_url)
             return proc.pid
 
         except Exception as e:
             logger.error(f"Failed to spawn bot: {e}")
             raise HTTPException(status_code=500, detail=f"Bot spawn failed: {e}")
 
+    def _env(self) -> Dict[str, str]:
+        env = os.environ.copy()
+        env["PYTHONPATH"] = BACKEND_ROOT
+        return env
+
+    def _launch(self, runner_args: List[str], spec: Optional[CallSpec] = None, stdin=False):
+        """Start bot_runner, forked from the zygote when enabled.
+
+        The call spec is encoded once into an in-memory file the bot inherits and reads at
+        startup. Returns a `subprocess.Popen` or a `ZygoteProcess` (same pid/poll/stdin
+        interface).
+        """
+        env = self._env()
+        spec_fd = write_spec_fd(spec) if spec else None
+        try:
+            if self.zygote:
+                try:
+                    return self.zygote.spawn(runner_args, env, stdin=stdin, spec_fd=spec_fd)
+                except Exception as e:
+                    logger.warning(f"Zygote spawn failed, starting a fresh interpreter: {e}")
+
+            cmd = [sys.executable, RUNNER_PATH, *runner_args]
+            pass_fds = ()
+            if spec_fd is not None:
+                cmd.extend(["--call-spec-fd", str(spec_fd)])
+                pass_fds = (spec_fd,)
+            if stdin:
+                return subprocess.Popen(
+                    cmd,
+                    bufsize=1,
+                    cwd=BACKEND_ROOT,
+                    env=env,
+                    pass_fds=pass_fds,
+                    stdin=subprocess.PIPE,
+                    text=True,
+                )
+            return subprocess.Popen(cmd, bufsize=1, cwd=BACKEND_ROOT, env=env, pass_fds=pass_fds)
+        finally:
+            if spec_fd is not None:
+                os.close(spec_fd)
+
+    def _spawn_standby(self, spec: CallSpec):
+        """Start a bot process that waits on stdin for its call."""
+        return self._launch([*self.base_bot_args, "--standby"], spec, stdin=True)
+
+    def _track(self, proc, room_url: str, started_at: Optional[float] = None):
+        self.active_processes[proc.pid] = (proc, room_url)
+        self.records[proc.pid] = CallRecord(
+            id=str(proc.pid), room_url=room_url, started_at=started_at or time.time()
+        )
+        if self.sampler:
+            self.sampler.track(proc.pid)
+        try:
+            pidfd = os.pidfd_open(proc.pid)
+        except (AttributeError, OSError) as e:
+            # Older kernels: the cleanup loop notices the exit instead
+            logger.debug(f"No pidfd for bot {proc.pid}: {e}")
+            return
+        # The pidfd becomes readable when the process exits
+        asyncio.get_running_loop().add_reader(pidfd, self._on_exit, proc.pid, pidfd)
+        self._watched[proc.pid] = pidfd
+
+    def _unwatch(self, pid: int):
+        pidfd = self._watched.pop(pid, None)
+        if pidfd is not None:
+            asyncio.get_running_loop().remove_reader(pidfd)
+            os.close(pidfd)
+
+    def _on_exit(self, pid: int, pidfd: int):
+        self._unwatch(pid)
+        task = asyncio.get_running_loop().create_task(self._finish(pid))
+        self._finishing.add(task)
+        task.add_done_callback(self._finishing.discard)
+
+    def _reap(self, proc):
+        """Collect the exit status. Returns the process' resource usage, if known."""
+        if not isinstance(proc, subprocess.Popen):
+            # Forked by the zygote, which reaps it and reports the status
+            proc.poll()
+            return None
+        try:
+            pid, status, rusage = os.wait4(proc.pid, os.WNOHANG)
+        except ChildProcessError:
+            proc.poll()
+            return None
+        if pid == 0:
+            return None
+        proc.returncode = os.waitstatus_to_exitcode(status)
+        return rusage
+
+    async def _finish(self, pid: int):
+        entry = self.active_processes.pop(pid, None)
+        if not entry:
+            return
+        proc, room_url = entry
+        rusage = self._reap(proc)
+        if isinstance(proc, ZygoteProcess):
+            # The zygote reports the exit status right after reaping the bot
+            await proc.wait_status()
+        series = self.sampler.get(pid) if self.sampler else None
+        if self.sampler:
+            self.sampler.untrack(pid)
+
+        record = self.records.get(pid)
+        if record:
+            record.ended_at = time.time()
+            record.exit_code = proc.returncode
+            if rusage:
+                record.peak_rss_kb = rusage.ru_maxrss
+                record.cpu_secs = round(rusage.ru_utime + rusage.ru_stime, 2)
+            elif series:
+                # Zygote children: the last /proc sample is as close as we get
+                record.peak_rss_kb = series.peak_rss_kb
+                record.cpu_secs = round(series.cpu_secs, 2)
+            logger.info(
+                f"🧹 Bot {pid} exited with {record.exit_code} after {record.duration_secs}s "
+                f"(CPU {record.cpu_secs}s, peak RSS {record.peak_rss_kb} KB), "
+                f"releasing room {room_url}"
+            )
+        clear_exit_status(pid)
+        self._notify_exit(pid, proc.returncode)
+        while len(self.records) > MAX_CALL_RECORDS + len(self.active_processes):
+            self.records.popitem(last=False)
+
+        if not room_url:
+            return
+        try:
+            await self.room_provider.delete_room(room_url)
+        except Exception as e:
+            logger.error(f"Failed to delete room {room_url}: {e}")
+
+    def adopt(self, pid: int, room_url: Optional[str], started_at: float) -> bool:
+        if pid in self.active_processes:
+            return True
+        # A live process under the bot's pid may be another one that reused the pid
+        cmdline = b""
+        try:
+            with open(f"/proc/{pid}/cmdline", "rb") as f:
+                cmdline = f.read()
+        except OSError:
+            pass
+        process_started_at = read_started_at(pid)
+        if (
+            (b"bot_runner" not in cmdline and b"bot_zygote" not in cmdline)
+            or process_started_at is None
+            or process_started_at > started_at + BOT_START_WINDOW_SECS
+        ):
+            return False
+        # Not our child: liveness and signals as for zygote children, and the exit
+        # status is the one the bot records itself
+        clear_exit_status(pid)  # Left by an earlier process with the same pid
+        self._track(AdoptedProcess(pid), room_url or "", started_at)
+        return True
+
+    def release(self, pid: int) -> bool:
+        if not self.active_processes.pop(pid, None):
+            return False
+        self._unwatch(pid)
+        self.records.pop(pid, None)
+        if self.sampler:
+            self.sampler.untrack(pid)
+        return True
+
     def get_status(self, pid: int) -> str:
-        if pid not in self.active_processes:
-            raise HTTPException(status_code=404, detail="Bot process not found")
+        if pid in self.active_processes:
+            return "running"
+        if pid in self.records:
+            return "finished"
+        raise HTTPException(status_code=404, detail="Bot process not found")
 
-        proc, _ = self.active_processes[pid]
-        return "running" if proc.poll() is None else "finished"
+    def get_record(self, pid: int) -> Optional[CallRecord]:
+        return self.records.get(pid)
+
+    def get_resources(self, pid: int) -> Optional[Dict[str, Any]]:
+        series = self.sampler.get(pid) if self.sampler else None
+        return series.summary(include_samples=True) if series else None
 
     async def cleanup(self):
-        """Periodic cleanup task"""
-        while True:
-            try:
-                for pid in list(self.active_processes.keys()):
-                    proc, room_url = self.active_processes[pid]
-                    if proc.poll() is not None:
-                        logger.info(f"🧹 Cleaning up process {pid} for room {room_url}")
-                        await self.room_provider.delete_room(room_url)
-                        del self.active_processes[pid]
-            except Exception as e:
-                logger.error(f"Cleanup error: {e}")
-            await asyncio.sleep(5)
+        """Fallback sweep for exits the pidfd watchers could not report"""
+        # Start the zygote ahead of the first call, it preloads for a few seconds
+        if self.zygote:
+            self.zygote.start()
+        try:
+            while True:
+                try:
+                    # poll() reaps the process, so watched ones are left to _on_exit
+                    exited = [
+                        pid
+                        for pid, (proc, _) in list(self.active_processes.items())
+                        if pid not in self._watched and has_exited(proc)
+                    ]
+                    await asyncio.gather(*(self._finish(pid) for pid in exited))
+                except Exception as e:
+                    logger.error(f"Cleanup error: {e}")
+                await asyncio.sleep(5)
+        finally:
+            if self.zygote:
+                self.zygote.close()
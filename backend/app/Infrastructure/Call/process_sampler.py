@@ -0,0 +1,214 @@
+"""CPU, memory and I/O of bot processes, sampled from /proc."""
+
+import asyncio
+import os
+import time
+from collections import OrderedDict, deque
+from dataclasses import asdict, dataclass, field
+from typing import Any, Deque, Dict, Optional, Tuple
+
+from loguru import logger
+
+CLK_TCK = os.sysconf("SC_CLK_TCK") if hasattr(os, "sysconf") else 100
+PAGE_KB = (os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096) // 1024
+
+
+@dataclass
+class ResourceSample:
+    at: float
+    cpu_percent: float  # Of one core, so above 100 for a process using several
+    rss_kb: int
+    read_kb_per_sec: Optional[float] = None
+    write_kb_per_sec: Optional[float] = None
+
+
+def read_counters(pid: int) -> Optional[Tuple[int, int, Optional[int], Optional[int]]]:
+    """(cpu ticks, rss KB, read bytes, write bytes) of a process, None once it is gone."""
+    try:
+        with open(f"/proc/{pid}/stat") as f:
+            # The command name may contain spaces and parentheses
+            fields = f.read().rsplit(")", 1)[1].split()
+        with open(f"/proc/{pid}/statm") as f:
+            rss_kb = int(f.read().split()[1]) * PAGE_KB
+    except (OSError, IndexError, ValueError):
+        return None
+    # utime and stime, fields 14 and 15 of stat
+    cpu_ticks = int(fields[11]) + int(fields[12])
+
+    read_bytes = write_bytes = None
+    try:
+        with open(f"/proc/{pid}/io") as f:
+            io = dict(line.split(": ") for line in f.read().splitlines())
+        read_bytes, write_bytes = int(io["read_bytes"]), int(io["write_bytes"])
+    except (OSError, KeyError, ValueError):
+        pass  # Not readable for processes of other users
+    return cpu_ticks, rss_kb, read_bytes, write_bytes
+
+
+def read_started_at(pid: int) -> Optional[float]:
+    """Start time (epoch seconds) of a process, None once it is gone."""
+    try:
+        with open(f"/proc/{pid}/stat") as f:
+            fields = f.read().rsplit(")", 1)[1].split()
+        with open("/proc/stat") as f:
+            boot_time = next(int(line.split()[1]) for line in f if line.startswith("btime"))
+    except (OSError, IndexError, ValueError, StopIteration):
+        return None
+    # starttime, field 22 of stat, in clock ticks since boot
+    return boot_time + int(fields[19]) / CLK_TCK
+
+
+@dataclass
+class ProcessSeries:
+    """Ring buffer of samples for one bot process."""
+
+    pid: int
+    history: int
+    started_at: float = field(default_factory=time.time)
+    samples: Deque[ResourceSample] = field(init=False)
+    peak_cpu_percent: float = 0.0
+    peak_rss_kb: int = 0
+    cpu_secs: float = 0.0
+    runaway: bool = False
+    _hot: int = 0
+    _last: Optional[Tuple[float, int, Optional[int], Optional[int]]] = None
+
+    def __post_init__(self):
+        self.samples = deque(maxlen=self.history)
+
+    def add(self, now: float, counters: Tuple[int, int, Optional[int], Optional[int]]):
+        cpu_ticks, rss_kb, read_bytes, write_bytes = counters
+        self.cpu_secs = cpu_ticks / CLK_TCK
+        self.peak_rss_kb = max(self.peak_rss_kb, rss_kb)
+        last, self._last = self._last, (now, cpu_ticks, read_bytes, write_bytes)
+        if not last or now <= last[0]:
+            return
+
+        elapsed = now - last[0]
+        sample = ResourceSample(
+            at=time.time(),
+            cpu_percent=round(100.0 * (cpu_ticks - last[1]) / CLK_TCK / elapsed, 1),
+            rss_kb=rss_kb,
+        )
+        if read_bytes is not None and last[2] is not None:
+            sample.read_kb_per_sec = round((read_bytes - last[2]) / 1024 / elapsed, 1)
+            sample.write_kb_per_sec = round((write_bytes - last[3]) / 1024 / elapsed, 1)
+        self.samples.append(sample)
+        self.peak_cpu_percent = max(self.peak_cpu_percent, sample.cpu_percent)
+
+    def summary(self, include_samples: bool = False) -> Dict[str, Any]:
+        latest = self.samples[-1] if self.samples else None
+        result = {
+            "pid": self.pid,
+            "cpu_percent": latest.cpu_percent if latest else None,
+            "rss_kb": latest.rss_kb if latest else None,
+            "read_kb_per_sec": latest.read_kb_per_sec if latest else None,
+            "write_kb_per_sec": latest.write_kb_per_sec if latest else None,
+            "mean_cpu_percent": (
+                round(sum(s.cpu_percent for s in self.samples) / len(self.samples), 1)
+                if self.samples
+                else None
+            ),
+            "peak_cpu_percent": self.peak_cpu_percent,
+            "peak_rss_kb": self.peak_rss_kb,
+            "cpu_secs": round(self.cpu_secs, 2),
+            "runaway": self.runaway,
+        }
+        if include_samples:
+            result["samples"] = [asdict(s) for s in self.samples]
+        return result
+
+
+class ProcessSampler:
+    """Samples every tracked bot process each `interval_secs`.
+
+    Each process keeps its last `history` samples (CPU%, RSS, I/O rates). A process
+    above `runaway_cpu_percent` for `runaway_secs` straight is flagged and logged, which
+    is how a bot spinning in a loop shows up. Series of exited processes are kept for
+    the status endpoint, up to `max_finished`.
+    """
+
+    def __init__(
+        self,
+        interval_secs: float = 2.0,
+        history: int = 60,
+        runaway_cpu_percent: float = 90.0,
+        runaway_secs: float = 30.0,
+        max_finished: int = 1000,
+    ):
+        self.interval_secs = interval_secs
+        self.history = history
+        self.runaway_cpu_percent = runaway_cpu_percent
+        self.runaway_samples = max(1, round(runaway_secs / interval_secs))
+        self.max_finished = max_finished
+        self.active: Dict[int, ProcessSeries] = {}
+        self.finished: "OrderedDict[int, ProcessSeries]" = OrderedDict()
+
+    def track(self, pid: int):
+        series = ProcessSeries(pid, self.history)
+        counters = read_counters(pid)
+        if counters:
+            series.add(time.monotonic(), counters)
+        self.active[pid] = series
+
+    def untrack(self, pid: int):
+        series = self.active.pop(pid, None)
+        if not series:
+            return
+        self.finished[pid] = series
+        while len(self.finished) > self.max_finished:
+            self.finished.popitem(last=False)
+
+    def get(self, pid: int) -> Optional[ProcessSeries]:
+        return self.active.get(pid) or self.finished.get(pid)
+
+    def sample(self):
+        now = time.monotonic()
+        for pid, series in list(self.active.items()):
+            counters = read_counters(pid)
+            if not counters:
+                # Exited; its manager untracks it
+                continue
+            series.add(now, counters)
+            if not series.samples:
+                continue
+
+            cpu = series.samples[-1].cpu_percent
+            series._hot = series._hot + 1 if cpu >= self.runaway_cpu_percent else 0
+            if series._hot >= self.runaway_samples and not series.runaway:
+                series.runaway = True
+                logger.warning(
+                    f"Bot {pid} has used {cpu}% CPU for over "
+                    f"{round(series._hot * self.interval_secs)}s, it may be stuck in a loop"
+                )
+            elif series._hot == 0:
+                series.runaway = False
+
+    async def run(self):
+        """Background sampling loop."""
+        while True:
+            try:
+                self.sample()
+            except Exception as e:
+                logger.error(f"Process sampler error: {e}")
+            await asyncio.sleep(self.interval_secs)
+
+    def summary(self) -> Dict[str, Any]:
+        bots = [series.summary() for series in self.active.values()]
+        sampled = [b for b in bots if b["cpu_percent"] is not None]
+        return {
+            "interval_secs": self.interval_secs,
+            "bots": len(bots),
+            "cpu_percent": round(sum(b["cpu_percent"] for b in sampled), 1),
+            "rss_kb": sum(b["rss_kb"] for b in sampled),
+            "read_kb_per_sec": round(sum(b["read_kb_per_sec"] or 0 for b in sampled), 1),
+            "write_kb_per_sec": round(sum(b["write_kb_per_sec"] or 0 for b in sampled), 1),
+            "mean_cpu_percent_per_bot": (
+                round(sum(b["cpu_percent"] for b in sampled) / len(sampled), 1) if sampled else None
+            ),
+            "mean_rss_kb_per_bot": (
+                round(sum(b["rss_kb"] for b in sampled) / len(sampled)) if sampled else None
+            ),
+            "runaway": [b["pid"] for b in bots if b["runaway"]],
+            "top_cpu": sorted(sampled, key=lambda b: b["cpu_percent"], reverse=True)[:5],
+        }
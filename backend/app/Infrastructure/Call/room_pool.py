@@ -0,0 +1,198 @@
+"""Daily rooms and meeting tokens created ahead of the calls that will use them."""
+
+import asyncio
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Deque, Dict, List, Set, Tuple
+
+from loguru import logger
+
+from app.Domains.Call.Interfaces.room_provider import RoomProvider
+from app.Infrastructure.Call.daily_room_provider import DailyRoomProvider
+
+
+@dataclass
+class PooledRoom:
+    url: str
+    token: str
+    room_exp: float  # No one can join the room after this
+    token_exp: float  # ...nor with this token
+    in_use: bool = False
+
+
+class RoomPool(RoomProvider):
+    """Keeps `size` private rooms with a meeting token ready to hand out.
+
+    Taking a pooled room saves the two Daily REST round trips (create room, get token)
+    on the call's critical path; the pool refills in the background. Rooms expire at
+    `room_ttl_secs` (room `exp`) and tokens only admit joins for `token_ttl_secs`, which
+    does not limit how long a call lasts. A room is dropped from the pool, or given a new
+    token, before either expiry gets within `min_join_secs`.
+
+    Rooms released after a call are recycled instead of deleted: once the call's token
+    can no longer be used to join and the room is empty, it gets a new token and goes
+    back to the pool. Rooms are private, so the URL alone does not let anyone in.
+    """
+
+    def __init__(
+        self,
+        provider: DailyRoomProvider,
+        size: int,
+        room_ttl_secs: float = 24 * 60 * 60,
+        token_ttl_secs: float = 10 * 60,
+        min_join_secs: float = 60,
+        interval_secs: float = 1.0,
+        max_concurrent_requests: int = 4,
+    ):
+        self.provider = provider
+        self.size = size
+        self.room_ttl_secs = room_ttl_secs
+        self.token_ttl_secs = token_ttl_secs
+        self.min_join_secs = min_join_secs
+        self.interval_secs = interval_secs
+        self._requests = asyncio.Semaphore(max_concurrent_requests)
+
+        self._ready: Deque[PooledRoom] = deque()
+        # Released rooms waiting for their last token to expire: (reusable_at, url)
+        self._cooling: List[Tuple[float, str]] = []
+        # Every room this pool created, with its expiry and latest token expiry
+        self._rooms: Dict[str, PooledRoom] = {}
+        self._filling: Set[asyncio.Task] = set()
+        self._wakeup = asyncio.Event()
+        self.hits = 0
+        self.misses = 0
+        self.recycled = 0
+
+    def _usable(self, room: PooledRoom, now: float) -> bool:
+        return min(room.room_exp, room.token_exp) - now > self.min_join_secs
+
+    async def _new_room(self) -> PooledRoom:
+        async with self._requests:
+            now = time.time()
+            url = await self.provider.create_room(exp=now + self.room_ttl_secs, private=True)
+            room = PooledRoom(url, "", now + self.room_ttl_secs, 0.0)
+            self._rooms[url] = room
+            return await self._new_token(room)
+
+    async def _new_token(self, room: PooledRoom) -> PooledRoom:
+        room.token = await self.provider.create_token(room.url, self.token_ttl_secs)
+        room.token_exp = time.time() + self.token_ttl_secs
+        return room
+
+    async def create_room_and_token(self) -> Tuple[str, str]:
+        now = time.time()
+        while self._ready:
+            room = self._ready.popleft()
+            if self._usable(room, now):
+                room.in_use = True
+                self.hits += 1
+                self._wakeup.set()
+                return room.url, room.token
+            self._cooling.append((now, room.url))
+
+        self.misses += 1
+        self._wakeup.set()
+        try:
+            room = await self._new_room()
+        except Exception as e:
+            logger.warning(f"Room pool could not create a room, using a one-off room: {e}")
+            return await self.provider.create_room_and_token()
+        room.in_use = True
+        return room.url, room.token
+
+    async def delete_room(self, room_url: str) -> None:
+        room = self._rooms.get(room_url)
+        if not room:
+            await self.provider.delete_room(room_url)
+            return
+        room.in_use = False
+        # Whoever held the last token could still join with it until it expires
+        self._cooling.append((room.token_exp, room_url))
+        self._wakeup.set()
+
+    async def _recycle(self, room_url: str):
+        room = self._rooms.get(room_url)
+        if not room:
+            return
+        try:
+            if room.room_exp - time.time() <= self.token_ttl_secs + self.min_join_secs:
+                raise ValueError("room about to expire")
+            async with self._requests:
+                occupancy = await self.provider.room_occupancy(room_url)
+                if occupancy != 0:
+                    raise ValueError(f"{occupancy} participants still in the room")
+                await self._new_token(room)
+            self._ready.append(room)
+            self.recycled += 1
+        except Exception as e:
+            logger.debug(f"Not recycling room {room_url}: {e}")
+            del self._rooms[room_url]
+            await self.provider.delete_room(room_url)
+
+    async def _add_room(self):
+        try:
+            self._ready.append(await self._new_room())
+        except Exception as e:
+            logger.error(f"Room pool could not create a room: {e}")
+            await asyncio.sleep(self.interval_secs)
+
+    def _spawn(self, coro):
+        task = asyncio.create_task(coro)
+        self._filling.add(task)
+        task.add_done_callback(self._filling.discard)
+
+    def top_up(self):
+        now = time.time()
+        for room in [r for r in self._ready if not self._usable(r, now)]:
+            self._ready.remove(room)
+            self._cooling.append((now, room.url))
+
+        due = [url for reusable_at, url in self._cooling if reusable_at <= now]
+        self._cooling = [(at, url) for at, url in self._cooling if at > now]
+        for url in due:
+            self._spawn(self._recycle(url))
+
+        missing = self.size - len(self._ready) - len(self._filling)
+        for _ in range(max(0, missing)):
+            self._spawn(self._add_room())
+
+    async def run(self):
+        """Background loop keeping the pool filled."""
+        try:
+            while True:
+                try:
+                    self.top_up()
+                except Exception as e:
+                    logger.error(f"Room pool error: {e}")
+                self._wakeup.clear()
+                try:
+                    # Not wait_for: it can swallow a cancel that races a wakeup (3.11)
+                    async with asyncio.timeout(self.interval_secs):
+                        await self._wakeup.wait()
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            await self.close()
+
+    async def close(self):
+        for task in list(self._filling):
+            task.cancel()
+        # Rooms of calls still running are released by their process manager
+        unused = [url for url, room in self._rooms.items() if not room.in_use]
+        self._rooms.clear()
+        self._ready.clear()
+        self._cooling.clear()
+        await asyncio.gather(*(self.provider.delete_room(url) for url in unused))
+        await self.provider.close()
+
+    def summary(self) -> Dict:
+        return {
+            "size": self.size,
+            "ready": len(self._ready),
+            "cooling": len(self._cooling),
+            "creating": len(self._filling),
+            "hits": self.hits,
+            "misses": self.misses,
+            "recycled": self.recycled,
+        }
@@ -0,0 +1,196 @@
+"""Bot processes constructed ahead of the calls that will use them."""
+
+import asyncio
+import os
+import subprocess
+import time
+from collections import Counter, deque
+from dataclasses import dataclass, field
+from typing import Callable, Deque, Dict, List, Optional, Tuple
+
+from loguru import logger
+
+from app.Core.Config.call_spec import CallSpec
+from app.Domains.Agent.Cache.prompt_cache import CACHING_PROVIDERS
+from app.Infrastructure.Call.zygote_spawner import has_exited
+
+# Standby spec (CallSpec.for_standby) serialized; calls with the same one share processes
+PoolKey = str
+
+
+def prompt_fixed_at_construction(spec: CallSpec) -> bool:
+    """Whether the bot's LLM setup depends on the rendered system prompt.
+
+    Standby bots render the prompt without the call's variables, and `bind_call` only
+    replaces it in the context. Ultravox takes the prompt when its service is built, and
+    provider prompt caching keys the cache on it, so neither can take per-call variables.
+    """
+    if not spec.prompt_variables:
+        return False
+    settings = spec.settings()
+    provider = (settings.get("LLM_PROVIDER") or os.getenv("LLM_PROVIDER") or "google").lower()
+    if provider == "ultravox":
+        return True
+    cache_enabled = settings.get("PROMPT_CACHE_ENABLED") or os.getenv("PROMPT_CACHE_ENABLED")
+    return provider in CACHING_PROVIDERS and (cache_enabled or "true").lower() == "true"
+
+
+@dataclass
+class StandbyBot:
+    proc: subprocess.Popen
+    key: PoolKey
+    assistant_id: Optional[str] = None
+    started_at: float = field(default_factory=time.time)
+
+
+class StandbyBotPool:
+    """Keeps `size` idle bot processes per popular assistant.
+
+    A standby process runs bot_runner with `--standby` and the call spec minus its
+    per-call parts: it constructs the bot (services, context, VAD model, tool runtime),
+    then blocks on stdin. `acquire` hands it the full spec of a call (room, token, prompt
+    variables, call environment), so the answer path only attaches the transport and
+    starts the pipeline.
+
+    Pooled assistants are those listed in `assistants` plus the `top_assistants` with the
+    most calls in the last hour. `run` tops the pool up and retires processes idle for
+    longer than `max_idle_secs`, so edits to an assistant are picked up.
+    """
+
+    def __init__(
+        self,
+        spawn: Callable[[CallSpec], subprocess.Popen],
+        *,
+        size: int,
+        assistants: Optional[List[str]] = None,
+        top_assistants: int = 0,
+        assistant_spec: Optional[Callable[[str], Optional[CallSpec]]] = None,
+        max_idle_secs: float = 300.0,
+        interval_secs: float = 5.0,
+    ):
+        self._spawn = spawn
+        self.size = size
+        self.assistants = assistants or []
+        self.top_assistants = top_assistants
+        self._assistant_spec = assistant_spec
+        self.max_idle_secs = max_idle_secs
+        self.interval_secs = interval_secs
+
+        self._standby: List[StandbyBot] = []
+        self._demand: Deque[Tuple[float, PoolKey]] = deque(maxlen=1000)
+        # Standby spec of every key asked for recently or configured
+        self._specs: Dict[PoolKey, CallSpec] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def _key(self, spec: CallSpec) -> PoolKey:
+        standby = spec.for_standby()
+        key = standby.model_dump_json()
+        self._specs.setdefault(key, standby)
+        return key
+
+    def acquire(self, spec: CallSpec) -> Optional[subprocess.Popen]:
+        """Bind a standby process to a call. Returns None if none can take it."""
+        # Keywords and provider keys are read when the services are built, not at call start
+        if (
+            spec.stt_keywords
+            or any(name.endswith("_API_KEY") for name in spec.env)
+            or prompt_fixed_at_construction(spec)
+        ):
+            self.misses += 1
+            return None
+        key = self._key(spec)
+        self._demand.append((time.time(), key))
+
+        binding = spec.model_dump_json(exclude_defaults=True)
+        # Oldest first: the longest-waiting process is the most likely to be constructed
+        for standby in [s for s in self._standby if s.key == key]:
+            self._standby.remove(standby)
+            if has_exited(standby.proc):
+                continue
+            try:
+                standby.proc.stdin.write(binding + "\n")
+                standby.proc.stdin.close()
+            except (BrokenPipeError, OSError) as e:
+                logger.warning(f"Standby bot {standby.proc.pid} unusable: {e}")
+                standby.proc.kill()
+                continue
+            self.hits += 1
+            logger.info(f"Bound call to standby bot {standby.proc.pid}")
+            return standby.proc
+
+        self.misses += 1
+        return None
+
+    def _targets(self) -> Dict[PoolKey, int]:
+        targets: Dict[PoolKey, int] = {}
+        if self._assistant_spec:
+            for assistant_id in self.assistants:
+                spec = self._assistant_spec(assistant_id)
+                if spec:
+                    targets[self._key(spec)] = self.size
+
+        since = time.time() - 3600
+        recent = Counter(key for ts, key in self._demand if ts >= since)
+        for key, _ in recent.most_common(self.top_assistants):
+            targets[key] = self.size
+
+        # Forget specs of assistants that were edited or are no longer called
+        demanded = {key for _, key in self._demand}
+        for key in [k for k in self._specs if k not in targets and k not in demanded]:
+            del self._specs[key]
+        return targets
+
+    def _retire(self, standby: StandbyBot, reason: str):
+        logger.debug(f"Retiring standby bot {standby.proc.pid} ({reason})")
+        self._standby.remove(standby)
+        if not has_exited(standby.proc):
+            standby.proc.terminate()
+
+    def top_up(self):
+        targets = self._targets()
+        now = time.time()
+        for standby in list(self._standby):
+            if has_exited(standby.proc):
+                self._standby.remove(standby)
+            elif standby.key not in targets:
+                self._retire(standby, "assistant no longer pooled")
+            elif now - standby.started_at > self.max_idle_secs:
+                self._retire(standby, "idle too long")
+
+        for key, size in targets.items():
+            missing = size - sum(1 for s in self._standby if s.key == key)
+            spec = self._specs[key]
+            assistant_id = spec.assistant.id if spec.assistant else None
+            for _ in range(missing):
+                try:
+                    proc = self._spawn(spec)
+                except Exception as e:
+                    logger.error(f"Failed to spawn standby bot for {assistant_id}: {e}")
+                    break
+                self._standby.append(StandbyBot(proc, key, assistant_id))
+
+    async def run(self):
+        """Background loop keeping the pool filled."""
+        try:
+            while True:
+                try:
+                    self.top_up()
+                except Exception as e:
+                    logger.error(f"Standby pool error: {e}")
+                await asyncio.sleep(self.interval_secs)
+        finally:
+            self.close()
+
+    def close(self):
+        for standby in list(self._standby):
+            self._retire(standby, "shutting down")
+
+    def summary(self) -> Dict:
+        standby = Counter(s.assistant_id or "inline" for s in self._standby)
+        return {
+            "size": self.size,
+            "standby": dict(standby),
+            "hits": self.hits,
+            "misses": self.misses,
+        }
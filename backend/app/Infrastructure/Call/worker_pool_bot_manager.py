@@ -0,0 +1,227 @@
+import asyncio
+import itertools
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+from fastapi import HTTPException
+from loguru import logger
+
+from app.Core.Config.call_spec import CallSpec
+from app.Core.Config.server import ServerConfig
+from app.Domains.Call.Interfaces.bot_process_manager import BotProcessManager
+from app.Domains.Call.Interfaces.room_provider import RoomProvider
+from app.Infrastructure.Call.local_bot_process_manager import BACKEND_ROOT
+from app.Infrastructure.Call.process_sampler import ProcessSampler
+
+# Request lines carry the call spec, with the assistant and its system prompt
+MAX_LINE_BYTES = 4 * 1024 * 1024
+
+
+@dataclass
+class Worker:
+    index: int
+    socket_path: str
+    proc: Optional[subprocess.Popen] = None
+    active: int = 0
+    healthy: bool = False
+
+
+@dataclass
+class WorkerCall:
+    worker: int
+    room_url: str
+    status: str = "running"
+    started_at: float = field(default_factory=time.time)
+
+
+class WorkerPoolBotManager(BotProcessManager):
+    """Runs calls on a fixed set of bot worker processes (runners/bot_worker.py).
+
+    Each worker runs many bot pipelines on its own event loop, so interpreters, imported
+    SDKs and models are shared by all the calls of a worker instead of paid per call. New
+    calls go to the worker with the fewest active calls; call ids are allocated here and
+    returned in place of a pid. Workers that die are restarted and their calls reported
+    as finished.
+    """
+
+    def __init__(self, room_provider: RoomProvider, workers: int, socket_dir: Optional[str] = None):
+        self.config = ServerConfig()
+        self.room_provider = room_provider
+        self.base_bot_args: List[str] = []
+        socket_dir = socket_dir or tempfile.gettempdir()
+        self.workers = [
+            Worker(i, os.path.join(socket_dir, f"tito-bot-worker-{os.getpid()}-{i}.sock"))
+            for i in range(workers)
+        ]
+        self.calls: Dict[int, WorkerCall] = {}
+        # Ids stay unique across server restarts without any shared state
+        self._call_ids = itertools.count(int(time.time() * 1000))
+
+        # CPU, memory and I/O per worker process; calls of a worker share its numbers
+        self.sampler: Optional[ProcessSampler] = None
+        if self.config.bot_sample_interval_secs > 0:
+            self.sampler = ProcessSampler(
+                interval_secs=self.config.bot_sample_interval_secs,
+                history=self.config.bot_sample_history,
+                runaway_cpu_percent=self.config.bot_runaway_cpu_percent,
+                runaway_secs=self.config.bot_runaway_secs,
+            )
+
+    def set_base_args(self, args: List[str]):
+        self.base_bot_args = args
+
+    def _start_worker(self, worker: Worker):
+        if self.sampler and worker.proc:
+            self.sampler.untrack(worker.proc.pid)
+        env = os.environ.copy()
+        env["PYTHONPATH"] = BACKEND_ROOT
+        worker.proc = subprocess.Popen(
+            [sys.executable, "-m", "runners.bot_worker", "--socket", worker.socket_path],
+            cwd=BACKEND_ROOT,
+            env=env,
+        )
+        worker.active = 0
+        worker.healthy = False
+        if self.sampler:
+            self.sampler.track(worker.proc.pid)
+        logger.info(f"Started bot worker {worker.index} (pid {worker.proc.pid})")
+
+    async def _request(self, worker: Worker, payload: dict, timeout: float = 5.0) -> dict:
+        reader, writer = await asyncio.wait_for(
+            asyncio.open_unix_connection(worker.socket_path, limit=MAX_LINE_BYTES), timeout
+        )
+        try:
+            writer.write(json.dumps(payload).encode() + b"\n")
+            await writer.drain()
+            line = await asyncio.wait_for(reader.readline(), timeout)
+        finally:
+            writer.close()
+        if not line:
+            raise ConnectionError(f"Bot worker {worker.index} closed the connection")
+        reply = json.loads(line)
+        if "error" in reply:
+            raise RuntimeError(reply["error"])
+        return reply
+
+    async def start_bot(self, spec: CallSpec) -> int:
+        room_url = spec.room_url
+        # Capacity check
+        active_in_room = sum(
+            1
+            for call in self.calls.values()
+            if call.room_url == room_url and call.status == "running"
+        )
+        if active_in_room >= self.config.max_bots_per_room:
+            raise HTTPException(status_code=429, detail="Room capacity reached")
+
+        call_id = next(self._call_ids)
+        request = {
+            "op": "start",
+            "call_id": str(call_id),
+            "args": self.base_bot_args,
+            "spec": spec.model_dump(mode="json", exclude_defaults=True),
+        }
+
+        # Least loaded first; a worker that does not answer is skipped for this call
+        candidates = [w for w in self.workers if w.proc and w.proc.poll() is None]
+        for worker in sorted(candidates, key=lambda w: (not w.healthy, w.active)):
+            try:
+                await self._request(worker, request)
+            except Exception as e:
+                logger.warning(f"Bot worker {worker.index} did not take call {call_id}: {e}")
+                worker.healthy = False
+                continue
+            worker.active += 1
+            self.calls[call_id] = WorkerCall(worker.index, room_url)
+            logger.info(f"Call {call_id} dispatched to bot worker {worker.index}")
+            return call_id
+
+        raise HTTPException(status_code=503, detail="No bot worker available")
+
+    def get_status(self, pid: int) -> str:
+        if pid not in self.calls:
+            raise HTTPException(status_code=404, detail="Bot process not found")
+        return "running" if self.calls[pid].status == "running" else "finished"
+
+    def get_resources(self, pid: int) -> Optional[Dict[str, Any]]:
+        call = self.calls.get(pid)
+        if not call or not self.sampler:
+            return None
+        worker = self.workers[call.worker]
+        series = self.sampler.get(worker.proc.pid) if worker.proc else None
+        if not series:
+            return None
+        return {
+            "worker": worker.index,
+            "shared_with_calls": worker.active,
+            **series.summary(include_samples=True),
+        }
+
+    async def _refresh(self, worker: Worker):
+        if not worker.proc or worker.proc.poll() is not None:
+            if worker.proc:
+                logger.error(f"Bot worker {worker.index} exited with {worker.proc.returncode}")
+            for call in self.calls.values():
+                if call.worker == worker.index and call.status == "running":
+                    call.status = "failed"
+            self._start_worker(worker)
+            return
+
+        try:
+            status = await self._request(worker, {"op": "status"})
+        except Exception:
+            # Still starting up, or too busy to answer right now
+            worker.healthy = False
+            return
+        worker.healthy = True
+        worker.active = status["active"]
+        finished = status["finished"]
+        for call_id, call in self.calls.items():
+            if call.worker == worker.index and call.status == "running":
+                state = finished.get(str(call_id))
+                if state:
+                    call.status = state
+
+    async def cleanup(self):
+        """Keeps the workers running and releases the rooms of finished calls."""
+        for worker in self.workers:
+            self._start_worker(worker)
+        try:
+            while True:
+                try:
+                    await asyncio.gather(*(self._refresh(w) for w in self.workers))
+                    done = [c for c, call in self.calls.items() if call.status != "running"]
+                    for call_id in done:
+                        call = self.calls.pop(call_id)
+                        self._notify_exit(call_id, 0 if call.status == "finished" else 1)
+                        logger.info(f"🧹 Cleaning up call {call_id} for room {call.room_url}")
+                        await self.room_provider.delete_room(call.room_url)
+                except Exception as e:
+                    logger.error(f"Cleanup error: {e}")
+                await asyncio.sleep(2)
+        finally:
+            for worker in self.workers:
+                if worker.proc and worker.proc.poll() is None:
+                    worker.proc.terminate()
+
+    def summary(self) -> List[Dict]:
+        return [
+            {
+                "worker": w.index,
+                "pid": w.proc.pid if w.proc else None,
+                "healthy": w.healthy,
+                "active_calls": w.active,
+                "resources": (
+                    self.sampler.get(w.proc.pid).summary()
+                    if self.sampler and w.proc and self.sampler.get(w.proc.pid)
+                    else None
+                ),
+            }
+            for w in self.workers
+        ]
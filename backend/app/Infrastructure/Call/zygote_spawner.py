@@ -0,0 +1,261 @@
+"""Client side of the bot zygote (runners/bot_zygote.py)."""
+
+import asyncio
+import json
+import os
+import select
+import signal
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Dict, List, Optional
+
+from loguru import logger
+
+DEFAULT_ZYGOTE_SOCKET = os.path.join(tempfile.gettempdir(), "tito-bot-zygote.sock")
+
+# Requests carry the full environment, so allow well over the usual
+MAX_MESSAGE_BYTES = 4 * 1024 * 1024
+
+
+def server_zygote_socket() -> str:
+    """Socket of this server's zygote: one per server process, so a server taking over the
+    calls of another does not share (or unlink) its zygote."""
+    return os.path.join(tempfile.gettempdir(), f"tito-bot-zygote-{os.getpid()}.sock")
+
+
+def send_message(sock: socket.socket, payload: dict, fds: Optional[List[int]] = None):
+    socket.send_fds(sock, [json.dumps(payload).encode()], fds or [])
+
+
+def recv_message(sock: socket.socket, max_fds: int = 0):
+    data, fds, _, _ = socket.recv_fds(sock, MAX_MESSAGE_BYTES, max_fds)
+    if not data:
+        raise ConnectionError("Zygote closed the connection")
+    return json.loads(data), fds
+
+
+class ZygoteProcess:
+    """A bot forked by the zygote, exposing the parts of `subprocess.Popen` we use.
+
+    The zygote is the parent and reaps the process, then writes its exit status to the
+    pipe read through `status_fd`. Liveness and signals go through a pidfd, so a pid the
+    kernel reused for another process is never taken for the bot. `exited` tells whether
+    the bot is gone; `returncode` stays None while its exit status is unknown (the zygote
+    has not reported it, or never will).
+    """
+
+    def __init__(self, pid: int, stdin=None, status_fd: Optional[int] = None):
+        self.pid = pid
+        self.stdin = stdin
+        self.returncode: Optional[int] = None
+        self.exited = False
+        self._status_fd = status_fd
+        if status_fd is not None:
+            os.set_blocking(status_fd, False)
+        self._pidfd: Optional[int] = None
+        try:
+            self._pidfd = os.pidfd_open(pid)
+        except ProcessLookupError:
+            self.exited = True
+        except (AttributeError, OSError):
+            pass  # Older kernels: signal 0, which cannot tell a reused pid apart
+
+    def _alive(self) -> bool:
+        if self._pidfd is not None:
+            # A pidfd becomes readable once the process has exited
+            return not select.select([self._pidfd], [], [], 0)[0]
+        try:
+            os.kill(self.pid, 0)
+        except (ProcessLookupError, PermissionError):
+            return False
+        return True
+
+    def _read_status(self):
+        if self._status_fd is None:
+            return
+        try:
+            data = os.read(self._status_fd, 32)
+        except BlockingIOError:
+            return  # Not reported yet
+        if data:
+            self.returncode = int(data)
+        # Reported, or the zygote is gone without reporting it
+        os.close(self._status_fd)
+        self._status_fd = None
+
+    def poll(self) -> Optional[int]:
+        """The exit status once the bot is gone and the zygote reported it, else None."""
+        if not self.exited and not self._alive():
+            self.exited = True
+            if self._pidfd is not None:
+                os.close(self._pidfd)
+                self._pidfd = None
+        if self.exited:
+            self._read_status()
+        return self.returncode
+
+    async def wait_status(self, timeout: float = 2.0) -> Optional[int]:
+        """Exit status of the gone bot, waiting up to `timeout` for the zygote to report it."""
+        if self._status_fd is not None:
+            loop = asyncio.get_running_loop()
+            reported = loop.create_future()
+            loop.add_reader(self._status_fd, lambda: reported.done() or reported.set_result(None))
+            try:
+                await asyncio.wait_for(reported, timeout)
+            except asyncio.TimeoutError:
+                pass
+            finally:
+                loop.remove_reader(self._status_fd)
+        return self.poll()
+
+    def send_signal(self, sig: int):
+        self.poll()
+        if self.exited:
+            return
+        try:
+            if self._pidfd is not None:
+                signal.pidfd_send_signal(self._pidfd, sig)
+            else:
+                os.kill(self.pid, sig)
+        except ProcessLookupError:
+            pass
+
+    def terminate(self):
+        self.send_signal(signal.SIGTERM)
+
+    def kill(self):
+        self.send_signal(signal.SIGKILL)
+
+    def __del__(self):
+        for fd in (self._pidfd, self._status_fd):
+            if fd is not None:
+                os.close(fd)
+
+
+def has_exited(proc) -> bool:
+    """Whether a `subprocess.Popen` or a ZygoteProcess has exited."""
+    if isinstance(proc, ZygoteProcess):
+        proc.poll()
+        return proc.exited
+    return proc.poll() is not None
+
+
+class ZygoteSpawner:
+    """Starts bots by asking a pre-initialized zygote process to fork.
+
+    The zygote has pipecat, the provider SDKs, onnxruntime and the bot modules imported
+    already, so a forked bot skips the seconds a fresh interpreter spends importing them,
+    and shares those pages copy-on-write with every other bot. The zygote is started on
+    first use; spawns fail (and the caller falls back to a fresh process) until it listens.
+    """
+
+    def __init__(self, socket_path: str, cwd: str, env: Dict[str, str], timeout: float = 5.0):
+        self.socket_path = socket_path
+        self.cwd = cwd
+        self.env = env
+        self.timeout = timeout
+        self._proc: Optional[subprocess.Popen] = None
+
+    def start(self):
+        if self._proc and self._proc.poll() is None:
+            return
+        if self._proc:
+            logger.warning(f"Bot zygote exited with {self._proc.returncode}, restarting")
+        self._proc = subprocess.Popen(
+            [sys.executable, "-m", "runners.bot_zygote", "--socket", self.socket_path],
+            cwd=self.cwd,
+            env=self.env,
+        )
+        logger.info(f"Started bot zygote {self._proc.pid} on {self.socket_path}")
+
+    def wait_ready(self, timeout: float = 60.0) -> bool:
+        """Block until the zygote accepts connections (it listens once preloading is done)."""
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if self._proc and self._proc.poll() is not None:
+                return False
+            try:
+                self._ping()
+                return True
+            except OSError:
+                time.sleep(0.1)
+        return False
+
+    def _connect(self) -> socket.socket:
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_SEQPACKET)
+        sock.settimeout(self.timeout)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, MAX_MESSAGE_BYTES)
+        try:
+            sock.connect(self.socket_path)
+        except OSError:
+            sock.close()
+            raise
+        return sock
+
+    def _ping(self):
+        with self._connect() as sock:
+            send_message(sock, {"ping": True})
+            recv_message(sock)
+
+    def spawn(
+        self,
+        args: List[str],
+        env: Dict[str, str],
+        stdin: bool = False,
+        stdout: Optional[int] = None,
+        spec_fd: Optional[int] = None,
+    ) -> ZygoteProcess:
+        """Fork a bot running bot_runner with `args`.
+
+        With `stdin` the bot reads from a new pipe, exposed as the returned process'
+        `stdin` (text mode, like Popen(stdin=PIPE, text=True)). `stdout` is an optional file
+        descriptor for the bot's standard output, and `spec_fd` one holding its call spec
+        (see write_spec_fd).
+        """
+        self.start()
+        fds, names = [], []
+        stdin_write = None
+        if stdin:
+            stdin_read, stdin_write = os.pipe()
+            fds.append(stdin_read)
+            names.append("stdin")
+        if stdout is not None:
+            fds.append(stdout)
+            names.append("stdout")
+        if spec_fd is not None:
+            fds.append(spec_fd)
+            names.append("spec")
+        # The zygote writes the bot's exit status here once it reaps it
+        status_read, status_write = os.pipe()
+        fds.append(status_write)
+        names.append("status")
+
+        try:
+            with self._connect() as sock:
+                send_message(sock, {"args": args, "env": env, "fds": names}, fds)
+                reply, _ = recv_message(sock)
+        except Exception:
+            if stdin_write is not None:
+                os.close(stdin_write)
+            os.close(status_read)
+            raise
+        finally:
+            if stdin:
+                os.close(fds[0])
+            os.close(status_write)
+
+        if "error" in reply:
+            if stdin_write is not None:
+                os.close(stdin_write)
+            os.close(status_read)
+            raise RuntimeError(reply["error"])
+
+        pipe = os.fdopen(stdin_write, "w", buffering=1) if stdin_write is not None else None
+        return ZygoteProcess(reply["pid"], stdin=pipe, status_fd=status_read)
+
+    def close(self):
+        if self._proc and self._proc.poll() is None:
+            self._proc.terminate()
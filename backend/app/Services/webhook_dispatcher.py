@@ -0,0 +1,369 @@
+"""Background webhook delivery.
+
+Events are handed to a bounded in-memory queue and delivered by a single background
+task per process, so a slow or failing endpoint never blocks the caller (the audio
+pipeline). Deliveries share one pooled aiohttp session, are batched per destination,
+retried with exponential backoff and spilled to disk when the queue overflows or
+retries are exhausted. Spilled events are replayed by the next dispatcher that starts,
+half a queue at a time as the worker catches up.
+"""
+
+import asyncio
+import glob
+import json
+import os
+import random
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+import aiohttp
+from dotenv import load_dotenv
+from loguru import logger
+
+# backend/resources/data/webhooks
+DEFAULT_SPILL_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+    "resources",
+    "data",
+    "webhooks",
+)
+
+
+@dataclass
+class WebhookEnvelope:
+    url: str
+    headers: Dict[str, str]
+    body: Dict[str, Any]
+    enqueued_at: float = field(default_factory=time.monotonic)
+    attempts: int = 0
+
+    @property
+    def destination(self) -> Tuple[str, str]:
+        return self.url, json.dumps(self.headers, sort_keys=True)
+
+
+class WebhookDispatcher:
+    def __init__(self):
+        load_dotenv()
+
+        self.queue_size: int = int(os.getenv("WEBHOOK_QUEUE_SIZE", "1000"))
+        self.batch_size: int = int(os.getenv("WEBHOOK_BATCH_SIZE", "10"))
+        self.batch_window: float = float(os.getenv("WEBHOOK_BATCH_WINDOW_MS", "50")) / 1000
+        self.max_retries: int = int(os.getenv("WEBHOOK_MAX_RETRIES", "5"))
+        self.backoff_base: float = float(os.getenv("WEBHOOK_BACKOFF_BASE_SECS", "0.5"))
+        self.backoff_max: float = float(os.getenv("WEBHOOK_BACKOFF_MAX_SECS", "30"))
+        self.request_timeout: float = float(os.getenv("WEBHOOK_TIMEOUT_SECS", "10"))
+        self.spill_dir: str = os.getenv("WEBHOOK_SPILL_DIR", DEFAULT_SPILL_DIR)
+
+        self._queue: Optional[asyncio.Queue] = None
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._worker_task: Optional[asyncio.Task] = None
+        self._deliveries: set = set()
+        self._destination_locks: Dict[Tuple[str, str], asyncio.Lock] = {}
+        # Spill file this process claimed and is replaying, resumed after every batch
+        self._replaying: Optional[str] = None
+
+        self._counters: Dict[str, int] = {
+            "enqueued": 0,
+            "delivered": 0,
+            "retried": 0,
+            "failed": 0,
+            "spilled": 0,
+            "replayed": 0,
+        }
+        self._lags_ms: Deque[float] = deque(maxlen=1000)
+
+    # --- Public API ---
+
+    def enqueue(self, url: str, headers: Optional[Dict[str, str]], body: Dict[str, Any]) -> None:
+        """Queue an event for delivery. Never blocks and never raises."""
+        envelope = WebhookEnvelope(url=url, headers=dict(headers or {}), body=body)
+        self._counters["enqueued"] += 1
+        try:
+            self._ensure_started()
+            self._queue.put_nowait(envelope)
+        except asyncio.QueueFull:
+            logger.warning(f"Webhook queue full, spilling '{body.get('event')}' to disk")
+            self._spill([envelope])
+        except RuntimeError:
+            # No running event loop (e.g. called from a sync context), keep it for replay
+            self._spill([envelope])
+
+    async def flush(self, timeout: float = 10.0) -> bool:
+        """Wait until everything queued so far is delivered, failed or spilled."""
+        if not self._queue:
+            return True
+        try:
+            await asyncio.wait_for(self._drain(), timeout=timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+
+    async def close(self, timeout: float = 10.0) -> None:
+        """Flush pending events (spilling what is left) and release the session."""
+        if not await self.flush(timeout):
+            logger.warning("Webhook flush timed out, spilling undelivered events")
+        if self._worker_task:
+            self._worker_task.cancel()
+            try:
+                await self._worker_task
+            except asyncio.CancelledError:
+                pass
+            self._worker_task = None
+        for delivery in list(self._deliveries):
+            delivery.cancel()
+        if self._queue:
+            leftovers = []
+            while not self._queue.empty():
+                leftovers.append(self._queue.get_nowait())
+                self._queue.task_done()
+            self._spill(leftovers)
+        if self._session:
+            await self._session.close()
+            self._session = None
+        self._queue = None
+        if self._counters["enqueued"]:
+            logger.info(f"Webhook dispatcher stats: {self.metrics()}")
+
+    def metrics(self) -> Dict[str, Any]:
+        lags = sorted(self._lags_ms)
+        return {
+            **self._counters,
+            "queue_depth": self._queue.qsize() if self._queue else 0,
+            "in_flight": len(self._deliveries),
+            "lag_ms": {
+                "p50": _percentile(lags, 0.50),
+                "p95": _percentile(lags, 0.95),
+                "max": lags[-1] if lags else 0.0,
+            },
+        }
+
+    # --- Internals ---
+
+    def _ensure_started(self):
+        loop = asyncio.get_running_loop()
+        if self._worker_task and not self._worker_task.done():
+            return
+        self._queue = asyncio.Queue(maxsize=self.queue_size)
+        self._worker_task = loop.create_task(self._run())
+        self._replay_spilled(include_own=True)
+
+    async def _drain(self):
+        await self._queue.join()
+        while self._deliveries:
+            await asyncio.gather(*list(self._deliveries), return_exceptions=True)
+
+    async def _run(self):
+        while True:
+            first = await self._queue.get()
+            batch = [first]
+            deadline = time.monotonic() + self.batch_window
+            while len(batch) < self.batch_size * 4:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout=remaining))
+                except asyncio.TimeoutError:
+                    break
+
+            by_destination: Dict[Tuple[str, str], List[WebhookEnvelope]] = {}
+            for envelope in batch:
+                by_destination.setdefault(envelope.destination, []).append(envelope)
+
+            for destination, envelopes in by_destination.items():
+                for start in range(0, len(envelopes), self.batch_size):
+                    chunk = envelopes[start : start + self.batch_size]
+                    task = asyncio.create_task(self._deliver(destination, chunk))
+                    self._deliveries.add(task)
+                    task.add_done_callback(self._deliveries.discard)
+
+            for _ in batch:
+                self._queue.task_done()
+            if self._replaying:
+                self._replay_spilled()
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        if not self._session or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=100, limit_per_host=10, keepalive_timeout=30),
+                timeout=aiohttp.ClientTimeout(total=self.request_timeout),
+            )
+        return self._session
+
+    async def _deliver(self, destination: Tuple[str, str], envelopes: List[WebhookEnvelope]):
+        # Deliveries to the same destination stay ordered
+        lock = self._destination_locks.setdefault(destination, asyncio.Lock())
+        async with lock:
+            url = envelopes[0].url
+            headers = envelopes[0].headers
+            if len(envelopes) == 1:
+                payload = envelopes[0].body
+            else:
+                payload = {"events": [e.body for e in envelopes]}
+            events = ", ".join(str(e.body.get("event")) for e in envelopes)
+
+            for attempt in range(self.max_retries + 1):
+                retryable = True
+                try:
+                    session = await self._get_session()
+                    async with session.post(url, json=payload, headers=headers) as resp:
+                        if resp.status < 400:
+                            self._record_delivered(envelopes)
+                            logger.debug(f"Webhook [{events}] sent successfully")
+                            return
+                        retryable = resp.status >= 500 or resp.status == 429
+                        text = await resp.text()
+                        logger.warning(
+                            f"Webhook [{events}] failed with status {resp.status}: {text}"
+                        )
+                except Exception as e:
+                    logger.error(f"Failed to send webhook [{events}]: {e}")
+
+                if not retryable:
+                    self._counters["failed"] += len(envelopes)
+                    return
+                if attempt < self.max_retries:
+                    self._counters["retried"] += len(envelopes)
+                    for envelope in envelopes:
+                        envelope.attempts += 1
+                    delay = min(self.backoff_max, self.backoff_base * 2**attempt)
+                    await asyncio.sleep(delay * random.uniform(0.5, 1.0))
+
+            logger.error(f"Webhook [{events}] exhausted retries, spilling to disk")
+            self._spill(envelopes)
+
+    def _record_delivered(self, envelopes: List[WebhookEnvelope]):
+        now = time.monotonic()
+        self._counters["delivered"] += len(envelopes)
+        for envelope in envelopes:
+            self._lags_ms.append((now - envelope.enqueued_at) * 1000)
+
+    def _spill_path(self) -> str:
+        return os.path.join(self.spill_dir, f"spill-{os.getpid()}.jsonl")
+
+    def _spill(self, envelopes: List[WebhookEnvelope]):
+        if not envelopes:
+            return
+        try:
+            os.makedirs(self.spill_dir, exist_ok=True)
+            with open(self._spill_path(), "a") as f:
+                for envelope in envelopes:
+                    record = {
+                        "url": envelope.url,
+                        "headers": envelope.headers,
+                        "body": envelope.body,
+                    }
+                    f.write(json.dumps(record, default=str) + "\n")
+            self._counters["spilled"] += len(envelopes)
+        except Exception as e:
+            logger.error(f"Failed to spill {len(envelopes)} webhook event(s): {e}")
+
+    def _claim_spill(self, include_own: bool) -> Optional[str]:
+        """Claim a spill file of a process that is no longer running, None if there is none.
+
+        Files are renamed on claim, so two processes never replay the same one. A claimed
+        file whose replayer exited mid-way is claimed again and resumed at its offset.
+        """
+        pattern = os.path.join(self.spill_dir, "spill-*.jsonl*")
+        for path in sorted(glob.glob(pattern)):
+            name = os.path.basename(path)
+            if name.endswith(".offset"):
+                continue
+            source, _, replayer = name.partition(".replay-")
+            try:
+                owner = int(replayer or source[len("spill-") : -len(".jsonl")])
+            except ValueError:
+                continue
+            if owner == os.getpid() and not include_own:
+                continue
+            if owner != os.getpid() and _pid_alive(owner):
+                continue
+
+            claimed = os.path.join(self.spill_dir, f"{source}.replay-{os.getpid()}")
+            try:
+                os.rename(path, claimed)
+                if replayer and os.path.exists(f"{path}.offset"):
+                    os.rename(f"{path}.offset", f"{claimed}.offset")
+            except OSError:
+                continue
+            return claimed
+        return None
+
+    def _replay_spilled(self, include_own: bool = False):
+        """Re-queue spilled events while the queue is less than half full.
+
+        Reading stops there and resumes (from the offset saved next to the claimed file)
+        after the worker's next batch, so a large spill neither floods the queue only to
+        be spilled again nor has to be read in full by every process that starts.
+        """
+        budget = self.queue_size // 2 - self._queue.qsize()
+        while budget > 0:
+            if not self._replaying:
+                self._replaying = self._claim_spill(include_own)
+                if not self._replaying:
+                    return
+            path = self._replaying
+            try:
+                with open(f"{path}.offset") as f:
+                    offset = int(f.read() or 0)
+            except (FileNotFoundError, ValueError):
+                offset = 0
+
+            with open(path, "rb") as f:
+                f.seek(offset)
+                while budget > 0:
+                    line = f.readline()
+                    if not line:
+                        break
+                    budget -= 1
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue
+                    envelope = WebhookEnvelope(
+                        url=record["url"], headers=record.get("headers", {}), body=record["body"]
+                    )
+                    self._queue.put_nowait(envelope)
+                    self._counters["replayed"] += 1
+                offset = f.tell()
+                finished = offset >= os.fstat(f.fileno()).st_size
+
+            if finished:
+                os.remove(path)
+                if os.path.exists(f"{path}.offset"):
+                    os.remove(f"{path}.offset")
+                self._replaying = None
+            else:
+                with open(f"{path}.offset", "w") as f:
+                    f.write(str(offset))
+
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def _percentile(sorted_values: List[float], fraction: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(round(fraction * (len(sorted_values) - 1))))
+    return round(sorted_values[index], 1)
+
+
+_dispatcher: Optional[WebhookDispatcher] = None
+
+
+def get_webhook_dispatcher() -> WebhookDispatcher:
+    """Return the process-wide dispatcher."""
+    global _dispatcher
+    if _dispatcher is None:
+        _dispatcher = WebhookDispatcher()
+    return _dispatcher
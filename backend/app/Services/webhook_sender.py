@@ -1,10 +1,11 @@
 import asyncio
+import time
 from typing import Any, Dict, Optional
 
-import aiohttp
 from loguru import logger
 
 from app.Http.DTOs.schemas import WebhookConfig
+from app.Services.webhook_dispatcher import get_webhook_dispatcher
 
 
 class WebhookSender:
@@ -16,10 +17,12 @@ class WebhookSender:
             logger.warning("WebhookSender: No URL configured, skipping.")
             return
 
-        logger.info(f"WebhookSender: Attempting to send event '{event}' to {self.config.url}")
+        logger.debug(f"WebhookSender: Queueing event '{event}' to {self.config.url}")
 
         if event not in self.config.events:
-            logger.info(f"WebhookSender: Event '{event}' filtered out (Allowed: {self.config.events})")
+            logger.info(
+                f"WebhookSender: Event '{event}' filtered out (Allowed: {self.config.events})"
+            )
             return
 
         data = {
@@ -28,16 +31,13 @@ class WebhookSender:
             "timestamp": asyncio.get_event_loop().time(),  # Or use real time
         }
 
-        try:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    self.config.url, json=data, headers=self.config.headers
-                ) as resp:
-                    if resp.status >= 400:
-                        logger.warning(
-                            f"Webhook {event} failed with status {resp.status}: {await resp.text()}"
-                        )
-                    else:
-                        logger.debug(f"Webhook {event} sent successfully")
-        except Exception as e:
-            logger.error(f"Failed to send webhook {event}: {e}")
+        # Delivery happens in the background dispatcher, never on the caller's path
+        get_webhook_dispatcher().enqueue(self.config.url, self.config.headers, data)
+
+
+def report_call_state(url: Optional[str], token: Optional[str], state: str):
+    """Tells the API server the call moved to `state` (POST /calls/{call_id}/state)."""
+    if not url:
+        return
+    body = {"event": state, "data": {}, "timestamp": time.time()}
+    get_webhook_dispatcher().enqueue(url, {"X-Call-Token": token or ""}, body)
@@ -1,5 +1,6 @@
 import json
 import os
+from typing import Awaitable, Callable, Dict, Optional
 
 import aiohttp
 from loguru import logger
@@ -35,7 +36,8 @@ async def analyze_conversation_with_gemini(api_key: str, transcript: list) -> di
             if resp.status != 200:
                 text = await resp.text()
                 logger.error(f"Analysis failed: {text}")
-                return {"error": "Analysis API call failed"}
+                # Raised rather than returned so the analysis worker retries it
+                raise RuntimeError(f"Analysis API call failed with status {resp.status}")
 
             data = await resp.json()
             try:
@@ -44,3 +46,60 @@ async def analyze_conversation_with_gemini(api_key: str, transcript: list) -> di
             except Exception as e:
                 logger.error(f"Failed to parse analysis result: {e}")
                 return {"error": "Failed to parse analysis"}
+
+
+POSITIVE_WORDS = {"gracias", "perfecto", "genial", "excelente", "thanks", "great", "perfect"}
+NEGATIVE_WORDS = {"no", "mal", "problema", "queja", "molesto", "bad", "problem", "angry"}
+
+
+async def analyze_conversation_locally(api_key: Optional[str], transcript: list) -> dict:
+    """Deterministic stand-in analyzer, no network access. Used for tests and local runs."""
+    user_turns = [
+        m.get("content")
+        for m in transcript
+        if isinstance(m, dict) and m.get("role") == "user" and isinstance(m.get("content"), str)
+    ]
+    words = " ".join(user_turns).lower().split()
+    score = sum(w in POSITIVE_WORDS for w in words) - sum(w in NEGATIVE_WORDS for w in words)
+
+    return {
+        "sentiment": "positive" if score > 0 else "negative" if score < 0 else "neutral",
+        "summary": f"Conversation with {len(user_turns)} user turn(s).",
+        "user_intent": user_turns[0][:200] if user_turns else "",
+        "resolution_status": "unresolved",
+    }
+
+
+ANALYZERS: Dict[str, Callable[[Optional[str], list], Awaitable[dict]]] = {
+    "gemini": analyze_conversation_with_gemini,
+    "local": analyze_conversation_locally,
+}
+
+
+def get_analyzer(provider: Optional[str] = None):
+    """Return the analyzer for `provider` (default: ANALYSIS_PROVIDER env, then gemini)."""
+    provider = (provider or os.getenv("ANALYSIS_PROVIDER", "gemini")).lower()
+    if provider not in ANALYZERS:
+        logger.warning(f"Unknown analysis provider '{provider}', using gemini")
+        provider = "gemini"
+    return ANALYZERS[provider]
+
+
+def hand_off_call_analysis(config, messages: list, webhooks, call_ended: dict) -> bool:
+    """Queue post-call analysis (and the call_ended webhook) for the analysis worker.
+
+    Called by bots when the call ends so the process can exit without waiting on the
+    analysis model. Returns False when a job for this call was already queued.
+    """
+    from app.Domains.Call.Models.analysis_job import AnalysisJob
+    from app.Infrastructure.Call.file_analysis_queue import FileAnalysisQueue
+
+    job = AnalysisJob(
+        call_id=config.call_id,
+        # Provider-specific entries in the context are not part of the transcript
+        messages=[m for m in messages or [] if isinstance(m, dict)],
+        webhooks=webhooks,
+        call_ended=call_ended,
+        api_key=config.google_api_key,
+    )
+    return FileAnalysisQueue(config.analysis_queue_dir).enqueue(job)
@@ -1,13 +1,28 @@
 import asyncio
 import os
+from typing import Any, Callable, Dict
 
 from fastapi import Request
+from loguru import logger
 
+from app.Core.Config.call_spec import CallSpec
+from app.Core.Config.server import ServerConfig
+from app.Domains.Agent.Metrics.latency import LatencyStore
 from app.Domains.Assistant.Services.assistant_service import AssistantService
+from app.Domains.Call.Interfaces.bot_process_manager import BotProcessManager
+from app.Domains.Call.Interfaces.room_provider import RoomProvider
+from app.Domains.Call.Services.admission_controller import AdmissionController
+from app.Domains.Call.Services.analysis_worker import AnalysisWorker
+from app.Domains.Call.Services.call_registry import CallRegistry
 from app.Domains.Call.Services.call_service import CallService
 from app.Domains.Campaign.Services.campaign_service import CampaignService
 from app.Infrastructure.Call.daily_room_provider import DailyRoomProvider
+from app.Infrastructure.Call.file_analysis_queue import FileAnalysisQueue
+from app.Infrastructure.Call.file_call_store import FileCallStore
+from app.Infrastructure.Call.handover import HandoverServer, request_handover
 from app.Infrastructure.Call.local_bot_process_manager import LocalBotProcessManager
+from app.Infrastructure.Call.room_pool import RoomPool
+from app.Infrastructure.Call.worker_pool_bot_manager import WorkerPoolBotManager
 from app.Infrastructure.Repositories.file_assistant_repository import FileAssistantRepository
 from app.Infrastructure.Repositories.file_campaign_repository import FileCampaignRepository
 
@@ -29,8 +44,52 @@ CAMPAIGN_DATA_DIR = os.path.join(
 )
 
 # Singletons (Infrastructure)
-_room_provider = DailyRoomProvider()
-_process_manager = LocalBotProcessManager(_room_provider)
+_server_config = ServerConfig()
+_room_provider: RoomProvider = DailyRoomProvider()
+if _server_config.room_pool_size > 0:
+    _room_provider = RoomPool(
+        _room_provider,
+        size=_server_config.room_pool_size,
+        room_ttl_secs=_server_config.room_pool_room_ttl_secs,
+        token_ttl_secs=_server_config.room_pool_token_ttl_secs,
+    )
+
+
+def _standby_bot_spec(assistant_id: str):
+    """Call spec CallService.initiate_call builds for the assistant, for the standby pool."""
+    assistant = get_assistant_service().get_assistant(assistant_id)
+    if not assistant:
+        return None
+    return CallSpec(assistant=assistant)
+
+
+_bot_workers = _server_config.bot_workers
+if _bot_workers > 0:
+    _process_manager = WorkerPoolBotManager(_room_provider, _bot_workers)
+else:
+    _process_manager = LocalBotProcessManager(_room_provider, assistant_spec=_standby_bot_spec)
+_analysis_queue = FileAnalysisQueue(os.getenv("ANALYSIS_QUEUE_DIR"))
+# Keeps the parsed snapshots between /metrics/latency requests
+_latency_store = LatencyStore(os.getenv("LATENCY_METRICS_DIR"))
+
+_call_registry = CallRegistry(
+    (
+        FileCallStore(_server_config.call_registry_dir or None)
+        if _server_config.call_registry_backend == "file"
+        else None
+    ),
+    events_base_url=_server_config.call_events_base_url,
+)
+_process_manager.add_exit_listener(_call_registry.on_process_exit)
+_admission = AdmissionController(
+    _call_registry,
+    max_concurrent_calls=_server_config.max_concurrent_calls,
+    max_cpu_percent=_server_config.admission_max_cpu_percent,
+    min_free_memory_mb=_server_config.admission_min_free_memory_mb,
+    queue_size=_server_config.admission_queue_size,
+    queue_timeout_secs=_server_config.admission_queue_timeout_secs,
+    retry_after_secs=_server_config.admission_retry_after_secs,
+)
 
 
 # Helper to start cleanup task
@@ -38,14 +97,120 @@ async def start_process_cleanup():
     await _process_manager.cleanup()
 
 
-def get_room_provider() -> DailyRoomProvider:
+# Helper to keep standby bots ready (no-op when the pool is disabled)
+async def start_standby_pool():
+    pool = getattr(_process_manager, "standby_pool", None)
+    if pool:
+        await pool.run()
+
+
+# Helper to sample CPU, memory and I/O of the bots (no-op when disabled)
+async def start_bot_sampler():
+    sampler = getattr(_process_manager, "sampler", None)
+    if sampler:
+        await sampler.run()
+
+
+# Helper to keep pooled rooms ready (no-op when the pool is disabled)
+async def start_room_pool():
+    if isinstance(_room_provider, RoomPool):
+        await _room_provider.run()
+
+
+# Helper to sample node capacity and release queued calls
+async def start_admission_controller():
+    await _admission.run()
+
+
+# Helper to run the post-call analysis worker in the server process
+async def start_analysis_worker():
+    await AnalysisWorker(_analysis_queue).run()
+
+
+async def adopt_running_calls():
+    """Takes over the calls a previous server left running, before serving requests.
+
+    With HANDOVER_SOCKET, the server still listening there hands its calls over;
+    otherwise the unfinished calls restored from the call store are used. Bots that are
+    gone fail their call, and their rooms are deleted here as no one else will.
+    """
+    if _server_config.handover_socket:
+        reply = await request_handover(_server_config.handover_socket)
+        if reply is not None:
+            _call_registry.receive(reply.get("calls", []))
+            logger.info(
+                f"Server {reply.get('pid')} handed over {len(reply.get('calls', []))} calls"
+            )
+
+    failed = _call_registry.adopt_unclaimed(
+        lambda call: _process_manager.adopt(call.bot_pid, call.room_url, call.created_at)
+    )
+    for call in failed:
+        if not call.room_url:
+            continue
+        try:
+            await _room_provider.delete_room(call.room_url)
+        except Exception as e:
+            logger.error(f"Failed to delete room {call.room_url}: {e}")
+
+
+async def _hand_over_calls() -> Dict[str, Any]:
+    """Gives the next server every running call whose bot can outlive this server."""
+    _admission.start_draining()
+    calls = []
+    for call in _call_registry.list():
+        if call.is_finished or call.bot_pid is None:
+            continue
+        if _process_manager.release(call.bot_pid):
+            calls.append(_call_registry.hand_over(call.id))
+    return {"pid": os.getpid(), "calls": calls}
+
+
+# Helper to serve the handover socket (no-op when HANDOVER_SOCKET is not set)
+async def start_handover_server(on_handed_over: Callable[[], None]):
+    if _server_config.handover_socket:
+        await HandoverServer(_server_config.handover_socket, _hand_over_calls, on_handed_over).run()
+
+
+async def drain_calls() -> int:
+    """Stops admitting calls and waits up to DRAIN_TIMEOUT_SECS for the active ones.
+
+    Returns how many are still running. Bots started by this server outlive it and the
+    next server adopts them; calls in bot workers end with the workers.
+    """
+    _admission.start_draining()
+    remaining = await _call_registry.wait_idle(_server_config.drain_timeout_secs)
+    if remaining:
+        logger.warning(f"Drain deadline passed with {remaining} calls still active")
+    else:
+        logger.info("Drained, no active calls left")
+    return remaining
+
+
+def get_analysis_queue() -> FileAnalysisQueue:
+    return _analysis_queue
+
+
+def get_latency_store() -> LatencyStore:
+    return _latency_store
+
+
+def get_room_provider() -> RoomProvider:
     return _room_provider
 
 
-def get_process_manager() -> LocalBotProcessManager:
+def get_process_manager() -> BotProcessManager:
     return _process_manager
 
 
+def get_call_registry() -> CallRegistry:
+    return _call_registry
+
+
+def get_admission_controller() -> AdmissionController:
+    return _admission
+
+
 def get_assistant_service() -> AssistantService:
     repo = FileAssistantRepository(ASSISTANT_DATA_DIR)
     return AssistantService(repo)
@@ -53,10 +218,12 @@ def get_assistant_service() -> AssistantService:
 
 def get_campaign_service() -> CampaignService:
     repo = FileCampaignRepository(CAMPAIGN_DATA_DIR)
-    return CampaignService(repo, _room_provider, _process_manager)
+    return CampaignService(repo, _room_provider, _process_manager, _call_registry, _admission)
 
 
 def get_call_service() -> CallService:
     # We construct CallService on demand, but injecting the singleton infra components
     assistant_service = get_assistant_service()
-    return CallService(assistant_service, _room_provider, _process_manager)
+    return CallService(
+        assistant_service, _room_provider, _process_manager, _call_registry, _admission
+    )
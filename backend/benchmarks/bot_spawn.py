@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""Spawn-to-ready latency and memory of bot processes: fresh interpreter vs zygote fork.
+
+Starts bots in standby mode (`bot_runner --standby`), which construct the whole bot for an
+assistant and then print a ready line, and times spawn until that line. Reports the
+resident (RSS) and proportional (PSS) memory of each ready bot: PSS splits pages shared
+copy-on-write with the zygote between the processes sharing them.
+
+The assistant's provider API keys must be set, as constructing the services needs them.
+
+Usage:
+    uv run python -m benchmarks.bot_spawn --assistant-id <id>
+    uv run python -m benchmarks.bot_spawn --assistant-id <id> --runs 10 --mode zygote
+"""
+
+import argparse
+import os
+import select
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Dict, List, Optional
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+from app.Infrastructure.Call.local_bot_process_manager import BACKEND_ROOT, RUNNER_PATH
+from app.Infrastructure.Call.zygote_spawner import ZygoteSpawner
+
+READY_MARKER = b"Standby bot ready"
+
+
+def _wait_for_marker(fd: int, timeout: float) -> Optional[float]:
+    deadline = time.perf_counter() + timeout
+    buffer = b""
+    while time.perf_counter() < deadline:
+        ready, _, _ = select.select([fd], [], [], deadline - time.perf_counter())
+        if not ready:
+            break
+        chunk = os.read(fd, 65536)
+        if not chunk:
+            break
+        buffer = (buffer + chunk)[-4096:]
+        if READY_MARKER in buffer:
+            return time.perf_counter()
+    return None
+
+
+def _memory_kb(pid: int) -> Dict[str, int]:
+    memory = {}
+    try:
+        with open(f"/proc/{pid}/smaps_rollup") as f:
+            for line in f:
+                key, _, value = line.partition(":")
+                if key in ("Rss", "Pss"):
+                    memory[key.lower() + "_kb"] = int(value.split()[0])
+    except OSError:
+        pass
+    return memory
+
+
+def _env() -> Dict[str, str]:
+    env = os.environ.copy()
+    env["PYTHONPATH"] = BACKEND_ROOT
+    return env
+
+
+def run(mode: str, args: List[str], timeout: float, spawner: Optional[ZygoteSpawner]) -> Dict:
+    read_fd, write_fd = os.pipe()
+    started = time.perf_counter()
+    if mode == "zygote":
+        proc = spawner.spawn(args, _env(), stdin=True, stdout=write_fd)
+    else:
+        proc = subprocess.Popen(
+            [sys.executable, RUNNER_PATH, *args],
+            cwd=BACKEND_ROOT,
+            env=_env(),
+            stdin=subprocess.PIPE,
+            stdout=write_fd,
+            text=True,
+        )
+    os.close(write_fd)
+
+    ready_at = _wait_for_marker(read_fd, timeout)
+    result = {"ready_ms": round((ready_at - started) * 1000) if ready_at else None}
+    result.update(_memory_kb(proc.pid))
+
+    # Closing stdin releases a standby bot without a call
+    proc.stdin.close()
+    proc.terminate()
+    os.close(read_fd)
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--assistant-id", required=True)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--mode", choices=["popen", "zygote", "both"], default="both")
+    parser.add_argument("--timeout", type=float, default=60.0)
+    args = parser.parse_args()
+
+    runner_args = ["--assistant-id", args.assistant_id, "--standby"]
+    modes = ["popen", "zygote"] if args.mode == "both" else [args.mode]
+
+    spawner = None
+    if "zygote" in modes:
+        socket_path = os.path.join(tempfile.gettempdir(), f"bot-zygote-bench-{os.getpid()}.sock")
+        spawner = ZygoteSpawner(socket_path, BACKEND_ROOT, _env())
+        spawner.start()
+        started = time.perf_counter()
+        if not spawner.wait_ready():
+            sys.exit("Zygote did not start")
+        print(f"zygote preload: {round((time.perf_counter() - started) * 1000)} ms (once)")
+
+    try:
+        for mode in modes:
+            results = [run(mode, runner_args, args.timeout, spawner) for _ in range(args.runs)]
+            ready = [r["ready_ms"] for r in results if r["ready_ms"] is not None]
+            summary = {
+                "ready_p50_ms": statistics.median(ready) if ready else None,
+                "ready_max_ms": max(ready) if ready else None,
+                "failed": len(results) - len(ready),
+                "rss_kb": statistics.median(r.get("rss_kb", 0) for r in results),
+                "pss_kb": statistics.median(r.get("pss_kb", 0) for r in results),
+            }
+            print(f"{mode:6} {summary}")
+    finally:
+        if spawner:
+            spawner.close()
+
+
+if __name__ == "__main__":
+    main()
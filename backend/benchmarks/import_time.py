@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""Import time of bot startup (`python -X importtime`), checked against a budget.
+
+Imports what a bot process loads before constructing its bot (bot_runner and the bot
+class of an architecture) in a fresh interpreter, and reports the total and the slowest
+modules by cumulative time. Exits with 1 when the median total is over --budget-ms, or
+when a provider SDK, transport or the VAD model was imported: those are loaded where the
+call's configuration selects them, never by every bot.
+
+Most of the time is pipecat's own: its pipeline core (frames, task, runner, context
+aggregators) takes about 3.5 s, 1.5 s of it in scipy.signal that pipecat.frames.frames
+loads through VADParams, and the bots add 0.1-0.3 s on top (flow more, with
+pipecat_flows). The default budget sits about 10% over the slowest measured run.
+
+The raw `-X importtime` log can be kept for a flame view (e.g. `tuna`) with --raw.
+
+Usage:
+    uv run python -m benchmarks.import_time
+    uv run python -m benchmarks.import_time --architecture flow --budget-ms 4500 --top 30
+    uv run python -m benchmarks.import_time --architecture simple --raw /tmp/importtime.log
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+BACKEND_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+BOT_MODULES = {
+    "simple": "app.Domains.Agent.Bots.simple",
+    "flow": "app.Domains.Agent.Bots.flow",
+    "multimodal": "app.Domains.Agent.Bots.multimodal",
+}
+
+# Imported on demand: by ServiceFactory for the selected providers, by setup_transport for
+# the transport and at bot construction for the VAD model
+LAZY_MODULES = (
+    "pipecat.services.google",
+    "pipecat.services.openai",
+    "pipecat.services.anthropic",
+    "pipecat.services.groq",
+    "pipecat.services.together",
+    "pipecat.services.mistral",
+    "pipecat.services.aws",
+    "pipecat.services.deepgram",
+    "pipecat.services.cartesia",
+    "pipecat.services.elevenlabs",
+    "pipecat.services.rime",
+    "pipecat.services.playht",
+    "pipecat.services.azure",
+    "pipecat.services.gladia",
+    "pipecat.services.assemblyai",
+    "pipecat.transports.daily",
+    "pipecat.audio.vad.silero",
+    "app.Domains.Agent.Transports.asterisk",
+    "app.Utils.analysis",
+    "onnxruntime",
+    "daily",
+)
+
+# (self us, cumulative us, indented module name)
+ImportLine = Tuple[int, int, str]
+
+
+def import_times(modules: List[str]) -> Tuple[List[ImportLine], str]:
+    """Import `modules` in a fresh interpreter. Returns the parsed and the raw log."""
+    env = os.environ.copy()
+    env["PYTHONPATH"] = BACKEND_ROOT
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {', '.join(modules)}"],
+        cwd=BACKEND_ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+    if proc.returncode != 0:
+        sys.exit(f"Importing {', '.join(modules)} failed:\n{proc.stderr[-2000:]}")
+
+    lines = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "imported package" in line:
+            continue
+        own, cumulative, name = line[len("import time:") :].split("|", 2)
+        lines.append((int(own), int(cumulative), name.rstrip()))
+    return lines, proc.stderr
+
+
+def report(architecture: str, runs: List[List[ImportLine]], top: int) -> Dict:
+    totals = [sum(own for own, _, _ in lines) / 1000 for lines in runs]
+    lines = runs[-1]
+    loaded = {name.strip() for _, _, name in lines}
+    eager = sorted(m for m in loaded if any(m == p or m.startswith(p + ".") for p in LAZY_MODULES))
+
+    print(f"\n{architecture}: {statistics.median(totals):.0f} ms over {len(loaded)} modules")
+    print(f"{'cumulative ms':>14} {'self ms':>8}  module")
+    for own, cumulative, name in sorted(lines, key=lambda line: line[1], reverse=True)[:top]:
+        print(f"{cumulative / 1000:14.1f} {own / 1000:8.1f}  {name.strip()}")
+    if eager:
+        print(f"Imported eagerly, should be lazy: {', '.join(eager)}")
+    return {"total_ms": statistics.median(totals), "eager": eager}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--architecture", choices=[*BOT_MODULES, "all"], default="all", help="Bot class to import"
+    )
+    parser.add_argument("--runs", type=int, default=3, help="Median of this many interpreters")
+    parser.add_argument("--top", type=int, default=15, help="Slowest modules to list")
+    parser.add_argument("--budget-ms", type=float, default=5000.0)
+    parser.add_argument("--raw", help="Write the last raw -X importtime log here")
+    args = parser.parse_args()
+
+    architectures = list(BOT_MODULES) if args.architecture == "all" else [args.architecture]
+    failed = []
+    for architecture in architectures:
+        modules = ["runners.bot_runner", BOT_MODULES[architecture]]
+        # The first interpreter also writes the bytecode caches, keep it out of the numbers
+        import_times(modules)
+        runs, raw = [], ""
+        for _ in range(args.runs):
+            lines, raw = import_times(modules)
+            runs.append(lines)
+        if args.raw:
+            with open(args.raw, "w") as f:
+                f.write(raw)
+
+        result = report(architecture, runs, args.top)
+        if result["total_ms"] > args.budget_ms:
+            failed.append(f"{architecture}: {result['total_ms']:.0f} ms > {args.budget_ms:.0f} ms")
+        if result["eager"]:
+            failed.append(f"{architecture}: {len(result['eager'])} modules imported eagerly")
+
+    if failed:
+        sys.exit("Over budget:\n  " + "\n  ".join(failed))
+    print(f"\nWithin budget ({args.budget_ms:.0f} ms)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""Room setup latency on the call path: creating a room and token per call vs the room pool.
+
+Runs against the local Daily API stand-in (runners/local_daily_api.py) with a delay per
+request, or against the Daily API in DAILY_API_URL with --daily (rooms are deleted after).
+
+Usage:
+    uv run python -m benchmarks.room_setup
+    uv run python -m benchmarks.room_setup --latency-ms 150 --calls 50 --pool-size 5
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import time
+from typing import List
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+
+async def measure(provider, calls: int, gap_secs: float) -> List[float]:
+    timings = []
+    for _ in range(calls):
+        started = time.perf_counter()
+        room_url, _ = await provider.create_room_and_token()
+        timings.append((time.perf_counter() - started) * 1000)
+        await provider.delete_room(room_url)
+        # Calls arrive spaced out, so the pool has time to refill between them
+        await asyncio.sleep(gap_secs)
+    return timings
+
+
+def report(name: str, timings: List[float]):
+    timings = sorted(timings)
+    p95 = timings[min(len(timings) - 1, int(len(timings) * 0.95))]
+    print(f"{name:10} p50 {statistics.median(timings):7.1f} ms   p95 {p95:7.1f} ms")
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=30)
+    parser.add_argument("--pool-size", type=int, default=3)
+    parser.add_argument("--gap-ms", type=float, default=50.0)
+    parser.add_argument("--latency-ms", type=float, default=100.0)
+    parser.add_argument("--port", type=int, default=9100)
+    parser.add_argument("--daily", action="store_true", help="Use the real Daily API")
+    args = parser.parse_args()
+
+    runner = None
+    if not args.daily:
+        from aiohttp import web
+
+        from runners.local_daily_api import create_app
+
+        runner = web.AppRunner(create_app(args.latency_ms))
+        await runner.setup()
+        await web.TCPSite(runner, "127.0.0.1", args.port).start()
+        os.environ["DAILY_API_URL"] = f"http://127.0.0.1:{args.port}/v1"
+        os.environ.setdefault("DAILY_API_KEY", "local")
+
+    from app.Infrastructure.Call.daily_room_provider import DailyRoomProvider
+    from app.Infrastructure.Call.room_pool import RoomPool
+
+    try:
+        direct = DailyRoomProvider()
+        report("direct", await measure(direct, args.calls, args.gap_ms / 1000))
+        await direct.close()
+
+        pool = RoomPool(DailyRoomProvider(), size=args.pool_size, interval_secs=0.1)
+        filler = asyncio.create_task(pool.run())
+        while pool.summary()["ready"] < args.pool_size:
+            await asyncio.sleep(0.05)
+        report("pooled", await measure(pool, args.calls, args.gap_ms / 1000))
+        print(f"pool       {pool.summary()}")
+        filler.cancel()
+        try:
+            await filler
+        except asyncio.CancelledError:
+            pass
+    finally:
+        if runner:
+            await runner.cleanup()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
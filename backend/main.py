@@ -7,8 +7,12 @@ and lifecycle management. It relies on environment variables for configuration
 """
 
 import asyncio
+import os
+import signal
+import socket
 import sys
 from contextlib import asynccontextmanager
+from typing import Callable, List
 
 from fastapi import Depends, FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
@@ -16,12 +20,28 @@ from fastapi.responses import JSONResponse, RedirectResponse
 from loguru import logger
 
 from app.Core.Config.server import ServerConfig
-from app.dependencies import get_call_service, get_process_manager, start_process_cleanup
+from app.dependencies import (
+    adopt_running_calls,
+    drain_calls,
+    get_call_registry,
+    get_call_service,
+    get_process_manager,
+    start_admission_controller,
+    start_analysis_worker,
+    start_bot_sampler,
+    start_handover_server,
+    start_process_cleanup,
+    start_room_pool,
+    start_standby_pool,
+)
 from app.Domains.Call.Models.call import CallConfig
 from app.Http.Routes.assistants import router as assistants_router
 from app.Http.Routes.calls import router as calls_router
 from app.Http.Routes.campaigns import router as campaigns_router
+from app.Http.Routes.health import router as health_router
+from app.Http.Routes.metrics import router as metrics_router
 from app.Http.Routes.ws.voice import router as voice_ws_router
+from app.Services.webhook_dispatcher import get_webhook_dispatcher
 
 # Server configuration
 server_config = ServerConfig()
@@ -39,21 +59,86 @@ logger.add(
 )
 
 
+def drain_on_sigterm(background_tasks: List[asyncio.Task]) -> Callable[[], None]:
+    """Makes SIGTERM drain the calls before the server shuts down.
+
+    The server's own SIGTERM handling (finish the open requests, then the lifespan exit)
+    runs once drain_calls returns; a second SIGTERM skips the wait. Returns the function
+    that stops the server right away, for when the next server took the calls over.
+    """
+    loop = asyncio.get_running_loop()
+    server_handler = signal.getsignal(signal.SIGTERM) or signal.SIG_DFL
+
+    def restore_handler():
+        loop.remove_signal_handler(signal.SIGTERM)
+        signal.signal(signal.SIGTERM, server_handler)
+
+    def stop_server():
+        restore_handler()
+        signal.raise_signal(signal.SIGTERM)
+
+    def stop_after_drain(task: asyncio.Task):
+        if not task.cancelled():
+            signal.raise_signal(signal.SIGTERM)
+
+    def start_drain():
+        if any(task.get_name() == "drain" for task in background_tasks):
+            return
+        restore_handler()
+        task = asyncio.create_task(drain_calls(), name="drain")
+        task.add_done_callback(stop_after_drain)
+        background_tasks.append(task)
+
+    try:
+        loop.add_signal_handler(signal.SIGTERM, start_drain)
+    except (NotImplementedError, RuntimeError, ValueError) as e:
+        # Not the main thread (e.g. an embedded server): shut down without draining
+        logger.warning(f"SIGTERM will not drain calls: {e}")
+    return stop_server
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """
     FastAPI lifespan manager that handles startup and shutdown tasks.
-    It initializes the background cleanup task.
+    It adopts the calls a previous server left running and initializes the background
+    cleanup and post-call analysis tasks.
     """
+    await adopt_running_calls()
     cleanup_task = asyncio.create_task(start_process_cleanup())
+    background_tasks = [
+        cleanup_task,
+        asyncio.create_task(start_standby_pool()),
+        asyncio.create_task(start_room_pool()),
+        asyncio.create_task(start_bot_sampler()),
+        asyncio.create_task(start_admission_controller()),
+    ]
+    # Post-call analysis can also run as a separate process (runners/analysis_worker.py)
+    if os.getenv("ANALYSIS_WORKER_ENABLED", "true").lower() == "true":
+        background_tasks.append(asyncio.create_task(start_analysis_worker()))
+    stop_server = drain_on_sigterm(background_tasks)
+    handed_over = asyncio.Event()
+
+    def on_handed_over():
+        # Stop accepting at once: new connections (and the handed-over bots' state reports)
+        # all go to the next server from now on
+        handed_over.set()
+        stop_server()
+
+    background_tasks.append(asyncio.create_task(start_handover_server(on_handed_over)))
     try:
         yield
     finally:
-        cleanup_task.cancel()
-        try:
-            await cleanup_task
-        except asyncio.CancelledError:
-            pass
+        if handed_over.is_set():
+            # Calls the next server could not take (still spawning, or in bot workers)
+            await drain_calls()
+        for task in background_tasks:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        await get_webhook_dispatcher().close()
         # Close room provider session if needed
         # (Assuming DailyRoomProvider manages its own session lifecycle per request or via singleton close if exposed)
 
@@ -83,6 +168,8 @@ app.add_middleware(
 app.include_router(assistants_router)
 app.include_router(calls_router)
 app.include_router(campaigns_router)
+app.include_router(metrics_router)
+app.include_router(health_router)
 app.include_router(voice_ws_router)
 
 
@@ -104,6 +191,9 @@ def parse_server_args():
         server_config.host = server_args.host
     if server_args.port:
         server_config.port = server_args.port
+        # Bots report call state back to this server
+        if not os.getenv("CALL_EVENTS_BASE_URL"):
+            get_call_registry().events_base_url = f"http://127.0.0.1:{server_args.port}"
     if server_args.reload:
         server_config.reload = server_args.reload
 
@@ -135,6 +225,8 @@ async def start_agent(request: Request):
         session = await service.start_rtvi_session({})
         logger.info(f"Room URL: {session.room_url}")
         return RedirectResponse(session.room_url)
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Failed to start agent: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -144,9 +236,18 @@ if __name__ == "__main__":
     import uvicorn
 
     logger.info("Starting FastAPI server")
-    uvicorn.run(
-        "main:app",
-        host=server_config.host,
-        port=server_config.port,
-        reload=server_config.reload,
-    )
+    if server_config.handover_socket and not server_config.reload:
+        # The next server listens on the same port while this one drains (SO_REUSEPORT)
+        family = socket.AF_INET6 if ":" in server_config.host else socket.AF_INET
+        sock = socket.socket(family, socket.SOCK_STREAM)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+        sock.bind((server_config.host, server_config.port))
+        uvicorn.Server(uvicorn.Config("main:app")).run(sockets=[sock])
+    else:
+        uvicorn.run(
+            "main:app",
+            host=server_config.host,
+            port=server_config.port,
+            reload=server_config.reload,
+        )
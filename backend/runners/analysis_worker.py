@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""Analysis Worker - Run post-call analysis outside the API server.
+
+Bots queue their transcript when a call ends and exit immediately. This worker
+drains that queue: it runs the analysis, then sends the `call_ended` webhook.
+
+Usage:
+    # Process jobs continuously
+    uv run python -m runners.analysis_worker
+
+    # Process what is pending and exit, using the offline stand-in analyzer
+    uv run python -m runners.analysis_worker --once --provider local
+
+Set ANALYSIS_WORKER_ENABLED=false on the API server when running this separately.
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+
+from dotenv import load_dotenv
+from loguru import logger
+
+load_dotenv()
+
+from app.Domains.Call.Services.analysis_worker import AnalysisWorker
+from app.Infrastructure.Call.file_analysis_queue import FileAnalysisQueue
+from app.Services.webhook_dispatcher import get_webhook_dispatcher
+from app.Utils.analysis import get_analyzer
+
+
+def parse_args():
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Post-call analysis worker")
+    parser.add_argument("--queue-dir", type=str, help="Analysis queue directory")
+    parser.add_argument(
+        "--provider", type=str.lower, choices=["gemini", "local"], help="Analysis provider"
+    )
+    parser.add_argument("-c", "--concurrency", type=int, help="Jobs analyzed in parallel")
+    parser.add_argument("--once", action="store_true", help="Drain pending jobs and exit")
+    return parser.parse_args()
+
+
+async def main():
+    """Main entry point."""
+    logger.remove()
+    logger.add(sys.stderr, level="DEBUG" if os.getenv("DEBUG") else "INFO")
+    args = parse_args()
+
+    queue = FileAnalysisQueue(args.queue_dir or os.getenv("ANALYSIS_QUEUE_DIR"))
+    worker = AnalysisWorker(
+        queue, analyzer=get_analyzer(args.provider), concurrency=args.concurrency
+    )
+    logger.info(f"Analysis queue: {queue.data_dir}")
+
+    try:
+        if args.once:
+            await worker.drain()
+        else:
+            await worker.run()
+    finally:
+        await get_webhook_dispatcher().close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
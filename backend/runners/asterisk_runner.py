@@ -178,6 +178,10 @@ async def main():
     except Exception as e:
         logger.error(f"Error: {e}")
         raise
+    finally:
+        from app.Services.webhook_dispatcher import get_webhook_dispatcher
+
+        await get_webhook_dispatcher().close()
 
 
 if __name__ == "__main__":
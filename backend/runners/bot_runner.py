@@ -2,22 +2,22 @@ import argparse
 import asyncio
 import json
 import os
+import sys
 import time
-from typing import Optional, Type
+from typing import Any, Dict, Optional, Type, Union
 
-import aiohttp
 from dotenv import load_dotenv
 from loguru import logger
 
 from app.Core.Config.bot import BotConfig
+from app.Core.Config.call_spec import CallSpec, assistant_settings, read_spec_fd
+from app.Infrastructure.Call.bot_exit_status import write_exit_status
+from app.Services.webhook_dispatcher import get_webhook_dispatcher
 
 # Load environment variables
 load_dotenv()
 
 
-from app.Utils.daily import create_daily_room
-
-
 async def run_bot(
     bot_class: Type,
     config: BotConfig,
@@ -25,6 +25,7 @@ async def run_bot(
     token: str,
     system_messages: Optional[list] = None,
     webhook_config: Optional["WebhookConfig"] = None,
+    bot=None,
 ) -> None:
     """Universal bot runner handling bot lifecycle.
 
@@ -35,10 +36,21 @@ async def run_bot(
         token: The Daily room token
         system_messages: Optional system messages to initialize the bot with
         webhook_config: Optional webhook configuration
+        bot: A bot already constructed for this call (standby mode), used as is
     """
     # Instantiate the bot using the provided configuration instance.
-    bot = bot_class(config, system_messages=system_messages, webhook_config=webhook_config)
+    if bot is None:
+        bot = bot_class(config, system_messages=system_messages, webhook_config=webhook_config)
+
+    try:
+        await run_call(bot, room_url, token)
+    finally:
+        # Give queued webhooks (e.g. call_ended) a chance to go out; the rest is spilled
+        await get_webhook_dispatcher().close()
 
+
+async def run_call(bot, room_url: str, token: str) -> None:
+    """Attach a constructed bot to its room and run it until the call ends."""
     # Set up transport and pipeline.
     await bot.setup_transport(room_url, token)
     bot.create_pipeline()
@@ -47,8 +59,19 @@ async def run_bot(
     await bot.start()
 
 
-def cli() -> None:
-    """Parse command-line arguments, override configuration if needed, and start the bot."""
+async def read_call_binding() -> CallSpec:
+    """Wait for the call a standby bot is handed: its CallSpec as one JSON line on stdin.
+
+    Only room_url, token, prompt_variables and env are used; the rest was fixed at spawn.
+    """
+    line = await asyncio.get_running_loop().run_in_executor(None, sys.stdin.readline)
+    if not line.strip():
+        raise SystemExit("Standby bot released without a call")
+    return CallSpec.model_validate_json(line)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Command-line arguments of the bot runner (also sent by the server to bot workers)."""
     parser = argparse.ArgumentParser(description="Unified Bot Runner")
 
     # Optional - if not provided, will auto-create a Daily room
@@ -169,132 +192,128 @@ def cli() -> None:
         help="JSON string of variables to inject into the system prompt",
     )
 
-    args = parser.parse_args()
-
-    # Helpers to set env vars if config loaded
-    def apply_assistant_config(assistant_id: str):
-        from app.Domains.Assistant.Services.assistant_service import AssistantService
-        from app.Infrastructure.Repositories.file_assistant_repository import (
-            FileAssistantRepository,
-        )
-
-        data_dir = os.path.join(
-            os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
-            "resources",
-            "data",
-            "assistants",
-        )
-        repo = FileAssistantRepository(data_dir)
-        service = AssistantService(repo)
-
-        assistant = service.get_assistant(assistant_id)
-        if not assistant:
-            print(f"❌ Assistant {assistant_id} not found!")
-            return None
-
-        print(f"🤖 Loading assistant: {assistant.name} ({assistant.id})")
-
-        # Core
-        os.environ["BOT_NAME"] = assistant.name
-        os.environ["ARCHITECTURE_TYPE"] = assistant.architecture_type
-
-        # Agent / LLM
-        os.environ["LLM_PROVIDER"] = assistant.agent.provider
-        if assistant.agent.model:
-            os.environ["LLM_MODEL"] = assistant.agent.model
-        os.environ["LLM_TEMPERATURE"] = str(assistant.agent.temperature)
-
-        # IO Layer
-        if assistant.io_layer.stt:
-            os.environ["STT_PROVIDER"] = assistant.io_layer.stt.provider
-        elif assistant.architecture_type == "multimodal":
-            os.environ.pop("STT_PROVIDER", None)
+    parser.add_argument(
+        "--standby",
+        action="store_true",
+        help="Construct the bot, then wait on stdin for the call to bind it to",
+    )
 
-        if assistant.io_layer.stt and assistant.io_layer.stt.model:
-            os.environ["STT_MODEL"] = assistant.io_layer.stt.model
-        if assistant.io_layer.stt and assistant.io_layer.stt.language:
-            os.environ["STT_LANGUAGE"] = assistant.io_layer.stt.language
+    parser.add_argument(
+        "--call-spec-fd",
+        type=int,
+        help="File descriptor to read the call spec from (set by the server)",
+    )
 
-        if assistant.io_layer.tts:
-            os.environ["TTS_PROVIDER"] = assistant.io_layer.tts.provider
-        elif assistant.architecture_type == "multimodal":
-            os.environ.pop("TTS_PROVIDER", None)
+    return parser
 
-        if assistant.io_layer.tts and assistant.io_layer.tts.voice_id:
-            os.environ["TTS_VOICE"] = assistant.io_layer.tts.voice_id
-        if assistant.io_layer.tts and assistant.io_layer.tts.language:
-            os.environ["TTS_LANGUAGE"] = assistant.io_layer.tts.language
 
-        # Mute filter
-        if assistant.io_layer.stt and assistant.io_layer.stt.enable_mute_filter:
-            os.environ["ENABLE_STT_MUTE_FILTER"] = "true"
+def load_assistant(assistant_id: str):
+    """Read a persisted assistant (bot started by hand with --assistant-id)."""
+    from app.Domains.Assistant.Services.assistant_service import AssistantService
+    from app.Infrastructure.Repositories.file_assistant_repository import (
+        FileAssistantRepository,
+    )
 
-        # Speak first
-        os.environ["SPEAK_FIRST"] = "true" if assistant.pipeline_settings.speak_first else "false"
+    data_dir = os.path.join(
+        os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+        "resources",
+        "data",
+        "assistants",
+    )
+    assistant = AssistantService(FileAssistantRepository(data_dir)).get_assistant(assistant_id)
+    if not assistant:
+        print(f"❌ Assistant {assistant_id} not found!")
+    return assistant
+
+
+def prepare_bot(
+    args: argparse.Namespace,
+    env: Optional[Dict[str, str]] = None,
+    spec: Optional[CallSpec] = None,
+):
+    """Resolve the call spec (or --assistant-id) and CLI overrides into a BotConfig and the
+    bot class to run.
+
+    Settings are written to `env` (a copy of the process environment by default), which
+    the returned config reads from. Returns (bot_class, config, loaded_assistant).
+    """
+    env = dict(os.environ) if env is None else env
 
-        return assistant
+    def apply(settings: Dict[str, Optional[str]]):
+        for name, value in settings.items():
+            if value is None:
+                env.pop(name, None)
+            else:
+                env[name] = value
 
-    # If assistant ID provided, load it first to populate defaults in ENV
+    # The server sends the assistant in the spec; by hand it is loaded from disk
     loaded_assistant = None
-    if args.assistant_id:
-        loaded_assistant = apply_assistant_config(args.assistant_id)
+    if spec:
+        loaded_assistant = spec.assistant
+        apply(spec.settings())
+    elif args.assistant_id:
+        loaded_assistant = load_assistant(args.assistant_id)
+        if loaded_assistant:
+            apply(assistant_settings(loaded_assistant))
+    if loaded_assistant:
+        print(f"🤖 Loading assistant: {loaded_assistant.name} ({loaded_assistant.id})")
 
     # Set environment variables based on CLI arguments (overrides loaded config)
     if args.architecture_type:
-        os.environ["ARCHITECTURE_TYPE"] = args.architecture_type
+        env["ARCHITECTURE_TYPE"] = args.architecture_type
     if args.bot_name:
-        os.environ["BOT_NAME"] = args.bot_name
+        env["BOT_NAME"] = args.bot_name
 
     if args.llm_provider:
-        os.environ["LLM_PROVIDER"] = args.llm_provider.lower()
+        env["LLM_PROVIDER"] = args.llm_provider.lower()
     if args.llm_model:
-        os.environ["LLM_MODEL"] = args.llm_model
+        env["LLM_MODEL"] = args.llm_model
     if args.llm_temperature is not None:
-        os.environ["LLM_TEMPERATURE"] = str(args.llm_temperature)
+        env["LLM_TEMPERATURE"] = str(args.llm_temperature)
 
     # Map old args to new environment variables for compatibility
     if args.google_model:
-        os.environ["LLM_MODEL"] = args.google_model
+        env["LLM_MODEL"] = args.google_model
     if args.openai_model:
-        os.environ["LLM_MODEL"] = args.openai_model
+        env["LLM_MODEL"] = args.openai_model
     if args.openai_temperature:
-        os.environ["LLM_TEMPERATURE"] = str(args.openai_temperature)
+        env["LLM_TEMPERATURE"] = str(args.openai_temperature)
 
     if args.stt_provider:
-        os.environ["STT_PROVIDER"] = args.stt_provider.lower()
+        env["STT_PROVIDER"] = args.stt_provider.lower()
 
     if args.tts_provider:
-        os.environ["TTS_PROVIDER"] = args.tts_provider.lower()
+        env["TTS_PROVIDER"] = args.tts_provider.lower()
     if args.tts_voice:
-        os.environ["TTS_VOICE"] = args.tts_voice
+        env["TTS_VOICE"] = args.tts_voice
 
     # Map old voice args
     if hasattr(args, "deepgram_voice") and args.deepgram_voice:
-        os.environ["DEEPGRAM_VOICE"] = args.deepgram_voice
+        env["DEEPGRAM_VOICE"] = args.deepgram_voice
     if hasattr(args, "cartesia_voice") and args.cartesia_voice:
-        os.environ["CARTESIA_VOICE"] = args.cartesia_voice
+        env["CARTESIA_VOICE"] = args.cartesia_voice
     if hasattr(args, "elevenlabs_voice_id") and args.elevenlabs_voice_id:
-        os.environ["ELEVENLABS_VOICE_ID"] = args.elevenlabs_voice_id
+        env["ELEVENLABS_VOICE_ID"] = args.elevenlabs_voice_id
     if hasattr(args, "rime_voice_id") and args.rime_voice_id:
-        os.environ["RIME_VOICE_ID"] = args.rime_voice_id
+        env["RIME_VOICE_ID"] = args.rime_voice_id
 
     if args.enable_stt_mute_filter is not None:
-        os.environ["ENABLE_STT_MUTE_FILTER"] = str(args.enable_stt_mute_filter).lower()
+        env["ENABLE_STT_MUTE_FILTER"] = str(args.enable_stt_mute_filter).lower()
 
     if args.amd_enabled:
-        os.environ["AMD_ENABLED"] = args.amd_enabled
+        env["AMD_ENABLED"] = args.amd_enabled
 
     if args.stt_keywords:
-        os.environ["STT_KEYWORDS"] = args.stt_keywords
+        env["STT_KEYWORDS"] = args.stt_keywords
 
     if args.agent_type:
-        os.environ["AGENT_TYPE"] = args.agent_type
+        env["AGENT_TYPE"] = args.agent_type
 
     if args.speak_first is not None:
-        os.environ["SPEAK_FIRST"] = "true" if args.speak_first else "false"
+        env["SPEAK_FIRST"] = "true" if args.speak_first else "false"
 
     # Instantiate the configuration AFTER setting environment variables
-    config = BotConfig()
+    config = BotConfig(env=env)
 
     # If an assistant was loaded, ensure we pass tools to the config object
     if loaded_assistant:
@@ -307,6 +326,10 @@ def cli() -> None:
         config.initial_delay = loaded_assistant.pipeline_settings.initial_delay
         config.initial_message_interruptible = loaded_assistant.pipeline_settings.initial_message_interruptible
         config.interruptibility = loaded_assistant.pipeline_settings.interruptibility
+        config.prerendered_audio = loaded_assistant.pipeline_settings.prerendered_audio
+        filler_speech = loaded_assistant.pipeline_settings.filler_speech
+        if filler_speech.enabled:
+            config.filler_speech = filler_speech.model_dump()
 
     # Determine the bot class to use based on the configuration
     if config.architecture_type == "flow":
@@ -322,36 +345,73 @@ def cli() -> None:
 
         bot_class = SimpleBot
 
-    async def main():
-        room_url = args.room_url
-        token = args.token
+    return bot_class, config, loaded_assistant
+
+
+def render_system_messages(
+    args: argparse.Namespace,
+    loaded_assistant,
+    prompt_variables: Optional[Union[str, Dict[str, Any]]],
+) -> Optional[list]:
+    # Determine base system prompt
+    base_system_prompt = None
+    if args.system_prompt:
+        base_system_prompt = args.system_prompt
+    elif loaded_assistant and loaded_assistant.agent.system_prompt:
+        base_system_prompt = loaded_assistant.agent.system_prompt
+
+    # Apply variables if provided
+    final_system_prompt = base_system_prompt
+    if prompt_variables and base_system_prompt:
+        try:
+            variables = prompt_variables
+            if isinstance(variables, str):
+                variables = json.loads(variables)
+            final_system_prompt = base_system_prompt.format(**variables)
+            print(f"🎨 Applied prompt variables: {variables}")
+        except Exception as e:
+            print(f"⚠️ Failed to apply prompt variables: {e}")
+
+    if final_system_prompt:
+        return [{"role": "system", "content": final_system_prompt}]
+    return None
 
-        # Auto-create room if not provided
-        if not room_url or not token:
-            print("🔄 No room URL/token provided, creating Daily room...")
-            room_url, token = await create_daily_room()
 
-        system_messages = None
+def cli() -> None:
+    """Run the bot from the command line, recording its exit status for a server that
+    adopted it (and so is not its parent)."""
+    try:
+        _run_cli()
+    except SystemExit as e:
+        write_exit_status(e.code if isinstance(e.code, int) else int(e.code is not None))
+        raise
+    except BaseException:
+        write_exit_status(1)
+        raise
+    write_exit_status(0)
+
+
+def _run_cli() -> None:
+    """Parse command-line arguments, override configuration if needed, and start the bot."""
+    args = build_parser().parse_args()
+    spec = read_spec_fd(args.call_spec_fd) if args.call_spec_fd is not None else None
+    if spec:
+        # Per-call secrets stay visible to tools that read them from the environment
+        os.environ.update(spec.env)
+    bot_class, config, loaded_assistant = prepare_bot(args, spec=spec)
 
-        # Determine base system prompt
-        base_system_prompt = None
-        if args.system_prompt:
-            base_system_prompt = args.system_prompt
-        elif loaded_assistant and loaded_assistant.agent.system_prompt:
-            base_system_prompt = loaded_assistant.agent.system_prompt
+    async def main():
+        # A standby bot's call replaces the config (its settings are resolved once)
+        nonlocal config
+        room_url = args.room_url or (spec and spec.room_url)
+        token = args.token or (spec and spec.token)
 
-        # Apply variables if provided
-        final_system_prompt = base_system_prompt
-        if args.prompt_variables and base_system_prompt:
-            try:
-                variables = json.loads(args.prompt_variables)
-                final_system_prompt = base_system_prompt.format(**variables)
-                print(f"🎨 Applied prompt variables: {variables}")
-            except Exception as e:
-                print(f"⚠️ Failed to apply prompt variables: {e}")
+        # Auto-create room if not provided
+        if not args.standby and (not room_url or not token):
+            print("🔄 No room URL/token provided, creating Daily room...")
+            from app.Infrastructure.Call.daily_room_provider import create_daily_room
 
-        if final_system_prompt:
-            system_messages = [{"role": "system", "content": final_system_prompt}]
+            room_url, token = await create_daily_room()
 
         webhook_config = None
         if loaded_assistant and loaded_assistant.webhooks:
@@ -360,6 +420,28 @@ def cli() -> None:
         else:
             print("⚠️ No webhook configuration found or loaded.")
 
+        bot = None
+        prompt_variables = (spec and spec.prompt_variables) or args.prompt_variables
+        if args.standby:
+            # Services, context and VAD are built from the assistant before the call exists;
+            # realtime (multimodal) services take the prompt at construction, so they wait.
+            if hasattr(bot_class, "bind_call"):
+                bot = bot_class(
+                    config,
+                    system_messages=render_system_messages(args, loaded_assistant, None),
+                    webhook_config=webhook_config,
+                )
+            print("💤 Standby bot ready, waiting for a call...", flush=True)
+            call = await read_call_binding()
+            os.environ.update(call.env)
+            config = config.with_env(call.env)
+            room_url, token = call.room_url, call.token
+            prompt_variables = call.prompt_variables
+
+        system_messages = render_system_messages(args, loaded_assistant, prompt_variables)
+        if bot is not None:
+            bot.bind_call(system_messages, env=call.env)
+
         await run_bot(
             bot_class,
             config,
@@ -367,6 +449,7 @@ def cli() -> None:
             token=token,
             system_messages=system_messages,
             webhook_config=webhook_config,
+            bot=bot,
         )
 
     asyncio.run(main())
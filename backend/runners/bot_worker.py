@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""Bot Worker - Run the bot pipelines of many calls in one process.
+
+The API server starts BOT_WORKERS of these (see WorkerPoolBotManager) and sends each new
+call to the least loaded one over a unix socket. Every call runs as its own asyncio task
+with its own BotConfig environment, so a failing call ends only itself.
+
+Protocol: one JSON request line per connection, answered with one JSON line.
+    {"op": "start", "call_id": "...", "args": [bot_runner args], "spec": {CallSpec}}
+    {"op": "status"}
+
+Usage:
+    uv run python -m runners.bot_worker --socket /tmp/tito-bot-worker-0.sock
+"""
+
+import argparse
+import asyncio
+import json
+import os
+from collections import OrderedDict
+from typing import Dict
+
+from dotenv import load_dotenv
+from loguru import logger
+
+from app.Core.Config.call_spec import CallSpec
+from app.Services.webhook_dispatcher import get_webhook_dispatcher
+from runners.bot_runner import build_parser, prepare_bot, render_system_messages, run_call
+
+# Load environment variables
+load_dotenv()
+
+# Finished calls remembered for status queries
+MAX_FINISHED = 1000
+
+
+class BotWorker:
+    def __init__(self, socket_path: str):
+        self.socket_path = socket_path
+        self.calls: Dict[str, asyncio.Task] = {}
+        self.finished: "OrderedDict[str, str]" = OrderedDict()
+        self.started = 0
+        self.failed = 0
+
+    async def _run_call(self, call_id: str, argv: list, spec: CallSpec):
+        state = "failed"
+        try:
+            # Each call gets its own copy of the environment for its BotConfig. The server's
+            # call id (CALL_ID in the spec env) names the call, rather than the worker call id
+            env = {**os.environ, "CALL_ID": call_id}
+            args = build_parser().parse_args(argv)
+            bot_class, config, assistant = prepare_bot(args, env, spec)
+            config.handle_sigint = False
+
+            bot = bot_class(
+                config,
+                system_messages=render_system_messages(args, assistant, spec.prompt_variables),
+                webhook_config=assistant.webhooks if assistant else None,
+            )
+            await run_call(bot, spec.room_url, spec.token)
+            state = "finished"
+        except asyncio.CancelledError:
+            state = "cancelled"
+            raise
+        except SystemExit as e:
+            logger.error(f"Call {call_id} rejected its arguments: {e}")
+        except Exception as e:
+            logger.exception(f"Call {call_id} failed: {e}")
+        finally:
+            if state == "failed":
+                self.failed += 1
+            self.calls.pop(call_id, None)
+            self.finished[call_id] = state
+            if len(self.finished) > MAX_FINISHED:
+                self.finished.popitem(last=False)
+
+    def start_call(self, request: dict) -> dict:
+        call_id = str(request["call_id"])
+        if call_id in self.calls:
+            return {"error": f"Call {call_id} already running"}
+        spec = CallSpec.model_validate(request.get("spec") or {})
+        self.calls[call_id] = asyncio.create_task(
+            self._run_call(call_id, request.get("args") or [], spec)
+        )
+        self.started += 1
+        return {"ok": True, "pid": os.getpid()}
+
+    def status(self) -> dict:
+        return {
+            "pid": os.getpid(),
+            "active": len(self.calls),
+            "started": self.started,
+            "failed": self.failed,
+            "running": list(self.calls),
+            "finished": dict(self.finished),
+        }
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            request = json.loads(await reader.readline())
+            match request.get("op"):
+                case "start":
+                    reply = self.start_call(request)
+                case "status":
+                    reply = self.status()
+                case op:
+                    reply = {"error": f"Unknown op: {op}"}
+        except Exception as e:
+            reply = {"error": str(e)}
+        writer.write(json.dumps(reply).encode() + b"\n")
+        try:
+            await writer.drain()
+        finally:
+            writer.close()
+
+    async def serve(self):
+        if os.path.exists(self.socket_path):
+            os.unlink(self.socket_path)
+        server = await asyncio.start_unix_server(
+            self._handle, path=self.socket_path, limit=4 * 1024 * 1024
+        )
+        os.chmod(self.socket_path, 0o600)
+        parent = os.getppid()
+        logger.info(f"Bot worker {os.getpid()} listening on {self.socket_path}")
+
+        try:
+            # Exit with the API server instead of lingering as an orphan
+            while os.getppid() == parent:
+                await asyncio.sleep(1.0)
+            logger.info("Parent exited, stopping bot worker")
+        finally:
+            server.close()
+            for task in list(self.calls.values()):
+                task.cancel()
+            await asyncio.gather(*self.calls.values(), return_exceptions=True)
+            await get_webhook_dispatcher().close()
+            if os.path.exists(self.socket_path):
+                os.unlink(self.socket_path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Bot worker")
+    parser.add_argument("--socket", required=True, help="Unix socket path")
+    args = parser.parse_args()
+    try:
+        asyncio.run(BotWorker(args.socket).serve())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,239 @@
+#!/usr/bin/env python3
+"""Bot Zygote - Fork pre-initialized bot processes instead of starting fresh interpreters.
+
+Imports everything a bot needs once (pipecat, provider SDKs, onnxruntime, the bot
+classes), freezes the heap so forked children keep sharing those pages, then forks one
+child per request received on a unix socket. Each child runs `bot_runner` with the
+requested arguments and environment, and the call spec descriptor sent along. When a
+child exits the zygote reaps it and writes its exit status to the status pipe sent with
+its request.
+
+Started by the API server when BOT_ZYGOTE_ENABLED=true; can also be run by hand:
+    uv run python -m runners.bot_zygote --socket /tmp/tito-bot-zygote.sock
+"""
+
+import argparse
+import gc
+import importlib
+import os
+import random
+import signal
+import socket
+import sys
+import time
+
+from dotenv import load_dotenv
+from loguru import logger
+
+load_dotenv()
+
+from app.Infrastructure.Call.zygote_spawner import (
+    DEFAULT_ZYGOTE_SOCKET,
+    recv_message,
+    send_message,
+)
+
+# Optional provider SDKs are skipped when not installed
+PRELOAD_MODULES = [
+    "runners.bot_runner",
+    "app.Domains.Agent.Bots.simple",
+    "app.Domains.Agent.Bots.flow",
+    "app.Domains.Agent.Bots.multimodal",
+    "pipecat_flows",
+    "onnxruntime",
+    "pipecat.audio.vad.silero",
+    "pipecat.transports.daily.transport",
+    "pipecat.services.deepgram.stt",
+    "pipecat.services.deepgram.tts",
+    "pipecat.services.cartesia.tts",
+    "pipecat.services.elevenlabs.tts",
+    "pipecat.services.rime.tts",
+    "pipecat.services.openai.tts",
+    "pipecat.services.google.llm",
+    "pipecat.services.openai.llm",
+    "pipecat.services.anthropic.llm",
+    "pipecat.services.groq.llm",
+    "pipecat.services.google.gemini_live.llm",
+    "pipecat.services.openai.realtime.llm",
+]
+
+
+def preload():
+    started = time.perf_counter()
+    for name in PRELOAD_MODULES:
+        try:
+            importlib.import_module(name)
+        except Exception as e:
+            logger.debug(f"Zygote skipped {name}: {e}")
+
+    # Read the VAD model into the page cache. The ONNX session itself is created per bot:
+    # onnxruntime starts thread pools with the session, and those do not survive a fork.
+    try:
+        import pipecat.audio.vad.silero as silero
+
+        model_dir = os.path.join(os.path.dirname(silero.__file__), "data")
+        for name in os.listdir(model_dir):
+            with open(os.path.join(model_dir, name), "rb") as f:
+                f.read()
+    except Exception as e:
+        logger.debug(f"Zygote could not preload the VAD model: {e}")
+
+    # Everything allocated so far lives for the whole process: keep it out of the GC so
+    # collections in the children do not touch (and un-share) those pages
+    gc.collect()
+    gc.freeze()
+    logger.info(f"Zygote preloaded in {time.perf_counter() - started:.2f}s")
+
+
+# Child PID -> write end of the pipe its exit status is reported on
+status_fds = {}
+
+
+def reap(*_):
+    """Collect exited children and report each exit status (also the SIGCHLD handler)."""
+    while True:
+        try:
+            pid, status = os.waitpid(-1, os.WNOHANG)
+        except ChildProcessError:
+            return
+        if pid == 0:
+            return
+        fd = status_fds.pop(pid, None)
+        if fd is None:
+            continue
+        try:
+            os.write(fd, str(os.waitstatus_to_exitcode(status)).encode())
+        except OSError:
+            pass  # The server closed its end
+        finally:
+            os.close(fd)
+
+
+def run_child(listener: socket.socket, conn: socket.socket, request: dict, fds: list):
+    """Runs in the forked child; never returns."""
+    code = 1
+    try:
+        listener.close()
+        conn.close()
+        signal.signal(signal.SIGCHLD, signal.SIG_DFL)
+        signal.pthread_sigmask(signal.SIG_UNBLOCK, {signal.SIGCHLD})
+        signal.signal(signal.SIGINT, signal.SIG_DFL)
+        signal.signal(signal.SIGTERM, signal.SIG_DFL)
+        # Other bots' status pipes stay with the zygote only
+        for fd in status_fds.values():
+            os.close(fd)
+        status_fds.clear()
+        random.seed()
+
+        args = list(request["args"])
+        for name, fd in zip(request.get("fds", []), fds):
+            if name == "spec":
+                # Stays open under its own number; bot_runner reads and closes it
+                args.extend(["--call-spec-fd", str(fd)])
+                continue
+            if name == "status":
+                os.close(fd)
+                continue
+            target = {"stdin": 0, "stdout": 1}[name]
+            os.dup2(fd, target)
+            os.close(fd)
+        if "stdin" in request.get("fds", []):
+            sys.stdin = os.fdopen(0, "r")
+
+        os.environ.clear()
+        os.environ.update(request["env"])
+        sys.argv = ["bot_runner.py", *args]
+
+        from runners.bot_runner import cli
+
+        cli()
+        code = 0
+    except SystemExit as e:
+        code = e.code if isinstance(e.code, int) else 1
+    except BaseException as e:
+        logger.exception(f"Forked bot failed: {e}")
+    finally:
+        sys.stdout.flush()
+        sys.stderr.flush()
+        os._exit(code)
+
+
+def serve(socket_path: str):
+    if os.path.exists(socket_path):
+        os.unlink(socket_path)
+    listener = socket.socket(socket.AF_UNIX, socket.SOCK_SEQPACKET)
+    listener.bind(socket_path)
+    os.chmod(socket_path, 0o600)
+    inode = os.stat(socket_path).st_ino
+    listener.listen(16)
+    listener.settimeout(1.0)
+    parent = os.getppid()
+    # Children are reaped (and their status reported) as soon as they exit
+    signal.signal(signal.SIGCHLD, reap)
+    logger.info(f"Bot zygote {os.getpid()} listening on {socket_path}")
+
+    try:
+        while True:
+            reap()
+            # Exit with the API server instead of lingering as an orphan
+            if os.getppid() != parent:
+                logger.info("Parent exited, stopping bot zygote")
+                return
+            try:
+                conn, _ = listener.accept()
+            except socket.timeout:
+                continue
+
+            fds = []
+            try:
+                conn.settimeout(5.0)
+                request, fds = recv_message(conn, max_fds=4)
+                if request.get("ping"):
+                    send_message(conn, {"pong": True})
+                    continue
+                # Hold SIGCHLD until the child's status pipe is registered
+                signal.pthread_sigmask(signal.SIG_BLOCK, {signal.SIGCHLD})
+                try:
+                    pid = os.fork()
+                    if pid == 0:
+                        run_child(listener, conn, request, fds)
+                    names = request.get("fds", [])
+                    if "status" in names:
+                        status_fds[pid] = fds.pop(names.index("status"))
+                finally:
+                    signal.pthread_sigmask(signal.SIG_UNBLOCK, {signal.SIGCHLD})
+                send_message(conn, {"pid": pid})
+            except Exception as e:
+                logger.error(f"Zygote request failed: {e}")
+                try:
+                    send_message(conn, {"error": str(e)})
+                except OSError:
+                    pass
+            finally:
+                for fd in fds:
+                    os.close(fd)
+                conn.close()
+    finally:
+        listener.close()
+        try:
+            # Once a new server's zygote took the path over, the socket there is not ours
+            if os.stat(socket_path).st_ino == inode:
+                os.unlink(socket_path)
+        except FileNotFoundError:
+            pass
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Bot zygote")
+    parser.add_argument("--socket", default=DEFAULT_ZYGOTE_SOCKET, help="Unix socket path")
+    args = parser.parse_args()
+
+    preload()
+    try:
+        serve(args.socket)
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""Local Daily REST API - A stand-in for the room and meeting token endpoints.
+
+Serves the subset of https://api.daily.co/v1 the server uses (create, get and delete
+rooms, room presence, meeting tokens) from memory, with an optional delay per request
+to mimic the round trip to Daily. Rooms it returns cannot be joined: use it to test and
+benchmark call setup (room pool, admission, process managers), not to run calls.
+
+Usage:
+    uv run python -m runners.local_daily_api --port 9100 --latency-ms 120
+    DAILY_API_URL=http://127.0.0.1:9100/v1 uv run python main.py
+"""
+
+import argparse
+import asyncio
+import secrets
+import time
+import uuid
+from datetime import datetime, timezone
+from typing import Dict
+
+from aiohttp import web
+
+ROOM_DOMAIN = "https://local.daily.co"
+
+# Rooms the stand-in holds, by name
+ROOMS = web.AppKey("rooms", Dict[str, dict])
+
+
+def create_app(latency_ms: float = 0.0) -> web.Application:
+    rooms: Dict[str, dict] = {}
+    routes = web.RouteTableDef()
+
+    @web.middleware
+    async def daily_like(request: web.Request, handler):
+        if not request.headers.get("Authorization", "").startswith("Bearer "):
+            return web.json_response({"error": "authentication-error"}, status=401)
+        if latency_ms:
+            await asyncio.sleep(latency_ms / 1000)
+        return await handler(request)
+
+    def room_or_404(name: str) -> dict:
+        room = rooms.get(name)
+        if not room:
+            raise web.HTTPNotFound(
+                text='{"error": "not-found"}', content_type="application/json"
+            )
+        return room
+
+    @routes.post("/v1/rooms")
+    async def create_room(request: web.Request):
+        body = await request.json() if request.can_read_body else {}
+        name = body.get("name") or secrets.token_urlsafe(12).replace("_", "").replace("-", "")
+        if name in rooms:
+            return web.json_response({"error": "invalid-request-error"}, status=400)
+        rooms[name] = {
+            "id": str(uuid.uuid4()),
+            "name": name,
+            "api_created": True,
+            "privacy": body.get("privacy", "public"),
+            "url": f"{ROOM_DOMAIN}/{name}",
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "config": {k: v for k, v in (body.get("properties") or {}).items() if v is not None},
+        }
+        return web.json_response(rooms[name])
+
+    @routes.get("/v1/rooms/{name}")
+    async def get_room(request: web.Request):
+        return web.json_response(room_or_404(request.match_info["name"]))
+
+    @routes.delete("/v1/rooms/{name}")
+    async def delete_room(request: web.Request):
+        name = request.match_info["name"]
+        room_or_404(name)
+        del rooms[name]
+        return web.json_response({"deleted": True, "name": name})
+
+    @routes.get("/v1/rooms/{name}/presence")
+    async def room_presence(request: web.Request):
+        room_or_404(request.match_info["name"])
+        return web.json_response({"total_count": 0, "data": []})
+
+    @routes.post("/v1/meeting-tokens")
+    async def create_token(request: web.Request):
+        properties = (await request.json()).get("properties") or {}
+        room = room_or_404(properties.get("room_name", ""))
+        exp = properties.get("exp")
+        if exp is not None and exp <= time.time():
+            return web.json_response({"error": "invalid-request-error"}, status=400)
+        return web.json_response({"token": f"local.{room['name']}.{secrets.token_urlsafe(24)}"})
+
+    app = web.Application(middlewares=[daily_like])
+    app.add_routes(routes)
+    app[ROOMS] = rooms
+    return app
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local Daily REST API")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=9100)
+    parser.add_argument(
+        "--latency-ms", type=float, default=0.0, help="Delay added to every request"
+    )
+    args = parser.parse_args()
+    web.run_app(create_app(args.latency_ms), host=args.host, port=args.port)
+
+
+if __name__ == "__main__":
+    main()
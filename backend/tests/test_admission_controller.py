@@ -0,0 +1,101 @@
+import asyncio
+
+import pytest
+
+from app.Domains.Call.Services.admission_controller import (
+    AdmissionController,
+    AdmissionRejected,
+    ServerDraining,
+)
+from app.Domains.Call.Services.call_registry import CallRegistry
+
+
+@pytest.fixture
+async def controller():
+    registry = CallRegistry()
+    controller = AdmissionController(
+        registry, max_concurrent_calls=1, queue_size=2, queue_timeout_secs=5, interval_secs=0.05
+    )
+    task = asyncio.create_task(controller.run())
+    yield controller
+    task.cancel()
+    await asyncio.gather(task, return_exceptions=True)
+
+
+async def test_admits_under_capacity(controller):
+    await controller.admit()
+    controller.registry.create()
+
+    assert controller.admitted == 1
+    assert controller.summary()["blocked_by"] == "1 of 1 calls active"
+
+
+async def test_queued_calls_start_by_priority_as_calls_end(controller):
+    await controller.admit()
+    running = controller.registry.create()
+    started = []
+
+    async def call(name: str, priority: int):
+        await controller.admit(priority=priority)
+        started.append(name)
+        return controller.registry.create()
+
+    low = asyncio.create_task(call("low", 0))
+    await asyncio.sleep(0)
+    high = asyncio.create_task(call("high", 5))
+    await asyncio.sleep(0.1)
+    assert started == []
+    assert controller.summary()["queued_calls"] == 2
+
+    controller.registry.transition(running.id, "ended")
+    high_call = await asyncio.wait_for(high, 1)
+    assert started == ["high"]
+
+    controller.registry.transition(high_call.id, "ended")
+    await asyncio.wait_for(low, 1)
+    assert started == ["high", "low"]
+
+
+async def test_rejects_when_queue_is_full(controller):
+    await controller.admit()
+    controller.registry.create()
+    waiters = [asyncio.create_task(controller.admit()) for _ in range(2)]
+    await asyncio.sleep(0)
+
+    with pytest.raises(AdmissionRejected) as rejected:
+        await controller.admit()
+
+    assert rejected.value.status_code == 429
+    assert rejected.value.headers["Retry-After"] == "5"
+    for waiter in waiters:
+        waiter.cancel()
+    await asyncio.gather(*waiters, return_exceptions=True)
+
+
+async def test_rejects_after_queue_timeout(controller):
+    await controller.admit()
+    controller.registry.create()
+
+    with pytest.raises(AdmissionRejected) as rejected:
+        await controller.admit(timeout=0.1)
+
+    assert rejected.value.reason == "timed out in the admission queue"
+    assert controller.rejected == 1
+
+
+async def test_draining_rejects_queued_and_new_calls(controller):
+    await controller.admit()
+    controller.registry.create()
+    waiter = asyncio.create_task(controller.admit())
+    await asyncio.sleep(0)
+
+    controller.start_draining()
+
+    with pytest.raises(ServerDraining) as queued:
+        await waiter
+    with pytest.raises(ServerDraining) as new:
+        await controller.admit()
+    assert queued.value.status_code == new.value.status_code == 503
+    assert new.value.headers["Retry-After"] == "5"
+    assert controller.summary()["ready"] is False
+    assert controller.summary()["queued_calls"] == 0
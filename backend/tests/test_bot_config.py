@@ -0,0 +1,58 @@
+import json
+
+import pytest
+
+from app.Core.Config.bot import BotConfig
+from app.Domains.Agent.Factory.service_factory import ServiceFactory
+from app.Domains.Agent.Metrics import provider_ledger
+
+
+def make_config(**settings: str) -> BotConfig:
+    return BotConfig(env={"DAILY_API_KEY": "key", "CALL_ID": "call-1", **settings})
+
+
+def test_settings_are_resolved_once_and_read_only():
+    config = make_config(LLM_PROVIDER="OpenAI", OPENAI_MODEL="gpt-4o", TTS_CACHE_MEMORY_MB="1")
+    config.initial_message = "Hola"
+
+    assert config.llm_provider == "openai"
+    assert config.llm_model == "gpt-4o"
+    assert config.tts_cache_memory_bytes == 1024 * 1024
+    assert config.speak_first
+    with pytest.raises(AttributeError):
+        config.llm_provider = "google"
+
+
+def test_routing_resolves_a_new_config(monkeypatch, tmp_path):
+    monkeypatch.setenv("PROVIDER_LEDGER_PATH", str(tmp_path / "ledger.json"))
+    monkeypatch.setattr(provider_ledger, "_ledger", None)
+    routing = {
+        "llm": [{"provider": "google", "model": "gemini-2.0-flash"}],
+        "tts": [{"provider": "elevenlabs"}],
+    }
+    config = make_config(
+        LLM_PROVIDER="openai", TTS_PROVIDER="cartesia", PROVIDER_ROUTING=json.dumps(routing)
+    )
+    config.tools = [{"name": "lookup"}]
+
+    routed, decisions = ServiceFactory.route_providers(config)
+
+    assert set(decisions) == {"llm", "tts"}
+    assert (routed.llm_provider, routed.llm_model) == ("google", "gemini-2.0-flash")
+    assert routed.tts_provider == "elevenlabs"
+    assert routed.tts_voice == routed.elevenlabs_voice_id == config.elevenlabs_voice_id
+    assert routed.tools == config.tools and routed.call_id == "call-1"
+    # The config it was routed from, and its environment, are left as they were
+    assert (config.llm_provider, config.tts_provider) == ("openai", "cartesia")
+    assert config.env["LLM_PROVIDER"] == "openai"
+
+
+def test_call_environment_gives_a_config_for_the_call():
+    config = make_config(ARCHITECTURE_TYPE="simple")
+
+    bound = config.with_env({"CALL_ID": "call-2", "CALL_EVENTS_URL": "http://server/events"})
+
+    assert bound.call_id == "call-2"
+    assert bound.call_events_url == "http://server/events"
+    assert bound.architecture_type == "simple"
+    assert config.call_id == "call-1" and config.call_events_url is None
@@ -0,0 +1,107 @@
+import pytest
+
+from app.Domains.Call.Services.call_registry import CallRegistry
+from app.Infrastructure.Call.file_call_store import FileCallStore
+
+
+@pytest.fixture
+def store(tmp_path):
+    return FileCallStore(str(tmp_path / "calls"))
+
+
+def start_call(registry: CallRegistry, bot_pid: int, room: str = "https://x.daily.co/r"):
+    call = registry.create(assistant_id="assistant-1")
+    registry.attach(call.id, room_url=room, bot_pid=bot_pid)
+    registry.transition(call.id, "ringing")
+    return call
+
+
+def token_of(registry: CallRegistry, call_id: str) -> str:
+    return registry.bot_env(call_id)["CALL_EVENTS_TOKEN"]
+
+
+def test_restore_keeps_unfinished_calls_and_their_tokens(store):
+    previous = CallRegistry(store, events_base_url="http://server")
+    running = start_call(previous, bot_pid=101)
+    token = token_of(previous, running.id)
+    ended = start_call(previous, bot_pid=102)
+    previous.transition(ended.id, "ended")
+
+    registry = CallRegistry(store, events_base_url="http://server")
+
+    assert registry.get(running.id).state == "ringing"
+    assert registry.get(ended.id).state == "ended"
+    assert registry.active_count() == 1
+    assert registry.find_by_pid(101).id == running.id
+    assert registry.verify_token(running.id, token)
+    assert store.load_token(ended.id) is None
+
+
+def test_adopt_unclaimed_fails_calls_whose_bots_are_gone(store):
+    previous = CallRegistry(store)
+    adopted = start_call(previous, bot_pid=201)
+    gone = start_call(previous, bot_pid=202)
+    unspawned = previous.create()
+    registry = CallRegistry(store)
+    offered = []
+
+    def adopt(call):
+        offered.append(call.bot_pid)
+        return call.bot_pid == 201
+
+    failed = registry.adopt_unclaimed(adopt)
+
+    assert sorted(offered) == [201, 202]
+    assert {call.id for call in failed} == {gone.id, unspawned.id}
+    assert registry.get(adopted.id).state == "ringing"
+    assert registry.get(gone.id).state == "failed"
+    assert registry.get(gone.id).history[-1].detail == "server restarted"
+    # Offered once only
+    assert registry.adopt_unclaimed(adopt) == []
+    assert len(offered) == 2
+
+
+def test_receive_takes_over_handed_over_calls(store):
+    old = CallRegistry(events_base_url="http://old")
+    call = start_call(old, bot_pid=301)
+    token = token_of(old, call.id)
+    # Left unfinished in the store by a server before the old one
+    stale = start_call(CallRegistry(store), bot_pid=302)
+    new = CallRegistry(store, events_base_url="http://new")
+
+    handed = old.hand_over(call.id)
+    new.receive([handed])
+
+    assert old.get(call.id) is None
+    assert old.handed_over(call.id)
+    assert old.active_count() == 0
+    assert new.get(stale.id) is None
+    assert new.get(call.id).state == "ringing"
+    assert new.find_by_pid(301).id == call.id
+    assert new.verify_token(call.id, token)
+    assert store.load_token(call.id) == token
+    assert new.adopt_unclaimed(lambda c: True) == []
+
+
+def test_hand_over_skips_finished_and_unknown_calls():
+    registry = CallRegistry()
+    call = start_call(registry, bot_pid=401)
+    registry.transition(call.id, "ended")
+
+    assert registry.hand_over(call.id) is None
+    assert registry.hand_over("missing") is None
+    assert not registry.handed_over(call.id)
+
+
+def test_process_exit_without_status_fails_the_call():
+    registry = CallRegistry()
+    clean = start_call(registry, bot_pid=501)
+    unknown = start_call(registry, bot_pid=502)
+
+    registry.on_process_exit(501, 0)
+    registry.on_process_exit(502, None)
+
+    assert registry.get(clean.id).state == "ended"
+    assert registry.get(clean.id).exit_code == 0
+    assert registry.get(unknown.id).state == "failed"
+    assert registry.get(unknown.id).history[-1].detail == "bot exited without an exit status"
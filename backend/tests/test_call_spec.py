@@ -0,0 +1,91 @@
+import os
+
+import pytest
+
+from app.Core.Config.call_spec import (
+    SPEC_HEADER,
+    SPEC_MAGIC,
+    CallSpec,
+    read_spec_fd,
+    write_spec_fd,
+)
+from app.Domains.Assistant.Models.assistant import Assistant
+
+
+def make_spec() -> CallSpec:
+    assistant = Assistant(name="Support", architecture_type="simple")
+    return CallSpec(
+        room_url="https://example.daily.co/room",
+        token="meeting-token",
+        assistant=assistant,
+        agent_type="outbound",
+        prompt_variables={"name": "Ana"},
+        stt_keywords=["Tito", "factura"],
+        env={"CALL_ID": "call-1", "OPENAI_API_KEY": "secret"},
+    )
+
+
+def test_encode_decode_round_trip():
+    spec = make_spec()
+
+    data = spec.encode()
+
+    assert data[:4] == SPEC_MAGIC
+    assert CallSpec.decode(data) == spec
+
+
+def test_decode_ignores_trailing_bytes():
+    spec = make_spec()
+
+    assert CallSpec.decode(spec.encode() + b"garbage") == spec
+
+
+def test_decode_rejects_other_data():
+    data = make_spec().encode()
+
+    with pytest.raises(ValueError):
+        CallSpec.decode(b"XXXX" + data[4:])
+    with pytest.raises(ValueError):
+        CallSpec.decode(data[: SPEC_HEADER.size - 1])
+    with pytest.raises(ValueError):
+        CallSpec.decode(data[:-1])
+
+
+def test_spec_is_immutable():
+    spec = make_spec()
+
+    with pytest.raises(Exception):
+        spec.room_url = "https://example.daily.co/other"
+
+
+def test_settings_resolve_assistant_call_and_env():
+    settings = make_spec().settings()
+
+    assert settings["BOT_NAME"] == "Support"
+    assert settings["ARCHITECTURE_TYPE"] == "simple"
+    assert settings["AGENT_TYPE"] == "outbound"
+    assert settings["STT_KEYWORDS"] == "Tito,factura"
+    assert settings["CALL_ID"] == "call-1"
+    assert settings["OPENAI_API_KEY"] == "secret"
+
+
+def test_for_standby_drops_call_only_fields():
+    spec = make_spec()
+
+    standby = spec.for_standby()
+
+    assert standby.room_url is None
+    assert standby.token is None
+    assert standby.prompt_variables is None
+    assert standby.env == {}
+    assert standby.assistant == spec.assistant
+    assert standby.stt_keywords == spec.stt_keywords
+
+
+def test_spec_fd_round_trip_closes_descriptor():
+    spec = make_spec()
+    fd = write_spec_fd(spec)
+
+    assert read_spec_fd(fd) == spec
+    with pytest.raises(OSError):
+        os.fstat(fd)
@@ -0,0 +1,72 @@
+import os
+import stat
+import time
+
+import pytest
+
+from app.Domains.Call.Models.analysis_job import AnalysisJob
+from app.Infrastructure.Call.file_analysis_queue import FileAnalysisQueue
+
+
+@pytest.fixture
+def queue(tmp_path):
+    return FileAnalysisQueue(str(tmp_path / "analysis"), keep_done_secs=3600)
+
+
+def job_file(queue: FileAnalysisQueue, state: str, call_id: str) -> str:
+    return queue._get_file_path(state, call_id)
+
+
+def test_enqueue_once_per_call_with_owner_only_file(queue):
+    job = AnalysisJob(call_id="call-1", api_key="key", messages=[{"role": "user"}])
+
+    assert queue.enqueue(job)
+    assert not queue.enqueue(AnalysisJob(call_id="call-1"))
+
+    mode = stat.S_IMODE(os.stat(job_file(queue, "pending", "call-1")).st_mode)
+    assert mode == 0o600
+    assert queue.get("call-1").api_key == "key"
+
+
+def test_claim_skips_jobs_not_due_yet(queue):
+    queue.enqueue(AnalysisJob(call_id="due"))
+    queue.enqueue(AnalysisJob(call_id="later", next_attempt_at=time.time() + 60))
+
+    claimed = queue.claim(limit=10)
+
+    assert [job.call_id for job in claimed] == ["due"]
+    assert queue.claim(limit=10) == []
+    assert os.path.exists(job_file(queue, "processing", "due"))
+
+
+def test_api_key_is_dropped_once_the_job_is_finished(queue):
+    queue.enqueue(AnalysisJob(call_id="ok", api_key="key"))
+    queue.enqueue(AnalysisJob(call_id="retry", api_key="key"))
+    queue.enqueue(AnalysisJob(call_id="broken", api_key="key"))
+    jobs = {job.call_id: job for job in queue.claim(limit=10)}
+
+    queue.complete(jobs["ok"])
+    queue.fail(jobs["retry"], "timeout", retry=True)
+    queue.fail(jobs["broken"], "bad request", retry=False)
+
+    assert queue.get("ok").api_key is None
+    assert queue.get("retry").api_key == "key"
+    assert queue.get("broken").api_key is None
+    assert queue.get("broken").last_error == "bad request"
+    assert os.path.exists(job_file(queue, "failed", "broken"))
+
+
+def test_old_done_jobs_are_pruned(queue):
+    queue.enqueue(AnalysisJob(call_id="old"))
+    queue.enqueue(AnalysisJob(call_id="recent"))
+    for job in queue.claim(limit=10):
+        queue.complete(job)
+    old = job_file(queue, "done", "old")
+    os.utime(old, (time.time() - 7200, time.time() - 7200))
+    # Pruning runs at most once a minute per queue: a worker starting now prunes
+    worker = FileAnalysisQueue(queue.data_dir, keep_done_secs=3600)
+
+    worker.claim(limit=10)
+
+    assert not os.path.exists(old)
+    assert queue.get("recent") is not None
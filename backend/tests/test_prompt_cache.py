@@ -0,0 +1,76 @@
+import pytest
+
+from app.Domains.Agent.Cache.prompt_cache import (
+    FilePromptCacheRegistry,
+    InMemoryPromptCacheRegistry,
+    PromptCacheUsage,
+    prompt_prefix_hash,
+)
+
+
+@pytest.fixture(params=["memory", "file"])
+def registry(request, tmp_path):
+    if request.param == "memory":
+        return InMemoryPromptCacheRegistry()
+    return FilePromptCacheRegistry(str(tmp_path / "prompt_cache.json"))
+
+
+def usage(prompt_tokens: int, cached_tokens: int) -> PromptCacheUsage:
+    result = PromptCacheUsage()
+    result.record(prompt_tokens, cached_tokens, cache_write_tokens=0)
+    return result
+
+
+def test_prefix_hash_changes_with_prompt_and_tools():
+    base = prompt_prefix_hash("openai", "gpt-4o", "You are Tito.")
+
+    assert base == prompt_prefix_hash("openai", "gpt-4o", "You are Tito.")
+    assert base != prompt_prefix_hash("openai", "gpt-4o", "You are Tito!")
+    assert base != prompt_prefix_hash("openai", "gpt-4o", "You are Tito.", [{"name": "t"}])
+    assert base != prompt_prefix_hash("anthropic", "gpt-4o", "You are Tito.")
+
+
+def test_calls_of_an_assistant_share_one_cache_key(registry):
+    prefix = prompt_prefix_hash("openai", "gpt-4o", "prompt")
+
+    first = registry.get_or_create("assistant-1", "openai", "gpt-4o", prefix)
+    second = registry.get_or_create("assistant-1", "openai", "gpt-4o", prefix)
+    other = registry.get_or_create("assistant-2", "openai", "gpt-4o", prefix)
+
+    assert first.cache_key == second.cache_key
+    assert first.cache_key != other.cache_key
+
+
+def test_usage_adds_up_until_the_prefix_changes(registry):
+    prefix = prompt_prefix_hash("openai", "gpt-4o", "prompt")
+    handle = registry.get_or_create("assistant-1", "openai", "gpt-4o", prefix)
+
+    registry.record_call(handle, usage(1000, 0))
+    registry.record_call(handle, usage(1000, 800))
+    stored = registry.get_or_create("assistant-1", "openai", "gpt-4o", prefix)
+
+    assert stored.calls == 2
+    assert stored.usage.stats()["hit_ratio"] == 0.5
+    assert stored.usage.stats()["cached_token_ratio"] == 0.4
+
+    changed = registry.get_or_create(
+        "assistant-1", "openai", "gpt-4o", prompt_prefix_hash("openai", "gpt-4o", "new")
+    )
+    # A call still running with the old prefix does not count toward the new one
+    registry.record_call(handle, usage(1000, 1000))
+
+    assert changed.cache_key != handle.cache_key
+    assert registry.get_or_create("assistant-1", "openai", "gpt-4o", changed.prefix_hash).calls == 0
+
+
+def test_file_registry_is_shared_between_processes(tmp_path):
+    path = str(tmp_path / "prompt_cache.json")
+    prefix = prompt_prefix_hash("anthropic", None, "prompt")
+    handle = FilePromptCacheRegistry(path).get_or_create("assistant-1", "anthropic", None, prefix)
+    FilePromptCacheRegistry(path).record_call(handle, usage(500, 500))
+
+    stored = FilePromptCacheRegistry(path).get_or_create("assistant-1", "anthropic", None, prefix)
+
+    assert stored.cache_key == handle.cache_key
+    assert stored.calls == 1
+    assert stored.usage.cached_tokens == 500
@@ -0,0 +1,129 @@
+import asyncio
+
+import pytest
+from aiohttp.test_utils import TestServer
+from fastapi import HTTPException
+
+from app.Core.Config.call_spec import CallSpec
+from app.Domains.Call.Services.admission_controller import AdmissionController
+from app.Domains.Call.Services.call_registry import CallRegistry
+from app.Domains.Call.Services.call_service import CallService
+from app.Infrastructure.Call.daily_room_provider import DailyRoomProvider
+from app.Infrastructure.Call.room_pool import RoomPool
+from runners.local_daily_api import ROOMS, create_app
+
+
+@pytest.fixture
+async def daily(monkeypatch):
+    """Local Daily stand-in; yields the rooms it holds, by name."""
+    app = create_app()
+    server = TestServer(app)
+    await server.start_server()
+    monkeypatch.setenv("DAILY_API_KEY", "local-key")
+    monkeypatch.setenv("DAILY_API_URL", str(server.make_url("/v1")))
+    yield app[ROOMS]
+    await server.close()
+
+
+async def start_pool(**kwargs) -> tuple:
+    pool = RoomPool(DailyRoomProvider(), interval_secs=0.05, **kwargs)
+    task = asyncio.create_task(pool.run())
+    return pool, task
+
+
+async def stop_pool(task: asyncio.Task):
+    task.cancel()
+    await asyncio.gather(task, return_exceptions=True)
+
+
+async def wait_until(condition, timeout: float = 5.0):
+    async with asyncio.timeout(timeout):
+        while not condition():
+            await asyncio.sleep(0.02)
+
+
+def room_name(url: str) -> str:
+    return url.rsplit("/", 1)[-1]
+
+
+async def test_pool_fills_and_hands_out_private_rooms(daily):
+    pool, task = await start_pool(size=2)
+    try:
+        await wait_until(lambda: pool.summary()["ready"] == 2)
+
+        url, token = await pool.create_room_and_token()
+
+        assert daily[room_name(url)]["privacy"] == "private"
+        assert token.startswith(f"local.{room_name(url)}.")
+        assert pool.hits == 1 and pool.misses == 0
+        # Refilled in the background
+        await wait_until(lambda: pool.summary()["ready"] == 2)
+        assert len(daily) == 3
+    finally:
+        await stop_pool(task)
+
+
+async def test_empty_pool_creates_a_room_on_demand(daily):
+    pool = RoomPool(DailyRoomProvider(), size=0)
+    try:
+        url, token = await pool.create_room_and_token()
+
+        assert room_name(url) in daily
+        assert token
+        assert pool.misses == 1
+    finally:
+        await pool.close()
+
+
+async def test_released_room_is_recycled_with_a_new_token(daily):
+    pool, task = await start_pool(size=1, token_ttl_secs=2, min_join_secs=0.5)
+    try:
+        await wait_until(lambda: pool.summary()["ready"] == 1)
+        url, token = await pool.create_room_and_token()
+
+        await pool.delete_room(url)
+
+        # Reused once the call's token can no longer join the room
+        await wait_until(lambda: pool.recycled >= 1)
+        assert room_name(url) in daily
+        # Behind the room created to refill the pool meanwhile
+        await wait_until(lambda: pool.summary()["ready"] == 2)
+        handed_out = dict([await pool.create_room_and_token() for _ in range(2)])
+        assert url in handed_out
+        assert handed_out[url] != token
+        assert pool.misses == 0
+    finally:
+        await stop_pool(task)
+
+
+async def test_close_deletes_unused_rooms_only(daily):
+    pool, task = await start_pool(size=2)
+    await wait_until(lambda: pool.summary()["ready"] == 2)
+    url, _ = await pool.create_room_and_token()
+    await wait_until(lambda: pool.summary()["ready"] == 2)
+
+    await stop_pool(task)
+
+    assert list(daily) == [room_name(url)]
+
+
+class NoWorkerProcessManager:
+    async def start_bot(self, spec: CallSpec) -> int:
+        raise HTTPException(status_code=503, detail="No bot worker available")
+
+
+async def test_room_of_a_call_whose_bot_failed_goes_back_to_the_pool(daily):
+    pool = RoomPool(DailyRoomProvider(), size=0, token_ttl_secs=2, min_join_secs=0.5)
+    registry = CallRegistry()
+    service = CallService(
+        None, pool, NoWorkerProcessManager(), registry, AdmissionController(registry)
+    )
+    call = registry.create()
+
+    with pytest.raises(HTTPException):
+        await service._start(call, CallSpec())
+
+    assert registry.get(call.id).state == "failed"
+    assert pool.summary()["cooling"] == 1
+    assert not any(room.in_use for room in pool._rooms.values())
+    await pool.close()